@@ -1,11 +1,10 @@
 import argparse
-import os
 
 from overrides import overrides
 
 from ark_sdk_python.actions.ark_action import ArkAction
 from ark_sdk_python.args import ArkArgsFormatter
-from ark_sdk_python.common.ark_keyring import ARK_BASIC_KEYRING_FOLDER_ENV_VAR, DEFAULT_BASIC_KEYRING_FOLDER, ArkKeyring, BasicKeyring
+from ark_sdk_python.common.ark_keyring import ArkKeyring, IndexedKeyring
 from ark_sdk_python.models import ArkException
 
 
@@ -25,12 +24,10 @@ class ArkCacheAction(ArkAction):
         cache_cmd_subparsers.add_parser('clear', help='Clears all profiles cache')
 
     def __run_clear_cache_action(self) -> None:
-        if isinstance(ArkKeyring.get_keyring(), BasicKeyring):
-            cache_folder_path = os.path.join(os.path.expanduser('~'), DEFAULT_BASIC_KEYRING_FOLDER)
-            if ARK_BASIC_KEYRING_FOLDER_ENV_VAR in os.environ:
-                cache_folder_path = os.environ[ARK_BASIC_KEYRING_FOLDER_ENV_VAR]
-            os.unlink(f'{cache_folder_path}{os.sep}keyring')
-            os.unlink(f'{cache_folder_path}{os.sep}mac')
+        kr = ArkKeyring.get_keyring()
+        if isinstance(kr, IndexedKeyring):
+            kr.clear()
+            ArkKeyring.clear_cache()
         else:
             ArkArgsFormatter.print_normal('Cache clear is only valid for basic keyring implementation at the moment')
 
@@ -1,5 +1,4 @@
 import argparse
-import itertools
 import json
 import os
 import traceback
@@ -10,7 +9,7 @@ from typing import Any, Dict, Generator, List, Optional, Tuple, Type, Union
 from overrides import overrides
 
 from ark_sdk_python.actions.ark_action import ArkAction
-from ark_sdk_python.args import ArkArgsFormatter, ArkPydanticArgparse
+from ark_sdk_python.args import ArkArgsFormatter, ArkCLISchemaCache, ArkPydanticArgparse
 from ark_sdk_python.auth import SUPPORTED_AUTHENTICATORS
 from ark_sdk_python.auth.ark_auth import ArkAuth
 from ark_sdk_python.cli_services import ArkCLIAPI
@@ -23,37 +22,19 @@ from ark_sdk_python.services.ark_service import ArkService
 
 
 class ArkExecAction(ArkAction):
+    def _serializable_item(self, item: Any) -> Any:
+        if issubclass(type(item), ArkModel):
+            return json.loads(item.model_dump_json(by_alias=False, exclude={'poll_progress_callback'}))
+        return item
+
     def _serialize_output(self, output: Optional[Union[List, Dict, ArkModel, Generator, Tuple, Any]]) -> str:
         if output is None:
             return ''
         if isinstance(output, Generator):
-            return self._serialize_output(list(itertools.chain.from_iterable([p.items for p in output])))
-        if isinstance(output, list):
-            return json.dumps(
-                [
-                    (
-                        json.loads(a.model_dump_json(by_alias=False, exclude={'poll_progress_callback'}))
-                        if issubclass(type(a), ArkModel)
-                        else a
-                    )
-                    for a in output
-                    if a is not None
-                ],
-                indent=4,
-            )
-        elif isinstance(output, tuple):
-            return json.dumps(
-                [
-                    (
-                        json.loads(a.model_dump_json(by_alias=False, exclude={'poll_progress_callback'}))
-                        if issubclass(type(a), ArkModel)
-                        else a
-                    )
-                    for a in output
-                    if a is not None
-                ],
-                indent=4,
-            )
+            # Only the serializable form of every item is kept, so the pages and their models can be released as they are iterated
+            return json.dumps([self._serializable_item(a) for p in output for a in p if a is not None], indent=4)
+        if isinstance(output, (list, tuple)):
+            return json.dumps([self._serializable_item(a) for a in output if a is not None], indent=4)
         elif isinstance(output, dict):
             return json.dumps(
                 {
@@ -86,7 +67,7 @@ class ArkExecAction(ArkAction):
         try:
             model_type: Type[ArkPollableModel] = schemas_map[action.replace('_', '-')]
             model: ArkPollableModel = model_type.model_validate(
-                ArkPydanticArgparse.argparse_to_schema(model_type.model_json_schema(), args)
+                ArkPydanticArgparse.argparse_to_schema(ArkCLISchemaCache.instance().model_json_schema(model_type), args)
             )
             model.poll_progress_callback = ArkPollers.default_poller()
             output = getattr(service, action.replace('-', '_'))(model)
@@ -160,7 +141,9 @@ class ArkExecAction(ArkAction):
         try:
             model_type: Type[ArkPollableModel] = schemas_map[action.replace('_', '-')]
             if model_type:
-                model: ArkModel = model_type.model_validate(ArkPydanticArgparse.argparse_to_schema(model_type.model_json_schema(), args))
+                model: ArkModel = model_type.model_validate(
+                    ArkPydanticArgparse.argparse_to_schema(ArkCLISchemaCache.instance().model_json_schema(model_type), args)
+                )
                 output = getattr(service, action.replace('-', '_'))(model)
             else:
                 output = getattr(service, action.replace('-', '_'))()
@@ -187,7 +170,9 @@ class ArkExecAction(ArkAction):
             parser = subparsers.add_parser(action)
             if schema:
                 ArkPydanticArgparse.schema_to_argparse(
-                    schema.model_json_schema(), parser, defaults=defaults_map.get(action, None) if defaults_map else None
+                    ArkCLISchemaCache.instance().model_json_schema(schema),
+                    parser,
+                    defaults=defaults_map.get(action, None) if defaults_map else None,
                 )
 
     @overrides
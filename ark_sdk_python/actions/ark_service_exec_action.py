@@ -1,15 +1,32 @@
 import argparse
-from typing import List, Optional, Tuple
+import os
+import shlex
+import sys
+from typing import List, Optional, Set, Tuple
 
 from overrides import overrides
 
 from ark_sdk_python.actions.ark_exec_action import ArkExecAction
+from ark_sdk_python.args import ArkCLISchemaCache
 from ark_sdk_python.cli_services import ArkCLIAPI
 from ark_sdk_python.models.actions.ark_service_action_definition import ArkServiceActionDefinition
 from ark_sdk_python.models.actions.services import SUPPORTED_SERVICE_ACTIONS
 
 
 class ArkServiceExecAction(ArkExecAction):
+    @staticmethod
+    def __selected_exec_commands() -> Set[str]:
+        argv = sys.argv[1:]
+        if '_ARGCOMPLETE' in os.environ and 'COMP_LINE' in os.environ:
+            comp_line = os.environ['COMP_LINE'][: int(os.environ.get('COMP_POINT', len(os.environ['COMP_LINE'])))]
+            try:
+                argv = shlex.split(comp_line)[1:]
+            except ValueError:
+                argv = comp_line.split()[1:]
+        if 'exec' not in argv:
+            return set()
+        return set(argv[argv.index('exec') + 1 :])
+
     def __define_service_exec_action(
         self,
         action_def: ArkServiceActionDefinition,
@@ -68,12 +85,19 @@ class ArkServiceExecAction(ArkExecAction):
     def define_exec_action(self, exec_subparsers: argparse._SubParsersAction) -> None:
         """
         Defines all the supported service actions as CLI actions, with its associated arguments and schemas.
+        Only the services selected in the command line are fully defined, every other service is defined by name only,
+        so the arguments of the models of a service are only generated when the service is actually used.
 
         Args:
             exec_subparsers (argparse._SubParsersAction): _description_
         """
+        selected_commands = self.__selected_exec_commands()
         for actions in SUPPORTED_SERVICE_ACTIONS:
-            self.__define_service_exec_actions(actions, exec_subparsers)
+            if actions.action_name in selected_commands:
+                self.__define_service_exec_actions(actions, exec_subparsers)
+            else:
+                exec_subparsers.add_parser(actions.action_name)
+        ArkCLISchemaCache.instance().flush()
 
     @overrides
     def run_exec_action(self, api: ArkCLIAPI, args: argparse.Namespace) -> None:
@@ -1,4 +1,5 @@
 from ark_sdk_python.args.ark_args_formatter import ARK_INQUIRER_THEME, ArkArgsFormatter, ArkInquirerRender
+from ark_sdk_python.args.ark_cli_schema_cache import ArkCLISchemaCache
 from ark_sdk_python.args.ark_pydantic_argparse import ArkPydanticArgparse
 
-__all__ = ['ArkArgsFormatter', 'ArkPydanticArgparse', 'ArkInquirerRender', 'ARK_INQUIRER_THEME']
+__all__ = ['ArkArgsFormatter', 'ArkPydanticArgparse', 'ArkCLISchemaCache', 'ArkInquirerRender', 'ARK_INQUIRER_THEME']
@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Final, Optional, Type
+
+from pydantic import BaseModel
+
+from ark_sdk_python.common.ark_logger import get_logger
+from ark_sdk_python.common.ark_version import __version__
+
+DEFAULT_CLI_CACHE_FOLDER: Final[str] = f'.ark_cache{os.sep}cli'
+ARK_CLI_CACHE_FOLDER_ENV_VAR: Final[str] = 'ARK_CLI_CACHE_FOLDER'
+ARK_DISABLE_CLI_CACHE_ENV_VAR: Final[str] = 'ARK_DISABLE_CLI_CACHE'
+
+
+class ArkCLISchemaCache:
+    """
+    Persistent cache of the JSON schemas of the CLI models, keyed by the SDK version.
+    Generating the JSON schema of a model is the most expensive part of building the CLI parsers,
+    so schemas are generated once per SDK version and loaded from disk on the following invocations.
+    The cache file is replaced atomically when new schemas were generated, so concurrent invocations never see a partially written file.
+    """
+
+    __INSTANCE_LOCK: Final[threading.Lock] = threading.Lock()
+    __INSTANCE: Optional['ArkCLISchemaCache'] = None
+
+    def __init__(self, cache_folder: Optional[str] = None, version: str = __version__) -> None:
+        self.__logger = get_logger(app=self.__class__.__name__)
+        self.__cache_folder = cache_folder or os.environ.get(
+            ARK_CLI_CACHE_FOLDER_ENV_VAR, os.path.join(os.path.expanduser('~'), DEFAULT_CLI_CACHE_FOLDER)
+        )
+        self.__cache_file_path = os.path.join(self.__cache_folder, f'schemas-{version}.json')
+        self.__lock = threading.Lock()
+        self.__schemas: Optional[Dict[str, Dict[str, Any]]] = None
+        self.__dirty = False
+
+    @staticmethod
+    def instance() -> 'ArkCLISchemaCache':
+        """
+        Returns the process wide CLI schema cache.
+
+        Returns:
+            ArkCLISchemaCache: _description_
+        """
+        with ArkCLISchemaCache.__INSTANCE_LOCK:
+            if not ArkCLISchemaCache.__INSTANCE:
+                ArkCLISchemaCache.__INSTANCE = ArkCLISchemaCache()
+            return ArkCLISchemaCache.__INSTANCE
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.environ.get(ARK_DISABLE_CLI_CACHE_ENV_VAR, 'false').lower() not in ['true', '1']
+
+    @property
+    def cache_file_path(self) -> str:
+        return self.__cache_file_path
+
+    def __read_schemas(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.__cache_file_path, 'r', encoding='utf-8') as fh:
+                schemas = json.load(fh)
+            return schemas if isinstance(schemas, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __load_schemas(self) -> Dict[str, Dict[str, Any]]:
+        if self.__schemas is None:
+            self.__schemas = self.__read_schemas() if self.is_enabled() else {}
+        return self.__schemas
+
+    def model_json_schema(self, model: Type[BaseModel]) -> Dict[str, Any]:
+        """
+        Returns the JSON schema of the given model, generating it only if it is not cached yet.
+
+        Args:
+            model (Type[BaseModel]): _description_
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        key = f'{model.__module__}.{model.__qualname__}'
+        with self.__lock:
+            schemas = self.__load_schemas()
+            if key not in schemas:
+                schemas[key] = model.model_json_schema()
+                self.__dirty = True
+            return schemas[key]
+
+    def flush(self) -> None:
+        """
+        Persists newly generated schemas to the cache file, merged with schemas persisted meanwhile by other invocations.
+        Failures to persist are only logged.
+        """
+        with self.__lock:
+            if not self.__dirty or not self.is_enabled():
+                return
+            try:
+                os.makedirs(self.__cache_folder, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=self.__cache_folder, prefix='.schemas', suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                        json.dump({**self.__read_schemas(), **self.__schemas}, fh)
+                    os.replace(temp_path, self.__cache_file_path)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
+                self.__dirty = False
+            except OSError as ex:
+                self.__logger.debug(f'Failed to persist CLI schemas cache [{str(ex)}]')
@@ -3,14 +3,29 @@ from __future__ import annotations
 from typing import Dict, List, Optional, Type, cast
 
 from ark_sdk_python.auth.ark_auth import ArkAuth
+from ark_sdk_python.common.ark_connection_pool import ArkConnectionPool
 from ark_sdk_python.models.ark_exceptions import ArkServiceException
 from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
+from ark_sdk_python.models.common import ArkRetryPolicy
 from ark_sdk_python.services.ark_service import ArkService
 
 
 class ArkAPI:
-    def __init__(self, authenticators: List[ArkAuth], profile: Optional[ArkProfile] = None) -> None:
+    def __init__(
+        self,
+        authenticators: List[ArkAuth],
+        profile: Optional[ArkProfile] = None,
+        connection_pool: Optional[ArkConnectionPool] = None,
+        retry_policy: Optional[ArkRetryPolicy] = None,
+    ) -> None:
         self.__authenticators = authenticators
+        if not connection_pool and self.__authenticators:
+            connection_pool = self.__authenticators[0].connection_pool
+        self.__connection_pool = connection_pool or ArkConnectionPool()
+        for auth in self.__authenticators:
+            auth.connection_pool = self.__connection_pool
+            if retry_policy:
+                auth.retry_policy = retry_policy
         self.__lazy_loaded_services: Dict[str, ArkService] = {}
         self.__profile = profile or ArkProfileLoader.load_default_profile()
 
@@ -70,6 +85,16 @@ class ArkAPI:
             return self.__lazy_loaded_services[service_name]
         return self.__lazy_load_service(service_type)
 
+    @property
+    def connection_pool(self) -> ArkConnectionPool:
+        """
+        Gets the connection pool shared by all the services of the API
+
+        Returns:
+            ArkConnectionPool: _description_
+        """
+        return self.__connection_pool
+
     @property
     def profile(self) -> ArkProfile:
         """
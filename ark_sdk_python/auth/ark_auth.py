@@ -3,7 +3,8 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, cast
 from urllib.parse import urlparse
 
-from ark_sdk_python.common import ArkKeyring, get_logger
+from ark_sdk_python.auth.ark_token_refresher import ArkTokenRefresher
+from ark_sdk_python.common import ArkConnectionPool, ArkKeyring, get_logger
 from ark_sdk_python.common.ark_keyring import DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS
 from ark_sdk_python.models import ArkAuthException, ArkProfile, ArkProfileLoader
 from ark_sdk_python.models.auth import (
@@ -15,11 +16,20 @@ from ark_sdk_python.models.auth import (
     ArkToken,
     DirectArkAuthMethodSettings,
 )
+from ark_sdk_python.models.common import ArkRetryPolicy
 
 
 class ArkAuth(ABC):
-    def __init__(self, cache_authentication: bool = True, token: Optional[ArkToken] = None) -> None:
+    def __init__(
+        self,
+        cache_authentication: bool = True,
+        token: Optional[ArkToken] = None,
+        connection_pool: Optional[ArkConnectionPool] = None,
+        retry_policy: Optional[ArkRetryPolicy] = None,
+    ) -> None:
         self._logger = get_logger(app=self.__class__.__name__)
+        self._connection_pool = connection_pool or ArkConnectionPool()
+        self._retry_policy = retry_policy or ArkRetryPolicy()
         self._cache_authentication = cache_authentication
         self._cache_keyring = None
         if cache_authentication:
@@ -27,6 +37,7 @@ class ArkAuth(ABC):
         self.__token = token
         self._active_profile = None
         self._active_auth_profile = None
+        self._token_refresher = ArkTokenRefresher(self)
 
     def _resolve_cache_postfix(self, auth_profile: ArkAuthProfile) -> str:
         """
@@ -63,15 +74,19 @@ class ArkAuth(ABC):
         """
 
     @abstractmethod
-    def _perform_refresh_authentication(self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken) -> ArkToken:
+    def _perform_refresh_authentication(
+        self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken, interactive: bool = True
+    ) -> ArkToken:
         """
         Tries to perform refresh authentication on the existing token
         This is not promised for all authenticators
+        Non interactive refreshes only use the existing refresh credentials, and fail instead of authenticating again
 
         Args:
             profile (ArkProfile): _description_
             auth_profile (ArkAuthProfile): _description_
             token (ArkToken): _description_
+            interactive (bool): _description_. Defaults to True.
 
         Returns:
             ArkToken: _description_
@@ -181,7 +196,11 @@ class ArkAuth(ABC):
         return False
 
     def load_authentication(
-        self, profile: Optional[ArkProfile] = None, refresh_auth: bool = False, grace_seconds: Optional[int] = None
+        self,
+        profile: Optional[ArkProfile] = None,
+        refresh_auth: bool = False,
+        grace_seconds: Optional[int] = None,
+        interactive: bool = True,
     ) -> Optional[ArkToken]:
         """
         Loads and returns the authentication token from the cache, if it exists.
@@ -191,6 +210,7 @@ class ArkAuth(ABC):
             profile (Optional[ArkProfile], optional): _description_. Defaults to None.
             refresh_auth (bool, optional): _description_. Defaults to False.
             grace_seconds (Optional[int], optional): try to refresh in case there is less than grace_seconds until expired. Defaults to None.
+            interactive (bool, optional): whether the refresh may authenticate again, possibly prompting for MFA. Defaults to True.
 
         Returns:
             Optional[ArkToken]: _description_
@@ -216,7 +236,7 @@ class ArkAuth(ABC):
                     self._logger.info('Token did not pass grace expiration, no need to refresh')
                 else:
                     self._logger.info('Trying to refresh token authentication')
-                    self.__token = self._perform_refresh_authentication(profile, auth_profile, self.__token)
+                    self.__token = self._perform_refresh_authentication(profile, auth_profile, self.__token, interactive)
                     if self.__token and self.__token.expires_in.replace(tzinfo=None) > datetime.now():
                         self._logger.info('Token refreshed')
                     if self.__token and self._cache_authentication and self._cache_keyring:
@@ -233,6 +253,44 @@ class ArkAuth(ABC):
     def token(self) -> Optional[ArkToken]:
         return self.__token
 
+    @property
+    def connection_pool(self) -> ArkConnectionPool:
+        """
+        Returns the connection pool shared by all the service clients created from this authenticator.
+
+        Returns:
+            ArkConnectionPool: _description_
+        """
+        return self._connection_pool
+
+    @connection_pool.setter
+    def connection_pool(self, connection_pool: ArkConnectionPool) -> None:
+        self._connection_pool = connection_pool
+
+    @property
+    def retry_policy(self) -> ArkRetryPolicy:
+        """
+        Returns the transport retry policy of the service clients created from this authenticator.
+
+        Returns:
+            ArkRetryPolicy: _description_
+        """
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, retry_policy: ArkRetryPolicy) -> None:
+        self._retry_policy = retry_policy
+
+    @property
+    def token_refresher(self) -> ArkTokenRefresher:
+        """
+        Returns the refresh coordinator of this authenticator, which refreshes the token once for all the service clients created from it.
+
+        Returns:
+            ArkTokenRefresher: _description_
+        """
+        return self._token_refresher
+
     @property
     def active_profile(self) -> Optional[ArkProfile]:
         return self._active_profile
@@ -1,7 +1,5 @@
 # pylint: disable=unused-argument
-import codecs
 import os
-import pickle
 from datetime import datetime, timedelta
 from typing import Final, List, Optional, Tuple, cast
 
@@ -10,6 +8,7 @@ from overrides import overrides
 from ark_sdk_python.auth.ark_auth import ArkAuth
 from ark_sdk_python.auth.identity.ark_identity import ArkIdentity
 from ark_sdk_python.auth.identity.ark_identity_service_user import ArkIdentityServiceUser
+from ark_sdk_python.common.ark_session_serializer import ArkSessionSerializer
 from ark_sdk_python.common.ark_system_config import ArkSystemConfig
 from ark_sdk_python.common.env import ROOT_DOMAIN, AwsEnv
 from ark_sdk_python.models import ArkProfile
@@ -67,13 +66,15 @@ class ArkISPAuth(ArkAuth):
                 auth_method=ArkAuthMethod.Identity,
                 expires_in=datetime.now() + timedelta(seconds=token_lifetime),
                 refresh_token=identity.session_details.refresh_token,
-                metadata={'env': env, 'cookies': codecs.encode(pickle.dumps(identity.session.cookies), 'base64').decode()},
+                metadata={'env': env, 'cookies': ArkSessionSerializer.serialize_cookies(identity.session.cookies)},
             )
         except Exception as ex:
             self._logger.exception(f'Failed to authenticate to identity security platform [{str(ex)}]')
             raise ArkAuthException from ex
 
-    def __perform_identity_refresh_authentication(self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken) -> ArkToken:
+    def __perform_identity_refresh_authentication(
+        self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken, interactive: bool
+    ) -> ArkToken:
         try:
             method_settings = cast(IdentityArkAuthMethodSettings, auth_profile.auth_method_settings)
             identity = ArkIdentity(
@@ -86,7 +87,10 @@ class ArkISPAuth(ArkAuth):
                 load_cache=True,
                 cache_profile=profile,
             )
-            identity.refresh_auth_identity(profile, method_settings.identity_mfa_interactive, False)
+            if not interactive and (not identity.session_details or not identity.session_details.token):
+                # Without a refresh token, refreshing would authenticate again and may prompt for MFA
+                raise ArkAuthException('No refresh token is available for a non interactive refresh')
+            identity.refresh_auth_identity(profile, interactive and method_settings.identity_mfa_interactive, False)
             env = AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
             found_env = list(filter(lambda e: ROOT_DOMAIN[e] in identity.identity_url, ROOT_DOMAIN.keys()))
             if found_env:
@@ -102,7 +106,7 @@ class ArkISPAuth(ArkAuth):
                 auth_method=ArkAuthMethod.Identity,
                 expires_in=datetime.now() + timedelta(seconds=token_lifetime),
                 refresh_token=identity.session_details.refresh_token,
-                metadata={'env': env, 'cookies': codecs.encode(pickle.dumps(identity.session.cookies), 'base64').decode()},
+                metadata={'env': env, 'cookies': ArkSessionSerializer.serialize_cookies(identity.session.cookies)},
             )
         except Exception as ex:
             raise ArkAuthException('Failed to authenticate to isp via identity') from ex
@@ -136,7 +140,7 @@ class ArkISPAuth(ArkAuth):
                 token_type=ArkTokenType.JWT,
                 auth_method=ArkAuthMethod.IdentityServiceUser,
                 expires_in=expires_in,
-                metadata={'env': env, 'cookies': codecs.encode(pickle.dumps(identity.session.cookies), 'base64').decode()},
+                metadata={'env': env, 'cookies': ArkSessionSerializer.serialize_cookies(identity.session.cookies)},
             )
         except Exception as ex:
             self._logger.exception(f'Failed to authenticate to identity security platform with service user [{str(ex)}]')
@@ -173,7 +177,9 @@ class ArkISPAuth(ArkAuth):
         raise ArkAuthException('Given auth method is not supported')
 
     @overrides
-    def _perform_refresh_authentication(self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken) -> ArkToken:
+    def _perform_refresh_authentication(
+        self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken, interactive: bool = True
+    ) -> ArkToken:
         """
         Refresh for isp tenant is supported only for identity
 
@@ -181,13 +187,14 @@ class ArkISPAuth(ArkAuth):
             profile (ArkProfile): _description_
             auth_profile (ArkAuthProfile): _description_
             token (ArkToken): _description_
+            interactive (bool): _description_. Defaults to True.
 
         Returns:
             ArkToken: _description_
         """
         self._logger.info('Performing refresh authentication to ISP')
         if auth_profile.auth_method in [ArkAuthMethod.Identity, ArkAuthMethod.Default]:
-            return self.__perform_identity_refresh_authentication(profile, auth_profile, token)
+            return self.__perform_identity_refresh_authentication(profile, auth_profile, token, interactive)
         return token
 
     @staticmethod
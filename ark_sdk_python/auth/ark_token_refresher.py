@@ -0,0 +1,175 @@
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Final, List, Optional
+
+from ark_sdk_python.common import get_logger
+from ark_sdk_python.common.ark_keyring import DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS
+from ark_sdk_python.common.ark_session_serializer import ArkSessionSerializer
+from ark_sdk_python.models.auth import ArkToken
+
+if TYPE_CHECKING:
+    from ark_sdk_python.auth.ark_auth import ArkAuth
+
+DEFAULT_REFRESH_DEBOUNCE_SECONDS: Final[float] = 5.0
+MIN_PROACTIVE_REFRESH_DELAY_SECONDS: Final[float] = 1.0
+
+
+class ArkTokenRefresher:
+    """
+    Coordinates the token refreshes of an authenticator and of all the service clients which were created from it.
+    Concurrent refresh requests, such as a burst of 401 responses on many threads, are collapsed into a single in flight refresh whose token
+    is shared by all the callers, and requests which arrive right after a refresh reuse its token instead of refreshing again.
+    Proactive refresh is opt in, and once enabled the token is also refreshed on a background timer shortly before it expires,
+    so long running processes do not hit the expiry at all.
+    Background refreshes are non interactive, they only use the existing refresh token and never authenticate again or prompt for MFA,
+    and a background refresh which fails is skipped, leaving the refresh to the next request of a client.
+    Every refreshed token and its cookies are pushed to all the registered clients.
+    """
+
+    def __init__(
+        self,
+        auth: 'ArkAuth',
+        grace_seconds: int = DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS,
+        debounce_seconds: float = DEFAULT_REFRESH_DEBOUNCE_SECONDS,
+        proactive: bool = False,
+    ) -> None:
+        self._logger = get_logger(app=self.__class__.__name__)
+        self.__auth_ref = weakref.ref(auth)
+        self.__grace_seconds = grace_seconds
+        self.__debounce_seconds = debounce_seconds
+        self.__proactive = proactive
+        self.__lock = threading.Lock()
+        self.__clients: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+        self.__in_flight: Optional[Future] = None
+        self.__last_token: Optional[ArkToken] = None
+        self.__last_refresh: float = 0.0
+        self.__timer: Optional[threading.Timer] = None
+
+    def __push_token(self, token: ArkToken, clients: List[Any]) -> None:
+        cookie_jar = ArkSessionSerializer.deserialize_cookies(token.metadata['cookies']) if 'cookies' in token.metadata else None
+        for client in clients:
+            client.update_token(token.token.get_secret_value())
+            client.update_cookies(cookie_jar=cookie_jar)
+
+    def __proactive_delay(self, token: Optional[ArkToken]) -> Optional[float]:
+        if not token or not token.expires_in:
+            return None
+        delay = (token.expires_in.replace(tzinfo=None) - datetime.now()).total_seconds() - self.__grace_seconds
+        if delay <= 0:
+            # The token cannot be refreshed ahead of its expiry, refreshes are left to the clients
+            return None
+        return max(delay, MIN_PROACTIVE_REFRESH_DELAY_SECONDS)
+
+    def __schedule(self, delay: Optional[float]) -> None:
+        with self.__lock:
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.__proactive or delay is None or len(self.__clients) == 0:
+                return
+            self.__timer = threading.Timer(delay, self.__proactive_refresh)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+    def __proactive_refresh(self) -> None:
+        with self.__lock:
+            self.__timer = None
+            if len(self.__clients) == 0:
+                return
+        try:
+            self.__refresh(force=True, interactive=False)
+        except Exception as ex:
+            self._logger.warning(f'Proactive token refresh failed, the token is left to be refreshed on demand [{str(ex)}]')
+
+    def register_client(self, client: Any) -> None:
+        """
+        Registers a service client to receive every refreshed token.
+        Clients are held weakly, and are dropped once they are garbage collected.
+        When proactive refresh is enabled, the first registered client starts its timer.
+
+        Args:
+            client (Any): _description_
+        """
+        with self.__lock:
+            self.__clients.add(client)
+            scheduled = self.__timer is not None
+        if not scheduled:
+            auth = self.__auth_ref()
+            self.__schedule(self.__proactive_delay(auth.token if auth else None))
+
+    def unregister_client(self, client: Any) -> None:
+        """
+        Stops pushing refreshed tokens to the given service client.
+
+        Args:
+            client (Any): _description_
+        """
+        with self.__lock:
+            self.__clients.discard(client)
+
+    def refresh(self, force: bool = False) -> Optional[ArkToken]:
+        """
+        Refreshes the token of the authenticator and pushes it to all the registered clients.
+        Only one refresh is performed at a time, concurrent callers wait for the in flight refresh and share its token.
+        Unless forced, a refresh which completed within the debounce window is reused as is.
+
+        Args:
+            force (bool): _description_. Defaults to False.
+
+        Returns:
+            Optional[ArkToken]: _description_
+        """
+        return self.__refresh(force, interactive=True)
+
+    def __refresh(self, force: bool, interactive: bool) -> Optional[ArkToken]:
+        with self.__lock:
+            future = self.__in_flight
+            owner = future is None
+            if owner:
+                if not force and self.__last_token and time.monotonic() - self.__last_refresh < self.__debounce_seconds:
+                    return self.__last_token
+                future = Future()
+                self.__in_flight = future
+        if not owner:
+            return future.result()
+        auth = self.__auth_ref()
+        try:
+            grace_seconds = self.__grace_seconds + MIN_PROACTIVE_REFRESH_DELAY_SECONDS if force else None
+            token = auth.load_authentication(auth.active_profile, True, grace_seconds, interactive) if auth else None
+        except BaseException as ex:
+            with self.__lock:
+                self.__in_flight = None
+            future.set_exception(ex)
+            raise
+        with self.__lock:
+            self.__in_flight = None
+            self.__last_token = token
+            self.__last_refresh = time.monotonic()
+            clients = list(self.__clients)
+        if token:
+            self.__push_token(token, clients)
+        future.set_result(token)
+        self.__schedule(self.__proactive_delay(token))
+        return token
+
+    def enable_proactive_refresh(self) -> None:
+        """
+        Enables refreshing the token on a background timer ahead of its expiry, using only its refresh token.
+        """
+        self.__proactive = True
+        auth = self.__auth_ref()
+        self.__schedule(self.__proactive_delay(auth.token if auth else None))
+
+    def disable_proactive_refresh(self) -> None:
+        """
+        Disables and cancels the background refresh timer, tokens are then only refreshed on demand.
+        """
+        self.__proactive = False
+        self.__schedule(None)
+
+    @property
+    def is_proactive(self) -> bool:
+        return self.__proactive
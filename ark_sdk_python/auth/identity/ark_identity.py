@@ -1,4 +1,3 @@
-import codecs
 import json
 import logging
 import os
@@ -20,7 +19,7 @@ from requests.cookies import RequestsCookieJar
 
 from ark_sdk_python.args import ArkArgsFormatter, ArkInquirerRender
 from ark_sdk_python.auth.identity.ark_identity_fqdn_resolver import ArkIdentityFQDNResolver
-from ark_sdk_python.common import ArkKeyring, ArkSystemConfig, get_logger
+from ark_sdk_python.common import ArkKeyring, ArkSessionSerializer, ArkSystemConfig, get_logger
 from ark_sdk_python.common.ark_jwt_utils import ArkJWTUtils
 from ark_sdk_python.common.env import AwsEnv
 from ark_sdk_python.models import ArkException, ArkNonInteractiveException
@@ -121,14 +120,12 @@ class ArkIdentity:
             token = self.__keyring.load_token(profile, f'{self.__username}_identity')
             session = self.__keyring.load_token(profile, f'{self.__username}_identity_session')
             if token and session:
-                import dill as pickle
-
                 try:
                     self.__session_details = AdvanceAuthResult.model_validate_json(token.token.get_secret_value())
                 except ValidationError:
                     self.__session_details = IdpAuthStatusResult.model_validate_json(token.token.get_secret_value())
                 self.__session_exp = token.expires_in
-                self.__session = pickle.loads(codecs.decode(session.token.get_secret_value().encode(), "base64"))
+                self.__session = ArkSessionSerializer.deserialize_session(session.token.get_secret_value())
                 self.__session.verify = self.__verify
                 self.__identity_url = token.endpoint
                 return True
@@ -136,8 +133,6 @@ class ArkIdentity:
 
     def __save_cache(self, profile: Optional[ArkProfile] = None) -> None:
         if self.__keyring and profile and self.__session_details:
-            import dill as pickle
-
             delta = self.__session_details.token_lifetime or DEFAULT_TOKEN_LIFETIME_SECONDS
             self.__session_exp = datetime.now() + timedelta(seconds=delta)
             self.__keyring.save_token(
@@ -156,7 +151,7 @@ class ArkIdentity:
             self.__keyring.save_token(
                 profile,
                 ArkToken(
-                    token=codecs.encode(pickle.dumps(self.__session), 'base64').decode(),
+                    token=ArkSessionSerializer.serialize_session(self.__session),
                     username=self.__username,
                     endpoint=self.__identity_url,
                     token_type=ArkTokenType.Internal,
@@ -628,8 +623,9 @@ class ArkIdentity:
         self.__session = Session()
         self.__session.verify = self.__verify
         self.__session.headers.update(ArkIdentityFQDNResolver.default_headers())
-        decoded_token = ArkJWTUtils.get_unverified_claims(self.__session_details.token)
-        platform_tenant_id = decoded_token['tenant_id']
+        platform_tenant_id = ArkJWTUtils.get_claims(self.__session_details.token).tenant_id
+        if not platform_tenant_id:
+            raise ArkAuthException('Failed to retrieve tenant id from the token to refresh')
         refresh_cookies = {
             f'refreshToken-{platform_tenant_id}': self.__session_details.refresh_token,
             f'idToken-{platform_tenant_id}': self.__session_details.token,
@@ -648,10 +644,10 @@ class ArkIdentity:
             self.__session.cookies = saved_cookies
         self.__session_details.token = new_token
         self.__session_details.refresh_token = new_refresh_token
-        self.__session_details.token_lifetime = (
-            datetime.fromtimestamp(ArkJWTUtils.get_unverified_claims(new_token)['exp'])
-            - datetime.fromtimestamp(ArkJWTUtils.get_unverified_claims(new_token)['iat'])
-        ).seconds
+        new_token_claims = ArkJWTUtils.get_claims(new_token)
+        if not new_token_claims.exp or not new_token_claims.iat:
+            raise ArkAuthException('Failed to retrieve the lifetime of the refreshed token')
+        self.__session_details.token_lifetime = (new_token_claims.exp - new_token_claims.iat).seconds
         delta = self.__session_details.token_lifetime or DEFAULT_TOKEN_LIFETIME_SECONDS
         self.__session_exp = datetime.now() + timedelta(seconds=delta)
         if self.__cache_authentication:
@@ -6,6 +6,7 @@ from cachetools import LRUCache, cached
 from pydantic import ValidationError
 from requests import Session
 
+from ark_sdk_python.common.ark_discovery_cache import ArkDiscoveryCache
 from ark_sdk_python.common.ark_user_agent import user_agent
 from ark_sdk_python.common.env import IDENTITY_ENV_URLS, ROOT_DOMAIN, AwsEnv
 from ark_sdk_python.models import ArkException
@@ -32,6 +33,39 @@ class ArkIdentityFQDNResolver:
     def default_system_headers() -> Dict[str, str]:
         return {'X-IDAP-NATIVE-CLIENT': 'true', 'User-Agent': user_agent()}
 
+    @staticmethod
+    def __discover_tenant_fqdn_from_tenant_subdomain(tenant_subdomain: str, env: AwsEnv) -> str:
+        platform_discovery_url = f'https://{ArkIdentityFQDNResolver.__DISCOVERY_SERVICE_DOMAIN_NAME}.{ROOT_DOMAIN[env]}'
+        session = Session()
+        response = session.get(
+            f'{platform_discovery_url}/api/identity-endpoint/{tenant_subdomain}',
+            headers={'Content-Type': 'application/json'},
+            timeout=ArkIdentityFQDNResolver.__DISCOVERY_TIMEOUT,
+        )
+        try:
+            if response.status_code == HTTPStatus.OK:
+                parsed_response: IdentityEndpointResponse = IdentityEndpointResponse.model_validate_json(response.text)
+                return str(parsed_response.endpoint)
+        except (ValidationError, TypeError) as ex:
+            raise ArkException('Getting tenant FQDN failed from platform discovery to be parsed / validated') from ex
+        raise ArkException(f'Getting tenant FQDN failed from platform discovery [{response.status_code}] - [{response.text}]')
+
+    @staticmethod
+    def __discover_tenant_fqdn_from_tenant_suffix(tenant_suffix: str, identity_env_url: str) -> str:
+        session = Session()
+        response = session.post(
+            f'https://pod0.{identity_env_url}/Security/StartAuthentication',
+            json={'User': tenant_suffix, 'Version': '1.0', 'PlatformTokenResponse': True, 'MfaRequestor': 'DeviceAgent'},
+            headers={'Content-Type': 'application/json', 'X-IDAP-NATIVE-CLIENT': 'true'},
+        )
+        try:
+            parsed_res: TenantFqdnResponse = TenantFqdnResponse.model_validate_json(response.text)
+        except (ValidationError, TypeError) as ex:
+            raise ArkException('Getting tenant FQDN failed to be parsed / validated') from ex
+        if not parsed_res.result.pod_fqdn.startswith('https://'):
+            parsed_res.result.pod_fqdn = f'https://{parsed_res.result.pod_fqdn}'
+        return parsed_res.result.pod_fqdn
+
     @staticmethod
     @cached(cache=LRUCache(maxsize=1024))
     def resolve_tenant_fqdn_from_tenant_subdomain(tenant_subdomain: str, env: AwsEnv) -> str:
@@ -49,20 +83,10 @@ class ArkIdentityFQDNResolver:
         Returns:
             str: The tenant's resolved FQDN
         """
-        platform_discovery_url = f'https://{ArkIdentityFQDNResolver.__DISCOVERY_SERVICE_DOMAIN_NAME}.{ROOT_DOMAIN[env]}'
-        session = Session()
-        response = session.get(
-            f'{platform_discovery_url}/api/identity-endpoint/{tenant_subdomain}',
-            headers={'Content-Type': 'application/json'},
-            timeout=ArkIdentityFQDNResolver.__DISCOVERY_TIMEOUT,
+        return ArkDiscoveryCache.instance().get_or_resolve(
+            f'tenant-fqdn/subdomain/{env.value}/{tenant_subdomain}',
+            lambda: ArkIdentityFQDNResolver.__discover_tenant_fqdn_from_tenant_subdomain(tenant_subdomain, env),
         )
-        try:
-            if response.status_code == HTTPStatus.OK:
-                parsed_response: IdentityEndpointResponse = IdentityEndpointResponse.model_validate_json(response.text)
-                return str(parsed_response.endpoint)
-        except (ValidationError, TypeError) as ex:
-            raise ArkException('Getting tenant FQDN failed from platform discovery to be parsed / validated') from ex
-        raise ArkException(f'Getting tenant FQDN failed from platform discovery [{response.status_code}] - [{response.text}]')
 
     @staticmethod
     @cached(cache=LRUCache(maxsize=1024))
@@ -84,16 +108,7 @@ class ArkIdentityFQDNResolver:
         identity_env_url = identity_env_url or (
             IDENTITY_ENV_URLS[AwsEnv(os.getenv('DEPLOY_ENV', None))] if os.getenv('DEPLOY_ENV', None) else IDENTITY_ENV_URLS[AwsEnv.PROD]
         )
-        session = Session()
-        response = session.post(
-            f'https://pod0.{identity_env_url}/Security/StartAuthentication',
-            json={'User': tenant_suffix, 'Version': '1.0', 'PlatformTokenResponse': True, 'MfaRequestor': 'DeviceAgent'},
-            headers={'Content-Type': 'application/json', 'X-IDAP-NATIVE-CLIENT': 'true'},
+        return ArkDiscoveryCache.instance().get_or_resolve(
+            f'tenant-fqdn/suffix/{identity_env_url}/{tenant_suffix}',
+            lambda: ArkIdentityFQDNResolver.__discover_tenant_fqdn_from_tenant_suffix(tenant_suffix, identity_env_url),
         )
-        try:
-            parsed_res: TenantFqdnResponse = TenantFqdnResponse.model_validate_json(response.text)
-        except (ValidationError, TypeError) as ex:
-            raise ArkException('Getting tenant FQDN failed to be parsed / validated') from ex
-        if not parsed_res.result.pod_fqdn.startswith('https://'):
-            parsed_res.result.pod_fqdn = f'https://{parsed_res.result.pod_fqdn}'
-        return parsed_res.result.pod_fqdn
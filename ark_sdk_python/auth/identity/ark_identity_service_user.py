@@ -145,8 +145,7 @@ class ArkIdentityServiceUser:
         self.__session_token = parsed_query['id_token'][0]
         self.__session.headers.update({'Authorization': f'Bearer {self.__session_token}', **ArkIdentityFQDNResolver.default_headers()})
         try:
-            decoded_token = ArkJWTUtils.get_unverified_claims(self.__session_token)
-            self.__session_exp = datetime.fromtimestamp(decoded_token['exp'])
+            self.__session_exp = ArkJWTUtils.get_claims(self.__session_token).exp or datetime.now() + timedelta(hours=4)
         except Exception:
             self.__session_exp = datetime.now() + timedelta(hours=4)
         self.__logger.info(
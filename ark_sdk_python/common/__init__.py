@@ -1,26 +1,45 @@
 from ark_sdk_python.common.ark_async_client import ArkAsyncClient
+from ark_sdk_python.common.ark_async_http_client import ArkAsyncHttpClient
 from ark_sdk_python.common.ark_async_request import ArkAsyncRequest
 from ark_sdk_python.common.ark_client import ArkClient
+from ark_sdk_python.common.ark_concurrent_pager import ArkConcurrentPager
+from ark_sdk_python.common.ark_connection_pool import ArkConnectionPool
+from ark_sdk_python.common.ark_discovery_cache import ArkDiscoveryCache
 from ark_sdk_python.common.ark_ip_utils import is_ip_address
-from ark_sdk_python.common.ark_jwt_utils import ArkJWTUtils
+from ark_sdk_python.common.ark_jwt_utils import ArkJWTClaims, ArkJWTUtils
 from ark_sdk_python.common.ark_keyring import ArkKeyring
 from ark_sdk_python.common.ark_logger import ArkLogger, get_logger
 from ark_sdk_python.common.ark_page import ArkPage
 from ark_sdk_python.common.ark_pollers import ArkPollers
 from ark_sdk_python.common.ark_random_utils import ArkRandomUtils
+from ark_sdk_python.common.ark_rate_limiter import ArkRateLimiter, ArkRateLimiters, ArkTokenBucketRateLimiter
+from ark_sdk_python.common.ark_request_retrier import ArkRequestRetrier
+from ark_sdk_python.common.ark_session_serializer import ArkSessionSerializer
+from ark_sdk_python.common.ark_stats_aggregator import ArkStatsAggregator
 from ark_sdk_python.common.ark_system_config import ArkSystemConfig
 
 __all__ = [
     'ArkClient',
+    'ArkConnectionPool',
+    'ArkConcurrentPager',
+    'ArkDiscoveryCache',
     'ArkAsyncRequest',
     'ArkKeyring',
     'ArkAsyncClient',
+    'ArkAsyncHttpClient',
     'ArkPage',
     'ArkRandomUtils',
+    'ArkRequestRetrier',
+    'ArkSessionSerializer',
+    'ArkRateLimiter',
+    'ArkRateLimiters',
+    'ArkTokenBucketRateLimiter',
     'ArkPollers',
+    'ArkStatsAggregator',
     'ArkSystemConfig',
     'ArkLogger',
     'ArkJWTUtils',
+    'ArkJWTClaims',
     'get_logger',
     'is_ip_address',
 ]
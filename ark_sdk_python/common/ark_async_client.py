@@ -3,8 +3,10 @@ from typing import Callable, List, Optional, Tuple, Type
 
 from ark_sdk_python.common.ark_async_request import ArkAsyncRequest
 from ark_sdk_python.common.ark_client import ArkClient
+from ark_sdk_python.common.ark_connection_pool import ArkConnectionPool
+from ark_sdk_python.common.ark_rate_limiter import ArkRateLimiter
 from ark_sdk_python.models.ark_model import ArkPollableModel
-from ark_sdk_python.models.common import ArkAsyncRequestSettings
+from ark_sdk_python.models.common import ArkAsyncRequestSettings, ArkRetryPolicy
 from ark_sdk_python.models.common.ark_async_task import ArkAsyncTask
 
 
@@ -21,6 +23,9 @@ class ArkAsyncClient(ABC, ArkClient):
         refresh_connection_callback: Optional[Callable[['ArkClient'], None]] = None,
         origin_verify: Optional[str] = None,
         origin_verify_header_name: str = 'x-origin-verify',
+        connection_pool: Optional[ArkConnectionPool] = None,
+        retry_policy: Optional[ArkRetryPolicy] = None,
+        rate_limiter: Optional[ArkRateLimiter] = None,
     ) -> None:
         super().__init__(
             base_url,
@@ -32,6 +37,9 @@ class ArkAsyncClient(ABC, ArkClient):
             refresh_connection_callback=refresh_connection_callback,
             origin_verify=origin_verify,
             origin_verify_header_name=origin_verify_header_name,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
         )
         self.__async_request_settings = async_request_settings or ArkAsyncRequestSettings()
 
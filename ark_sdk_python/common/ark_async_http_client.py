@@ -0,0 +1,286 @@
+import asyncio
+import inspect
+import ssl
+from base64 import b64decode
+from http import HTTPStatus
+from typing import Awaitable, Callable, Dict, Final, List, Optional, Tuple, Union
+
+import httpx
+from requests.cookies import RequestsCookieJar
+
+from ark_sdk_python.common.ark_client import join_url
+from ark_sdk_python.common.ark_rate_limiter import ArkRateLimiter
+from ark_sdk_python.common.ark_request_retrier import ArkRequestRetrier
+from ark_sdk_python.common.ark_system_config import ArkSystemConfig
+from ark_sdk_python.common.ark_user_agent import user_agent
+from ark_sdk_python.models.common import ArkConnectionPoolSettings, ArkRetryPolicy
+
+ArkAsyncRefreshCallback = Callable[['ArkAsyncHttpClient'], Union[None, Awaitable[None]]]
+
+
+class ArkAsyncHttpClient:
+    """
+    Native asyncio http client, the awaitable counterpart of `ArkClient`.
+    Requests are sent over a pooled httpx transport, so thousands of requests can run concurrently on a single event loop.
+    When a request is unauthorized and a refresh callback is given, the callback is invoked (and awaited if it is a coroutine)
+    and the request is retried, same as `ArkClient`. Throttled and failed requests are retried by the retry policy, same as `ArkClient`.
+
+    Connection pool settings are mapped to the httpx limits, where `pool_maxsize` is the amount of keep alive connections to hold,
+    and when `pool_block` is set, it is also the maximum amount of concurrent connections.
+    """
+
+    __DEFAULT_REFRESH_RETRY_COUNT: Final[int] = 5
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        token_type: str = 'Bearer',
+        cookies: Optional[List] = None,
+        auth_header_name: str = 'Authorization',
+        auth: Optional[Tuple[str, str]] = None,
+        cookie_jar: Optional[RequestsCookieJar] = None,
+        verify: Optional[Union[str, bool]] = None,
+        refresh_connection_callback: Optional[ArkAsyncRefreshCallback] = None,
+        origin_verify: Optional[str] = None,
+        origin_verify_header_name: str = 'x-origin-verify',
+        connection_pool_settings: Optional[ArkConnectionPoolSettings] = None,
+        timeout: Optional[float] = None,
+        retry_policy: Optional[ArkRetryPolicy] = None,
+        rate_limiter: Optional[ArkRateLimiter] = None,
+    ) -> None:
+        self.__base_url = base_url
+        self.__token = token
+        self.__token_type = token_type
+        self.__auth_header_name = auth_header_name
+        self.__refresh_connection_callback = refresh_connection_callback
+        self.__connection_pool_settings = connection_pool_settings or ArkConnectionPoolSettings()
+        self.__retrier = ArkRequestRetrier(retry_policy)
+        self.__rate_limiter = rate_limiter
+        if self.__base_url and not self.__base_url.startswith('https://'):
+            self.__base_url = f'https://{self.__base_url}'
+        if verify is None:
+            if ArkSystemConfig.trusted_certificate() is not None:
+                verify = ArkSystemConfig.trusted_certificate()
+            else:
+                verify = ArkSystemConfig.is_verifiying_certificates()
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+        self.__session = httpx.AsyncClient(
+            verify=verify,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.__connection_pool_settings.pool_maxsize if self.__connection_pool_settings.pool_block else None,
+                max_keepalive_connections=(
+                    self.__connection_pool_settings.pool_maxsize if self.__connection_pool_settings.keep_alive else 0
+                ),
+            ),
+        )
+        if auth:
+            self.__session.auth = auth
+        self.update_token(token)
+        self.update_cookies(cookies, cookie_jar)
+        self.__session.headers['User-Agent'] = user_agent()
+        if origin_verify is not None and len(origin_verify) > 0:
+            self.__session.headers[origin_verify_header_name] = origin_verify
+
+    async def __aenter__(self) -> 'ArkAsyncHttpClient':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    @property
+    def base_url(self) -> Optional[str]:
+        return self.__base_url
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        return self.__session
+
+    @property
+    def retry_policy(self) -> ArkRetryPolicy:
+        return self.__retrier.policy
+
+    @property
+    def rate_limiter(self) -> Optional[ArkRateLimiter]:
+        return self.__rate_limiter
+
+    @property
+    def session_token(self) -> Optional[str]:
+        return self.__token
+
+    @property
+    def refresh_connection_callback(self) -> Optional[ArkAsyncRefreshCallback]:
+        return self.__refresh_connection_callback
+
+    def add_header(self, key: str, value: str) -> None:
+        self.__session.headers.update({key: value})
+
+    def add_headers(self, headers: Dict[str, str]) -> None:
+        self.__session.headers.update(headers)
+
+    def add_cookie(self, key: str, value: str) -> None:
+        self.__session.cookies.set(key, value)
+
+    async def __send_with_retry_policy(self, method: str, url: str, **kwargs) -> httpx.Response:
+        retryable_method = self.__retrier.is_retryable_method(method)
+        max_retries = self.__retrier.policy.max_retries
+        retries = 0
+        delay = 0.0
+        while True:
+            if self.__rate_limiter:
+                await self.__rate_limiter.async_acquire()
+            try:
+                response: httpx.Response = await self.__session.request(method, url, **kwargs)
+            except (httpx.NetworkError, httpx.RemoteProtocolError):
+                if (
+                    not retryable_method
+                    or not self.__retrier.policy.retry_on_connection_errors
+                    or retries >= max_retries
+                    or not self.__retrier.acquire_retry()
+                ):
+                    raise
+                delay = self.__retrier.next_delay(delay)
+            else:
+                if not self.__retrier.is_retryable_status(response.status_code):
+                    if retries == 0:
+                        self.__retrier.record_success()
+                    return response
+                if not retryable_method or retries >= max_retries or not self.__retrier.acquire_retry():
+                    return response
+                delay = self.__retrier.next_delay(delay, response.headers.get('Retry-After'))
+            retries += 1
+            await asyncio.sleep(delay)
+
+    async def __generic_http_method_request_with_retry(self, method: str, route: str, refresh_retry_count: int, **kwargs) -> httpx.Response:
+        url = join_url(self.__base_url, route)
+        if method in ['get', 'delete', 'options'] and 'data' in kwargs and not kwargs['data']:
+            # httpx does not allow a body on those methods, requests ignores an empty one
+            kwargs.pop('data')
+        response: httpx.Response = await self.__send_with_retry_policy(method.upper(), url, **kwargs)
+        if response.status_code == HTTPStatus.UNAUTHORIZED and self.__refresh_connection_callback and refresh_retry_count > 0:
+            result = self.__refresh_connection_callback(self)
+            if inspect.isawaitable(result):
+                await result
+            return await self.__generic_http_method_request_with_retry(method, route, refresh_retry_count - 1, **kwargs)
+        return response
+
+    async def generic_http_method_request(self, method: str, route: str, **kwargs) -> httpx.Response:
+        return await self.__generic_http_method_request_with_retry(
+            method=method,
+            route=route,
+            refresh_retry_count=ArkAsyncHttpClient.__DEFAULT_REFRESH_RETRY_COUNT,
+            **kwargs,
+        )
+
+    async def get(self, route: str, **kwargs) -> httpx.Response:
+        """
+        Performs an awaitable GET request with the session details and given headers and tokens.
+
+        Args:
+            route (str): _description_
+
+        Returns:
+            httpx.Response: _description_
+        """
+        return await self.generic_http_method_request('get', route, **kwargs)
+
+    async def post(self, route: str, **kwargs) -> httpx.Response:
+        """
+        Performs an awaitable POST request with the session details and given headers and tokens.
+
+        Args:
+            route (str): _description_
+
+        Returns:
+            httpx.Response: _description_
+        """
+        return await self.generic_http_method_request('post', route, **kwargs)
+
+    async def put(self, route: str, **kwargs) -> httpx.Response:
+        """
+        Performs an awaitable PUT request with the session details and given headers and tokens.
+
+        Args:
+            route (str): _description_
+
+        Returns:
+            httpx.Response: _description_
+        """
+        return await self.generic_http_method_request('put', route, **kwargs)
+
+    async def delete(self, route: str, **kwargs) -> httpx.Response:
+        """
+        Performs an awaitable DELETE request with the session details and given headers and tokens.
+
+        Args:
+            route (str): _description_
+
+        Returns:
+            httpx.Response: _description_
+        """
+        return await self.generic_http_method_request('delete', route, **kwargs)
+
+    async def patch(self, route: str, **kwargs) -> httpx.Response:
+        """
+        Performs an awaitable PATCH request with the session details and given headers and tokens.
+
+        Args:
+            route (str): _description_
+
+        Returns:
+            httpx.Response: _description_
+        """
+        return await self.generic_http_method_request('patch', route, **kwargs)
+
+    async def options(self, route: str, **kwargs) -> httpx.Response:
+        """
+        Performs an awaitable OPTIONS request with the session details and given headers and tokens.
+
+        Args:
+            route (str): _description_
+
+        Returns:
+            httpx.Response: _description_
+        """
+        return await self.generic_http_method_request('options', route, **kwargs)
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying connections of the client.
+        """
+        await self.__session.aclose()
+
+    def update_token(self, token: Optional[str] = None) -> None:
+        """
+        Updates a session token.
+
+        Args:
+            token (Optional[str], optional): _description_. Defaults to None.
+        """
+        self.__token = token
+        if token:
+            if self.__token_type == 'Basic':
+                user, password = b64decode(token.encode('ascii')).decode('ascii').split(':')
+                self.__session.auth = (user, password)
+            else:
+                if len(self.__token_type) == 0:
+                    self.__session.headers.update({self.__auth_header_name: f'{self.__token}'})
+                else:
+                    self.__session.headers.update({self.__auth_header_name: f'{self.__token_type} {self.__token}'})
+
+    def update_cookies(self, cookies: Optional[List] = None, cookie_jar: Optional[RequestsCookieJar] = None) -> None:
+        """
+        Updates session cookies.
+
+        Args:
+            cookies (Optional[List], optional): _description_. Defaults to None.
+            cookie_jar (Optional[RequestsCookieJar], optional): _description_. Defaults to None.
+        """
+        if cookies:
+            for c in cookies:
+                self.__session.cookies.jar.set_cookie(c)
+        if cookie_jar:
+            for c in cookie_jar:
+                self.__session.cookies.jar.set_cookie(c)
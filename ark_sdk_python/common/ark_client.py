@@ -1,4 +1,5 @@
 import socket
+import time
 from base64 import b64decode
 from http import HTTPStatus
 from typing import Callable, Dict, Final, List, Optional, Tuple, Union
@@ -6,10 +7,15 @@ from typing import Callable, Dict, Final, List, Optional, Tuple, Union
 import requests.packages.urllib3.util.connection as urllib3_cn  # pylint: disable=import-error
 from requests import Response, Session
 from requests.cookies import RequestsCookieJar
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
+from ark_sdk_python.common.ark_connection_pool import ArkConnectionPool
+from ark_sdk_python.common.ark_rate_limiter import ArkRateLimiter
+from ark_sdk_python.common.ark_request_retrier import ArkRequestRetrier
 from ark_sdk_python.common.ark_system_config import ArkSystemConfig
 from ark_sdk_python.common.ark_user_agent import user_agent
 from ark_sdk_python.common.ark_version import __version__
+from ark_sdk_python.models.common import ArkRetryPolicy
 
 
 def allowed_gai_family():
@@ -19,6 +25,23 @@ def allowed_gai_family():
 urllib3_cn.allowed_gai_family = allowed_gai_family
 
 
+def join_url(base_url: Optional[str], route: str) -> str:
+    url = route
+    if base_url:
+        url = f'{base_url}'
+        if route and route != '':
+            base_end = base_url.endswith('/')
+            route_start = route.startswith('/')
+            if base_end ^ route_start:
+                url = f'{base_url}{route}'
+            else:
+                if base_end and route_start:
+                    url = f'{base_url}{route[1:]}'
+                else:
+                    url = f'{base_url}/{route}'
+    return url
+
+
 class ArkClient:
     __DEFAULT_REFRESH_RETRY_COUNT: Final[int] = 5
 
@@ -35,8 +58,16 @@ class ArkClient:
         refresh_connection_callback: Optional[Callable[['ArkClient'], None]] = None,
         origin_verify: Optional[str] = None,
         origin_verify_header_name: str = 'x-origin-verify',
+        connection_pool: Optional[ArkConnectionPool] = None,
+        retry_policy: Optional[ArkRetryPolicy] = None,
+        rate_limiter: Optional[ArkRateLimiter] = None,
     ) -> None:
         self.__session = Session()
+        self.__connection_pool = connection_pool or ArkConnectionPool()
+        self.__retrier = ArkRequestRetrier(retry_policy)
+        self.__rate_limiter = rate_limiter
+        self.__session.mount('https://', self.__connection_pool.adapter)
+        self.__session.mount('http://', self.__connection_pool.adapter)
         self.__base_url = base_url
         self.__token = token
         self.__token_type = token_type
@@ -66,6 +97,18 @@ class ArkClient:
     def session(self) -> Session:
         return self.__session
 
+    @property
+    def connection_pool(self) -> ArkConnectionPool:
+        return self.__connection_pool
+
+    @property
+    def retry_policy(self) -> ArkRetryPolicy:
+        return self.__retrier.policy
+
+    @property
+    def rate_limiter(self) -> Optional[ArkRateLimiter]:
+        return self.__rate_limiter
+
     @property
     def session_token(self) -> Optional[str]:
         return self.__token
@@ -83,22 +126,40 @@ class ArkClient:
     def add_cookie(self, key: str, value: str) -> None:
         self.__session.cookies[key] = value
 
-    def __generic_http_method_request_with_retry(self, method: str, route: str, refresh_retry_count: int, **kwargs) -> Response:
-        url = route
-        if self.__base_url:
-            url = f'{self.__base_url}'
-            if route and route != '':
-                base_end = self.__base_url.endswith('/')
-                route_start = route.startswith('/')
-                if base_end ^ route_start:
-                    url = f'{self.__base_url}{route}'
-                else:
-                    if base_end and route_start:
-                        url = f'{self.__base_url}{route[1:]}'
-                    else:
-                        url = f'{self.__base_url}/{route}'
+    def __send_with_retry_policy(self, method: str, url: str, **kwargs) -> Response:
         http_method = getattr(self.__session, method)
-        response: Response = http_method(url, **kwargs)
+        retryable_method = self.__retrier.is_retryable_method(method)
+        max_retries = self.__retrier.policy.max_retries
+        retries = 0
+        delay = 0.0
+        while True:
+            if self.__rate_limiter:
+                self.__rate_limiter.acquire()
+            try:
+                response: Response = http_method(url, **kwargs)
+            except RequestsConnectionError:
+                if (
+                    not retryable_method
+                    or not self.__retrier.policy.retry_on_connection_errors
+                    or retries >= max_retries
+                    or not self.__retrier.acquire_retry()
+                ):
+                    raise
+                delay = self.__retrier.next_delay(delay)
+            else:
+                if not self.__retrier.is_retryable_status(response.status_code):
+                    if retries == 0:
+                        self.__retrier.record_success()
+                    return response
+                if not retryable_method or retries >= max_retries or not self.__retrier.acquire_retry():
+                    return response
+                delay = self.__retrier.next_delay(delay, response.headers.get('Retry-After'))
+            retries += 1
+            time.sleep(delay)
+
+    def __generic_http_method_request_with_retry(self, method: str, route: str, refresh_retry_count: int, **kwargs) -> Response:
+        url = join_url(self.__base_url, route)
+        response: Response = self.__send_with_retry_policy(method, url, **kwargs)
         if response.status_code == HTTPStatus.UNAUTHORIZED and self.__refresh_connection_callback and refresh_retry_count > 0:
             self.__refresh_connection_callback(self)
             return self.__generic_http_method_request_with_retry(method, route, refresh_retry_count - 1, **kwargs)
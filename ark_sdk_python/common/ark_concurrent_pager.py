@@ -0,0 +1,222 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Iterable, Iterator, Optional, Set, Tuple, TypeVar, Union
+
+from ark_sdk_python.models import ArkException
+
+PageType = TypeVar('PageType')
+SourceType = TypeVar('SourceType')
+
+
+class ArkConcurrentPager:
+    @staticmethod
+    def fetch_pages(
+        fetch_page: Callable[[int], PageType],
+        offsets: Iterable[int],
+        max_workers: int,
+        ordered: bool = True,
+    ) -> Iterator[PageType]:
+        """
+        Fetches the pages of the given offsets concurrently with a bounded amount of workers.
+        At most `max_workers` pages are in flight at any point, so memory stays bounded even for huge listings.
+        When ordered, pages are yielded in the order of the offsets, otherwise as soon as they complete.
+        Any failure of a page fetch is raised to the consumer and the remaining fetches are cancelled.
+
+        Args:
+            fetch_page (Callable[[int], PageType]): Fetches and parses a single page by offset
+            offsets (Iterable[int]): The offsets of the pages to fetch
+            max_workers (int): Maximum amount of concurrent fetches
+            ordered (bool): Whether to yield pages by offset order or by completion order. Defaults to True.
+
+        Yields:
+            Iterator[PageType]: _description_
+        """
+        offsets_iter = iter(offsets)
+        max_workers = max(max_workers, 1)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            if ordered:
+                in_flight: Deque[Future] = deque()
+                for offset in offsets_iter:
+                    in_flight.append(executor.submit(fetch_page, offset))
+                    if len(in_flight) >= max_workers:
+                        break
+                while in_flight:
+                    page = in_flight.popleft().result()
+                    next_offset = next(offsets_iter, None)
+                    if next_offset is not None:
+                        in_flight.append(executor.submit(fetch_page, next_offset))
+                    yield page
+            else:
+                pending: Set[Future] = set()
+                for offset in offsets_iter:
+                    pending.add(executor.submit(fetch_page, offset))
+                    if len(pending) >= max_workers:
+                        break
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        next_offset = next(offsets_iter, None)
+                        if next_offset is not None:
+                            pending.add(executor.submit(fetch_page, next_offset))
+                    for future in done:
+                        yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def fetch_pages_by_total(
+        fetch_page: Callable[[int], Tuple[PageType, int]],
+        start_offset: int,
+        max_workers: int,
+        ordered: bool = True,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[PageType]:
+        """
+        Fetches the pages of an offset based listing whose responses report the total count of items.
+        The first page is fetched on its own, which reveals the total count and the page size used by the server,
+        and the offsets of all the remaining pages are then fetched concurrently with `fetch_pages`.
+        The page size is the amount of items in the first page.
+
+        Args:
+            fetch_page (Callable[[int], Tuple[PageType, int]]): Fetches and parses a single page by offset, returning it with the total count
+            start_offset (int): The offset of the first page
+            max_workers (int): Maximum amount of concurrent fetches
+            ordered (bool): Whether to yield pages by offset order or by completion order. Defaults to True.
+            max_pages (Optional[int]): Maximum amount of pages to fetch, more pages than that raise an error. Defaults to None.
+
+        Raises:
+            ArkException: _description_
+
+        Yields:
+            Iterator[PageType]: _description_
+        """
+        first_page, total_count = fetch_page(start_offset)
+        yield first_page
+        page_size = len(first_page)
+        if page_size <= 0:
+            return
+        offsets = range(start_offset + page_size, total_count, page_size)
+        exceeds_max_pages = max_pages is not None and len(offsets) + 1 > max_pages
+        if exceeds_max_pages:
+            offsets = offsets[: max(max_pages - 1, 0)]
+        yield from ArkConcurrentPager.fetch_pages(
+            fetch_page=lambda offset: fetch_page(offset)[0],
+            offsets=offsets,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
+        if exceeds_max_pages:
+            raise ArkException(f'Reached maximum number of pages [{max_pages}] for listing')
+
+    @staticmethod
+    async def fetch_pages_async(
+        fetch_page: Callable[[int], Awaitable[PageType]],
+        offsets: Iterable[int],
+        max_concurrency: int,
+    ) -> AsyncIterator[PageType]:
+        """
+        Awaitable counterpart of `fetch_pages`, fetching the pages of the given offsets as tasks on the running event loop.
+        At most `max_concurrency` pages are in flight at any point, and pages are yielded in the order of the offsets.
+        Any failure of a page fetch is raised to the consumer and the remaining fetches are cancelled.
+
+        Args:
+            fetch_page (Callable[[int], Awaitable[PageType]]): Fetches and parses a single page by offset
+            offsets (Iterable[int]): The offsets of the pages to fetch
+            max_concurrency (int): Maximum amount of concurrent fetches
+
+        Yields:
+            AsyncIterator[PageType]: _description_
+        """
+        offsets_iter = iter(offsets)
+        max_concurrency = max(max_concurrency, 1)
+        in_flight: Deque[asyncio.Task] = deque()
+        try:
+            for offset in offsets_iter:
+                in_flight.append(asyncio.ensure_future(fetch_page(offset)))
+                if len(in_flight) >= max_concurrency:
+                    break
+            while in_flight:
+                page = await in_flight.popleft()
+                next_offset = next(offsets_iter, None)
+                if next_offset is not None:
+                    in_flight.append(asyncio.ensure_future(fetch_page(next_offset)))
+                yield page
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    @staticmethod
+    async def stream_pages_async(
+        fetch_pages: Callable[[SourceType], AsyncIterator[PageType]],
+        sources: Union[Iterable[SourceType], AsyncIterable[SourceType]],
+        max_concurrency: int,
+    ) -> AsyncIterator[PageType]:
+        """
+        Fans out a paged listing per source, such as the activities of every session, as tasks on the running event loop.
+        Sources may be an async iterable which is itself being listed, and every source is fetched as soon as it arrives,
+        while at most `max_concurrency` sources are fetched at any point.
+        Pages are yielded as soon as any of the sources fetches them, in completion order.
+        Any failure of a source or of a page fetch is raised to the consumer and the remaining fetches are cancelled.
+
+        Args:
+            fetch_pages (Callable[[SourceType], AsyncIterator[PageType]]): Fetches the pages of a single source
+            sources (Union[Iterable[SourceType], AsyncIterable[SourceType]]): The sources to fetch the pages of
+            max_concurrency (int): Maximum amount of sources fetched concurrently
+
+        Yields:
+            AsyncIterator[PageType]: _description_
+        """
+        max_concurrency = max(max_concurrency, 1)
+        # Bounded, so sources are not fetched much faster than the pages are consumed
+        results: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency)
+        slots = asyncio.Semaphore(max_concurrency)
+        workers: Set[asyncio.Task] = set()
+        end_of_pages = object()
+
+        async def fetch_source(source: SourceType) -> None:
+            try:
+                async for page in fetch_pages(source):
+                    await results.put((page, None))
+            except Exception as ex:
+                await results.put((None, ex))
+            finally:
+                slots.release()
+
+        async def start_worker(source: SourceType) -> None:
+            await slots.acquire()
+            worker = asyncio.ensure_future(fetch_source(source))
+            workers.add(worker)
+            worker.add_done_callback(workers.discard)
+
+        async def fan_out() -> None:
+            try:
+                if isinstance(sources, AsyncIterable):
+                    async for source in sources:
+                        await start_worker(source)
+                else:
+                    for source in sources:
+                        await start_worker(source)
+                await asyncio.gather(*workers)
+            except Exception as ex:
+                await results.put((None, ex))
+                return
+            await results.put((end_of_pages, None))
+
+        producer = asyncio.ensure_future(fan_out())
+        try:
+            while True:
+                page, error = await results.get()
+                if error is not None:
+                    raise error
+                if page is end_of_pages:
+                    break
+                yield page
+        finally:
+            tasks = [producer, *workers]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
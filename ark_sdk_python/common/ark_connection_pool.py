@@ -0,0 +1,121 @@
+import socket
+import threading
+from functools import partial
+from typing import Any, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ark_sdk_python.models.common import ArkConnectionPoolSettings, ArkConnectionPoolStats
+
+
+class _ArkConnectionCounter:
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__new_connections = 0
+        self.__reused_connections = 0
+
+    def count(self, conn: Any) -> None:
+        with self.__lock:
+            if getattr(conn, 'sock', None) is None:
+                self.__new_connections += 1
+            else:
+                self.__reused_connections += 1
+
+    def stats(self) -> ArkConnectionPoolStats:
+        with self.__lock:
+            return ArkConnectionPoolStats(new_connections=self.__new_connections, reused_connections=self.__reused_connections)
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__new_connections = 0
+            self.__reused_connections = 0
+
+
+class _ArkCountingHTTPConnectionPool(HTTPConnectionPool):
+    def __init__(self, *args, counter: _ArkConnectionCounter, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__counter = counter
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)
+        self.__counter.count(conn)
+        return conn
+
+
+class _ArkCountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def __init__(self, *args, counter: _ArkConnectionCounter, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__counter = counter
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)
+        self.__counter.count(conn)
+        return conn
+
+
+class _ArkPooledHTTPAdapter(HTTPAdapter):
+    def __init__(self, settings: ArkConnectionPoolSettings, counter: _ArkConnectionCounter) -> None:
+        self.__settings = settings
+        self.__counter = counter
+        super().__init__(
+            pool_connections=settings.pool_connections,
+            pool_maxsize=settings.pool_maxsize,
+            pool_block=settings.pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs) -> None:
+        if self.__settings.keep_alive:
+            pool_kwargs['socket_options'] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': partial(_ArkCountingHTTPConnectionPool, counter=self.__counter),
+            'https': partial(_ArkCountingHTTPSConnectionPool, counter=self.__counter),
+        }
+
+    def add_headers(self, request, **kwargs) -> None:
+        if not self.__settings.keep_alive:
+            request.headers['Connection'] = 'close'
+
+
+class ArkConnectionPool:
+    """
+    Pooled http transport which can be shared between multiple clients.
+    Connections are pooled per host, so every client talking to the same tenant host reuses the same connections.
+    """
+
+    def __init__(self, settings: Optional[ArkConnectionPoolSettings] = None) -> None:
+        self.__settings = settings or ArkConnectionPoolSettings()
+        self.__counter = _ArkConnectionCounter()
+        self.__adapter = _ArkPooledHTTPAdapter(self.__settings, self.__counter)
+
+    @property
+    def settings(self) -> ArkConnectionPoolSettings:
+        return self.__settings
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        return self.__adapter
+
+    @property
+    def stats(self) -> ArkConnectionPoolStats:
+        """
+        Returns the counters of new and reused connections for all requests made through the pool.
+
+        Returns:
+            ArkConnectionPoolStats: _description_
+        """
+        return self.__counter.stats()
+
+    def reset_stats(self) -> None:
+        """
+        Resets the connection counters.
+        """
+        self.__counter.reset()
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        self.__adapter.close()
@@ -0,0 +1,172 @@
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Final, Optional, Set
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+DEFAULT_DISCOVERY_CACHE_FOLDER: Final[str] = f'.ark_cache{os.sep}discovery'
+ARK_DISCOVERY_CACHE_FOLDER_ENV_VAR: Final[str] = 'ARK_DISCOVERY_CACHE_FOLDER'
+ARK_DISABLE_DISCOVERY_CACHE_ENV_VAR: Final[str] = 'ARK_DISABLE_DISCOVERY_CACHE'
+DEFAULT_DISCOVERY_CACHE_TTL_SECONDS: Final[int] = 24 * 60 * 60
+DEFAULT_DISCOVERY_CACHE_STALE_TTL_SECONDS: Final[int] = 7 * 24 * 60 * 60
+DISCOVERY_CACHE_ENTRY_FILE_SUFFIX: Final[str] = '.json'
+
+
+class ArkDiscoveryCache:
+    """
+    Persistent TTL cache of discovery results (tenant FQDNs and such), shared by all the processes of the user.
+    Entries younger than the TTL are served as is. Entries older than the TTL but younger than the stale TTL are served immediately
+    and revalidated in the background, so only the first process ever pays the discovery round trip.
+    Every entry is stored in its own file, which is replaced atomically on every write,
+    so concurrent readers never see a partially written entry and processes which resolve different keys never overwrite each other.
+    """
+
+    __INSTANCE_LOCK: Final[threading.Lock] = threading.Lock()
+    __INSTANCE: Optional['ArkDiscoveryCache'] = None
+
+    def __init__(
+        self,
+        cache_folder: Optional[str] = None,
+        ttl_seconds: int = DEFAULT_DISCOVERY_CACHE_TTL_SECONDS,
+        stale_ttl_seconds: int = DEFAULT_DISCOVERY_CACHE_STALE_TTL_SECONDS,
+    ) -> None:
+        self.__logger = get_logger(app=self.__class__.__name__)
+        self.__cache_folder = cache_folder or os.environ.get(
+            ARK_DISCOVERY_CACHE_FOLDER_ENV_VAR, os.path.join(os.path.expanduser('~'), DEFAULT_DISCOVERY_CACHE_FOLDER)
+        )
+        self.__ttl_seconds = ttl_seconds
+        self.__stale_ttl_seconds = max(stale_ttl_seconds, ttl_seconds)
+        self.__lock = threading.Lock()
+        self.__revalidating: Set[str] = set()
+
+    @staticmethod
+    def instance() -> 'ArkDiscoveryCache':
+        """
+        Returns the process wide discovery cache.
+
+        Returns:
+            ArkDiscoveryCache: _description_
+        """
+        with ArkDiscoveryCache.__INSTANCE_LOCK:
+            if not ArkDiscoveryCache.__INSTANCE:
+                ArkDiscoveryCache.__INSTANCE = ArkDiscoveryCache()
+            return ArkDiscoveryCache.__INSTANCE
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.environ.get(ARK_DISABLE_DISCOVERY_CACHE_ENV_VAR, 'false').lower() not in ['true', '1']
+
+    def entry_file_path(self, key: str) -> str:
+        """
+        Returns the path of the file which holds the entry of the given key.
+
+        Args:
+            key (str): _description_
+
+        Returns:
+            str: _description_
+        """
+        return os.path.join(self.__cache_folder, f'{hashlib.sha256(key.encode()).hexdigest()}{DISCOVERY_CACHE_ENTRY_FILE_SUFFIX}')
+
+    def __read_entry(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self.entry_file_path(key), 'r', encoding='utf-8') as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get('key') == key else None
+
+    def __write_entry(self, key: str, value: str) -> None:
+        try:
+            os.makedirs(self.__cache_folder, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.__cache_folder, prefix='.discovery', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                    json.dump({'key': key, 'value': value, 'updated_at': time.time()}, fh)
+                os.replace(temp_path, self.entry_file_path(key))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as ex:
+            self.__logger.debug(f'Failed to persist discovery cache entry [{key}] [{str(ex)}]')
+
+    def __revalidate(self, key: str, resolver: Callable[[], str]) -> None:
+        try:
+            self.__write_entry(key, resolver())
+        except Exception as ex:
+            self.__logger.debug(f'Failed to revalidate discovery cache entry [{key}] [{str(ex)}]')
+        finally:
+            with self.__lock:
+                self.__revalidating.discard(key)
+
+    def __revalidate_in_background(self, key: str, resolver: Callable[[], str]) -> None:
+        with self.__lock:
+            if key in self.__revalidating:
+                return
+            self.__revalidating.add(key)
+        threading.Thread(target=self.__revalidate, args=(key, resolver), daemon=True).start()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached value of the key if it is still fresh.
+
+        Args:
+            key (str): _description_
+
+        Returns:
+            Optional[str]: _description_
+        """
+        entry = self.__read_entry(key)
+        if entry and time.time() - entry.get('updated_at', 0) < self.__ttl_seconds:
+            return entry.get('value')
+        return None
+
+    def get_or_resolve(self, key: str, resolver: Callable[[], str]) -> str:
+        """
+        Returns the cached value of the key, resolving and persisting it when missing or too old.
+        A stale value is returned as is and revalidated in the background.
+
+        Args:
+            key (str): Unique key of the discovered value, including its environment
+            resolver (Callable[[], str]): Resolves the value from the discovery service
+
+        Returns:
+            str: _description_
+        """
+        if not ArkDiscoveryCache.is_enabled():
+            return resolver()
+        entry = self.__read_entry(key)
+        if entry and 'value' in entry:
+            age = time.time() - entry.get('updated_at', 0)
+            if 0 <= age < self.__ttl_seconds:
+                return entry['value']
+            if 0 <= age < self.__stale_ttl_seconds:
+                self.__revalidate_in_background(key, resolver)
+                return entry['value']
+        value = resolver()
+        self.__write_entry(key, value)
+        return value
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Removes the given key from the cache, or the whole cache when no key is given.
+
+        Args:
+            key (Optional[str], optional): _description_. Defaults to None.
+        """
+        if key is None:
+            paths = glob.glob(os.path.join(glob.escape(self.__cache_folder), f'*{DISCOVERY_CACHE_ENTRY_FILE_SUFFIX}'))
+        else:
+            paths = [self.entry_file_path(key)]
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as ex:
+                self.__logger.debug(f'Failed to invalidate discovery cache entry [{path}] [{str(ex)}]')
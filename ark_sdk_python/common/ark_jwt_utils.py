@@ -1,22 +1,99 @@
-from typing import Any, Dict
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Optional
+
+from cachetools import LRUCache
+
+DEFAULT_CLAIMS_CACHE_MAX_SIZE: Final[int] = 128
+
+
+class ArkJWTClaims:
+    """
+    Read only view of the unverified claims of a token, with typed accessors of the claims which are commonly used.
+    """
+
+    def __init__(self, claims: Dict[str, Any]) -> None:
+        self.__claims: Mapping[str, Any] = MappingProxyType(claims)
+
+    @property
+    def claims(self) -> Mapping[str, Any]:
+        return self.__claims
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.__claims.get(name, default)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.__claims[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__claims
+
+    @property
+    def tenant_id(self) -> Optional[str]:
+        return self.__claims.get('tenant_id')
+
+    @property
+    def subdomain(self) -> Optional[str]:
+        return self.__claims.get('subdomain')
+
+    @property
+    def platform_domain(self) -> Optional[str]:
+        return self.__claims.get('platform_domain')
+
+    @property
+    def unique_name(self) -> Optional[str]:
+        return self.__claims.get('unique_name')
+
+    @property
+    def exp(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.__claims['exp']) if 'exp' in self.__claims else None
+
+    @property
+    def iat(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.__claims['iat']) if 'iat' in self.__claims else None
 
 
 class ArkJWTUtils:
+    __CLAIMS_LOCK: Final[threading.Lock] = threading.Lock()
+    __CLAIMS: Final[LRUCache] = LRUCache(maxsize=DEFAULT_CLAIMS_CACHE_MAX_SIZE)
+
     @staticmethod
-    def get_unverified_claims(token: str) -> Dict[str, Any]:
-        from jwt import decode as jwt_decode
+    def get_claims(token: str) -> ArkJWTClaims:
+        """
+        Returns the unverified claims of the given token.
+        Every token is decoded once, and its claims are kept in a bounded cache keyed by the token,
+        so refreshed tokens are decoded on their first use and the claims of old tokens are evicted over time.
 
-        return jwt_decode(
-            token,
-            options={'verify_signature': False},
-        )
+        Args:
+            token (str): _description_
+
+        Returns:
+            ArkJWTClaims: _description_
+        """
+        with ArkJWTUtils.__CLAIMS_LOCK:
+            claims = ArkJWTUtils.__CLAIMS.get(token)
+        if claims is None:
+            from jwt import decode as jwt_decode
+
+            claims = ArkJWTClaims(
+                jwt_decode(
+                    token,
+                    options={'verify_signature': False},
+                )
+            )
+            with ArkJWTUtils.__CLAIMS_LOCK:
+                ArkJWTUtils.__CLAIMS[token] = claims
+        return claims
+
+    @staticmethod
+    def get_unverified_claims(token: str) -> Dict[str, Any]:
+        return dict(ArkJWTUtils.get_claims(token).claims)
 
     @staticmethod
     def get_subdomain_from_token(token: str) -> str:
-        claims = ArkJWTUtils.get_unverified_claims(token)
-        return claims.get('subdomain', '')
+        return ArkJWTUtils.get_claims(token).subdomain or ''
 
     @staticmethod
     def get_platform_domain_from_token(token: str) -> str:
-        claims = ArkJWTUtils.get_unverified_claims(token)
-        return claims.get('platform_domain', '')
+        return ArkJWTUtils.get_claims(token).platform_domain or ''
@@ -3,10 +3,14 @@ import hashlib
 import json
 import os
 import socket
+import sqlite3
+import stat
 import sys
+import threading
+from contextlib import closing
 from datetime import datetime, timedelta
 from platform import uname
-from typing import Dict, Final, Optional
+from typing import Any, Dict, Final, Optional, Tuple
 
 from ark_sdk_python.common.ark_logger import get_logger
 from ark_sdk_python.models import ArkProfile
@@ -19,6 +23,8 @@ ARK_BASIC_KEYRING_OVERRIDE_ENV_VAR: Final[str] = 'ARK_BASIC_KEYRING'
 DBUS_SESSION_ENV_VAR: Final[str] = 'DBUS_SESSION_BUS_ADDRESS'
 DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS: Final[int] = 60
 MAX_KEYRING_RECORD_TIME_HOURS: Final[int] = 12
+INDEXED_KEYRING_DB_FILE_NAME: Final[str] = 'keyring.db'
+INDEXED_KEYRING_LOCK_TIMEOUT_SECONDS: Final[float] = 30.0
 
 
 class BasicKeyring:
@@ -124,7 +130,162 @@ class BasicKeyring:
         self.__update_mac()
 
 
+class IndexedKeyring:
+    """
+    Keyring backed by an indexed sqlite store in the basic keyring folder.
+    Every entry is stored as its own record, keyed by service name and username, so lookups and updates only touch that record
+    instead of reading and rewriting the whole keyring.
+    Each record is encrypted with AES-GCM where the service name and username are bound as associated data,
+    so the GCM tag serves as a per entry integrity tag, and a tampered or swapped record fails only on its own.
+    Writes run in an immediate transaction, which holds the database write lock, so concurrent processes do not corrupt the store.
+    Entries of the previous `keyring` / `mac` file format are migrated on first use.
+    """
+
+    def __init__(self) -> None:
+        self.__basic_folder_path = os.path.join(os.path.expanduser('~'), DEFAULT_BASIC_KEYRING_FOLDER)
+        if ARK_BASIC_KEYRING_FOLDER_ENV_VAR in os.environ:
+            self.__basic_folder_path = os.environ[ARK_BASIC_KEYRING_FOLDER_ENV_VAR]
+        if not os.path.exists(self.__basic_folder_path):
+            os.makedirs(self.__basic_folder_path)
+        self.__db_file_path = os.path.join(self.__basic_folder_path, INDEXED_KEYRING_DB_FILE_NAME)
+        self.__legacy_keyring_file_path = os.path.join(self.__basic_folder_path, 'keyring')
+        self.__legacy_mac_file_path = os.path.join(self.__basic_folder_path, 'mac')
+        self.__create_db_file()
+        with closing(self.__connect()) as conn:
+            with conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS entries ('
+                    'service_name TEXT NOT NULL, username TEXT NOT NULL, nonce BLOB NOT NULL, ciphertext BLOB NOT NULL, tag BLOB NOT NULL, '
+                    'PRIMARY KEY (service_name, username))'
+                )
+            self.__migrate_legacy_keyring(conn)
+
+    @property
+    def db_file_path(self) -> str:
+        return self.__db_file_path
+
+    @staticmethod
+    def __secret() -> bytes:
+        from Crypto.Util.Padding import pad
+
+        return pad(socket.gethostname().encode(), BLOCK_SIZE)
+
+    @staticmethod
+    def __associated_data(service_name: str, username: str) -> bytes:
+        return json.dumps([service_name, username]).encode()
+
+    def __create_db_file(self) -> None:
+        # The file is created owner only before sqlite opens it, so it is never readable by others under the process umask
+        os.close(os.open(self.__db_file_path, os.O_CREAT | os.O_RDWR, 0o600))
+        if os.name != 'nt' and stat.S_IMODE(os.stat(self.__db_file_path).st_mode) != 0o600:
+            os.chmod(self.__db_file_path, 0o600)
+
+    def __connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.__db_file_path, timeout=INDEXED_KEYRING_LOCK_TIMEOUT_SECONDS, isolation_level=None)
+
+    def __encrypt(self, service_name: str, username: str, password: str) -> Tuple[bytes, bytes, bytes]:
+        from Crypto.Cipher import AES
+
+        cipher = AES.new(self.__secret(), AES.MODE_GCM)
+        cipher.update(self.__associated_data(service_name, username))
+        ciphertext, tag = cipher.encrypt_and_digest(password.encode())
+        return cipher.nonce, ciphertext, tag
+
+    def __decrypt(self, service_name: str, username: str, nonce: bytes, ciphertext: bytes, tag: bytes) -> str:
+        from Crypto.Cipher import AES
+
+        cipher = AES.new(self.__secret(), AES.MODE_GCM, nonce=nonce)
+        cipher.update(self.__associated_data(service_name, username))
+        try:
+            return cipher.decrypt_and_verify(ciphertext, tag).decode()
+        except ValueError as ex:
+            raise Exception(f'Keyring entry [{service_name}] of [{username}] is invalid') from ex
+
+    def __migrate_legacy_keyring(self, conn: sqlite3.Connection) -> None:
+        if not os.path.exists(self.__legacy_keyring_file_path):
+            return
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another process might have migrated the legacy keyring while we waited for the lock
+            if os.path.exists(self.__legacy_keyring_file_path):
+                legacy_entries = self.__read_legacy_keyring()
+                for service_name, usernames in legacy_entries.items():
+                    for username, password in usernames.items():
+                        conn.execute(
+                            'INSERT OR IGNORE INTO entries (service_name, username, nonce, ciphertext, tag) VALUES (?, ?, ?, ?, ?)',
+                            (service_name, username, *self.__encrypt(service_name, username, password)),
+                        )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        for legacy_file_path in [self.__legacy_keyring_file_path, self.__legacy_mac_file_path]:
+            if os.path.exists(legacy_file_path):
+                os.unlink(legacy_file_path)
+
+    def __read_legacy_keyring(self) -> Dict[str, Dict[str, str]]:
+        from Crypto.Cipher import AES
+
+        if not os.path.exists(self.__legacy_mac_file_path):
+            return {}
+        with open(self.__legacy_mac_file_path, 'r', encoding='utf-8') as f:
+            mac = f.read()
+        with open(self.__legacy_keyring_file_path, 'r', encoding='utf-8') as f:
+            data = f.read()
+        if hashlib.sha256(data.encode()).hexdigest() != mac:
+            # An invalid legacy keyring cannot be trusted, its entries are dropped
+            return {}
+        entries: Dict[str, Dict[str, str]] = {}
+        for service_name, usernames in json.loads(data).items():
+            for username, encrypted in usernames.items():
+                jv = {k: base64.b64decode(encrypted[k]) for k in encrypted.keys()}
+                cipher = AES.new(self.__secret(), AES.MODE_GCM, nonce=jv['nonce'])
+                try:
+                    entries.setdefault(service_name, {})[username] = cipher.decrypt_and_verify(jv['ciphertext'], jv['tag']).decode()
+                except ValueError:
+                    continue
+        return entries
+
+    def set_password(self, service_name: str, username: str, password: str) -> None:
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries (service_name, username, nonce, ciphertext, tag) VALUES (?, ?, ?, ?, ?)',
+                (service_name, username, *self.__encrypt(service_name, username, password)),
+            )
+
+    def get_password(self, service_name: str, username: str) -> Optional[str]:
+        with closing(self.__connect()) as conn:
+            row = conn.execute(
+                'SELECT nonce, ciphertext, tag FROM entries WHERE service_name = ? AND username = ?', (service_name, username)
+            ).fetchone()
+        if not row:
+            return None
+        return self.__decrypt(service_name, username, *row)
+
+    def delete_password(self, service_name: str, username: str) -> None:
+        with closing(self.__connect()) as conn:
+            conn.execute('DELETE FROM entries WHERE service_name = ? AND username = ?', (service_name, username))
+
+    def clear(self) -> None:
+        """
+        Deletes all the entries of the keyring.
+        """
+        with closing(self.__connect()) as conn:
+            conn.execute('DELETE FROM entries')
+
+
 class ArkKeyring:
+    """
+    Token cache per service, backed by the OS keyring or by the indexed keyring as a fallback.
+    The keyring backend is resolved once per process, and tokens are kept in a process level cache in front of it,
+    written through on save and evicted on expiry, so repeated loads of the same token do not touch the disk or decrypt it again.
+    """
+
+    __KEYRINGS_LOCK: Final[threading.Lock] = threading.Lock()
+    __KEYRINGS: Dict[Tuple, Any] = {}
+    __TOKENS_LOCK: Final[threading.Lock] = threading.Lock()
+    __TOKENS: Dict[Tuple, ArkToken] = {}
+
     def __init__(self, service_name: str) -> None:
         self.__service_name = service_name
         self.__logger = get_logger(self.__class__.__name__)
@@ -136,6 +297,40 @@ class ArkKeyring:
 
     @staticmethod
     def get_keyring(enforce_basic_keyring: bool = False):
+        """
+        Returns the keyring backend to use, the backend is resolved once per process for the given environment.
+
+        Args:
+            enforce_basic_keyring (bool): _description_
+
+        Returns:
+            Any: _description_
+        """
+        keyring_key = (
+            enforce_basic_keyring,
+            os.environ.get(ARK_BASIC_KEYRING_OVERRIDE_ENV_VAR),
+            os.environ.get(ARK_BASIC_KEYRING_FOLDER_ENV_VAR),
+        )
+        kr = ArkKeyring.__KEYRINGS.get(keyring_key)
+        if kr is not None:
+            return kr
+        with ArkKeyring.__KEYRINGS_LOCK:
+            if keyring_key not in ArkKeyring.__KEYRINGS:
+                ArkKeyring.__KEYRINGS[keyring_key] = ArkKeyring.__resolve_keyring(enforce_basic_keyring)
+            return ArkKeyring.__KEYRINGS[keyring_key]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clears the process level cache of tokens and of the resolved keyring backends.
+        """
+        with ArkKeyring.__KEYRINGS_LOCK:
+            ArkKeyring.__KEYRINGS.clear()
+        with ArkKeyring.__TOKENS_LOCK:
+            ArkKeyring.__TOKENS.clear()
+
+    @staticmethod
+    def __resolve_keyring(enforce_basic_keyring: bool):
         try:
             from keyring.backends import SecretService, macOS  # pylint: disable=unused-import
             from keyrings.cryptfile.cryptfile import CryptFileKeyring  # pylint: disable=import-error
@@ -147,24 +342,47 @@ class ArkKeyring:
                 or ARK_BASIC_KEYRING_OVERRIDE_ENV_VAR in os.environ
                 or enforce_basic_keyring
             ):
-                return BasicKeyring()
+                return IndexedKeyring()
             if sys.platform == 'win32':
                 kr = CryptFileKeyring()
                 kr.keyring_key = socket.gethostname()
                 return kr
             elif sys.platform == 'darwin' or os.path.exists('/etc/redhat-release'):
-                return BasicKeyring()
+                return IndexedKeyring()
             else:
                 if DBUS_SESSION_ENV_VAR not in os.environ:
-                    return BasicKeyring()
+                    return IndexedKeyring()
                 return SecretService.Keyring()
         except Exception:
-            return BasicKeyring()
+            return IndexedKeyring()
+
+    def __token_key(self, profile: ArkProfile, postfix: str) -> Tuple:
+        return os.environ.get(ARK_BASIC_KEYRING_FOLDER_ENV_VAR), f'{self.__service_name}-{postfix}', profile.profile_name
+
+    def __evict_token(self, profile: ArkProfile, postfix: str) -> None:
+        with ArkKeyring.__TOKENS_LOCK:
+            ArkKeyring.__TOKENS.pop(self.__token_key(profile, postfix), None)
+
+    @staticmethod
+    def __token_expiry_reason(token: ArkToken) -> Optional[str]:
+        if token.expires_in:
+            if (
+                not token.refresh_token
+                and token.token_type != ArkTokenType.Internal
+                and (token.expires_in.replace(tzinfo=None) - timedelta(seconds=DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS)) < datetime.now()
+            ):
+                return 'Token is expired and no refresh token exists'
+            elif (
+                token.refresh_token
+                and (token.expires_in.replace(tzinfo=None) + timedelta(hours=MAX_KEYRING_RECORD_TIME_HOURS)) < datetime.now()
+            ):
+                return 'Token is expired and has been in the cache for too long before another usage'
+        return None
 
     def save_token(self, profile: ArkProfile, token: ArkToken, postfix: str, enforce_basic_keyring: bool = False) -> None:
         """
         Saves the specified token for a profile in the keyring.
-        The keyring is the OS-based implementation or, when unavailable, a fallback to BasicKeyring is used.
+        The keyring is the OS-based implementation or, when unavailable, a fallback to IndexedKeyring is used.
 
         Args:
             profile (ArkProfile): _description_
@@ -172,6 +390,8 @@ class ArkKeyring:
             postfix (str): _description_
             enforce_basic_keyring (bool): _description_
         """
+        with ArkKeyring.__TOKENS_LOCK:
+            ArkKeyring.__TOKENS[self.__token_key(profile, postfix)] = token.model_copy()
         try:
             self.__logger.info(f'Trying to save token [{self.__service_name}-{postfix}] of profile [{profile.profile_name}]')
             kr = self.get_keyring(enforce_basic_keyring)
@@ -179,15 +399,33 @@ class ArkKeyring:
             self.__logger.info('Saved token successfully')
         except Exception as ex:
             # Last resort fallback to basic keyring
-            if not isinstance(kr, BasicKeyring) or not enforce_basic_keyring:
+            if not isinstance(kr, IndexedKeyring) or not enforce_basic_keyring:
                 self.__logger.warning(f'Falling back to basic keyring as we failed to save token with keyring [{str(kr)}]')
                 return self.save_token(profile, token, postfix, True)
             self.__logger.warning(f'Failed to save token [{str(ex)}]')
 
+    def delete_token(self, profile: ArkProfile, postfix: str, enforce_basic_keyring: bool = False) -> None:
+        """
+        Deletes the token of a profile from the process level cache and from the keyring, if it exists.
+
+        Args:
+            profile (ArkProfile): _description_
+            postfix (str): _description_
+            enforce_basic_keyring (bool): _description_
+        """
+        self.__evict_token(profile, postfix)
+        try:
+            kr = self.get_keyring(enforce_basic_keyring)
+            if kr.get_password(f'{self.__service_name}-{postfix}', profile.profile_name):
+                self.__logger.info(f'Deleting token [{self.__service_name}-{postfix}] of profile [{profile.profile_name}]')
+                kr.delete_password(f'{self.__service_name}-{postfix}', profile.profile_name)
+        except Exception as ex:
+            self.__logger.warning(f'Failed to delete token [{str(ex)}]')
+
     def load_token(self, profile: ArkProfile, postfix: str, enforce_basic_keyring: bool = False) -> Optional[ArkToken]:
         """
-        Loads a token for a profile from the keyring.
-        The keyring is the OS-based implementation or, when unavailable, a fallback to BasicKeyring is used.
+        Loads a token for a profile from the process level cache, or from the keyring when not cached.
+        The keyring is the OS-based implementation or, when unavailable, a fallback to IndexedKeyring is used.
         When the token has expired and no refresh token exists, the token is deleted from the keyring and nothing is returned.
         When the token has expired but a refresh token exists, the token is only deleted if the max token time has passed (48 hours).
 
@@ -199,6 +437,13 @@ class ArkKeyring:
         Returns:
             Optional[ArkToken]: _description_
         """
+        with ArkKeyring.__TOKENS_LOCK:
+            cached_token = ArkKeyring.__TOKENS.get(self.__token_key(profile, postfix))
+        if cached_token:
+            if not self.__token_expiry_reason(cached_token):
+                return cached_token.model_copy()
+            # Let the keyring load below evict the expired token from the keyring as well
+            self.__evict_token(profile, postfix)
         try:
             kr = self.get_keyring(enforce_basic_keyring)
             self.__logger.info(f'Trying to load token [{self.__service_name}-{postfix}] of profile [{profile.profile_name}]')
@@ -207,30 +452,22 @@ class ArkKeyring:
                 self.__logger.info('No token found')
                 return None
             token = ArkToken.model_validate_json(token_val)
-            if token.expires_in:
-                if (
-                    not token.refresh_token
-                    and token.token_type != ArkTokenType.Internal
-                    and (token.expires_in.replace(tzinfo=None) - timedelta(seconds=DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS)) < datetime.now()
-                ):
-                    self.__logger.info('Token is expired and no refresh token exists')
-                    kr.delete_password(f'{self.__service_name}-{postfix}', profile.profile_name)
-                    return None
-                elif (
-                    token.refresh_token
-                    and (token.expires_in.replace(tzinfo=None) + timedelta(hours=MAX_KEYRING_RECORD_TIME_HOURS)) < datetime.now()
-                ):
-                    self.__logger.info('Token is expired and has been in the cache for too long before another usage')
-                    kr.delete_password(f'{self.__service_name}-{postfix}', profile.profile_name)
-                    return None
+            expiry_reason = self.__token_expiry_reason(token)
+            if expiry_reason:
+                self.__logger.info(expiry_reason)
+                kr.delete_password(f'{self.__service_name}-{postfix}', profile.profile_name)
+                return None
+            with ArkKeyring.__TOKENS_LOCK:
+                ArkKeyring.__TOKENS[self.__token_key(profile, postfix)] = token.model_copy()
             self.__logger.info('Loaded token successfully')
             return token
         except Exception as ex:
             # Last resort fallback to basic keyring
-            if not isinstance(kr, BasicKeyring) or not enforce_basic_keyring:
+            if not isinstance(kr, IndexedKeyring) or not enforce_basic_keyring:
                 self.__logger.warning(f'Falling back to basic keyring as we failed to load token with keyring [{str(kr)}]')
                 return self.load_token(profile, postfix, True)
             self.__logger.warning(f'Failed to load cached token [{str(ex)}]')
+            self.__evict_token(profile, postfix)
             try:
                 kr.delete_password(f'{self.__service_name}-{postfix}', profile.profile_name)
             except Exception as ex_deletion:
@@ -1,16 +1,172 @@
-from typing import Generic, List, TypeVar
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union, overload
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from ark_sdk_python.models import ArkTypeAdapters
 
 PageItem = TypeVar('PageItem')
 
 
 class ArkPage(Generic[PageItem]):
+    """
+    A page of listed items.
+    Pages are either created from their items, or lazily from the decoded rows of the response with `from_rows`.
+    Listing APIs which take a `lazy` option build their pages with `from_json_field`, so callers opt in to lazy pages per listing.
+    Lazy pages only hold the raw rows, and every item is validated on its first access,
+    so the memory of a page scales with the items that were actually touched.
+    Slices and projections of a page are views over the same rows and items, nothing is copied.
+    """
+
     def __init__(self, items: List[PageItem]) -> None:
-        self.__items = items
+        self.__items: List[Any] = items
+        self.__item_type: Optional[Type[PageItem]] = None
+        self.__materialized: Optional[List[Optional[PageItem]]] = None
+        self.__indices: range = range(len(items))
+        self.__fields: Optional[Tuple[Tuple[str, str], ...]] = None
+
+    @classmethod
+    def from_rows(cls, item_type: Type[PageItem], rows: List[Any]) -> 'ArkPage[PageItem]':
+        """
+        Creates a lazy page from the decoded rows of a response, items are validated as the given type only when accessed.
+
+        Args:
+            item_type (Type[PageItem]): _description_
+            rows (List[Any]): _description_
+
+        Returns:
+            ArkPage[PageItem]: _description_
+        """
+        page = cls(rows)
+        page.__item_type = item_type
+        page.__materialized = [None] * len(rows)
+        return page
+
+    @classmethod
+    def from_json_field(
+        cls, item_type: Type[PageItem], data: Union[str, bytes], field: str, lazy: bool = False
+    ) -> Tuple['ArkPage[PageItem]', Dict[str, Any]]:
+        """
+        Creates a page from the items field of the given raw JSON response, along with the rest of the fields of the response.
+        By default the items are validated up front in a single pass, lazy pages only decode the response and validate every item on its first access.
+        Items are never constructed without validation, as building the models in python is slower than validating the raw JSON.
+
+        Args:
+            item_type (Type[PageItem]): The type of the items
+            data (Union[str, bytes]): The raw JSON response
+            field (str): The name of the items field in the response
+            lazy (bool): _description_. Defaults to False.
+
+        Returns:
+            Tuple[ArkPage[PageItem], Dict[str, Any]]: The page and the rest of the fields of the response
+        """
+        if lazy:
+            result = from_json(data)
+            return cls.from_rows(item_type, result.pop(field)), result
+        items, result = ArkTypeAdapters.validate_json_field(List[item_type], data, field)
+        return cls(items), result
+
+    def __view(self, indices: range, fields: Optional[Tuple[Tuple[str, str], ...]]) -> 'ArkPage':
+        view = type(self).__new__(type(self))
+        view.__items = self.__items
+        view.__item_type = self.__item_type
+        view.__materialized = self.__materialized
+        view.__indices = indices
+        view.__fields = fields
+        return view
+
+    @property
+    def is_lazy(self) -> bool:
+        return self.__item_type is not None
+
+    def __item(self, index: int) -> Any:
+        if self.__materialized is None:
+            return self.__items[index]
+        item = self.__materialized[index]
+        if item is None:
+            item = ArkTypeAdapters.validate_python(self.__item_type, self.__items[index])
+            self.__materialized[index] = item
+        return item
+
+    def __project(self, index: int) -> Dict[str, Any]:
+        if self.__materialized is not None and self.__materialized[index] is None:
+            # Projected fields are read from the raw row without materializing the item,
+            # and are validated one by one so they hold the same values as the fields of a materialized item
+            row = self.__items[index]
+            if not isinstance(self.__item_type, type) or not issubclass(self.__item_type, BaseModel):
+                return {field: row.get(key) for field, key in self.__fields}
+            projected = self.__item_type.model_construct()
+            for field, key in self.__fields:
+                if field in self.__item_type.model_fields and key in row:
+                    self.__item_type.__pydantic_validator__.validate_assignment(projected, field, row[key])
+            return {field: getattr(projected, field, None) for field, _ in self.__fields}
+        item = self.__item(index)
+        if isinstance(item, dict):
+            return {field: item.get(field) for field, _ in self.__fields}
+        return {field: getattr(item, field, None) for field, _ in self.__fields}
 
     @property
     def items(self) -> List[PageItem]:
-        return self.__items
+        if self.__materialized is None and self.__fields is None and self.__indices == range(len(self.__items)):
+            return self.__items
+        return list(self)
+
+    @property
+    def rows(self) -> Optional[Sequence[Any]]:
+        """
+        The raw decoded rows of a lazy page, None for pages which were created from their items.
+
+        Returns:
+            Optional[Sequence[Any]]: _description_
+        """
+        if not self.is_lazy:
+            return None
+        if self.__indices == range(len(self.__items)):
+            return self.__items
+        return [self.__items[i] for i in self.__indices]
+
+    def project(self, *fields: str) -> 'ArkPage[Dict[str, Any]]':
+        """
+        Returns a view of the page whose items are dicts of only the given fields of each item.
+        On lazy pages, only the given fields are validated from the raw rows and the items are not materialized,
+        so the projected values are the same whether or not an item was accessed before.
+
+        Returns:
+            ArkPage[Dict[str, Any]]: _description_
+        """
+        model_fields = {}
+        if isinstance(self.__item_type, type) and issubclass(self.__item_type, BaseModel):
+            model_fields = self.__item_type.model_fields
+        keys = tuple((field, (model_fields[field].alias or field) if field in model_fields else field) for field in fields)
+        return self.__view(self.__indices, keys)
+
+    def to_json(self) -> bytes:
+        """
+        Serializes the page items to a JSON array.
+        Lazy pages are serialized from their raw rows as is, without materializing the items.
+
+        Returns:
+            bytes: _description_
+        """
+        if self.is_lazy and self.__fields is None:
+            return to_json(self.rows)
+        return to_json(self.items, by_alias=True)
+
+    def __len__(self) -> int:
+        return len(self.__indices)
+
+    @overload
+    def __getitem__(self, index: int) -> PageItem: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'ArkPage[PageItem]': ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[PageItem, 'ArkPage[PageItem]']:
+        if isinstance(index, slice):
+            return self.__view(self.__indices[index], self.__fields)
+        real_index = self.__indices[index]
+        return self.__project(real_index) if self.__fields is not None else self.__item(real_index)
 
-    def __iter__(self):
-        for item in self.__items:
-            yield item
+    def __iter__(self) -> Iterator[PageItem]:
+        for index in self.__indices:
+            yield self.__project(index) if self.__fields is not None else self.__item(index)
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Union
+
+from ark_sdk_python.models.common import ArkRateLimitSettings
+
+
+class ArkRateLimiter(ABC):
+    """
+    Client side rate limiter, every request of a client holding the limiter first acquires a permit from it.
+    """
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """
+        Reserves a permit for a single request.
+
+        Returns:
+            float: Amount of seconds to wait before the request may be sent
+        """
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self) -> None:
+        """
+        Waits on the event loop until a request may be sent.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ArkTokenBucketRateLimiter(ArkRateLimiter):
+    """
+    Thread safe token bucket, refilled at a steady rate of `requests_per_second` up to `burst` tokens.
+    Permits are reserved in order, so waiting callers are released at the sustained rate instead of all at once.
+    A burst of 1 makes it behave as a leaky bucket, spacing every request evenly.
+    """
+
+    def __init__(self, settings: ArkRateLimitSettings) -> None:
+        self.__settings = settings
+        self.__lock = threading.Lock()
+        self.__tokens = float(settings.burst)
+        self.__last_refill = time.monotonic()
+
+    @property
+    def settings(self) -> ArkRateLimitSettings:
+        return self.__settings
+
+    def reserve(self) -> float:
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(
+                float(self.__settings.burst), self.__tokens + (now - self.__last_refill) * self.__settings.requests_per_second
+            )
+            self.__last_refill = now
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.__settings.requests_per_second
+
+
+class ArkRateLimiters:
+    """
+    Process wide registry of rate limiters per service name (e.g. `pcloud-accounts`, `sm`, `cmgr`).
+    All the clients of a service share the same limiter across threads, limiters must be configured before the services are created.
+    """
+
+    _LOCK = threading.Lock()
+    _LIMITERS: Dict[str, ArkRateLimiter] = {}
+    _DEFAULT_LIMITER: Optional[ArkRateLimiter] = None
+
+    @staticmethod
+    def __as_limiter(limiter: Union[ArkRateLimiter, ArkRateLimitSettings]) -> ArkRateLimiter:
+        if isinstance(limiter, ArkRateLimitSettings):
+            return ArkTokenBucketRateLimiter(limiter)
+        return limiter
+
+    @staticmethod
+    def configure(service_name: str, limiter: Union[ArkRateLimiter, ArkRateLimitSettings]) -> None:
+        with ArkRateLimiters._LOCK:
+            ArkRateLimiters._LIMITERS[service_name] = ArkRateLimiters.__as_limiter(limiter)
+
+    @staticmethod
+    def configure_default(limiter: Optional[Union[ArkRateLimiter, ArkRateLimitSettings]]) -> None:
+        with ArkRateLimiters._LOCK:
+            ArkRateLimiters._DEFAULT_LIMITER = ArkRateLimiters.__as_limiter(limiter) if limiter else None
+
+    @staticmethod
+    def limiter_for(service_name: str) -> Optional[ArkRateLimiter]:
+        with ArkRateLimiters._LOCK:
+            return ArkRateLimiters._LIMITERS.get(service_name, ArkRateLimiters._DEFAULT_LIMITER)
+
+    @staticmethod
+    def reset() -> None:
+        with ArkRateLimiters._LOCK:
+            ArkRateLimiters._LIMITERS.clear()
+            ArkRateLimiters._DEFAULT_LIMITER = None
@@ -0,0 +1,97 @@
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from ark_sdk_python.models.common import ArkRetryPolicy
+
+
+class ArkRequestRetrier:
+    """
+    Decides whether and when a failed request is retried, according to a retry policy.
+    Delays use decorrelated jitter exponential backoff, unless the server asked for a specific delay with a Retry-After header.
+    Retries are limited by a retry budget, so once a service is throttling, the client stops amplifying the load with more retries.
+    """
+
+    def __init__(self, policy: Optional[ArkRetryPolicy] = None) -> None:
+        self.__policy = policy or ArkRetryPolicy()
+        self.__retry_methods = {m.upper() for m in self.__policy.retry_methods}
+        self.__retry_statuses = set(self.__policy.retry_statuses)
+        self.__lock = threading.Lock()
+        self.__budget = self.__policy.retry_budget
+
+    @property
+    def policy(self) -> ArkRetryPolicy:
+        return self.__policy
+
+    @property
+    def budget(self) -> float:
+        with self.__lock:
+            return self.__budget
+
+    def is_retryable_method(self, method: str) -> bool:
+        return method.upper() in self.__retry_methods
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.__retry_statuses
+
+    def acquire_retry(self) -> bool:
+        """
+        Consumes a retry token from the budget.
+
+        Returns:
+            bool: Whether the retry is allowed
+        """
+        with self.__lock:
+            if self.__budget < 1:
+                return False
+            self.__budget -= 1
+            return True
+
+    def record_success(self) -> None:
+        """
+        Refills the budget after a request which succeeded without retries.
+        """
+        with self.__lock:
+            self.__budget = min(self.__policy.retry_budget, self.__budget + self.__policy.retry_budget_refill)
+
+    def next_delay(self, previous_delay: float, retry_after: Optional[str] = None) -> float:
+        """
+        Calculates the delay before the next retry.
+
+        Args:
+            previous_delay (float): The previous delay, or 0 for the first retry
+            retry_after (Optional[str]): The Retry-After header of the response, if any
+
+        Returns:
+            float: _description_
+        """
+        if retry_after and self.__policy.respect_retry_after:
+            delay = ArkRequestRetrier.parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.__policy.max_retry_after)
+        base_delay = self.__policy.base_delay
+        return min(self.__policy.max_delay, random.uniform(base_delay, max(base_delay, previous_delay * 3)))
+
+    @staticmethod
+    def parse_retry_after(retry_after: str) -> Optional[float]:
+        """
+        Parses a Retry-After header value, which is either an amount of seconds or an http date.
+
+        Args:
+            retry_after (str): _description_
+
+        Returns:
+            Optional[float]: The delay in seconds, or None if the value is invalid
+        """
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,134 @@
+import codecs
+import json
+import pickle
+from http.cookiejar import Cookie
+from typing import Any, Dict, Final, List
+
+from requests import Session
+from requests.cookies import RequestsCookieJar, create_cookie
+
+ARK_SESSION_STATE_VERSION: Final[int] = 1
+
+
+class ArkSessionSerializer:
+    """
+    Compact and versioned serialization of the state of an http session which matters between invocations, its cookies and headers.
+    The state is serialized as a small JSON document, which is fast to save and load,
+    unlike pickling the whole session with its adapters, pools and hooks.
+    Entries which were persisted by older versions as base64 encoded pickles are still loaded, and are saved in the compact form on their next save.
+    """
+
+    @staticmethod
+    def __is_legacy(data: str) -> bool:
+        return not data.lstrip().startswith('{')
+
+    @staticmethod
+    def __load_legacy_cookies(data: str) -> Any:
+        return pickle.loads(codecs.decode(data.encode(), 'base64'))
+
+    @staticmethod
+    def __load_legacy_session(data: str) -> Session:
+        # Older versions pickled sessions with dill, which is only required to load such entries
+        import dill
+
+        return dill.loads(codecs.decode(data.encode(), 'base64'))
+
+    @staticmethod
+    def __cookie_to_dict(cookie: Cookie) -> Dict[str, Any]:
+        cookie_dict = {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path}
+        if cookie.secure:
+            cookie_dict['secure'] = True
+        if cookie.expires is not None:
+            cookie_dict['expires'] = cookie.expires
+        if cookie.port is not None:
+            cookie_dict['port'] = cookie.port
+        rest = getattr(cookie, '_rest', None)
+        if rest:
+            cookie_dict['rest'] = rest
+        return cookie_dict
+
+    @staticmethod
+    def __cookies_to_list(cookie_jar: RequestsCookieJar) -> List[Dict[str, Any]]:
+        return [ArkSessionSerializer.__cookie_to_dict(cookie) for cookie in cookie_jar]
+
+    @staticmethod
+    def __cookies_from_list(cookies: List[Dict[str, Any]]) -> RequestsCookieJar:
+        cookie_jar = RequestsCookieJar()
+        for cookie in cookies:
+            cookie_jar.set_cookie(create_cookie(**cookie))
+        return cookie_jar
+
+    @staticmethod
+    def serialize_cookies(cookie_jar: RequestsCookieJar) -> str:
+        """
+        Serializes the given cookie jar to its compact form.
+
+        Args:
+            cookie_jar (RequestsCookieJar): _description_
+
+        Returns:
+            str: _description_
+        """
+        return json.dumps(
+            {'version': ARK_SESSION_STATE_VERSION, 'cookies': ArkSessionSerializer.__cookies_to_list(cookie_jar)}, separators=(',', ':')
+        )
+
+    @staticmethod
+    def deserialize_cookies(data: str) -> RequestsCookieJar:
+        """
+        Deserializes a cookie jar from its compact form, or from a legacy pickled cookie jar.
+
+        Args:
+            data (str): _description_
+
+        Returns:
+            RequestsCookieJar: _description_
+        """
+        if ArkSessionSerializer.__is_legacy(data):
+            return ArkSessionSerializer.__load_legacy_cookies(data)
+        return ArkSessionSerializer.__cookies_from_list(json.loads(data).get('cookies', []))
+
+    @staticmethod
+    def serialize_session(session: Session) -> str:
+        """
+        Serializes the cookies and headers of the given session to their compact form.
+
+        Args:
+            session (Session): _description_
+
+        Returns:
+            str: _description_
+        """
+        return json.dumps(
+            {
+                'version': ARK_SESSION_STATE_VERSION,
+                'cookies': ArkSessionSerializer.__cookies_to_list(session.cookies),
+                'headers': dict(session.headers),
+            },
+            separators=(',', ':'),
+        )
+
+    @staticmethod
+    def deserialize_session(data: str) -> Session:
+        """
+        Deserializes a new session with the cookies and headers of the given compact form, or of a legacy pickled session.
+
+        Args:
+            data (str): _description_
+
+        Returns:
+            Session: _description_
+        """
+        if ArkSessionSerializer.__is_legacy(data):
+            legacy_session = ArkSessionSerializer.__load_legacy_session(data)
+            state = {
+                'cookies': ArkSessionSerializer.__cookies_to_list(legacy_session.cookies),
+                'headers': dict(legacy_session.headers),
+            }
+        else:
+            state = json.loads(data)
+        session = Session()
+        session.headers.clear()
+        session.headers.update(state.get('headers', {}))
+        session.cookies = ArkSessionSerializer.__cookies_from_list(state.get('cookies', []))
+        return session
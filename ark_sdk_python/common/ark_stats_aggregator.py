@@ -0,0 +1,204 @@
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Tuple, TypeVar
+
+ItemType = TypeVar('ItemType')
+
+
+class ArkStatsAggregator(Generic[ItemType]):
+    """
+    Single pass, streaming aggregator used to calculate the stats of listed items.
+    Items are consumed one by one (or page by page) and only the counters per key are kept in memory,
+    so the full item list never has to be materialized.
+
+    Example:
+        >>> aggregator = ArkStatsAggregator().count_by('platform', lambda a: a.platform_id)
+        >>> aggregator.consume_pages(service.list_accounts())
+        >>> aggregator.count, aggregator.counts('platform')
+    """
+
+    def __init__(self) -> None:
+        self.__count: int = 0
+        self.__group_bys: Dict[str, Tuple[Callable[[ItemType], Any], bool, bool]] = {}
+        self.__predicates: Dict[str, Callable[[ItemType], bool]] = {}
+        self.__mappings: Dict[str, Tuple[Callable[[ItemType], Hashable], Callable[[ItemType], Any]]] = {}
+        self.__counters: Dict[str, Counter] = {}
+        self.__totals: Dict[str, int] = {}
+        self.__values: Dict[str, Dict[Hashable, Any]] = {}
+        self.__collectors: Dict[str, Tuple[Callable[[ItemType], Hashable], Callable[[ItemType], Any]]] = {}
+        self.__collected: Dict[str, Dict[Hashable, List[Any]]] = {}
+
+    def count_by(self, name: str, key: Callable[[ItemType], Hashable], skip_empty: bool = False) -> 'ArkStatsAggregator[ItemType]':
+        """
+        Registers a group by counter, counting the items per the key returned for each item.
+
+        Args:
+            name (str): Name of the counter
+            key (Callable[[ItemType], Hashable]): Returns the key to group the item by
+            skip_empty (bool): Whether to skip items with an empty key. Defaults to False.
+
+        Returns:
+            ArkStatsAggregator[ItemType]: _description_
+        """
+        self.__group_bys[name] = (key, skip_empty, False)
+        self.__counters[name] = Counter()
+        return self
+
+    def count_by_each(self, name: str, keys: Callable[[ItemType], Iterable[Hashable]]) -> 'ArkStatsAggregator[ItemType]':
+        """
+        Registers a group by counter for items which belong to multiple keys, each key is counted once per item occurrence.
+
+        Args:
+            name (str): Name of the counter
+            keys (Callable[[ItemType], Iterable[Hashable]]): Returns the keys to group the item by
+
+        Returns:
+            ArkStatsAggregator[ItemType]: _description_
+        """
+        self.__group_bys[name] = (keys, False, True)
+        self.__counters[name] = Counter()
+        return self
+
+    def count_if(self, name: str, predicate: Callable[[ItemType], bool]) -> 'ArkStatsAggregator[ItemType]':
+        """
+        Registers a counter of the items matching the predicate.
+
+        Args:
+            name (str): Name of the counter
+            predicate (Callable[[ItemType], bool]): _description_
+
+        Returns:
+            ArkStatsAggregator[ItemType]: _description_
+        """
+        self.__predicates[name] = predicate
+        self.__totals[name] = 0
+        return self
+
+    def map_by(self, name: str, key: Callable[[ItemType], Hashable], value: Callable[[ItemType], Any]) -> 'ArkStatsAggregator[ItemType]':
+        """
+        Registers a per item mapping of key to value, for stats which are reported per item.
+
+        Args:
+            name (str): Name of the mapping
+            key (Callable[[ItemType], Hashable]): _description_
+            value (Callable[[ItemType], Any]): _description_
+
+        Returns:
+            ArkStatsAggregator[ItemType]: _description_
+        """
+        self.__mappings[name] = (key, value)
+        self.__values[name] = {}
+        return self
+
+    def collect_by(
+        self, name: str, key: Callable[[ItemType], Hashable], value: Callable[[ItemType], Any]
+    ) -> 'ArkStatsAggregator[ItemType]':
+        """
+        Registers a group by collector, collecting the value of each item per its key.
+        Only the collected values are kept, not the items themselves.
+
+        Args:
+            name (str): Name of the collector
+            key (Callable[[ItemType], Hashable]): Returns the key to group the item by
+            value (Callable[[ItemType], Any]): Returns the value to collect for the item
+
+        Returns:
+            ArkStatsAggregator[ItemType]: _description_
+        """
+        self.__collectors[name] = (key, value)
+        self.__collected[name] = defaultdict(list)
+        return self
+
+    def consume(self, items: Iterable[ItemType]) -> 'ArkStatsAggregator[ItemType]':
+        """
+        Consumes the given items and updates all the registered counters.
+
+        Args:
+            items (Iterable[ItemType]): _description_
+
+        Returns:
+            ArkStatsAggregator[ItemType]: _description_
+        """
+        for item in items:
+            self.__count += 1
+            for name, (key, skip_empty, multi) in self.__group_bys.items():
+                if multi:
+                    self.__counters[name].update(key(item))
+                    continue
+                item_key = key(item)
+                if skip_empty and not item_key:
+                    continue
+                self.__counters[name][item_key] += 1
+            for name, predicate in self.__predicates.items():
+                if predicate(item):
+                    self.__totals[name] += 1
+            for name, (key, value) in self.__mappings.items():
+                self.__values[name][key(item)] = value(item)
+            for name, (key, value) in self.__collectors.items():
+                self.__collected[name][key(item)].append(value(item))
+        return self
+
+    def consume_pages(self, pages: Iterable[Iterable[ItemType]]) -> 'ArkStatsAggregator[ItemType]':
+        """
+        Consumes the given pages one at a time, every page can be discarded once it was counted.
+
+        Args:
+            pages (Iterable[Iterable[ItemType]]): _description_
+
+        Returns:
+            ArkStatsAggregator[ItemType]: _description_
+        """
+        for page in pages:
+            self.consume(page)
+        return self
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    def counts(self, name: str) -> Dict[Hashable, int]:
+        """
+        Returns the counts per key of a registered group by counter.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            Dict[Hashable, int]: _description_
+        """
+        return dict(self.__counters[name])
+
+    def total(self, name: str) -> int:
+        """
+        Returns the amount of items which matched a registered predicate.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            int: _description_
+        """
+        return self.__totals[name]
+
+    def values(self, name: str) -> Dict[Hashable, Any]:
+        """
+        Returns the per item mapping of a registered mapping.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            Dict[Hashable, Any]: _description_
+        """
+        return dict(self.__values[name])
+
+    def collected(self, name: str) -> Dict[Hashable, List[Any]]:
+        """
+        Returns the collected values per key of a registered collector.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            Dict[Hashable, List[Any]]: _description_
+        """
+        return dict(self.__collected[name])
@@ -1,16 +1,86 @@
 from __future__ import annotations
 
+import codecs
+import tempfile
+import time
+from collections import deque
 from io import StringIO
 from pathlib import Path
-from typing import Any, Final, Optional
+from typing import IO, Any, Callable, Deque, Final, Iterator, Optional, Tuple
 
 from overrides import overrides
 
 from ark_sdk_python.common.connections.ark_connection import ArkConnection
 from ark_sdk_python.models import ArkException
-from ark_sdk_python.models.common.connections import ArkConnectionCommand, ArkConnectionDetails, ArkConnectionResult
+from ark_sdk_python.models.common.connections import (
+    ArkConnectionCommand,
+    ArkConnectionDetails,
+    ArkConnectionOutputStream,
+    ArkConnectionResult,
+    ArkConnectionStreamingResult,
+)
 
 SSH_PORT: Final[int] = 22
+SSH_RECV_CHUNK_SIZE: Final[int] = 32768
+SSH_OUTPUT_POLL_INTERVAL_SECONDS: Final[float] = 0.01
+DEFAULT_MAX_RETAINED_OUTPUT_SIZE: Final[int] = 1024 * 1024
+
+# Receives every decoded output chunk of a streamed command with the stream it was written to
+ArkSSHOutputCallback = Callable[[ArkConnectionOutputStream, str], None]
+
+
+class _ArkSSHOutputSink:
+    def __init__(self, stream: ArkConnectionOutputStream, max_retained_size: Optional[int], spill_to_file: bool) -> None:
+        self.stream = stream
+        self.size = 0
+        self.truncated = False
+        self.path: Optional[str] = None
+        self.__decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.__max_retained_size = max_retained_size
+        self.__retained: Deque[str] = deque()
+        self.__retained_size = 0
+        self.__file: Optional[IO[str]] = None
+        if spill_to_file:
+            self.__file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', prefix=f'ark_ssh_{stream.value}_', delete=False)
+            self.path = self.__file.name
+
+    def __retain(self, text: str) -> None:
+        self.__retained.append(text)
+        self.__retained_size += len(text)
+        if self.__max_retained_size is None:
+            return
+        # Only the tail of the output is kept in memory, which is where errors usually are
+        while self.__retained_size > self.__max_retained_size:
+            self.truncated = True
+            head = self.__retained.popleft()
+            overflow = self.__retained_size - self.__max_retained_size
+            self.__retained_size -= len(head)
+            if len(head) > overflow:
+                self.__retained.appendleft(head[overflow:])
+                self.__retained_size += len(head) - overflow
+
+    def write(self, data: bytes, final: bool = False) -> str:
+        text = self.__decoder.decode(data, final)
+        if text:
+            self.size += len(text)
+            if self.__file:
+                self.__file.write(text)
+            self.__retain(text)
+        return text
+
+    def close(self) -> None:
+        if self.__file:
+            self.__file.close()
+
+    def remove(self) -> None:
+        self.close()
+        if self.path:
+            Path(self.path).unlink(missing_ok=True)
+            self.path = None
+
+    @property
+    def output(self) -> str:
+        return ''.join(self.__retained)
 
 
 class ArkSSHConnection(ArkConnection):
@@ -115,6 +185,134 @@ class ArkSSHConnection(ArkConnection):
         """
         return self.__is_connected
 
+    def __drain(self, channel: Any, sinks: Tuple[_ArkSSHOutputSink, _ArkSSHOutputSink]) -> Iterator[Tuple[ArkConnectionOutputStream, str]]:
+        stdout_sink, stderr_sink = sinks
+        while True:
+            received = False
+            for sink, is_ready, recv in (
+                (stdout_sink, channel.recv_ready, channel.recv),
+                (stderr_sink, channel.recv_stderr_ready, channel.recv_stderr),
+            ):
+                if is_ready():
+                    data = recv(SSH_RECV_CHUNK_SIZE)
+                    if data:
+                        received = True
+                        text = sink.write(data)
+                        if text:
+                            yield sink.stream, text
+            if received:
+                continue
+            # The exit status is sent after all of the output, so once it arrived and nothing is pending the output is complete
+            if channel.exit_status_ready() and not channel.recv_ready() and not channel.recv_stderr_ready():
+                break
+            time.sleep(SSH_OUTPUT_POLL_INTERVAL_SECONDS)
+        for sink in sinks:
+            text = sink.write(b'', final=True)
+            if text:
+                yield sink.stream, text
+
+    def __exec_command(self, command: ArkConnectionCommand) -> Any:
+        if not self.__is_connected or self.__is_suspended:
+            raise ArkException('Cannot run command while not being connected')
+        self._logger.debug(f'Running command [{command.command}]')
+        _, stdout_stream, _ = self.__ssh_client.exec_command(command=command.command)
+        return stdout_stream.channel
+
+    def stream_command_output(
+        self, command: ArkConnectionCommand, max_retained_output_size: Optional[int] = DEFAULT_MAX_RETAINED_OUTPUT_SIZE
+    ) -> Iterator[Tuple[ArkConnectionOutputStream, str]]:
+        """
+        Runs a command over ssh session and yields every decoded chunk of its output with the stream it was written to, as it is written.
+        Once the output is exhausted, an unexpected return code is raised with the tail of stderr, up to max_retained_output_size characters.
+        Closing the generator before the output is exhausted closes the channel of the command.
+
+        Args:
+            command (ArkConnectionCommand): _description_
+            max_retained_output_size (Optional[int]): _description_. Defaults to DEFAULT_MAX_RETAINED_OUTPUT_SIZE.
+
+        Raises:
+            ArkException: _description_
+
+        Yields:
+            Iterator[Tuple[ArkConnectionOutputStream, str]]: _description_
+        """
+        channel = self.__exec_command(command)
+        stderr_sink = _ArkSSHOutputSink(ArkConnectionOutputStream.STDERR, max_retained_output_size, False)
+        sinks = (_ArkSSHOutputSink(ArkConnectionOutputStream.STDOUT, 0, False), stderr_sink)
+        completed = False
+        try:
+            yield from self.__drain(channel, sinks)
+            completed = True
+        finally:
+            if not completed:
+                channel.close()
+        rc = channel.recv_exit_status()
+        if rc != command.expected_rc and command.raise_on_error:
+            raise ArkException(f'Failed to execute command [{command.command}] - [{rc}] - [{stderr_sink.output}]')
+        self._logger.debug(f'Command rc: [{rc}], stdout size: [{sinks[0].size}], stderr size: [{stderr_sink.size}]')
+
+    def run_command_streaming(
+        self,
+        command: ArkConnectionCommand,
+        output_callback: Optional[ArkSSHOutputCallback] = None,
+        max_retained_output_size: Optional[int] = DEFAULT_MAX_RETAINED_OUTPUT_SIZE,
+        spill_to_file: bool = False,
+    ) -> ArkConnectionStreamingResult:
+        """
+        Runs a command over ssh session while draining its stdout and stderr as they are written,
+        so commands with large output never block on a full channel window.
+        Every decoded chunk of output is passed to the output callback when given.
+        Only the tail of each stream is kept in memory, up to max_retained_output_size characters, or all of it when the limit is None.
+        When spill_to_file is set, the whole output of each stream is also written to a temporary file whose path is returned,
+        and which the caller should remove. The files are removed when the command fails or the output callback raises.
+
+        Args:
+            command (ArkConnectionCommand): _description_
+            output_callback (Optional[ArkSSHOutputCallback]): _description_. Defaults to None.
+            max_retained_output_size (Optional[int]): _description_. Defaults to DEFAULT_MAX_RETAINED_OUTPUT_SIZE.
+            spill_to_file (bool): _description_. Defaults to False.
+
+        Raises:
+            ArkException: _description_
+
+        Returns:
+            ArkConnectionStreamingResult: _description_
+        """
+        channel = self.__exec_command(command)
+        sinks = (
+            _ArkSSHOutputSink(ArkConnectionOutputStream.STDOUT, max_retained_output_size, spill_to_file),
+            _ArkSSHOutputSink(ArkConnectionOutputStream.STDERR, max_retained_output_size, spill_to_file),
+        )
+        stdout_sink, stderr_sink = sinks
+        try:
+            for stream, text in self.__drain(channel, sinks):
+                if output_callback:
+                    output_callback(stream, text)
+            rc = channel.recv_exit_status()
+            if rc != command.expected_rc and command.raise_on_error:
+                raise ArkException(f'Failed to execute command [{command.command}] - [{rc}] - [{stderr_sink.output}]')
+        except BaseException:
+            # The caller never gets the paths of a failed command, so its spill files are removed rather than leaked
+            channel.close()
+            for sink in sinks:
+                sink.remove()
+            raise
+        finally:
+            for sink in sinks:
+                sink.close()
+        self._logger.debug(f'Command rc: [{rc}], stdout size: [{stdout_sink.size}], stderr size: [{stderr_sink.size}]')
+        return ArkConnectionStreamingResult(
+            stdout=stdout_sink.output,
+            stderr=stderr_sink.output,
+            rc=rc,
+            stdout_size=stdout_sink.size,
+            stderr_size=stderr_sink.size,
+            stdout_truncated=stdout_sink.truncated,
+            stderr_truncated=stderr_sink.truncated,
+            stdout_path=stdout_sink.path,
+            stderr_path=stderr_sink.path,
+        )
+
     @overrides
     def run_command(self, command: ArkConnectionCommand) -> ArkConnectionResult:
         """
@@ -129,16 +327,7 @@ class ArkSSHConnection(ArkConnection):
         Returns:
             ArkConnectionResult: _description_
         """
-        if not self.__is_connected or self.__is_suspended:
-            raise ArkException('Cannot run command while not being connected')
-        self._logger.debug(f'Running command [{command.command}]')
-        _, stdout_stream, stderr_stream = self.__ssh_client.exec_command(command=command.command)
-        rc = stdout_stream.channel.recv_exit_status()
-        stdout = ''.join(stdout_stream.readlines())
-        stderr = ''.join(stderr_stream.readlines())
-        if rc != command.expected_rc and command.raise_on_error:
-            raise ArkException(f'Failed to execute command [{command.command}] - [{rc}] - [{stderr}]')
-        self._logger.debug(f'Command rc: [{rc}]')
-        self._logger.debug(f'Command stdout: [{stdout}]')
-        self._logger.debug(f'Command stderr: [{stderr}]')
-        return ArkConnectionResult(stdout=stdout, stderr=stderr, rc=rc)
+        result = self.run_command_streaming(command, max_retained_output_size=None)
+        self._logger.debug(f'Command stdout: [{result.stdout}]')
+        self._logger.debug(f'Command stderr: [{result.stderr}]')
+        return ArkConnectionResult(stdout=result.stdout, stderr=result.stderr, rc=result.rc)
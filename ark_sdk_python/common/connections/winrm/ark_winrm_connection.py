@@ -1,6 +1,8 @@
 import base64
+import codecs
+import gzip
 import uuid
-from typing import Any, Final, Optional
+from typing import Any, Final, List, Optional
 
 from overrides import overrides
 
@@ -9,6 +11,11 @@ from ark_sdk_python.models import ArkException
 from ark_sdk_python.models.common.connections import ArkConnectionCommand, ArkConnectionDetails, ArkConnectionResult
 
 WINRM_HTTPS_PORT: Final[int] = 5986
+WINRM_TEMP_FOLDER: Final[str] = 'C:\\temp'
+# WinRM commands are run through cmd.exe, whose command line is limited to 8191 characters,
+# so each chunk of base64 payload is sized to leave room for the powershell wrapper around it
+WINRM_MAX_COMMAND_LENGTH: Final[int] = 8191
+WINRM_SPLIT_COMMAND_LENGTH: Final[int] = 2000
 
 
 class ArkWinRMConnection(ArkConnection):
@@ -111,6 +118,66 @@ class ArkWinRMConnection(ArkConnection):
         """
         return self.__is_connected
 
+    @staticmethod
+    def __powershell_command(command: str) -> str:
+        return f'powershell -NoProfile -NonInteractive -Command "{command}"'
+
+    @staticmethod
+    def __transfer_commands(data: bytes, remote_path: str) -> List[str]:
+        payload_path = f'{remote_path}.b64'
+        remote_folder = remote_path.rsplit('\\', 1)[0]
+        # The folder is created with the first chunk, and the payload is decoded with the last one, saving their round trips
+        first_prefix = (
+            f"New-Item -ItemType Directory -Force -Path '{remote_folder}' | Out-Null; "
+            f"Remove-Item -Force -ErrorAction SilentlyContinue -Path '{payload_path}'; "
+        )
+        last_suffix = (
+            '; '
+            f"$i = New-Object IO.MemoryStream(,[Convert]::FromBase64String((Get-Content -Raw -Path '{payload_path}'))); "
+            '$g = New-Object IO.Compression.GZipStream($i, [IO.Compression.CompressionMode]::Decompress); '
+            f"$o = [IO.File]::Create('{remote_path}'); $g.CopyTo($o); $o.Close(); $g.Close(); "
+            f"Remove-Item -Force -Path '{payload_path}'"
+        )
+        # A single chunk carries both the first and the last additions, so every chunk is sized to fit along with both of them
+        overhead = len(
+            ArkWinRMConnection.__powershell_command(f"{first_prefix}Add-Content -Path '{payload_path}' -Value '' -NoNewline{last_suffix}")
+        )
+        chunk_size = WINRM_MAX_COMMAND_LENGTH - overhead
+        if chunk_size <= 0:
+            raise ArkException(f'Cannot upload file to [{remote_path}], the path is too long for a command line')
+        payload = base64.b64encode(gzip.compress(data)).decode('ascii')
+        chunks = [payload[i : i + chunk_size] for i in range(0, len(payload), chunk_size)] or ['']
+        commands = [f"Add-Content -Path '{payload_path}' -Value '{chunk}' -NoNewline" for chunk in chunks]
+        commands[0] = f'{first_prefix}{commands[0]}'
+        commands[-1] = f'{commands[-1]}{last_suffix}'
+        return [ArkWinRMConnection.__powershell_command(c) for c in commands]
+
+    def upload_file(self, data: bytes, remote_path: str) -> None:
+        """
+        Uploads the given data to a file on the target over the winrm session.
+        The data is compressed and transferred in chunks which are as large as the 8191 characters of a cmd.exe command line allow,
+        which takes a round trip per ~5KB of compressed data instead of one per 4KB of raw data.
+
+        Args:
+            data (bytes): _description_
+            remote_path (str): _description_
+
+        Raises:
+            ArkException: _description_
+        """
+        if not self.__is_connected or self.__is_suspended:
+            raise ArkException('Cannot upload file while not being connected')
+        transfer_commands = ArkWinRMConnection.__transfer_commands(data, remote_path)
+        self._logger.debug(f'Uploading [{len(data)}] bytes to [{remote_path}] in [{len(transfer_commands)}] chunks')
+        for transfer_command in transfer_commands:
+            command_id = self.__winrm_protocol.run_command(self.__winrm_shell_id, transfer_command)
+            try:
+                _, stderr, rc = self.__winrm_protocol.get_command_output(self.__winrm_shell_id, command_id)
+            finally:
+                self.__winrm_protocol.cleanup_command(self.__winrm_shell_id, command_id)
+            if rc != 0:
+                raise ArkException(f'Failed to upload file [{remote_path}] - [{rc}] - [{stderr.decode("utf8")}]')
+
     @overrides
     def run_command(self, command: ArkConnectionCommand) -> ArkConnectionResult:
         """
@@ -128,31 +195,19 @@ class ArkWinRMConnection(ArkConnection):
         if not self.__is_connected or self.__is_suspended:
             raise ArkException('Cannot run command while not being connected')
         self._logger.debug(f'Running powershell command [{command.command}] of length [{len(command.command)}]')
-        if len(command.command) > 2000 or (command.extra_command_data and command.extra_command_data.get('force_command_split', False)):
-            encoded_command = command.command.encode('utf_16_le')
-            max_size = 4000
-            chunks = [encoded_command[i : i + max_size] for i in range(0, len(encoded_command), max_size)]
-            command_unique_file_name = uuid.uuid4().hex
-            command_file = f'"C:\\temp\\{command_unique_file_name}.ps1"'
-
-            # Ensure C:\temp exists
-            self.__winrm_protocol.run_command(self.__winrm_shell_id, 'if not exist "C:\\temp" mkdir C:\\temp')
-
-            # Write chunks to the file
-            for chunk in chunks:
-                encoded_chunk_base64 = base64.b64encode(chunk).decode('ascii')
-                command_id = self.__winrm_protocol.run_command(
-                    self.__winrm_shell_id,
-                    f'powershell -Command "[System.Text.Encoding]::Unicode.GetString([System.Convert]::FromBase64String(\'{encoded_chunk_base64}\')) | Add-Content -Path {command_file} -Encoding Unicode -NoNewline"',
-                )
-                stdout, stderr, rc = self.__winrm_protocol.get_command_output(self.__winrm_shell_id, command_id)
+        if len(command.command) > WINRM_SPLIT_COMMAND_LENGTH or (
+            command.extra_command_data and command.extra_command_data.get('force_command_split', False)
+        ):
+            command_file = f'{WINRM_TEMP_FOLDER}\\{uuid.uuid4().hex}.ps1'
+            # Scripts are transferred as UTF-8 with a BOM, which powershell reads as unicode
+            self.upload_file(codecs.BOM_UTF8 + command.command.encode('utf-8'), command_file)
 
             # Execute the PowerShell script
-            command_id = self.__winrm_protocol.run_command(self.__winrm_shell_id, f'powershell -File {command_file}')
+            command_id = self.__winrm_protocol.run_command(self.__winrm_shell_id, f'powershell -File "{command_file}"')
             stdout, stderr, rc = self.__winrm_protocol.get_command_output(self.__winrm_shell_id, command_id)
 
             # Clean up the temporary file
-            self.__winrm_protocol.run_command(self.__winrm_shell_id, f'del /f {command_file}')
+            self.__winrm_protocol.run_command(self.__winrm_shell_id, f'del /f "{command_file}"')
         else:
             encoded_ps = f'powershell -encodedcommand {base64.b64encode(command.command.encode("utf_16_le")).decode("ascii")}'
             command_id: str = self.__winrm_protocol.run_command(self.__winrm_shell_id, encoded_ps.split()[0], encoded_ps.split()[1:])
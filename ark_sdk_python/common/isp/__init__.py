@@ -1,3 +1,4 @@
+from ark_sdk_python.common.isp.ark_async_isp_service_client import ArkAsyncISPServiceClient
 from ark_sdk_python.common.isp.ark_isp_service_client import ArkISPServiceClient
 
-__all__ = ['ArkISPServiceClient']
+__all__ = ['ArkISPServiceClient', 'ArkAsyncISPServiceClient']
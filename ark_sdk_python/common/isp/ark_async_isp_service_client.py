@@ -0,0 +1,113 @@
+import asyncio
+import os
+from typing import Optional
+
+from requests.cookies import RequestsCookieJar
+
+from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common.ark_async_http_client import ArkAsyncHttpClient, ArkAsyncRefreshCallback
+from ark_sdk_python.common.ark_jwt_utils import ArkJWTUtils
+from ark_sdk_python.common.ark_rate_limiter import ArkRateLimiter
+from ark_sdk_python.common.ark_session_serializer import ArkSessionSerializer
+from ark_sdk_python.common.env import ROOT_DOMAIN, AwsEnv
+from ark_sdk_python.common.isp.ark_isp_service_client import ArkISPServiceClient
+from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.common import ArkConnectionPoolSettings, ArkRetryPolicy
+
+
+class ArkAsyncISPServiceClient(ArkAsyncHttpClient):
+    def __init__(
+        self,
+        service_name: Optional[str] = None,
+        tenant_subdomain: Optional[str] = None,
+        base_tenant_url: Optional[str] = None,
+        tenant_env: Optional[AwsEnv] = None,
+        token: Optional[str] = None,
+        auth_header_name: str = 'Authorization',
+        seperator: str = '.',
+        base_path: Optional[str] = None,
+        cookie_jar: Optional[RequestsCookieJar] = None,
+        refresh_connection_callback: Optional[ArkAsyncRefreshCallback] = None,
+        connection_pool_settings: Optional[ArkConnectionPoolSettings] = None,
+        retry_policy: Optional[ArkRetryPolicy] = None,
+        rate_limiter: Optional[ArkRateLimiter] = None,
+    ) -> None:
+        self.__tenant_env = tenant_env or AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
+        service_url = ArkISPServiceClient.service_url(service_name, tenant_subdomain, base_tenant_url, tenant_env, token, seperator)
+        if base_path:
+            service_url = f'{service_url}/{base_path}'
+        super().__init__(
+            base_url=service_url,
+            token=token,
+            auth_header_name=auth_header_name,
+            cookie_jar=cookie_jar,
+            refresh_connection_callback=refresh_connection_callback,
+            connection_pool_settings=connection_pool_settings,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        self.add_header('Origin', service_url)
+        self.add_header('Referer', service_url)
+        self.add_header('Content-Type', 'application/json')
+
+    @staticmethod
+    def from_isp_auth(
+        isp_auth: ArkISPAuth,
+        service_name: Optional[str] = None,
+        seperator: str = '.',
+        refresh_connection_callback: Optional[ArkAsyncRefreshCallback] = None,
+        rate_limiter: Optional[ArkRateLimiter] = None,
+    ) -> 'ArkAsyncISPServiceClient':
+        tenant_env = None
+        base_tenant_url = None
+        if isp_auth.token.username:
+            for env, domain in ROOT_DOMAIN.items():
+                if domain in isp_auth.token.username and '@' in isp_auth.token.username:
+                    base_tenant_url = isp_auth.token.username.split('@')[1]
+                    tenant_env = env
+                    break
+        if not tenant_env and 'env' in isp_auth.token.metadata:
+            tenant_env = AwsEnv(isp_auth.token.metadata['env'])
+        if not tenant_env:
+            tenant_env = AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
+        client = ArkAsyncISPServiceClient(
+            service_name=service_name,
+            base_tenant_url=base_tenant_url,
+            tenant_env=tenant_env,
+            token=isp_auth.token.token.get_secret_value(),
+            seperator=seperator,
+            cookie_jar=(
+                ArkSessionSerializer.deserialize_cookies(isp_auth.token.metadata['cookies'])
+                if 'cookies' in isp_auth.token.metadata
+                else None
+            ),
+            refresh_connection_callback=refresh_connection_callback,
+            connection_pool_settings=isp_auth.connection_pool.settings,
+            retry_policy=isp_auth.retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        # Refreshed tokens are pushed to every client of the authenticator
+        isp_auth.token_refresher.register_client(client)
+        return client
+
+    @staticmethod
+    async def refresh_client(client: 'ArkAsyncISPServiceClient', isp_auth: ArkISPAuth) -> None:
+        # Authentication is blocking and may prompt or hit the keyring, so it runs off the event loop
+        # Concurrent refreshes of the clients of the authenticator are collapsed into a single refresh
+        token = await asyncio.to_thread(isp_auth.token_refresher.refresh)
+        if token:
+            client.update_token(token.token.get_secret_value())
+            client.update_cookies(
+                cookie_jar=(ArkSessionSerializer.deserialize_cookies(token.metadata['cookies']) if 'cookies' in token.metadata else None)
+            )
+
+    @property
+    def tenant_env(self) -> AwsEnv:
+        return self.__tenant_env
+
+    @property
+    def tenant_id(self) -> str:
+        tenant_id = ArkJWTUtils.get_claims(self.session_token).tenant_id if self.session_token else None
+        if tenant_id:
+            return tenant_id
+        raise ArkException('Failed to retrieve tenant id')
@@ -1,7 +1,5 @@
 # pylint: disable=unused-argument
-import codecs
 import os
-import pickle
 from typing import Callable, Optional
 from urllib.parse import urlparse
 
@@ -9,9 +7,13 @@ from requests.cookies import RequestsCookieJar
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
 from ark_sdk_python.common.ark_client import ArkClient
+from ark_sdk_python.common.ark_connection_pool import ArkConnectionPool
 from ark_sdk_python.common.ark_jwt_utils import ArkJWTUtils
+from ark_sdk_python.common.ark_rate_limiter import ArkRateLimiter
+from ark_sdk_python.common.ark_session_serializer import ArkSessionSerializer
 from ark_sdk_python.common.env import ROOT_DOMAIN, AwsEnv
 from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.common import ArkRetryPolicy
 
 
 class ArkISPServiceClient(ArkClient):
@@ -27,6 +29,9 @@ class ArkISPServiceClient(ArkClient):
         base_path: Optional[str] = None,
         cookie_jar: Optional[RequestsCookieJar] = None,
         refresh_connection_callback: Optional[Callable[['ArkClient'], None]] = None,
+        connection_pool: Optional[ArkConnectionPool] = None,
+        retry_policy: Optional[ArkRetryPolicy] = None,
+        rate_limiter: Optional[ArkRateLimiter] = None,
     ) -> None:
         self.__tenant_env = tenant_env or AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
         service_url = ArkISPServiceClient.service_url(service_name, tenant_subdomain, base_tenant_url, tenant_env, token, seperator)
@@ -38,6 +43,9 @@ class ArkISPServiceClient(ArkClient):
             auth_header_name=auth_header_name,
             cookie_jar=cookie_jar,
             refresh_connection_callback=refresh_connection_callback,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
         )
         self.add_header('Origin', service_url)
         self.add_header('Referer', service_url)
@@ -55,11 +63,12 @@ class ArkISPServiceClient(ArkClient):
         tenant_env = tenant_env or AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
         platform_domain = ROOT_DOMAIN[tenant_env]
         tenant_chosen_subdomain = None
-        if token:
-            subdomain = ArkJWTUtils.get_unverified_claims(token).get('subdomain', None)
+        claims = ArkJWTUtils.get_claims(token) if token else None
+        if claims:
+            subdomain = claims.subdomain
             if subdomain:
                 tenant_chosen_subdomain = subdomain
-            platform_token_domain = ArkJWTUtils.get_unverified_claims(token).get('platform_domain', None)
+            platform_token_domain = claims.platform_domain
             if platform_token_domain:
                 platform_domain = platform_token_domain
                 tenant_env = list(filter(lambda e: ROOT_DOMAIN[e] == platform_domain, ROOT_DOMAIN.keys()))
@@ -70,8 +79,8 @@ class ArkISPServiceClient(ArkClient):
                 base_tenant_url = f'https://{base_tenant_url}'
             parsed_url = urlparse(base_tenant_url)
             tenant_chosen_subdomain = parsed_url.netloc.split('.', 1)[0]
-        if not tenant_chosen_subdomain:
-            unique_name = ArkJWTUtils.get_unverified_claims(token).get('unique_name', None)
+        if not tenant_chosen_subdomain and claims:
+            unique_name = claims.unique_name
             if unique_name:
                 full_domain = unique_name.split('@', 1)
                 if len(full_domain) > 1:
@@ -96,6 +105,7 @@ class ArkISPServiceClient(ArkClient):
         service_name: Optional[str] = None,
         seperator: str = '.',
         refresh_connection_callback: Optional[Callable[['ArkClient'], None]] = None,
+        rate_limiter: Optional[ArkRateLimiter] = None,
     ) -> 'ArkISPServiceClient':
         tenant_env = None
         base_tenant_url = None
@@ -109,29 +119,34 @@ class ArkISPServiceClient(ArkClient):
             tenant_env = AwsEnv(isp_auth.token.metadata['env'])
         if not tenant_env:
             tenant_env = AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
-        return ArkISPServiceClient(
+        client = ArkISPServiceClient(
             service_name=service_name,
             base_tenant_url=base_tenant_url,
             tenant_env=tenant_env,
             token=isp_auth.token.token.get_secret_value(),
             seperator=seperator,
             cookie_jar=(
-                pickle.loads(codecs.decode(isp_auth.token.metadata['cookies'].encode(), "base64"))
+                ArkSessionSerializer.deserialize_cookies(isp_auth.token.metadata['cookies'])
                 if 'cookies' in isp_auth.token.metadata
                 else None
             ),
             refresh_connection_callback=refresh_connection_callback,
+            connection_pool=isp_auth.connection_pool,
+            retry_policy=isp_auth.retry_policy,
+            rate_limiter=rate_limiter,
         )
+        # Refreshed tokens are pushed to every client of the authenticator
+        isp_auth.token_refresher.register_client(client)
+        return client
 
     @staticmethod
     def refresh_client(client: 'ArkISPServiceClient', isp_auth: ArkISPAuth) -> None:
-        token = isp_auth.load_authentication(isp_auth.active_profile, True)
+        # Concurrent refreshes of the clients of the authenticator are collapsed into a single refresh
+        token = isp_auth.token_refresher.refresh()
         if token:
             client.update_token(token.token.get_secret_value())
             client.update_cookies(
-                cookie_jar=(
-                    pickle.loads(codecs.decode(token.metadata['cookies'].encode(), "base64")) if 'cookies' in token.metadata else None
-                )
+                cookie_jar=(ArkSessionSerializer.deserialize_cookies(token.metadata['cookies']) if 'cookies' in token.metadata else None)
             )
 
     @property
@@ -140,6 +155,7 @@ class ArkISPServiceClient(ArkClient):
 
     @property
     def tenant_id(self) -> str:
-        if self.session_token:
-            return ArkJWTUtils.get_unverified_claims(self.session_token)['tenant_id']
+        tenant_id = ArkJWTUtils.get_claims(self.session_token).tenant_id if self.session_token else None
+        if tenant_id:
+            return tenant_id
         raise ArkException('Failed to retrieve tenant id')
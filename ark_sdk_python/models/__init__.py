@@ -21,6 +21,7 @@ from ark_sdk_python.models.ark_model import (
     ArkTitleizedModel,
 )
 from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
+from ark_sdk_python.models.ark_type_adapters import ArkTypeAdapters
 
 __all__ = [
     'ArkException',
@@ -42,4 +43,5 @@ __all__ = [
     'ArkSecretStr',
     'ArkSecretBytes',
     'ArkHttpUrlString',
+    'ArkTypeAdapters',
 ]
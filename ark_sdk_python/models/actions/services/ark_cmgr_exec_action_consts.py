@@ -19,6 +19,7 @@ from ark_sdk_python.models.services.cmgr import (
     ArkCmgrPoolComponentsFilter,
     ArkCmgrPoolIdentifiersFilter,
     ArkCmgrPoolsFilter,
+    ArkCmgrSyncPoolIdentifiers,
     ArkCmgrUpdateNetwork,
     ArkCmgrUpdatePool,
 )
@@ -43,6 +44,7 @@ CMGR_ACTION_TO_SCHEMA_MAP: Final[Dict[str, Optional[Type[ArkModel]]]] = {
     'add-pool-identifiers': ArkCmgrAddPoolBulkIdentifier,
     'delete-pool-identifier': ArkCmgrDeletePoolSingleIdentifier,
     'delete-pool-identifiers': ArkCmgrDeletePoolBulkIdentifier,
+    'sync-pool-identifiers': ArkCmgrSyncPoolIdentifiers,
     'list-pool-identifiers': ArkCmgrListPoolIdentifiers,
     'list-pool-identifiers-by': ArkCmgrPoolIdentifiersFilter,
     'list-pools-components': None,
@@ -19,6 +19,7 @@ from ark_sdk_python.models.services.identity.roles import (
     ArkIdentityAddGroupToRole,
     ArkIdentityAddRoleToRole,
     ArkIdentityAddUserToRole,
+    ArkIdentityBulkAddUsersToRoles,
     ArkIdentityCreateRole,
     ArkIdentityDeleteRole,
     ArkIdentityListRoleMembers,
@@ -29,6 +30,7 @@ from ark_sdk_python.models.services.identity.roles import (
     ArkIdentityUpdateRole,
 )
 from ark_sdk_python.models.services.identity.users import (
+    ArkIdentityBulkCreateUsers,
     ArkIdentityCreateUser,
     ArkIdentityDeleteUser,
     ArkIdentityDeleteUsers,
@@ -85,6 +87,7 @@ IDENTITY_POLICIES_ACTIONS: Final[ArkServiceActionDefinition] = ArkServiceActionD
 # Roles
 IDENTITY_ROLES_ACTION_TO_SCHEMA_MAP: Final[Dict[str, Optional[Type[ArkModel]]]] = {
     'add-user-to-role': ArkIdentityAddUserToRole,
+    'bulk-add-users-to-roles': ArkIdentityBulkAddUsersToRoles,
     'add-group-to-role': ArkIdentityAddGroupToRole,
     'add-role-to-role': ArkIdentityAddRoleToRole,
     'remove-user-from-role': ArkIdentityRemoveUserFromRole,
@@ -105,6 +108,7 @@ IDENTITY_ROLES_ACTIONS: Final[ArkServiceActionDefinition] = ArkServiceActionDefi
 # Users
 IDENTITY_USERS_ACTION_TO_SCHEMA_MAP: Final[Dict[str, Optional[Type[ArkModel]]]] = {
     'create-user': ArkIdentityCreateUser,
+    'bulk-create-users': ArkIdentityBulkCreateUsers,
     'update-user': ArkIdentityUpdateUser,
     'delete-user': ArkIdentityDeleteUser,
     'delete-users': ArkIdentityDeleteUsers,
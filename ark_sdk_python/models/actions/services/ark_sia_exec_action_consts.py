@@ -14,7 +14,13 @@ from ark_sdk_python.models.cli_services.sia.policies_editor.common import (
 )
 from ark_sdk_python.models.cli_services.sia.policies_editor.db import ArkSIADBGeneratePolicy
 from ark_sdk_python.models.cli_services.sia.policies_editor.vm import ArkSIAVMGeneratePolicy
-from ark_sdk_python.models.services.sia.access import ArkSIAGetConnectorSetupScript, ArkSIAInstallConnector, ArkSIAUninstallConnector
+from ark_sdk_python.models.services.sia.access import (
+    ArkSIABulkInstallConnectors,
+    ArkSIABulkUninstallConnectors,
+    ArkSIAGetConnectorSetupScript,
+    ArkSIAInstallConnector,
+    ArkSIAUninstallConnector,
+)
 from ark_sdk_python.models.services.sia.certificates import (
     ArkSIACertificatesFilter,
     ArkSIACreateCertificate,
@@ -249,6 +255,8 @@ ACCESS_ACTION_TO_SCHEMA_MAP: Final[Dict[str, Optional[Type[ArkModel]]]] = {
     'connector-setup-script': ArkSIAGetConnectorSetupScript,
     'install-connector': ArkSIAInstallConnector,
     'uninstall-connector': ArkSIAUninstallConnector,
+    'bulk-install-connectors': ArkSIABulkInstallConnectors,
+    'bulk-uninstall-connectors': ArkSIABulkUninstallConnectors,
 }
 ACCESS_ACTION: Final[ArkServiceActionDefinition] = ArkServiceActionDefinition(
     action_name='access',
@@ -2,7 +2,13 @@ from typing import Any, Dict, Final, Optional, Type
 
 from ark_sdk_python.models import ArkModel
 from ark_sdk_python.models.actions.ark_service_action_definition import ArkServiceActionDefinition
-from ark_sdk_python.models.services.sm import ArkSMGetSession, ArkSMGetSessionActivities, ArkSMSessionActivitiesFilter, ArkSMSessionsFilter
+from ark_sdk_python.models.services.sm import (
+    ArkSMGetSession,
+    ArkSMGetSessionActivities,
+    ArkSMSearchSessionsActivities,
+    ArkSMSessionActivitiesFilter,
+    ArkSMSessionsFilter,
+)
 
 # Session Monitoring Definitions
 SM_ACTION_TO_SCHEMA_MAP: Final[Dict[str, Optional[Type[ArkModel]]]] = {
@@ -15,6 +21,7 @@ SM_ACTION_TO_SCHEMA_MAP: Final[Dict[str, Optional[Type[ArkModel]]]] = {
     'count-session-activities': ArkSMGetSessionActivities,
     'list-session-activities-by': ArkSMSessionActivitiesFilter,
     'count-session-activities-by': ArkSMSessionActivitiesFilter,
+    'search-sessions-activities': ArkSMSearchSessionsActivities,
     'sessions-stats': None,
 }
 SM_ACTION_DEFAULTS_MAP: Final[Dict[str, Dict[str, Any]]] = {}
@@ -4,21 +4,11 @@ from datetime import datetime
 from typing import Any, Callable, Dict, Optional, Union
 
 from humps.main import camelize
-from pydantic import (
-    BaseModel,
-    BeforeValidator,
-    ConfigDict,
-    Field,
-    HttpUrl,
-    PlainSerializer,
-    SecretBytes,
-    SecretStr,
-    TypeAdapter,
-    field_validator,
-)
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, HttpUrl, PlainSerializer, SecretBytes, SecretStr, field_validator
 from typing_extensions import Annotated
 
 from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.ark_type_adapters import ArkTypeAdapters
 
 
 class ArkModel(BaseModel):
@@ -74,7 +64,7 @@ ArkPollCallback = Callable
 ArkSecretStr = Annotated[SecretStr, PlainSerializer(func=secret_serializer, return_type=str)]
 ArkSecretBytes = Annotated[SecretBytes, PlainSerializer(func=secret_serializer, return_type=bytes)]
 ArkB64SerializedDict = Annotated[Dict[str, Any], PlainSerializer(base64_serializer, return_type=str)]
-ArkHttpUrlString = Annotated[str, BeforeValidator(lambda value: str(TypeAdapter(HttpUrl).validate_python(value)))]
+ArkHttpUrlString = Annotated[str, BeforeValidator(lambda value: str(ArkTypeAdapters.validate_python(HttpUrl, value)))]
 ArkSerializableDatetime = Annotated[datetime, PlainSerializer(lambda v: v.strftime('%FT%T%z'))]
 
 
@@ -0,0 +1,96 @@
+import threading
+from typing import Any, Dict, Final, Tuple, Union
+
+from pydantic import ConfigDict, Field, TypeAdapter, create_model
+
+
+class ArkTypeAdapters:
+    """
+    Process wide registry of compiled validators per type.
+    Building a `TypeAdapter` compiles the pydantic core schema of the type, which is costly for large models,
+    so every type is compiled once and its validator is reused by all the services.
+    Raw responses can be validated straight from their bytes with `validate_json` and `validate_json_field`,
+    which parse and validate the body in a single pass instead of parsing it to python objects first.
+    """
+
+    __LOCK: Final[threading.Lock] = threading.Lock()
+    __ADAPTERS: Dict[Any, TypeAdapter] = {}
+    __FIELD_ADAPTERS: Dict[Tuple[Any, str], TypeAdapter] = {}
+
+    @staticmethod
+    def adapter(type_: Any) -> TypeAdapter:
+        """
+        Returns the compiled validator of the given type, compiling it only on first use.
+
+        Args:
+            type_ (Any): _description_
+
+        Returns:
+            TypeAdapter: _description_
+        """
+        adapter = ArkTypeAdapters.__ADAPTERS.get(type_)
+        if adapter is None:
+            with ArkTypeAdapters.__LOCK:
+                adapter = ArkTypeAdapters.__ADAPTERS.get(type_)
+                if adapter is None:
+                    adapter = TypeAdapter(type_)
+                    ArkTypeAdapters.__ADAPTERS[type_] = adapter
+        return adapter
+
+    @staticmethod
+    def validate_python(type_: Any, data: Any) -> Any:
+        """
+        Validates the given python data as the given type.
+
+        Args:
+            type_ (Any): _description_
+            data (Any): _description_
+
+        Returns:
+            Any: _description_
+        """
+        return ArkTypeAdapters.adapter(type_).validate_python(data)
+
+    @staticmethod
+    def validate_json(type_: Any, data: Union[str, bytes]) -> Any:
+        """
+        Parses and validates the given raw JSON as the given type in a single pass.
+
+        Args:
+            type_ (Any): _description_
+            data (Union[str, bytes]): _description_
+
+        Returns:
+            Any: _description_
+        """
+        return ArkTypeAdapters.adapter(type_).validate_json(data)
+
+    @staticmethod
+    def validate_json_field(type_: Any, data: Union[str, bytes], field: str) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Parses the given raw JSON object and validates one of its fields as the given type in a single pass.
+        The rest of the fields of the object are returned as is, for paging information and such.
+
+        Args:
+            type_ (Any): The type of the field
+            data (Union[str, bytes]): The raw JSON object
+            field (str): The name of the field in the object
+
+        Returns:
+            Tuple[Any, Dict[str, Any]]: The validated field and the rest of the fields of the object
+        """
+        key = (type_, field)
+        adapter = ArkTypeAdapters.__FIELD_ADAPTERS.get(key)
+        if adapter is None:
+            with ArkTypeAdapters.__LOCK:
+                adapter = ArkTypeAdapters.__FIELD_ADAPTERS.get(key)
+                if adapter is None:
+                    envelope = create_model(
+                        'ArkJsonFieldEnvelope',
+                        __config__=ConfigDict(extra='allow', populate_by_name=False),
+                        field_value=(type_, Field(alias=field)),
+                    )
+                    adapter = TypeAdapter(envelope)
+                    ArkTypeAdapters.__FIELD_ADAPTERS[key] = adapter
+        envelope_value = adapter.validate_json(data)
+        return envelope_value.field_value, dict(envelope_value.model_extra or {})
@@ -1,8 +1,9 @@
 from typing import Any, Optional
 
-from pydantic import Field, SerializeAsAny, TypeAdapter, ValidationInfo, field_validator
+from pydantic import Field, SerializeAsAny, ValidationInfo, field_validator
 
 from ark_sdk_python.models.ark_model import ArkModel
+from ark_sdk_python.models.ark_type_adapters import ArkTypeAdapters
 from ark_sdk_python.models.auth.ark_auth_method import (
     ArkAuthMethod,
     ArkAuthMethodSettings,
@@ -30,4 +31,4 @@ class ArkAuthProfile(ArkModel):
     def parse_method_settings(cls, v: Any, validation_info: ValidationInfo) -> Any:
         if 'auth_method' in validation_info.data:
             return ArkAuthMethodSettingsMap[validation_info.data['auth_method']].model_validate(v)
-        return TypeAdapter(ArkAuthMethodSettingsTypes).validate_python(v)
+        return ArkTypeAdapters.validate_python(ArkAuthMethodSettingsTypes, v)
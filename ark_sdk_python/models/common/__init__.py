@@ -5,12 +5,15 @@ from ark_sdk_python.models.common.ark_async_status import ArkAsyncStatus
 from ark_sdk_python.models.common.ark_async_task import ArkAsyncTask
 from ark_sdk_python.models.common.ark_category_type import ArkCategoryType
 from ark_sdk_python.models.common.ark_connection_method import ArkConnectionMethod
+from ark_sdk_python.models.common.ark_connection_pool_settings import ArkConnectionPoolSettings, ArkConnectionPoolStats
 from ark_sdk_python.models.common.ark_connector_type import ArkConnectorType
 from ark_sdk_python.models.common.ark_counted_values import ArkCountedValues
 from ark_sdk_python.models.common.ark_network_entity_type import ArkNetworkEntityType
 from ark_sdk_python.models.common.ark_os_type import ArkOsType, running_os
 from ark_sdk_python.models.common.ark_protocol_type import ArkProtocolType
+from ark_sdk_python.models.common.ark_rate_limit_settings import ArkRateLimitSettings
 from ark_sdk_python.models.common.ark_region import ArkRegion, platform_region_dict, region_to_platform_region, regions_full_names
+from ark_sdk_python.models.common.ark_retry_policy import ArkRetryPolicy
 from ark_sdk_python.models.common.ark_status import ArkStatus
 from ark_sdk_python.models.common.ark_status_stats import ArkStatusStats
 from ark_sdk_python.models.common.ark_validations import VALID_DATE_REGEX, VALID_LOGIN_MAX_LENGTH, VALID_LOGIN_NAME_REGEX
@@ -40,4 +43,8 @@ __all__ = [
     'ArkConnectionMethod',
     'ArkAccessMethod',
     'ArkCategoryType',
+    'ArkConnectionPoolSettings',
+    'ArkConnectionPoolStats',
+    'ArkRetryPolicy',
+    'ArkRateLimitSettings',
 ]
@@ -0,0 +1,26 @@
+from typing import Final
+
+from pydantic import Field
+
+from ark_sdk_python.models.ark_model import ArkModel
+
+DEFAULT_POOL_CONNECTIONS: Final[int] = 10
+DEFAULT_POOL_MAXSIZE: Final[int] = 10
+
+
+class ArkConnectionPoolSettings(ArkModel):
+    pool_connections: int = Field(description='Amount of per host connection pools to keep cached', default=DEFAULT_POOL_CONNECTIONS, ge=1)
+    pool_maxsize: int = Field(description='Maximum amount of connections to keep per host', default=DEFAULT_POOL_MAXSIZE, ge=1)
+    pool_block: bool = Field(
+        description='Whether to block and wait for a free connection when the pool is exhausted instead of opening a new one',
+        default=False,
+    )
+    keep_alive: bool = Field(
+        description='Whether to keep connections alive between requests, also enables tcp keep alive probes on the sockets',
+        default=True,
+    )
+
+
+class ArkConnectionPoolStats(ArkModel):
+    new_connections: int = Field(description='Amount of requests which required a new connection', default=0)
+    reused_connections: int = Field(description='Amount of requests which reused an already established connection', default=0)
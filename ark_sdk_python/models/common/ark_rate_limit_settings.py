@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from ark_sdk_python.models.ark_model import ArkModel
+
+
+class ArkRateLimitSettings(ArkModel):
+    requests_per_second: float = Field(description='Sustained amount of requests per second allowed', gt=0)
+    burst: int = Field(
+        description='Amount of requests which may be sent at once before being limited to the sustained rate', default=1, ge=1
+    )
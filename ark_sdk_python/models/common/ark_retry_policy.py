@@ -0,0 +1,32 @@
+from typing import Final, List
+
+from pydantic import Field
+
+from ark_sdk_python.models.ark_model import ArkModel
+
+DEFAULT_RETRY_STATUSES: Final[List[int]] = [429, 502, 503, 504]
+DEFAULT_RETRY_METHODS: Final[List[str]] = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE']
+
+
+class ArkRetryPolicy(ArkModel):
+    max_retries: int = Field(description='Maximum amount of retries for a single request, 0 disables retries', default=4, ge=0)
+    retry_statuses: List[int] = Field(
+        description='Response status codes which are retried', default_factory=lambda: list(DEFAULT_RETRY_STATUSES)
+    )
+    retry_on_connection_errors: bool = Field(description='Whether to retry requests which failed on a connection error', default=True)
+    retry_methods: List[str] = Field(
+        description='Http methods which may be retried, non idempotent methods such as POST and PATCH are only retried when added here',
+        default_factory=lambda: list(DEFAULT_RETRY_METHODS),
+    )
+    base_delay: float = Field(description='Base delay in seconds of the exponential backoff', default=0.5, gt=0)
+    max_delay: float = Field(description='Maximum delay in seconds between retries', default=30.0, gt=0)
+    respect_retry_after: bool = Field(description='Whether to wait for the delay given by the Retry-After response header', default=True)
+    max_retry_after: float = Field(description='Maximum delay in seconds to accept from a Retry-After header', default=300.0, ge=0)
+    retry_budget: float = Field(
+        description='Amount of retry tokens of a client, every retry consumes a token and no retries are made once depleted',
+        default=20.0,
+        ge=0,
+    )
+    retry_budget_refill: float = Field(
+        description='Amount of retry tokens refilled on every request which succeeded without retries', default=0.1, ge=0
+    )
@@ -2,5 +2,14 @@ from ark_sdk_python.models.common.connections.ark_connection_command import ArkC
 from ark_sdk_python.models.common.connections.ark_connection_credentials import ArkConnectionCredentials
 from ark_sdk_python.models.common.connections.ark_connection_details import ArkConnectionDetails, ArkConnectionType
 from ark_sdk_python.models.common.connections.ark_connection_result import ArkConnectionResult
+from ark_sdk_python.models.common.connections.ark_connection_streaming_result import ArkConnectionOutputStream, ArkConnectionStreamingResult
 
-__all__ = ['ArkConnectionCredentials', 'ArkConnectionDetails', 'ArkConnectionType', 'ArkConnectionCommand', 'ArkConnectionResult']
+__all__ = [
+    'ArkConnectionCredentials',
+    'ArkConnectionDetails',
+    'ArkConnectionType',
+    'ArkConnectionCommand',
+    'ArkConnectionResult',
+    'ArkConnectionOutputStream',
+    'ArkConnectionStreamingResult',
+]
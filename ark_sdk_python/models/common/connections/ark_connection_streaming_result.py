@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import Field
+
+from ark_sdk_python.models.common.connections.ark_connection_result import ArkConnectionResult
+
+
+class ArkConnectionOutputStream(str, Enum):
+    STDOUT = 'stdout'
+    STDERR = 'stderr'
+
+
+class ArkConnectionStreamingResult(ArkConnectionResult):
+    stdout_size: int = Field(description='Total amount of characters the command wrote to stdout', default=0)
+    stderr_size: int = Field(description='Total amount of characters the command wrote to stderr', default=0)
+    stdout_truncated: bool = Field(
+        description='Whether stdout only holds the tail of the output due to the output size limit', default=False
+    )
+    stderr_truncated: bool = Field(
+        description='Whether stderr only holds the tail of the output due to the output size limit', default=False
+    )
+    stdout_path: Optional[str] = Field(description='Path of the file the whole stdout was spilled to, if spilled', default=None)
+    stderr_path: Optional[str] = Field(description='Path of the file the whole stderr was spilled to, if spilled', default=None)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field
 
@@ -11,3 +11,6 @@ class ArkServiceConfig(ArkModel):
     optional_authenticator_names: List[str] = Field(
         description='Optional authenticators for the service for extra capabilities', default_factory=list
     )
+    rate_limit_name: Optional[str] = Field(
+        description='Name of the API whose rate limit the service draws from, defaults to the service name', default=None
+    )
@@ -31,6 +31,11 @@ from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers_filter import
 from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_common_filter import ArkCmgrPoolsCommonFilter
 from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_filter import ArkCmgrPoolsFilter
 from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_stats import ArkCmgrPoolsStats
+from ark_sdk_python.models.services.cmgr.ark_cmgr_sync_pool_identifiers import (
+    ArkCmgrPoolIdentifierBulkFailure,
+    ArkCmgrPoolIdentifiersSyncResult,
+    ArkCmgrSyncPoolIdentifiers,
+)
 from ark_sdk_python.models.services.cmgr.ark_cmgr_update_network import ArkCmgrUpdateNetwork
 from ark_sdk_python.models.services.cmgr.ark_cmgr_update_pool import ArkCmgrUpdatePool
 
@@ -65,6 +70,9 @@ __all__ = [
     'ArkCmgrPoolsCommonFilter',
     'ArkCmgrPoolsFilter',
     'ArkCmgrPoolsStats',
+    'ArkCmgrPoolIdentifierBulkFailure',
+    'ArkCmgrPoolIdentifiersSyncResult',
+    'ArkCmgrSyncPoolIdentifiers',
     'ArkCmgrUpdateNetwork',
     'ArkCmgrUpdatePool',
 ]
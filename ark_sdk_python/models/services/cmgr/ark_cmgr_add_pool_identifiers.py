@@ -1,10 +1,13 @@
-from typing import List
+from typing import Final, List
 
 from pydantic import Field
 
 from ark_sdk_python.models import ArkCamelizedModel
 from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers import ArkCmgrPoolIdentifierType
 
+DEFAULT_POOL_IDENTIFIERS_CHUNK_SIZE: Final[int] = 100
+DEFAULT_POOL_IDENTIFIERS_MAX_CONCURRENCY: Final[int] = 4
+
 
 class ArkCmgrAddPoolIdentifier(ArkCamelizedModel):
     type: ArkCmgrPoolIdentifierType = Field(description='Type of identifier to add')
@@ -18,3 +21,9 @@ class ArkCmgrAddPoolSingleIdentifier(ArkCmgrAddPoolIdentifier):
 class ArkCmgrAddPoolBulkIdentifier(ArkCamelizedModel):
     pool_id: str = Field(description='ID of the pool to add the identifiers to')
     identifiers: List[ArkCmgrAddPoolIdentifier] = Field(description='Identifiers to add')
+    chunk_size: int = Field(
+        default=DEFAULT_POOL_IDENTIFIERS_CHUNK_SIZE, ge=1, description='Maximum amount of identifiers to add in a single bulk request'
+    )
+    max_concurrency: int = Field(
+        default=DEFAULT_POOL_IDENTIFIERS_MAX_CONCURRENCY, ge=1, description='Maximum amount of bulk requests to send concurrently'
+    )
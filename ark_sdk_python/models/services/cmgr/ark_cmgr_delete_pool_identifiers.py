@@ -3,6 +3,10 @@ from typing import List
 from pydantic import Field
 
 from ark_sdk_python.models import ArkCamelizedModel
+from ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool_identifiers import (
+    DEFAULT_POOL_IDENTIFIERS_CHUNK_SIZE,
+    DEFAULT_POOL_IDENTIFIERS_MAX_CONCURRENCY,
+)
 
 
 class ArkCmgrDeletePoolIdentifier(ArkCamelizedModel):
@@ -16,3 +20,9 @@ class ArkCmgrDeletePoolSingleIdentifier(ArkCmgrDeletePoolIdentifier):
 class ArkCmgrDeletePoolBulkIdentifier(ArkCamelizedModel):
     pool_id: str = Field(description='ID of the pool to delete the identifiers from')
     identifiers: List[ArkCmgrDeletePoolIdentifier] = Field(description='Identifiers to delete')
+    chunk_size: int = Field(
+        default=DEFAULT_POOL_IDENTIFIERS_CHUNK_SIZE, ge=1, description='Maximum amount of identifiers to delete in a single bulk request'
+    )
+    max_concurrency: int = Field(
+        default=DEFAULT_POOL_IDENTIFIERS_MAX_CONCURRENCY, ge=1, description='Maximum amount of bulk requests to send concurrently'
+    )
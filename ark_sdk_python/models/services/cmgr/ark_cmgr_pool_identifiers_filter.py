@@ -1,6 +1,8 @@
+from pydantic import Field
+
 from ark_sdk_python.models.services.cmgr.ark_cmgr_list_pool_identifiers import ArkCmgrListPoolIdentifiers
 from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_common_filter import ArkCmgrPoolsCommonFilter
 
 
 class ArkCmgrPoolIdentifiersFilter(ArkCmgrListPoolIdentifiers, ArkCmgrPoolsCommonFilter):
-    pass
+    lazy: bool = Field(default=False, description='Whether to return lazy pages, whose items are only validated when they are accessed')
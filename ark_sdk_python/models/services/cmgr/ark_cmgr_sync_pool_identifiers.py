@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from pydantic import Field
+
+from ark_sdk_python.models import ArkCamelizedModel
+from ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool_identifiers import (
+    DEFAULT_POOL_IDENTIFIERS_CHUNK_SIZE,
+    DEFAULT_POOL_IDENTIFIERS_MAX_CONCURRENCY,
+    ArkCmgrAddPoolIdentifier,
+)
+from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers import ArkCmgrPoolIdentifier, ArkCmgrPoolIdentifierType
+
+
+class ArkCmgrSyncPoolIdentifiers(ArkCamelizedModel):
+    pool_id: str = Field(description='ID of the pool to sync the identifiers of')
+    identifiers: List[ArkCmgrAddPoolIdentifier] = Field(description='The desired identifiers of the pool')
+    delete_missing: bool = Field(
+        default=True, description='Whether to delete identifiers of the pool which are not in the desired identifiers'
+    )
+    chunk_size: int = Field(
+        default=DEFAULT_POOL_IDENTIFIERS_CHUNK_SIZE,
+        ge=1,
+        description='Maximum amount of identifiers to add or delete in a single bulk request',
+    )
+    max_concurrency: int = Field(
+        default=DEFAULT_POOL_IDENTIFIERS_MAX_CONCURRENCY, ge=1, description='Maximum amount of bulk requests to send concurrently'
+    )
+
+
+class ArkCmgrPoolIdentifierBulkFailure(ArkCamelizedModel):
+    identifier_id: Optional[str] = Field(default=None, description='ID of the identifier which failed, for deletions')
+    type: Optional[ArkCmgrPoolIdentifierType] = Field(default=None, description='Type of the identifier which failed, for additions')
+    value: Optional[str] = Field(default=None, description='Value of the identifier which failed, for additions')
+    status_code: Optional[int] = Field(default=None, description='Status code of the failed request, if any was received')
+    error: str = Field(description='Failure of the request')
+
+
+class ArkCmgrPoolIdentifiersSyncResult(ArkCamelizedModel):
+    added: List[ArkCmgrPoolIdentifier] = Field(default_factory=list, description='Identifiers which were added to the pool')
+    deleted: List[str] = Field(default_factory=list, description='IDs of the identifiers which were deleted from the pool')
+    unchanged_count: int = Field(default=0, description='Amount of desired identifiers which already existed in the pool')
+    failed: List[ArkCmgrPoolIdentifierBulkFailure] = Field(default_factory=list, description='Identifiers which failed to sync')
@@ -3,6 +3,10 @@ from ark_sdk_python.models.services.identity.roles.ark_identity_add_group_to_rol
 from ark_sdk_python.models.services.identity.roles.ark_identity_add_role_to_role import ArkIdentityAddRoleToRole
 from ark_sdk_python.models.services.identity.roles.ark_identity_add_user_to_role import ArkIdentityAddUserToRole
 from ark_sdk_python.models.services.identity.roles.ark_identity_admin_right import ArkIdentityAdminRights
+from ark_sdk_python.models.services.identity.roles.ark_identity_bulk_add_users_to_roles import (
+    ArkIdentityBulkAddUsersToRoles,
+    ArkIdentityBulkAddUserToRoleResult,
+)
 from ark_sdk_python.models.services.identity.roles.ark_identity_create_role import ArkIdentityCreateRole
 from ark_sdk_python.models.services.identity.roles.ark_identity_delete_role import ArkIdentityDeleteRole
 from ark_sdk_python.models.services.identity.roles.ark_identity_list_role_members import ArkIdentityListRoleMembers
@@ -30,4 +34,6 @@ __all__ = [
     'ArkIdentityUpdateRole',
     'ArkIdentityListRoleMembers',
     'ArkIdentityRoleMember',
+    'ArkIdentityBulkAddUsersToRoles',
+    'ArkIdentityBulkAddUserToRoleResult',
 ]
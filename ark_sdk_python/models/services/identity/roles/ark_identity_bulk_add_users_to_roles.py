@@ -0,0 +1,19 @@
+from typing import List, Optional
+
+from pydantic import Field
+
+from ark_sdk_python.models import ArkModel
+from ark_sdk_python.models.services.identity.roles.ark_identity_add_user_to_role import ArkIdentityAddUserToRole
+
+
+class ArkIdentityBulkAddUsersToRoles(ArkModel):
+    memberships: List[ArkIdentityAddUserToRole] = Field(min_length=1, description='Users and the roles to add them to')
+    max_concurrency: int = Field(default=8, ge=1, description='Maximum amount of role additions to run concurrently')
+    batch_size: int = Field(default=100, ge=1, description='Maximum amount of users to add to a role in a single request')
+
+
+class ArkIdentityBulkAddUserToRoleResult(ArkModel):
+    username: str = Field(description='Username that was requested to be added to the role')
+    role_name: str = Field(description='Name of the role the user was requested to be added to')
+    success: bool = Field(description='Whether the user was added to the role')
+    error: Optional[str] = Field(default=None, description='The failure of the addition, if it failed')
@@ -1,3 +1,7 @@
+from ark_sdk_python.models.services.identity.users.ark_identity_bulk_create_users import (
+    ArkIdentityBulkCreateUserResult,
+    ArkIdentityBulkCreateUsers,
+)
 from ark_sdk_python.models.services.identity.users.ark_identity_create_user import ArkIdentityCreateUser
 from ark_sdk_python.models.services.identity.users.ark_identity_delete_user import ArkIdentityDeleteUser
 from ark_sdk_python.models.services.identity.users.ark_identity_delete_users import ArkIdentityDeleteUsers
@@ -20,4 +24,6 @@ __all__ = [
     'ArkIdentityUserByName',
     'ArkIdentityUpdateUser',
     'ArkIdentityUserInfo',
+    'ArkIdentityBulkCreateUsers',
+    'ArkIdentityBulkCreateUserResult',
 ]
@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+from pydantic import Field
+
+from ark_sdk_python.models import ArkModel
+from ark_sdk_python.models.services.identity.users.ark_identity_create_user import ArkIdentityCreateUser
+from ark_sdk_python.models.services.identity.users.ark_identity_user import ArkIdentityUser
+
+
+class ArkIdentityBulkCreateUsers(ArkModel):
+    users: List[ArkIdentityCreateUser] = Field(min_length=1, description='Users to create')
+    max_concurrency: int = Field(default=8, ge=1, description='Maximum amount of users to create concurrently')
+    batch_size: int = Field(default=100, ge=1, description='Amount of users to create and report on per batch')
+
+
+class ArkIdentityBulkCreateUserResult(ArkModel):
+    username: str = Field(description='Name of the user that was requested to be created')
+    success: bool = Field(description='Whether the user was created and added to all of its roles')
+    user: Optional[ArkIdentityUser] = Field(default=None, description='The created user, if it was created')
+    error: Optional[str] = Field(default=None, description='The failure of the creation, if it failed')
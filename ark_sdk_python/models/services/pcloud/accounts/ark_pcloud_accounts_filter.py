@@ -13,3 +13,9 @@ class ArkPCloudAccountsFilter(ArkModel):
     safe_name: Optional[str] = Field(default=None, description='Safe name to filter by')
     offset: Optional[int] = Field(default=None, description='Offset to the accounts list')
     limit: Optional[int] = Field(default=None, description='Limit of results')
+    max_concurrent_pages: Optional[int] = Field(
+        default=None,
+        description='When given, pages are fetched by offset with up to this amount of concurrent requests, '
+        'while still being returned in order',
+    )
+    lazy: bool = Field(default=False, description='Whether to return lazy pages, whose items are only validated when they are accessed')
@@ -1,4 +1,9 @@
 from ark_sdk_python.models.services.sia.access.ark_sia_access_workspace_type_serializer import serialize_access_workspace_type
+from ark_sdk_python.models.services.sia.access.ark_sia_bulk_connectors import (
+    ArkSIABulkInstallConnectors,
+    ArkSIABulkUninstallConnectors,
+    ArkSIAConnectorOperationResult,
+)
 from ark_sdk_python.models.services.sia.access.ark_sia_connector_setup_script import ArkSIAConnectorSetupScript
 from ark_sdk_python.models.services.sia.access.ark_sia_get_connector_setup_script import ArkSIAGetConnectorSetupScript
 from ark_sdk_python.models.services.sia.access.ark_sia_install_connector import ArkSIAInstallConnector
@@ -9,5 +14,8 @@ __all__ = [
     'ArkSIAConnectorSetupScript',
     'ArkSIAInstallConnector',
     'ArkSIAUninstallConnector',
+    'ArkSIABulkInstallConnectors',
+    'ArkSIABulkUninstallConnectors',
+    'ArkSIAConnectorOperationResult',
     'serialize_access_workspace_type',
 ]
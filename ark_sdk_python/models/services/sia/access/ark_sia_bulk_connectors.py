@@ -0,0 +1,26 @@
+from typing import List, Optional
+
+from pydantic import Field
+
+from ark_sdk_python.models import ArkModel
+from ark_sdk_python.models.services.sia.access.ark_sia_install_connector import ArkSIAInstallConnector
+from ark_sdk_python.models.services.sia.access.ark_sia_uninstall_connector import ArkSIAUninstallConnector
+
+
+class ArkSIABulkInstallConnectors(ArkModel):
+    connectors: List[ArkSIAInstallConnector] = Field(min_length=1, description='Connectors to install, one per target machine')
+    max_concurrency: int = Field(default=10, ge=1, description='Maximum amount of machines to install connectors on concurrently')
+    ready_timeout_seconds: float = Field(default=60.0, gt=0, description='Maximum time to wait for every connector to become active')
+
+
+class ArkSIABulkUninstallConnectors(ArkModel):
+    connectors: List[ArkSIAUninstallConnector] = Field(min_length=1, description='Connectors to uninstall')
+    max_concurrency: int = Field(default=10, ge=1, description='Maximum amount of machines to uninstall connectors from concurrently')
+
+
+class ArkSIAConnectorOperationResult(ArkModel):
+    target_machine: Optional[str] = Field(default=None, description='Target machine of the operation')
+    connector_id: Optional[str] = Field(default=None, description='Connector id which was installed or uninstalled')
+    success: bool = Field(description='Whether the operation was successful or not')
+    error: Optional[str] = Field(default=None, description='The failure of the operation, if it failed')
+    duration_seconds: float = Field(description='Time the operation took on the target machine')
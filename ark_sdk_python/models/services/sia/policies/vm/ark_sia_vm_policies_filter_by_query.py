@@ -30,3 +30,12 @@ class ArkSIAVMQueryPolicies(ArkModel):
         description='Sort the policies based on the field. This parameter sets the sorting order of the retrieved '
         'items. The sorting order can be set to ascending (asc) or descending (desc).',
     )
+    max_concurrent_pages: Optional[int] = Field(
+        default=None,
+        description='When given and no limit is set, the pages following the first one are fetched by offset '
+        'with up to this amount of concurrent requests',
+    )
+    ordered_pages: bool = Field(
+        default=True,
+        description='Whether concurrently fetched pages are returned in order, or as soon as each of them is fetched',
+    )
@@ -1,4 +1,5 @@
 from ark_sdk_python.models.services.sia.sso.ark_sia_sso_acquire_token_response import ArkSIASSOAcquireTokenResponse
+from ark_sdk_python.models.services.sia.sso.ark_sia_sso_credentials_pool_stats import ArkSIASSOCredentialsPoolStats
 from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_client_certificate import (
     ArkSIASSOGetShortLivedClientCertificate,
     ArkSIASSOShortLiveClientCertificateFormat,
@@ -26,4 +27,5 @@ __all__ = [
     'ArkSIASSOGetTokenInfo',
     'ArkSIASSOTokenInfo',
     'ArkSIASSOGetSSHKey',
+    'ArkSIASSOCredentialsPoolStats',
 ]
@@ -0,0 +1,15 @@
+from pydantic import Field
+
+from ark_sdk_python.models import ArkModel
+
+
+class ArkSIASSOCredentialsPoolStats(ArkModel):
+    size: int = Field(description='Amount of credentials currently held by the pool', default=0)
+    hits: int = Field(description='Amount of credentials which were served from the pool', default=0)
+    misses: int = Field(description='Amount of credentials which had to be loaded or minted on demand', default=0)
+    deduplicated: int = Field(description='Amount of requests which waited for a concurrent mint of the same credential', default=0)
+    renewals: int = Field(description='Amount of credentials which were renewed in the background before they expired', default=0)
+    renewal_failures: int = Field(description='Amount of background renewals which failed', default=0)
+    evictions: int = Field(
+        description='Amount of credentials which were dropped since they were not used since their last renewal', default=0
+    )
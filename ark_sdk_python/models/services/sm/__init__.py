@@ -1,6 +1,7 @@
 from ark_sdk_python.models.services.sm.ark_sm_get_session import ArkSMGetSession
 from ark_sdk_python.models.services.sm.ark_sm_get_session_activities import ArkSMGetSessionActivities
 from ark_sdk_python.models.services.sm.ark_sm_protocol_type_serializer import serialize_sm_protocol_type
+from ark_sdk_python.models.services.sm.ark_sm_search_sessions_activities import ArkSMSearchSessionsActivities
 from ark_sdk_python.models.services.sm.ark_sm_session import ArkSMSession, ArkSMSessions, ArkSMSessionStatus
 from ark_sdk_python.models.services.sm.ark_sm_session_activity import ArkSMSessionActivities, ArkSMSessionActivity
 from ark_sdk_python.models.services.sm.ark_sm_session_activity_filter import ArkSMSessionActivitiesFilter
@@ -19,6 +20,7 @@ __all__ = [
     'ArkSMSessionActivity',
     'ArkSMSessionActivities',
     'ArkSMSessionActivitiesFilter',
+    'ArkSMSearchSessionsActivities',
     'serialize_sm_workspace_type',
     'serialize_sm_protocol_type',
 ]
@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+from pydantic import Field, StringConstraints, model_validator
+from typing_extensions import Annotated, Self
+
+from ark_sdk_python.models import ArkCamelizedModel
+
+
+class ArkSMSearchSessionsActivities(ArkCamelizedModel):
+    session_ids: Optional[List[str]] = Field(default=None, description='Session ids to search the activities of')
+    sessions_search: Optional[Annotated[str, StringConstraints(max_length=4096)]] = Field(
+        default=None, description='Free text query of the sessions to search the activities of. For example: "protocol IN SSH"'
+    )
+    search: Optional[Annotated[str, StringConstraints(max_length=4096)]] = Field(
+        default=None, description='Free text query to search the activities by on the server. For example: "command STARTSWITH sudo"'
+    )
+    command_contains: Optional[str] = Field(default=None, description='String which the command contains')
+    max_concurrency: int = Field(default=8, ge=1, description='Maximum amount of sessions to search concurrently')
+
+    @model_validator(mode='after')
+    def validate_either(self) -> Self:
+        if not self.session_ids and not self.sessions_search:
+            raise ValueError('Either session_ids or sessions_search needs to be provided')
+        return self
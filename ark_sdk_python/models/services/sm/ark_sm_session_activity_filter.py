@@ -1,8 +1,14 @@
-from pydantic import Field
+from typing import Optional
+
+from pydantic import Field, StringConstraints
+from typing_extensions import Annotated
 
 from ark_sdk_python.models import ArkCamelizedModel
 
 
 class ArkSMSessionActivitiesFilter(ArkCamelizedModel):
     session_id: str = Field(description='Session id to get')
-    command_contains: str = Field(description='String which the command contains')
+    command_contains: Optional[str] = Field(default=None, description='String which the command contains')
+    search: Optional[Annotated[str, StringConstraints(max_length=4096)]] = Field(
+        default=None, description='Free text query to search the activities by on the server. For example: "command STARTSWITH sudo"'
+    )
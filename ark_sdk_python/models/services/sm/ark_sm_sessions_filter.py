@@ -8,6 +8,7 @@ class ArkSMSessionsFilter(ArkCamelizedModel):
     search: Annotated[str, StringConstraints(max_length=4096)] = Field(
         description='Free text query to search sessions by. For example: "startTime GE 2023-11-18T06:53:30Z AND status IN Failed,Ended AND endReason STARTSWITH Err008"'
     )
+    lazy: bool = Field(default=False, description='Whether to return lazy pages, whose items are only validated when they are accessed')
     model_config = ConfigDict(
         json_schema_extra={
             'examples': [
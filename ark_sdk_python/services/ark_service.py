@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 
 from ark_sdk_python.auth.ark_auth import ArkAuth
 from ark_sdk_python.common import get_logger
+from ark_sdk_python.common.ark_rate_limiter import ArkRateLimiter, ArkRateLimiters
 from ark_sdk_python.models import ArkNotFoundException, ArkValidationException
 from ark_sdk_python.models.services import ArkServiceConfig
 
@@ -10,6 +11,10 @@ from ark_sdk_python.models.services import ArkServiceConfig
 class ArkService(ABC):
     def __init__(self, *authenticators: Any) -> None:
         self._logger = get_logger(self.__class__.__name__)
+        # Services of the same API, such as the sync and async variants, share the rate limit of the API
+        self._rate_limiter: Optional[ArkRateLimiter] = ArkRateLimiters.limiter_for(
+            self.service_config().rate_limit_name or self.service_config().service_name
+        )
         self._authenticators = [auth for auth in authenticators if issubclass(type(auth), ArkAuth)]
         given_auth_names = [auth.authenticator_name() for auth in self._authenticators]
         if any(a not in given_auth_names for a in self.service_config().required_authenticator_names):
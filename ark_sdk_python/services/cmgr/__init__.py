@@ -1,3 +1,4 @@
+from ark_sdk_python.services.cmgr.ark_async_cmgr_service import ArkAsyncCmgrService
 from ark_sdk_python.services.cmgr.ark_cmgr_service import ArkCmgrService
 
-__all__ = ['ArkCmgrService']
+__all__ = ['ArkCmgrService', 'ArkAsyncCmgrService']
@@ -0,0 +1,231 @@
+from http import HTTPStatus
+from json import JSONDecodeError
+from typing import Any, AsyncIterator, Final, Optional, Type
+
+from httpx import Response
+from overrides import overrides
+from pydantic import ValidationError
+
+from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkPage
+from ark_sdk_python.common.isp import ArkAsyncISPServiceClient
+from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.models.services import ArkServiceConfig
+from ark_sdk_python.models.services.cmgr import (
+    ArkCmgrGetNetwork,
+    ArkCmgrGetPool,
+    ArkCmgrListPoolIdentifiers,
+    ArkCmgrNetwork,
+    ArkCmgrNetworksFilter,
+    ArkCmgrPool,
+    ArkCmgrPoolIdentifier,
+    ArkCmgrPoolIdentifiersFilter,
+    ArkCmgrPoolsCommonFilter,
+    ArkCmgrPoolsFilter,
+)
+from ark_sdk_python.services.ark_service import ArkService
+from ark_sdk_python.services.cmgr.ark_cmgr_service import (
+    NETWORK_API,
+    NETWORKS_API,
+    POOL_API,
+    POOL_IDENTIFIERS_API,
+    POOLS_API,
+    ArkCmgrNetworkPage,
+    ArkCmgrPoolPage,
+    ArmCmgrPoolIdentifierPage,
+)
+
+SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
+    service_name='cmgr-async',
+    rate_limit_name='cmgr',
+    required_authenticator_names=['isp'],
+    optional_authenticator_names=[],
+)
+
+
+class ArkAsyncCmgrService(ArkService):
+    def __init__(self, isp_auth: ArkISPAuth) -> None:
+        super().__init__(isp_auth)
+        self.__isp_auth = isp_auth
+        self.__client: ArkAsyncISPServiceClient = ArkAsyncISPServiceClient.from_isp_auth(
+            isp_auth=self.__isp_auth,
+            service_name='connectormanagement',
+            refresh_connection_callback=self.__refresh_cmgr_auth,
+            rate_limiter=self._rate_limiter,
+        )
+
+    async def __refresh_cmgr_auth(self, client: ArkAsyncISPServiceClient) -> None:
+        await ArkAsyncISPServiceClient.refresh_client(client, self.__isp_auth)
+
+    async def __list_common_pools(
+        self,
+        name: str,
+        route: str,
+        item_type: Type[Any],
+        common_filter: Optional[ArkCmgrPoolsCommonFilter] = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[Any]:
+        cont_token = None
+        filters = {'projection': 'EXTENDED'}
+        if common_filter:
+            filters.update(common_filter.model_dump(exclude_none=True))
+        while True:
+            resp = await self.__client.get(route, params=filters)
+            if resp.status_code != HTTPStatus.OK:
+                raise ArkServiceException(f'Failed to list {name} [{resp.text}] - [{resp.status_code}]')
+            page, result = ArkPage[item_type].from_json_field(item_type, resp.content, 'resources', lazy)
+            yield page
+            if 'page' not in result:
+                break
+            page = result['page']
+            if 'continuation_token' not in page or not page['continuation_token']:
+                break
+            cont_token = page['continuation_token']
+            if 'total_resources_count' in page and page['total_resources_count'] and page['page_size'] == page['total_resources_count']:
+                break
+            filters['continuation_token'] = cont_token
+
+    async def list_networks(self) -> AsyncIterator[ArkCmgrNetworkPage]:
+        """
+        Listing all networks, yielding in pages
+
+        Yields:
+            AsyncIterator[ArkCmgrNetworkPage]: _description_
+        """
+        self._logger.info('Listing all networks')
+        async for page in self.__list_common_pools('networks', NETWORKS_API, ArkCmgrNetwork):
+            yield page
+
+    async def list_networks_by(self, networks_filter: ArkCmgrNetworksFilter) -> AsyncIterator[ArkCmgrNetworkPage]:
+        """
+        Listing networks by filters, yielding in pages
+
+        Args:
+            networks_filter (ArkCmgrNetworksFilter): _description_
+
+        Yields:
+            AsyncIterator[ArkCmgrNetworkPage]: _description_
+        """
+        self._logger.info(f'Listing networks by filters [{networks_filter}]')
+        async for page in self.__list_common_pools('networks', NETWORKS_API, ArkCmgrNetwork, networks_filter):
+            yield page
+
+    async def network(self, get_network: ArkCmgrGetNetwork) -> ArkCmgrNetwork:
+        """
+        Retrieves a network by ID.
+
+        Args:
+            get_network (ArkCmgrGetNetwork): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            ArkCmgrNetwork: _description_
+        """
+        self._logger.info(f'Retrieving network [{get_network}]')
+        resp: Response = await self.__client.get(NETWORK_API.format(network_id=get_network.network_id))
+        if resp.status_code == HTTPStatus.OK:
+            try:
+                return ArkCmgrNetwork.model_validate(resp.json())
+            except (ValidationError, JSONDecodeError) as ex:
+                self._logger.exception(f'Failed to parse network response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse network response [{str(ex)}]') from ex
+        raise ArkServiceException(f'Failed to retrieve network [{get_network.network_id}] [{resp.text}] - [{resp.status_code}]')
+
+    async def list_pools(self) -> AsyncIterator[ArkCmgrPoolPage]:
+        """
+        Listing all pools, yielding in pages
+
+        Yields:
+            AsyncIterator[ArkCmgrPoolPage]: _description_
+        """
+        self._logger.info('Listing all pools')
+        async for page in self.__list_common_pools('pools', POOLS_API, ArkCmgrPool):
+            yield page
+
+    async def list_pools_by(self, pools_filter: ArkCmgrPoolsFilter) -> AsyncIterator[ArkCmgrPoolPage]:
+        """
+        Listing pools by filters, yielding in pages
+
+        Args:
+            pools_filter (ArkCmgrPoolsFilter): _description_
+
+        Yields:
+            AsyncIterator[ArkCmgrPoolPage]: _description_
+        """
+        self._logger.info(f'Listing pools by filters [{pools_filter}]')
+        async for page in self.__list_common_pools('pools', POOLS_API, ArkCmgrPool, pools_filter):
+            yield page
+
+    async def pool(self, get_pool: ArkCmgrGetPool) -> ArkCmgrPool:
+        """
+        Retrieves a pool by ID.
+
+        Args:
+            get_pool (ArkCmgrGetPool): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            ArkCmgrPool: _description_
+        """
+        self._logger.info(f'Retrieving pool [{get_pool}]')
+        resp: Response = await self.__client.get(POOL_API.format(pool_id=get_pool.pool_id))
+        if resp.status_code == HTTPStatus.OK:
+            try:
+                return ArkCmgrPool.model_validate(resp.json())
+            except (ValidationError, JSONDecodeError) as ex:
+                self._logger.exception(f'Failed to parse pool response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse pool response [{str(ex)}]') from ex
+        raise ArkServiceException(f'Failed to retrieve pool [{get_pool.pool_id}] [{resp.text}] - [{resp.status_code}]')
+
+    async def list_pool_identifiers(self, list_identifiers: ArkCmgrListPoolIdentifiers) -> AsyncIterator[ArmCmgrPoolIdentifierPage]:
+        """
+        Listing all pool identifiers, yielding in pages
+
+        Args:
+            list_identifiers (ArkCmgrListPoolIdentifiers): _description_
+
+        Yields:
+            AsyncIterator[ArmCmgrPoolIdentifierPage]: _description_
+        """
+        self._logger.info(f'Listing all pool [{list_identifiers}] identifiers')
+        async for page in self.__list_common_pools(
+            'pool identifiers',
+            POOL_IDENTIFIERS_API.format(pool_id=list_identifiers.pool_id),
+            ArkCmgrPoolIdentifier,
+        ):
+            yield page
+
+    async def list_pool_identifiers_by(self, identifiers_filter: ArkCmgrPoolIdentifiersFilter) -> AsyncIterator[ArmCmgrPoolIdentifierPage]:
+        """
+        Listing pool identifiers with filters, yielding in pages
+
+        Args:
+            identifiers_filter (ArkCmgrPoolIdentifiersFilter): _description_
+
+        Yields:
+            AsyncIterator[ArmCmgrPoolIdentifierPage]: _description_
+        """
+        self._logger.info(f'Listing pool identifiers with filters [{identifiers_filter}]')
+        async for page in self.__list_common_pools(
+            'pool identifiers',
+            POOL_IDENTIFIERS_API.format(pool_id=identifiers_filter.pool_id),
+            ArkCmgrPoolIdentifier,
+            ArkCmgrPoolsCommonFilter(**identifiers_filter.model_dump()),
+            identifiers_filter.lazy,
+        ):
+            yield page
+
+    async def aclose(self) -> None:
+        """
+        Closes the connections of the service client.
+        """
+        await self.__client.aclose()
+
+    @staticmethod
+    @overrides
+    def service_config() -> ArkServiceConfig:
+        return SERVICE_CONFIG
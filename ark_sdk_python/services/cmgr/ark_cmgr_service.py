@@ -1,14 +1,16 @@
-import itertools
+import time
 from http import HTTPStatus
-from typing import Any, Final, Iterator, List, Optional, Type
+from typing import Any, Dict, Final, Iterator, List, Optional, Set, Tuple, Type
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
-from requests.exceptions import JSONDecodeError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout, JSONDecodeError, RequestException
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
-from ark_sdk_python.common import ArkPage
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage, ArkStatsAggregator
+from ark_sdk_python.common.ark_request_retrier import ArkRequestRetrier
 from ark_sdk_python.common.isp import ArkISPServiceClient
 from ark_sdk_python.models import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
@@ -16,6 +18,7 @@ from ark_sdk_python.models.services.cmgr import (
     ArkCmgrAddNetwork,
     ArkCmgrAddPool,
     ArkCmgrAddPoolBulkIdentifier,
+    ArkCmgrAddPoolIdentifier,
     ArkCmgrAddPoolSingleIdentifier,
     ArkCmgrDeleteNetwork,
     ArkCmgrDeletePool,
@@ -32,15 +35,18 @@ from ark_sdk_python.models.services.cmgr import (
     ArkCmgrPoolComponent,
     ArkCmgrPoolComponentsFilter,
     ArkCmgrPoolIdentifier,
+    ArkCmgrPoolIdentifierBulkFailure,
     ArkCmgrPoolIdentifiers,
     ArkCmgrPoolIdentifiersFilter,
+    ArkCmgrPoolIdentifiersSyncResult,
     ArkCmgrPoolsCommonFilter,
     ArkCmgrPoolsFilter,
     ArkCmgrPoolsStats,
+    ArkCmgrSyncPoolIdentifiers,
     ArkCmgrUpdateNetwork,
     ArkCmgrUpdatePool,
 )
-from ark_sdk_python.models.services.cmgr.ark_cmgr_bulk_response import ArkCmgrBulkResponses
+from ark_sdk_python.models.services.cmgr.ark_cmgr_bulk_response import ArkCmgrBulkResponse, ArkCmgrBulkResponses
 from ark_sdk_python.services.ark_service import ArkService
 
 SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
@@ -55,12 +61,18 @@ POOL_IDENTIFIERS_BULK_API: Final[str] = 'api/pool-service/pools/{pool_id}/identi
 POOL_IDENTIFIER_API: Final[str] = 'api/pool-service/pools/{pool_id}/identifiers/{identifier_id}'
 POOLS_COMPONENTS_API: Final[str] = 'api/pool-service/pools/components'
 POOL_COMPONENT_API: Final[str] = 'api/pool-service/pools/{pool_id}/components/{component_id}'
+MAX_REPORTED_BULK_FAILURES: Final[int] = 20
+# Statuses of a whole bulk request which guarantee that none of its sub requests were processed
+UNPROCESSED_BULK_STATUSES: Final[Set[int]] = {HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE}
 
 ArkCmgrNetworkPage = ArkPage[ArkCmgrNetwork]
 ArkCmgrPoolPage = ArkPage[ArkCmgrPool]
 ArmCmgrPoolIdentifierPage = ArkPage[ArkCmgrPoolIdentifier]
 ArkCmgrPoolComponentPage = ArkPage[ArkCmgrPoolComponent]
 
+# Failures of bulk sub requests by the index of their item, as the status code if any was received and the error
+ArkCmgrBulkFailures = Dict[int, Tuple[Optional[int], str]]
+
 
 class ArkCmgrService(ArkService):
     def __init__(self, isp_auth: ArkISPAuth) -> None:
@@ -70,13 +82,19 @@ class ArkCmgrService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='connectormanagement',
             refresh_connection_callback=self.__refresh_cmgr_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_cmgr_auth(self, client: ArkISPServiceClient) -> None:
         ArkISPServiceClient.refresh_client(client, self.__isp_auth)
 
     def __list_common_pools(
-        self, name: str, route: str, item_type: Type[Any], common_filter: Optional[ArkCmgrPoolsCommonFilter] = None
+        self,
+        name: str,
+        route: str,
+        item_type: Type[Any],
+        common_filter: Optional[ArkCmgrPoolsCommonFilter] = None,
+        lazy: bool = False,
     ) -> Iterator[Any]:
         cont_token = None
         filters = {'projection': 'EXTENDED'}
@@ -86,8 +104,8 @@ class ArkCmgrService(ArkService):
             resp = self.__client.get(route, params=filters)
             if resp.status_code != HTTPStatus.OK:
                 raise ArkServiceException(f'Failed to list {name} [{resp.text}] - [{resp.status_code}]')
-            result = resp.json()
-            yield ArkPage[item_type](TypeAdapter(List[item_type]).validate_python(result['resources']))
+            page, result = ArkPage[item_type].from_json_field(item_type, resp.content, 'resources', lazy)
+            yield page
             if 'page' not in result:
                 break
             page = result['page']
@@ -98,16 +116,156 @@ class ArkCmgrService(ArkService):
                 break
             filters['continuation_token'] = cont_token
 
+    def __send_pool_identifiers_bulk(self, method: str, pool_id: str, requests: Dict[str, Any]) -> Response:
+        return getattr(self.__client, method)(POOL_IDENTIFIERS_BULK_API.format(pool_id=pool_id), json={'requests': requests})
+
+    def __parse_pool_identifiers_bulk(self, response: Response) -> Dict[str, ArkCmgrBulkResponse]:
+        try:
+            return ArkCmgrBulkResponses.model_validate(response.json()).responses
+        except (ValidationError, JSONDecodeError, KeyError) as ex:
+            self._logger.exception(f'Failed to parse pool identifiers bulk response [{str(ex)}] - [{response.text}]')
+            raise ArkServiceException(f'Failed to parse pool identifiers bulk response [{str(ex)}]') from ex
+
     @staticmethod
-    def __identifiers_by_add_pool_identifies_response(response: Response) -> ArkCmgrPoolIdentifiers:
-        identifiers_responses: ArkCmgrBulkResponses = ArkCmgrBulkResponses.model_validate(response.json())
-        identifiers: List[ArkCmgrPoolIdentifier] = []
-        for identifier_response in identifiers_responses.responses.values():
-            if identifier_response.status_code != HTTPStatus.CREATED:
-                raise ArkServiceException(f'Failed to add pool identifiers bulk [{response.text}] - [{response.status_code}]')
-            identifiers.append(ArkCmgrPoolIdentifier.model_validate(identifier_response.body))
+    def __is_retryable_bulk_error(method: str, error: RequestException, retrier: ArkRequestRetrier) -> bool:
+        if not isinstance(error, RequestsConnectionError) or not retrier.policy.retry_on_connection_errors:
+            # Read timeouts are ambiguous, the bulk may have been applied by the server
+            return False
+        # Idempotent bulks were already retried by the client, and other bulks are only safe to resend when they never reached the server
+        return not retrier.is_retryable_method(method) and isinstance(error, ConnectTimeout)
 
-        return ArkCmgrPoolIdentifiers(identifiers=identifiers)
+    @staticmethod
+    def __is_retryable_bulk_status(method: str, status_code: int, retrier: ArkRequestRetrier) -> bool:
+        # Idempotent bulks were already retried by the client, and other bulks are only safe to resend when the server did not process them
+        return (
+            not retrier.is_retryable_method(method)
+            and status_code in UNPROCESSED_BULK_STATUSES
+            and retrier.is_retryable_status(status_code)
+        )
+
+    def __run_pool_identifiers_chunk(
+        self,
+        method: str,
+        pool_id: str,
+        requests: Dict[int, Any],
+        expected_status: HTTPStatus,
+        retrier: ArkRequestRetrier,
+    ) -> Tuple[Dict[int, ArkCmgrBulkResponse], ArkCmgrBulkFailures]:
+        succeeded: Dict[int, ArkCmgrBulkResponse] = {}
+        failed: ArkCmgrBulkFailures = {}
+        pending = requests
+        delay = 0.0
+        for attempt in range(retrier.policy.max_retries + 1):
+            retryable: Dict[int, Any] = {}
+            retry_after: Optional[str] = None
+            try:
+                response = self.__send_pool_identifiers_bulk(method, pool_id, {str(index): request for index, request in pending.items()})
+            except RequestException as ex:
+                failed.update({index: (None, f'Failed to send pool identifiers bulk [{str(ex)}]') for index in pending})
+                if self.__is_retryable_bulk_error(method, ex, retrier):
+                    retryable = pending
+            else:
+                if response.status_code != HTTPStatus.MULTI_STATUS:
+                    failed.update({index: (response.status_code, response.text) for index in pending})
+                    if self.__is_retryable_bulk_status(method, response.status_code, retrier):
+                        retryable = pending
+                        retry_after = response.headers.get('Retry-After')
+                else:
+                    try:
+                        responses = self.__parse_pool_identifiers_bulk(response)
+                    except ArkServiceException as ex:
+                        failed.update({index: (response.status_code, str(ex)) for index in pending})
+                        break
+                    for index, request in pending.items():
+                        sub_response = responses.get(str(index))
+                        if sub_response is not None and sub_response.status_code == expected_status:
+                            succeeded[index] = sub_response
+                            failed.pop(index, None)
+                            continue
+                        if sub_response is None:
+                            failed[index] = (None, 'Missing response for bulk request')
+                            continue
+                        failed[index] = (int(sub_response.status_code), str(sub_response.body))
+                        if retrier.is_retryable_status(sub_response.status_code):
+                            retryable[index] = request
+            if not retryable or attempt == retrier.policy.max_retries or not retrier.acquire_retry():
+                break
+            self._logger.debug(f'Retrying [{len(retryable)}] failed pool identifiers bulk requests')
+            delay = retrier.next_delay(delay, retry_after)
+            time.sleep(delay)
+            pending = retryable
+        return succeeded, failed
+
+    def __run_pool_identifiers_bulk(
+        self,
+        method: str,
+        pool_id: str,
+        requests: List[Any],
+        expected_status: HTTPStatus,
+        chunk_size: int,
+        max_concurrency: int,
+    ) -> Tuple[Dict[int, ArkCmgrBulkResponse], ArkCmgrBulkFailures]:
+        # Requests are sent in chunks with a bounded amount of concurrent chunks, and within every chunk only the sub requests
+        # which failed with a retryable status are retried, along with whole chunks which were certainly not processed by the server
+        retrier = ArkRequestRetrier(self.__client.retry_policy)
+        succeeded: Dict[int, ArkCmgrBulkResponse] = {}
+        failed: ArkCmgrBulkFailures = {}
+        for chunk_succeeded, chunk_failed in ArkConcurrentPager.fetch_pages(
+            fetch_page=lambda offset: self.__run_pool_identifiers_chunk(
+                method,
+                pool_id,
+                {index: requests[index - 1] for index in range(offset + 1, min(offset + chunk_size, len(requests)) + 1)},
+                expected_status,
+                retrier,
+            ),
+            offsets=range(0, len(requests), chunk_size),
+            max_workers=max_concurrency,
+        ):
+            succeeded.update(chunk_succeeded)
+            failed.update(chunk_failed)
+        return succeeded, failed
+
+    def __add_pool_identifiers(
+        self, pool_id: str, identifiers: List[ArkCmgrAddPoolIdentifier], chunk_size: int, max_concurrency: int
+    ) -> Tuple[List[ArkCmgrPoolIdentifier], List[ArkCmgrPoolIdentifierBulkFailure]]:
+        succeeded, failed = self.__run_pool_identifiers_bulk(
+            'post',
+            pool_id,
+            [i.model_dump(exclude={'pool_id'}) for i in identifiers],
+            HTTPStatus.CREATED,
+            chunk_size,
+            max_concurrency,
+        )
+        added: List[ArkCmgrPoolIdentifier] = []
+        for index in sorted(succeeded):
+            try:
+                added.append(ArkCmgrPoolIdentifier.model_validate(succeeded[index].body))
+            except ValidationError as ex:
+                failed[index] = (int(succeeded[index].status_code), f'Failed to parse added pool identifier [{str(ex)}]')
+        failures = [
+            ArkCmgrPoolIdentifierBulkFailure(
+                type=identifiers[index - 1].type, value=identifiers[index - 1].value, status_code=status_code, error=error
+            )
+            for index, (status_code, error) in sorted(failed.items())
+        ]
+        return added, failures
+
+    def __delete_pool_identifiers(
+        self, pool_id: str, identifier_ids: List[str], chunk_size: int, max_concurrency: int
+    ) -> Tuple[List[str], List[ArkCmgrPoolIdentifierBulkFailure]]:
+        succeeded, failed = self.__run_pool_identifiers_bulk(
+            'delete',
+            pool_id,
+            [{'id': identifier_id} for identifier_id in identifier_ids],
+            HTTPStatus.NO_CONTENT,
+            chunk_size,
+            max_concurrency,
+        )
+        failures = [
+            ArkCmgrPoolIdentifierBulkFailure(identifier_id=identifier_ids[index - 1], status_code=status_code, error=error)
+            for index, (status_code, error) in sorted(failed.items())
+        ]
+        return [identifier_ids[index - 1] for index in sorted(succeeded)], failures
 
     def add_network(self, add_network: ArkCmgrAddNetwork) -> ArkCmgrNetwork:
         """
@@ -238,10 +396,14 @@ class ArkCmgrService(ArkService):
             ArkCmgrNetworksStats: _description_
         """
         self._logger.info('Calculating network stats')
-        networks = list(itertools.chain.from_iterable([p.items for p in list(self.list_networks())]))
+        aggregator: ArkStatsAggregator[ArkCmgrNetwork] = (
+            ArkStatsAggregator()
+            .map_by('pools_count', lambda n: n.name, lambda n: len(n.assigned_pools))
+            .consume_pages(self.list_networks())
+        )
         networks_stats = ArkCmgrNetworksStats.model_construct()
-        networks_stats.networks_count = len(networks)
-        networks_stats.pools_count_per_network = {n.name: len(n.assigned_pools) for n in networks}
+        networks_stats.networks_count = aggregator.count
+        networks_stats.pools_count_per_network = aggregator.values('pools_count')
         return networks_stats
 
     def add_pool(self, add_pool: ArkCmgrAddPool) -> ArkCmgrPool:
@@ -371,12 +533,18 @@ class ArkCmgrService(ArkService):
             ArkCmgrPoolsStats: _description_
         """
         self._logger.info('Calculating pools stats')
-        pools = list(itertools.chain.from_iterable([p.items for p in list(self.list_pools())]))
+        aggregator: ArkStatsAggregator[ArkCmgrPool] = (
+            ArkStatsAggregator()
+            .map_by('networks_count', lambda p: p.name, lambda p: len(p.assigned_network_ids))
+            .map_by('identifiers_count', lambda p: p.name, lambda p: p.identifiers_count)
+            .map_by('components_count', lambda p: p.name, lambda p: p.components_count)
+            .consume_pages(self.list_pools())
+        )
         pools_stats = ArkCmgrPoolsStats.model_construct()
-        pools_stats.pools_count = len(pools)
-        pools_stats.networks_count_per_pool = {p.name: len(p.assigned_network_ids) for p in pools}
-        pools_stats.identifiers_count_per_pool = {p.name: p.identifiers_count for p in pools}
-        pools_stats.components_count_per_pool = {p.name: p.components_count for p in pools}
+        pools_stats.pools_count = aggregator.count
+        pools_stats.networks_count_per_pool = aggregator.values('networks_count')
+        pools_stats.identifiers_count_per_pool = aggregator.values('identifiers_count')
+        pools_stats.components_count_per_pool = aggregator.values('components_count')
         return pools_stats
 
     def add_pool_identifier(self, add_identifier: ArkCmgrAddPoolSingleIdentifier) -> ArkCmgrPoolIdentifier:
@@ -407,6 +575,7 @@ class ArkCmgrService(ArkService):
     def add_pool_identifiers(self, add_identifiers: ArkCmgrAddPoolBulkIdentifier) -> ArkCmgrPoolIdentifiers:
         """
         Adds a bulk of new pool identifiers.
+        The identifiers are split into chunks which are sent concurrently, and failed sub requests are retried when retryable.
 
         Args:
             add_identifiers (ArkCmgrAddPoolBulkIdentifier): The identifiers to add.
@@ -415,22 +584,18 @@ class ArkCmgrService(ArkService):
             ArkCmgrPoolIdentifiers: Detailed information about the added identifiers.
 
         Raises:
-            ArkServiceException: In case the response is not MULTI_STATUS, or if one of the responses is not CREATED.
-        """
-        self._logger.info(f'Adding new pool identifiers bulk [{add_identifiers}]')
-        response: Response = self.__client.post(
-            POOL_IDENTIFIERS_BULK_API.format(pool_id=add_identifiers.pool_id),
-            json={
-                'requests': {str(index): i.model_dump(exclude={'pool_id'}) for index, i in enumerate(add_identifiers.identifiers, start=1)}
-            },
+            ArkServiceException: In case any of the identifiers failed to be added, listing all the failed identifiers.
+        """
+        self._logger.info(f'Adding [{len(add_identifiers.identifiers)}] new pool identifiers to pool [{add_identifiers.pool_id}]')
+        added, failures = self.__add_pool_identifiers(
+            add_identifiers.pool_id, add_identifiers.identifiers, add_identifiers.chunk_size, add_identifiers.max_concurrency
         )
-        if response.status_code == HTTPStatus.MULTI_STATUS:
-            try:
-                return self.__identifiers_by_add_pool_identifies_response(response=response)
-            except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add pool identifiers bulk response [{str(ex)}] - [{response.text}]')
-                raise ArkServiceException(f'Failed to parse add pool identifiers bulk response [{str(ex)}]') from ex
-        raise ArkServiceException(f'Failed to add pool identifiers bulk [{response.text}] - [{response.status_code}]')
+        if failures:
+            raise ArkServiceException(
+                f'Failed to add [{len(failures)}/{len(add_identifiers.identifiers)}] pool identifiers bulk '
+                f'[{", ".join(f"{f.value} - [{f.status_code}] {f.error}" for f in failures[:MAX_REPORTED_BULK_FAILURES])}]'
+            )
+        return ArkCmgrPoolIdentifiers(identifiers=added)
 
     def delete_pool_identifier(self, delete_identifier: ArkCmgrDeletePoolSingleIdentifier) -> None:
         """
@@ -452,25 +617,26 @@ class ArkCmgrService(ArkService):
     def delete_pool_identifiers(self, delete_identifiers: ArkCmgrDeletePoolBulkIdentifier) -> None:
         """
         Deletes the given bulk of pool identifiers.
+        The identifiers are split into chunks which are sent concurrently, and failed sub requests are retried when retryable.
 
         Args:
             delete_identifiers (ArkCmgrDeletePoolBulkIdentifier): List of identifiers to delete.
 
         Raises:
-            ArkServiceException: In case the response is not MULTI_STATUS, or if one of the responses is not NO_CONTENT.
-        """
-        self._logger.info(f'Deleting pool identifiers bulk [{delete_identifiers}]')
-        resp: Response = self.__client.delete(
-            POOL_IDENTIFIERS_BULK_API.format(pool_id=delete_identifiers.pool_id),
-            json={'requests': {str(index): {'id': i.identifier_id} for index, i in enumerate(delete_identifiers.identifiers, start=1)}},
+            ArkServiceException: In case any of the identifiers failed to be deleted, listing all the failed identifiers.
+        """
+        self._logger.info(f'Deleting [{len(delete_identifiers.identifiers)}] pool identifiers from pool [{delete_identifiers.pool_id}]')
+        _, failures = self.__delete_pool_identifiers(
+            delete_identifiers.pool_id,
+            [i.identifier_id for i in delete_identifiers.identifiers],
+            delete_identifiers.chunk_size,
+            delete_identifiers.max_concurrency,
         )
-        if resp.status_code == HTTPStatus.MULTI_STATUS:
-            delete_responses: ArkCmgrBulkResponses = ArkCmgrBulkResponses.model_validate(resp.json())
-            for _, identifier_response in delete_responses.responses.items():
-                if identifier_response.status_code != HTTPStatus.NO_CONTENT:
-                    raise ArkServiceException(f'Failed to delete pool identifiers [{resp.text}] - [{resp.status_code}]')
-        else:
-            raise ArkServiceException(f'Failed to delete pool identifier [{resp.text}] - [{resp.status_code}]')
+        if failures:
+            raise ArkServiceException(
+                f'Failed to delete [{len(failures)}/{len(delete_identifiers.identifiers)}] pool identifiers bulk '
+                f'[{", ".join(f"{f.identifier_id} - [{f.status_code}] {f.error}" for f in failures[:MAX_REPORTED_BULK_FAILURES])}]'
+            )
 
     def list_pool_identifiers(self, list_identifiers: ArkCmgrListPoolIdentifiers) -> Iterator[ArmCmgrPoolIdentifierPage]:
         """
@@ -505,7 +671,46 @@ class ArkCmgrService(ArkService):
             POOL_IDENTIFIERS_API.format(pool_id=identifiers_filter.pool_id),
             ArkCmgrPoolIdentifier,
             ArkCmgrPoolsCommonFilter(**identifiers_filter.model_dump()),
+            identifiers_filter.lazy,
+        )
+
+    def sync_pool_identifiers(self, sync_identifiers: ArkCmgrSyncPoolIdentifiers) -> ArkCmgrPoolIdentifiersSyncResult:
+        """
+        Syncs the identifiers of a pool to the given desired identifiers.
+        The current identifiers of the pool are listed and diffed against the desired ones by their type and value,
+        only the missing identifiers are added and, unless disabled, only the identifiers which are not desired are deleted.
+        Both are sent as chunked and concurrent bulk requests, and failures are reported per identifier instead of raised.
+
+        Args:
+            sync_identifiers (ArkCmgrSyncPoolIdentifiers): _description_
+
+        Returns:
+            ArkCmgrPoolIdentifiersSyncResult: _description_
+        """
+        self._logger.info(f'Syncing [{len(sync_identifiers.identifiers)}] identifiers of pool [{sync_identifiers.pool_id}]')
+        current: Dict[Tuple[str, str], str] = {}
+        for page in self.list_pool_identifiers(ArkCmgrListPoolIdentifiers(pool_id=sync_identifiers.pool_id)):
+            current.update({(identifier.type, identifier.value): identifier.id for identifier in page})
+        desired: Dict[Tuple[str, str], ArkCmgrAddPoolIdentifier] = {
+            (identifier.type, identifier.value): identifier for identifier in sync_identifiers.identifiers
+        }
+        to_add = [identifier for key, identifier in desired.items() if key not in current]
+        to_delete = (
+            [identifier_id for key, identifier_id in current.items() if key not in desired] if sync_identifiers.delete_missing else []
         )
+        self._logger.info(f'Adding [{len(to_add)}] and deleting [{len(to_delete)}] identifiers of pool [{sync_identifiers.pool_id}]')
+        result = ArkCmgrPoolIdentifiersSyncResult(unchanged_count=len(desired) - len(to_add))
+        if to_add:
+            result.added, add_failures = self.__add_pool_identifiers(
+                sync_identifiers.pool_id, to_add, sync_identifiers.chunk_size, sync_identifiers.max_concurrency
+            )
+            result.failed.extend(add_failures)
+        if to_delete:
+            result.deleted, delete_failures = self.__delete_pool_identifiers(
+                sync_identifiers.pool_id, to_delete, sync_identifiers.chunk_size, sync_identifiers.max_concurrency
+            )
+            result.failed.extend(delete_failures)
+        return result
 
     def list_pools_components(self) -> Iterator[ArkCmgrPoolComponentPage]:
         """
@@ -1,3 +1,5 @@
+from ark_sdk_python.services.identity.common.ark_async_identity_base_service import ArkAsyncIdentityBaseService
 from ark_sdk_python.services.identity.common.ark_identity_base_service import ArkIdentityBaseService
+from ark_sdk_python.services.identity.common.ark_identity_lookup_cache import ArkIdentityLookupCache
 
-__all__ = ['ArkIdentityBaseService']
+__all__ = ['ArkIdentityBaseService', 'ArkAsyncIdentityBaseService', 'ArkIdentityLookupCache']
@@ -0,0 +1,63 @@
+import os
+
+from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common.ark_async_http_client import ArkAsyncHttpClient
+from ark_sdk_python.common.env import ROOT_DOMAIN, AwsEnv, is_gov_cloud
+from ark_sdk_python.common.isp import ArkAsyncISPServiceClient
+from ark_sdk_python.services.ark_service import ArkService
+from ark_sdk_python.services.identity.common.ark_identity_lookup_cache import ArkIdentityLookupCache
+
+
+class ArkAsyncIdentityBaseService(ArkService):
+    def __init__(self, isp_auth: ArkISPAuth) -> None:
+        super().__init__(isp_auth)
+        self._isp_auth = isp_auth
+        self._lookup_cache = ArkIdentityLookupCache.for_auth(isp_auth)
+        self._idp_client = ArkAsyncHttpClient(
+            isp_auth.token.endpoint,
+            isp_auth.token.token.get_secret_value(),
+            connection_pool_settings=isp_auth.connection_pool.settings,
+            retry_policy=isp_auth.retry_policy,
+            rate_limiter=self._rate_limiter,
+        )
+        self._idp_client.add_headers(
+            {
+                'Content-Type': 'application/json',
+                'X-IDAP-NATIVE-CLIENT': 'true',
+                'Authorization': f'Bearer {isp_auth.token.token.get_secret_value()}',
+            }
+        )
+        if not is_gov_cloud():
+            self._client = None
+            self._url_prefix = 'api/idadmin/'
+            self._env = None
+            if 'env' in isp_auth.token.metadata.keys():
+                self._env = AwsEnv(isp_auth.token.metadata['env'])
+            else:
+                self._env = AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
+            try:
+                self._client: ArkAsyncISPServiceClient = ArkAsyncISPServiceClient.from_isp_auth(
+                    isp_auth=self._isp_auth,
+                    refresh_connection_callback=self.__refresh_identity_auth,
+                    rate_limiter=self._rate_limiter,
+                )
+                self._env = self._client.tenant_env
+            except Exception:
+                self._client = self._idp_client
+                if any(f'id.{d}' in self._idp_client.base_url for d in ROOT_DOMAIN.values()):
+                    self._url_prefix = ''
+        else:
+            self._client = self._idp_client
+            self._url_prefix = ''
+            self._env = AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.GOV_PROD.value))
+
+    async def __refresh_identity_auth(self, client: ArkAsyncISPServiceClient) -> None:
+        await ArkAsyncISPServiceClient.refresh_client(client, self._isp_auth)
+
+    async def aclose(self) -> None:
+        """
+        Closes the connections of the service clients.
+        """
+        if self._client is not self._idp_client:
+            await self._client.aclose()
+        await self._idp_client.aclose()
@@ -5,15 +5,20 @@ from ark_sdk_python.common.ark_client import ArkClient
 from ark_sdk_python.common.env import ROOT_DOMAIN, AwsEnv, is_gov_cloud
 from ark_sdk_python.common.isp import ArkISPServiceClient
 from ark_sdk_python.services.ark_service import ArkService
+from ark_sdk_python.services.identity.common.ark_identity_lookup_cache import ArkIdentityLookupCache
 
 
 class ArkIdentityBaseService(ArkService):
     def __init__(self, isp_auth: ArkISPAuth) -> None:
         super().__init__(isp_auth)
         self._isp_auth = isp_auth
+        self._lookup_cache = ArkIdentityLookupCache.for_auth(isp_auth)
         self._idp_client = ArkClient(
             isp_auth.token.endpoint,
             isp_auth.token.token.get_secret_value(),
+            connection_pool=isp_auth.connection_pool,
+            retry_policy=isp_auth.retry_policy,
+            rate_limiter=self._rate_limiter,
         )
         self._idp_client.add_headers(
             {
@@ -34,6 +39,7 @@ class ArkIdentityBaseService(ArkService):
                 self._client: ArkISPServiceClient = ArkISPServiceClient.from_isp_auth(
                     isp_auth=self._isp_auth,
                     refresh_connection_callback=self.__refresh_identity_auth,
+                    rate_limiter=self._rate_limiter,
                 )
                 self._env = self._client.tenant_env
             except Exception:
@@ -0,0 +1,121 @@
+import threading
+from typing import Any, Callable, Final, Hashable, Optional, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+
+from cachetools import TTLCache
+
+from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+
+LookupValue = TypeVar('LookupValue')
+
+DEFAULT_LOOKUP_CACHE_TTL_SECONDS: Final[int] = 300
+DEFAULT_LOOKUP_CACHE_MAX_SIZE: Final[int] = 50000
+
+
+class ArkIdentityLookupCache:
+    """
+    TTL bounded cache of identity lookups which rarely change, such as directory uuids, the tenant suffix and role and user name to id resolution.
+    The cache is shared by all the identity services which were created with the same authenticator, which is the case for the services of one `ArkAPI`,
+    so bulk operations resolve every name once instead of once per operation.
+    Services invalidate the affected lookups when they create, rename or delete entities, and the TTL bounds changes made outside of this process.
+    """
+
+    DIRECTORIES: Final[str] = 'directories'
+    TENANT_SUFFIX: Final[str] = 'tenant_suffix'
+    ROLE_ID: Final[str] = 'role_id'
+    USER_ID: Final[str] = 'user_id'
+
+    __CACHES_LOCK: Final[threading.Lock] = threading.Lock()
+    __CACHES: 'WeakKeyDictionary[ArkISPAuth, ArkIdentityLookupCache]' = WeakKeyDictionary()
+
+    def __init__(self, ttl_seconds: float = DEFAULT_LOOKUP_CACHE_TTL_SECONDS, max_size: int = DEFAULT_LOOKUP_CACHE_MAX_SIZE) -> None:
+        self.__lock = threading.Lock()
+        self.__cache: TTLCache = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+
+    @staticmethod
+    def for_auth(isp_auth: ArkISPAuth) -> 'ArkIdentityLookupCache':
+        """
+        Returns the lookup cache shared by the identity services of the given authenticator.
+
+        Args:
+            isp_auth (ArkISPAuth): _description_
+
+        Returns:
+            ArkIdentityLookupCache: _description_
+        """
+        with ArkIdentityLookupCache.__CACHES_LOCK:
+            cache = ArkIdentityLookupCache.__CACHES.get(isp_auth)
+            if cache is None:
+                cache = ArkIdentityLookupCache()
+                ArkIdentityLookupCache.__CACHES[isp_auth] = cache
+            return cache
+
+    def get(self, namespace: str, key: Hashable = None, default: Any = None) -> Any:
+        """
+        Returns the cached lookup of the given namespace and key, or the default when it is not cached or expired.
+
+        Args:
+            namespace (str): _description_
+            key (Hashable): _description_. Defaults to None.
+            default (Any): _description_. Defaults to None.
+
+        Returns:
+            Any: _description_
+        """
+        with self.__lock:
+            return self.__cache.get((namespace, key), default)
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        """
+        Caches the lookup of the given namespace and key.
+
+        Args:
+            namespace (str): _description_
+            key (Hashable): _description_
+            value (Any): _description_
+        """
+        with self.__lock:
+            self.__cache[(namespace, key)] = value
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], LookupValue]) -> LookupValue:
+        """
+        Returns the cached lookup of the given namespace and key, loading and caching it when it is not cached.
+        The loader runs outside of the cache lock, and failures of the loader are not cached.
+
+        Args:
+            namespace (str): _description_
+            key (Hashable): _description_
+            loader (Callable[[], LookupValue]): _description_
+
+        Returns:
+            LookupValue: _description_
+        """
+        missing = object()
+        value = self.get(namespace, key, missing)
+        if value is missing:
+            value = loader()
+            self.set(namespace, key, value)
+        return value
+
+    def invalidate(self, namespace: str, key: Optional[Hashable] = None) -> None:
+        """
+        Invalidates a single cached lookup, or all the lookups of the namespace when no key is given.
+
+        Args:
+            namespace (str): _description_
+            key (Optional[Hashable]): _description_. Defaults to None.
+        """
+        with self.__lock:
+            if key is not None:
+                self.__cache.pop((namespace, key), None)
+                return
+            keys: Tuple[Tuple[str, Hashable], ...] = tuple(k for k in self.__cache.keys() if k[0] == namespace)
+            for k in keys:
+                self.__cache.pop(k, None)
+
+    def clear(self) -> None:
+        """
+        Invalidates all the cached lookups.
+        """
+        with self.__lock:
+            self.__cache.clear()
@@ -3,10 +3,11 @@ from http import HTTPStatus
 from typing import Final, List
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
+from ark_sdk_python.models import ArkTypeAdapters
 from ark_sdk_python.models.ark_exceptions import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.identity.connectors import (
@@ -44,7 +45,7 @@ class ArkIdentityConnectorsService(ArkIdentityBaseService):
                 raise ArkServiceException('Failed to retrieve identity connectors')
             if len(query_result['Result']["Results"]) == 0:
                 return []
-            return TypeAdapter(List[ArkIdentityConnectorInfo]).validate_python([r['Row'] for r in query_result['Result']["Results"]])
+            return ArkTypeAdapters.validate_python(List[ArkIdentityConnectorInfo], [r['Row'] for r in query_result['Result']["Results"]])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
             self._logger.exception(f'Failed to retrieve identity connectors [{str(ex)}] - [{response.text}]')
             raise ArkServiceException(f'Failed to retrieve identity connectors [{str(ex)}]') from ex
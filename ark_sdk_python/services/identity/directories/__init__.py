@@ -1,3 +1,4 @@
+from ark_sdk_python.services.identity.directories.ark_async_identity_directories_service import ArkAsyncIdentityDirectoriesService
 from ark_sdk_python.services.identity.directories.ark_identity_directories_service import ArkIdentityDirectoriesService
 
-__all__ = ['ArkIdentityDirectoriesService']
+__all__ = ['ArkIdentityDirectoriesService', 'ArkAsyncIdentityDirectoriesService']
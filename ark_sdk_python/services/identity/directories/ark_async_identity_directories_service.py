@@ -0,0 +1,172 @@
+from http import HTTPStatus
+from json import JSONDecodeError
+from typing import AsyncIterator, Final, List
+
+from httpx import Response
+from overrides import overrides
+from pydantic import ValidationError
+
+from ark_sdk_python.common.env import SHELL_DOMAIN, check_if_identity_generated_suffix
+from ark_sdk_python.models.ark_exceptions import ArkServiceException
+from ark_sdk_python.models.common.identity import (
+    DirectorySearchArgs,
+    DirectoryService,
+    DirectoryServiceQueryResponse,
+    DirectoryServiceRow,
+    GetDirectoryServicesResponse,
+    GetTenantSuffixResult,
+)
+from ark_sdk_python.models.common.identity.ark_identity_directory_schemas import DirectoryServiceQueryRequest
+from ark_sdk_python.models.services import ArkServiceConfig
+from ark_sdk_python.models.services.identity.directories import (
+    ArkIdentityDirectory,
+    ArkIdentityListDirectories,
+    ArkIdentityListDirectoriesEntities,
+)
+from ark_sdk_python.services.identity.common import ArkAsyncIdentityBaseService, ArkIdentityLookupCache
+from ark_sdk_python.services.identity.directories.ark_identity_directories_service import (
+    DIRECTORY_SERVICE_QUERY_URL,
+    GET_DIRECTORY_SERVICES_URL,
+    TENANT_SUFFIX_URL,
+    ArkIdentityEntitiesPage,
+    directories_entities_exclusions,
+    directories_entities_from_query_response,
+)
+
+SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
+    service_name='identity-directories-async',
+    rate_limit_name='identity-directories',
+    required_authenticator_names=['isp'],
+    optional_authenticator_names=[],
+)
+
+
+class ArkAsyncIdentityDirectoriesService(ArkAsyncIdentityBaseService):
+    async def __directory_services(self) -> List[DirectoryServiceRow]:
+        directory_services = self._lookup_cache.get(ArkIdentityLookupCache.DIRECTORIES)
+        if directory_services is not None:
+            return directory_services
+        response: Response = await self._client.get(f'{self._url_prefix}{GET_DIRECTORY_SERVICES_URL}')
+        try:
+            directory_services = GetDirectoryServicesResponse.model_validate_json(response.text).result.results
+        except (ValidationError, JSONDecodeError) as ex:
+            self._logger.exception(f'Failed to parse directory services response [{str(ex)}] - [{response.text}]')
+            raise ArkServiceException(f'Failed to parse directory services response [{str(ex)}]') from ex
+        self._lookup_cache.set(ArkIdentityLookupCache.DIRECTORIES, None, directory_services)
+        return directory_services
+
+    async def list_directories(self, list_directories: ArkIdentityListDirectories) -> List[ArkIdentityDirectory]:
+        """
+        Get directories for given types
+        The directory services of the tenant are cached in the shared identity lookup cache
+
+        Args:
+            list_directories (ArkIdentityListDirectories): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            List[ArkIdentityDirectory]: _description_
+        """
+        if not list_directories.directories:
+            list_directories.directories = [d for d in DirectoryService]
+        self._logger.info(f'Retrieving directory services for directories [{list_directories}] [{self._url_prefix}]')
+        directory_services = await self.__directory_services()
+        requested_directories = set(item.value for item in list_directories.directories)
+        requested_services = [service for service in directory_services if service.row.service in requested_directories]
+        if len(requested_services) == 0:
+            raise ArkServiceException(f'Could not find any directory services matching {requested_directories}')
+        return [
+            ArkIdentityDirectory(directory=DirectoryService(service.row.service), directory_service_uuid=service.row.directory_service_uuid)
+            for service in requested_services
+        ]
+
+    async def list_directories_entities(
+        self, list_directories_entities: ArkIdentityListDirectoriesEntities
+    ) -> AsyncIterator[ArkIdentityEntitiesPage]:
+        """
+        Lists given directories entities by filters of search and type and directories
+        Yields pages of entities
+
+        Args:
+            list_directories_entities (ArkIdentityListDirectoriesEntities): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Yields:
+            AsyncIterator[ArkIdentityEntitiesPage]: _description_
+        """
+        self._logger.info('Listing directories entities')
+        directories = [
+            d.directory_service_uuid
+            for d in await self.list_directories(
+                ArkIdentityListDirectories(directories=list_directories_entities.directories or [d for d in DirectoryService])
+            )
+        ]
+        response: Response = await self._idp_client.post(
+            DIRECTORY_SERVICE_QUERY_URL,
+            json=DirectoryServiceQueryRequest(
+                directory_services=directories,
+                search_string=list_directories_entities.search,
+                args=DirectorySearchArgs(
+                    limit=list_directories_entities.limit, page_number=1, page_size=list_directories_entities.page_size
+                ),
+            ).model_dump(by_alias=True, exclude=directories_entities_exclusions(list_directories_entities)),
+        )
+        if response.status_code != HTTPStatus.OK:
+            raise ArkServiceException(f'Failed to query for directory services entities [{response.text}] - [{response.status_code}]')
+        try:
+            entities = directories_entities_from_query_response(DirectoryServiceQueryResponse.model_validate_json(response.text))
+        except (ValidationError, JSONDecodeError) as ex:
+            self._logger.exception(f'Failed to parse list directories entities response [{str(ex)}] - [{response.text}]')
+            raise ArkServiceException(f'Failed to parse list directories entities response [{str(ex)}]') from ex
+        page_size = list_directories_entities.page_size
+        for start in range(0, len(entities), page_size):
+            yield ArkIdentityEntitiesPage(entities[start : start + page_size])
+
+    async def tenant_default_suffix(self) -> str:
+        """
+        Retrieves the tenant default suffix found in identity
+        The suffix is used when creating users based on whats configured on the tenant
+        The suffix is cached in the shared identity lookup cache
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            str: _description_
+        """
+        tenant_suffix = self._lookup_cache.get(ArkIdentityLookupCache.TENANT_SUFFIX)
+        if tenant_suffix is None:
+            tenant_suffix = await self.__tenant_default_suffix()
+            self._lookup_cache.set(ArkIdentityLookupCache.TENANT_SUFFIX, None, tenant_suffix)
+        return tenant_suffix
+
+    async def __tenant_default_suffix(self) -> str:
+        self._logger.info('Discovering default tenant suffix')
+        response: Response = await self._client.post(f'{self._url_prefix}{TENANT_SUFFIX_URL}')
+        if response.status_code != HTTPStatus.OK:
+            raise ArkServiceException(f'Failed to get directory services [{response.text}]')
+        try:
+            tenant_suffixes_result: GetTenantSuffixResult = GetTenantSuffixResult.model_validate_json(response.text)
+            tenant_suffixes_list: List[str] = [result['Entities'][0]['Key'] for result in tenant_suffixes_result.result['Results']]
+            if len(tenant_suffixes_list) == 0:
+                raise ArkServiceException('No tenant suffix has been found')
+            filtered_urls = [
+                suffix
+                for suffix in tenant_suffixes_list
+                if check_if_identity_generated_suffix(suffix, self._env) or SHELL_DOMAIN[self._env] in suffix
+            ]
+            if filtered_urls:
+                return filtered_urls[0]
+            return tenant_suffixes_list[0]
+        except (ValidationError, JSONDecodeError, KeyError) as ex:
+            self._logger.exception(f'Failed to parse tenant default suffix response [{str(ex)}] - [{response.text}]')
+            raise ArkServiceException(f'Failed to parse tenant default suffix response [{str(ex)}]') from ex
+
+    @staticmethod
+    @overrides
+    def service_config() -> ArkServiceConfig:
+        return SERVICE_CONFIG
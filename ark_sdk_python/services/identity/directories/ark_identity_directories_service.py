@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import Final, Iterator, List
+from typing import Final, Iterator, List, Set
 
 from overrides import overrides
 from pydantic import ValidationError
@@ -13,6 +13,7 @@ from ark_sdk_python.models.common.identity import (
     DirectorySearchArgs,
     DirectoryService,
     DirectoryServiceQueryResponse,
+    DirectoryServiceRow,
     GetDirectoryServicesResponse,
     GetTenantSuffixResult,
 )
@@ -28,7 +29,7 @@ from ark_sdk_python.models.services.identity.directories import (
     ArkIdentityRoleEntity,
     ArkIdentityUserEntity,
 )
-from ark_sdk_python.services.identity.common import ArkIdentityBaseService
+from ark_sdk_python.services.identity.common import ArkIdentityBaseService, ArkIdentityLookupCache
 
 SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
     service_name='identity-directories', required_authenticator_names=['isp'], optional_authenticator_names=[]
@@ -41,10 +42,77 @@ DIRECTORY_SERVICE_QUERY_URL: Final[str] = 'UserMgmt/DirectoryServiceQuery'
 ArkIdentityEntitiesPage = ArkPage[ArkIdentityEntity]
 
 
+def directories_entities_exclusions(list_directories_entities: ArkIdentityListDirectoriesEntities) -> Set[str]:
+    exclusion_list = set()
+    if list_directories_entities.entity_types:
+        if ArkIdentityEntityType.User not in list_directories_entities.entity_types:
+            exclusion_list.add('user')
+        if ArkIdentityEntityType.Group not in list_directories_entities.entity_types:
+            exclusion_list.add('group')
+        if ArkIdentityEntityType.Role not in list_directories_entities.entity_types:
+            exclusion_list.add('roles')
+    return exclusion_list
+
+
+def directories_entities_from_query_response(result: DirectoryServiceQueryResponse) -> List[ArkIdentityEntity]:
+    entities: List[ArkIdentityEntity] = []
+    if result.result.users and result.result.users.results:
+        for user in result.result.users.results:
+            entities.append(
+                ArkIdentityUserEntity(
+                    id=user.row.internal_id,
+                    name=user.row.system_name,
+                    entity_type=ArkIdentityEntityType.User,
+                    directory_service_type=user.row.directory_service_type,
+                    display_name=user.row.display_name,
+                    service_instance_localized=user.row.service_instance_localized,
+                    email=user.row.email,
+                    description=user.row.description,
+                )
+            )
+    if result.result.groups and result.result.groups.results:
+        for group in result.result.groups.results:
+            entities.append(
+                ArkIdentityGroupEntity(
+                    id=group.row.internal_id,
+                    name=group.row.system_name,
+                    entity_type=ArkIdentityEntityType.Group,
+                    directory_service_type=group.row.directory_service_type,
+                    display_name=group.row.display_name,
+                    service_instance_localized=group.row.service_instance_localized,
+                )
+            )
+    if result.result.roles and result.result.roles.results:
+        for role in result.result.roles.results:
+            entities.append(
+                ArkIdentityRoleEntity(
+                    id=role.row.id,
+                    name=role.row.name,
+                    entity_type=ArkIdentityEntityType.Role,
+                    directory_service_type=DirectoryService.Identity,
+                    display_name=role.row.name,
+                    service_instance_localized=DirectoryService.Identity.value,
+                    admin_rights=role.row.admin_rights,
+                    is_hidden=role.row.is_hidden or False,
+                    description=role.row.description,
+                )
+            )
+    return entities
+
+
 class ArkIdentityDirectoriesService(ArkIdentityBaseService):
+    def __directory_services(self) -> List[DirectoryServiceRow]:
+        response: Response = self._client.get(f'{self._url_prefix}{GET_DIRECTORY_SERVICES_URL}', data={})
+        try:
+            return GetDirectoryServicesResponse.model_validate_json(response.text).result.results
+        except (ValidationError, JSONDecodeError) as ex:
+            self._logger.exception(f'Failed to parse directory services response [{str(ex)}] - [{response.text}]')
+            raise ArkServiceException(f'Failed to parse directory services response [{str(ex)}]') from ex
+
     def list_directories(self, list_directories: ArkIdentityListDirectories) -> List[ArkIdentityDirectory]:
         """
         Get directories for given types
+        The directory services of the tenant are cached in the shared identity lookup cache
 
         Args:
             list_directories (ArkIdentityListDirectories): _description_
@@ -58,27 +126,15 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
         if not list_directories.directories:
             list_directories.directories = [d for d in DirectoryService]
         self._logger.info(f'Retrieving directory services for directories [{list_directories}] [{self._url_prefix}]')
-        response: Response = self._client.get(f'{self._url_prefix}{GET_DIRECTORY_SERVICES_URL}', data={})
-        try:
-            directory_services_result = GetDirectoryServicesResponse.model_validate_json(response.text)
-            requested_directories = set(item.value for item in list_directories.directories)
-            requested_services = list(
-                filter(lambda service: service.row.service in requested_directories, directory_services_result.result.results)
-            )
-            if len(requested_services) == 0:
-                raise ArkServiceException(f'Could not find any directory services matching {requested_directories}')
-            directories = list(
-                map(
-                    lambda service: ArkIdentityDirectory(
-                        directory=DirectoryService(service.row.service), directory_service_uuid=service.row.directory_service_uuid
-                    ),
-                    requested_services,
-                )
-            )
-            return directories
-        except (ValidationError, JSONDecodeError) as ex:
-            self._logger.exception(f'Failed to parse directory services response [{str(ex)}] - [{response.text}]')
-            raise ArkServiceException(f'Failed to parse directory services response [{str(ex)}]') from ex
+        directory_services = self._lookup_cache.get_or_load(ArkIdentityLookupCache.DIRECTORIES, None, self.__directory_services)
+        requested_directories = set(item.value for item in list_directories.directories)
+        requested_services = list(filter(lambda service: service.row.service in requested_directories, directory_services))
+        if len(requested_services) == 0:
+            raise ArkServiceException(f'Could not find any directory services matching {requested_directories}')
+        return [
+            ArkIdentityDirectory(directory=DirectoryService(service.row.service), directory_service_uuid=service.row.directory_service_uuid)
+            for service in requested_services
+        ]
 
     def list_directories_entities(self, list_directories_entities: ArkIdentityListDirectoriesEntities) -> Iterator[ArkIdentityEntitiesPage]:
         """
@@ -101,14 +157,7 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
                 ArkIdentityListDirectories(directories=list_directories_entities.directories or [d for d in DirectoryService])
             )
         ]
-        exclusion_list = set()
-        if list_directories_entities.entity_types:
-            if ArkIdentityEntityType.User not in list_directories_entities.entity_types:
-                exclusion_list.add('user')
-            if ArkIdentityEntityType.Group not in list_directories_entities.entity_types:
-                exclusion_list.add('group')
-            if ArkIdentityEntityType.Role not in list_directories_entities.entity_types:
-                exclusion_list.add('roles')
+        exclusion_list = directories_entities_exclusions(list_directories_entities)
         response: Response = self._idp_client.post(
             DIRECTORY_SERVICE_QUERY_URL,
             json=DirectoryServiceQueryRequest(
@@ -123,48 +172,7 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
             raise ArkServiceException(f'Failed to query for directory services entities [{response.text}] - [{response.status_code}]')
         try:
             result = DirectoryServiceQueryResponse.model_validate_json(response.text)
-            entities: List[ArkIdentityEntity] = []
-            if result.result.users and result.result.users.results:
-                for user in result.result.users.results:
-                    entities.append(
-                        ArkIdentityUserEntity(
-                            id=user.row.internal_id,
-                            name=user.row.system_name,
-                            entity_type=ArkIdentityEntityType.User,
-                            directory_service_type=user.row.directory_service_type,
-                            display_name=user.row.display_name,
-                            service_instance_localized=user.row.service_instance_localized,
-                            email=user.row.email,
-                            description=user.row.description,
-                        )
-                    )
-            if result.result.groups and result.result.groups.results:
-                for group in result.result.groups.results:
-                    entities.append(
-                        ArkIdentityGroupEntity(
-                            id=group.row.internal_id,
-                            name=group.row.system_name,
-                            entity_type=ArkIdentityEntityType.Group,
-                            directory_service_type=group.row.directory_service_type,
-                            display_name=group.row.display_name,
-                            service_instance_localized=group.row.service_instance_localized,
-                        )
-                    )
-            if result.result.roles and result.result.roles.results:
-                for role in result.result.roles.results:
-                    entities.append(
-                        ArkIdentityRoleEntity(
-                            id=role.row.id,
-                            name=role.row.name,
-                            entity_type=ArkIdentityEntityType.Role,
-                            directory_service_type=DirectoryService.Identity,
-                            display_name=role.row.name,
-                            service_instance_localized=DirectoryService.Identity.value,
-                            admin_rights=role.row.admin_rights,
-                            is_hidden=role.row.is_hidden or False,
-                            description=role.row.description,
-                        )
-                    )
+            entities = directories_entities_from_query_response(result)
             while entities:
                 if len(entities) <= list_directories_entities.page_size:
                     yield ArkIdentityEntitiesPage(entities)
@@ -181,6 +189,7 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
         """
         Retrieves the tenant default suffix found in identity
         The suffix is used when creating users based on whats configured on the tenant
+        The suffix is cached in the shared identity lookup cache
 
         Raises:
             ArkServiceException: _description_
@@ -188,6 +197,9 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
         Returns:
             str: _description_
         """
+        return self._lookup_cache.get_or_load(ArkIdentityLookupCache.TENANT_SUFFIX, None, self.__tenant_default_suffix)
+
+    def __tenant_default_suffix(self) -> str:
         self._logger.info('Discovering default tenant suffix')
         response: Response = self._client.post(f'{self._url_prefix}{TENANT_SUFFIX_URL}')
         if response.status_code != HTTPStatus.OK:
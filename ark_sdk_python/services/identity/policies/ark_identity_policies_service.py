@@ -2,10 +2,11 @@ from http import HTTPStatus
 from typing import Final, List
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
+from ark_sdk_python.models import ArkTypeAdapters
 from ark_sdk_python.models.ark_exceptions import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.identity.policies import (
@@ -113,7 +114,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             result = response.json()
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to list authentication profiles [{response.text}] - [{response.status_code}]')
-            return TypeAdapter(List[ArkIdentityAuthenticationProfile]).validate_python([r['Row'] for r in result['Result']['Results']])
+            return ArkTypeAdapters.validate_python(List[ArkIdentityAuthenticationProfile], [r['Row'] for r in result['Result']['Results']])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
             self._logger.exception(f'Failed to parse list authentication profiles response [{str(ex)}] - [{response.text}]')
             raise ArkServiceException(f'Failed to parse list authentication profiles response [{str(ex)}]') from ex
@@ -330,7 +331,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             result = response.json()
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to list policies [{response.text}] - [{response.status_code}]')
-            return TypeAdapter(List[ArkIdentityPolicyInfo]).validate_python([p['Row'] for p in result['Result']['Results']])
+            return ArkTypeAdapters.validate_python(List[ArkIdentityPolicyInfo], [p['Row'] for p in result['Result']['Results']])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
             self._logger.exception(f'Failed to parse list policies response [{str(ex)}] - [{response.text}]')
             raise ArkServiceException(f'Failed to parse list policies response [{str(ex)}]') from ex
@@ -1,11 +1,14 @@
+import time
 from http import HTTPStatus
-from typing import Final, List
+from typing import Dict, Final, Iterator, List, Optional, Tuple
 
 from overrides import overrides
 from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
+from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage
 from ark_sdk_python.models.ark_exceptions import ArkServiceException
 from ark_sdk_python.models.common.identity import (
     DirectorySearchArgs,
@@ -20,6 +23,8 @@ from ark_sdk_python.models.services.identity.roles import (
     ArkIdentityAddGroupToRole,
     ArkIdentityAddRoleToRole,
     ArkIdentityAddUserToRole,
+    ArkIdentityBulkAddUsersToRoles,
+    ArkIdentityBulkAddUserToRoleResult,
     ArkIdentityCreateRole,
     ArkIdentityDeleteRole,
     ArkIdentityListRoleMembers,
@@ -31,7 +36,7 @@ from ark_sdk_python.models.services.identity.roles import (
     ArkIdentityRoleMember,
     ArkIdentityUpdateRole,
 )
-from ark_sdk_python.services.identity.common import ArkIdentityBaseService
+from ark_sdk_python.services.identity.common import ArkIdentityBaseService, ArkIdentityLookupCache
 from ark_sdk_python.services.identity.directories import ArkIdentityDirectoriesService
 
 SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
@@ -48,8 +53,20 @@ DELETE_ROLE_URL: Final[str] = 'SaasManage/DeleteRole'
 DIRECTORY_SERVICE_QUERY_URL: Final[str] = 'UserMgmt/DirectoryServiceQuery'
 REDROCK_QUERY: Final[str] = 'Redrock/query'
 
+ArkIdentityBulkAddUserToRoleResultsPage = ArkPage[ArkIdentityBulkAddUserToRoleResult]
+
 
 class ArkIdentityRolesService(ArkIdentityBaseService):
+    def __init__(self, isp_auth: ArkISPAuth) -> None:
+        super().__init__(isp_auth)
+        self.__directories_service: Optional[ArkIdentityDirectoriesService] = None
+
+    @property
+    def _directories_service(self) -> ArkIdentityDirectoriesService:
+        if not self.__directories_service:
+            self.__directories_service = ArkIdentityDirectoriesService(self._isp_auth)
+        return self.__directories_service
+
     def create_role(self, create_role: ArkIdentityCreateRole) -> ArkIdentityRole:
         """
         Creates a role by given name and adds admin rights to it
@@ -82,6 +99,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
                 if response.status_code != HTTPStatus.OK or not result['success']:
                     raise ArkServiceException(f'Failed to create role [{response.text}]') from ex
                 role_id = result['Result']['_RowKey']
+                self._lookup_cache.set(ArkIdentityLookupCache.ROLE_ID, create_role.role_name, role_id)
                 role_details = ArkIdentityRole(role_name=create_role.role_name, role_id=role_id)
                 self._logger.info(f'Role created with id [{role_id}]')
             except (ValidationError, JSONDecodeError, KeyError) as ex:
@@ -113,6 +131,8 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         if update_role.description:
             update_role['Description'] = update_role.description
         response: Response = self._client.post(f'{self._url_prefix}{UPDATE_ROLE_URL}', json=update_dict)
+        if update_role.new_role_name:
+            self._lookup_cache.invalidate(ArkIdentityLookupCache.ROLE_ID)
         try:
             result = response.json()
             if response.status_code != HTTPStatus.OK or not result['success']:
@@ -190,6 +210,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
     def role_id_by_name(self, role_id_by_name: ArkIdentityRoleIdByName) -> str:
         """
         For a given role name, find its identifier on identity
+        Resolved identifiers are cached in the shared identity lookup cache
 
         Args:
             role_id_by_name (ArkIdentityRoleIdByName): _description_
@@ -200,16 +221,20 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Returns:
             str: _description_
         """
-        self._logger.info(f'Retrieving role id for name [{role_id_by_name.role_name}]')
-        directories_service = ArkIdentityDirectoriesService(self._isp_auth)
+        return self._lookup_cache.get_or_load(
+            ArkIdentityLookupCache.ROLE_ID, role_id_by_name.role_name, lambda: self.__role_id_by_name(role_id_by_name.role_name)
+        )
+
+    def __role_id_by_name(self, role_name: str) -> str:
+        self._logger.info(f'Retrieving role id for name [{role_name}]')
         directories = [
             d.directory_service_uuid
-            for d in directories_service.list_directories(ArkIdentityListDirectories(directories=[DirectoryService.Identity]))
+            for d in self._directories_service.list_directories(ArkIdentityListDirectories(directories=[DirectoryService.Identity]))
         ]
         response: Response = self._client.post(
             f'{self._url_prefix}{DIRECTORY_SERVICE_QUERY_URL}',
             json=DirectoryServiceQuerySpecificRoleRequest(
-                role_name=role_id_by_name.role_name, directory_services=directories, args=DirectorySearchArgs(limit=1)
+                role_name=role_name, directory_services=directories, args=DirectorySearchArgs(limit=1)
             ).model_dump(by_alias=True, exclude={'users'}),
         )
         if response.status_code != HTTPStatus.OK:
@@ -236,11 +261,14 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         """
         self._logger.info(f'Adding user [{add_user_to_role.username}] to role [{add_user_to_role.role_name}]')
         role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=add_user_to_role.role_name))
+        self.__add_users_to_role(role_id, [add_user_to_role.username])
+
+    def __add_users_to_role(self, role_id: str, usernames: List[str]) -> None:
         response: Response = self._client.post(
             f'{self._url_prefix}{ADD_USER_TO_ROLE_URL}',
             json={
                 'Name': role_id,
-                'Users': [add_user_to_role.username],
+                'Users': usernames,
             },
         )
         try:
@@ -251,6 +279,70 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             self._logger.exception(f'Failed to parse add user to role response [{str(ex)}] - [{response.text}]')
             raise ArkServiceException(f'Failed to parse add user to role response [{str(ex)}]') from ex
 
+    def __add_users_batch_to_role(self, role_name: str, role_id: str, usernames: List[str]) -> ArkIdentityBulkAddUserToRoleResultsPage:
+        try:
+            self.__add_users_to_role(role_id, usernames)
+            error = None
+        except Exception as ex:
+            error = str(ex)
+        return ArkIdentityBulkAddUserToRoleResultsPage(
+            [
+                ArkIdentityBulkAddUserToRoleResult(username=username, role_name=role_name, success=error is None, error=error)
+                for username in usernames
+            ]
+        )
+
+    def bulk_add_users_to_roles(
+        self, bulk_add_users_to_roles: ArkIdentityBulkAddUsersToRoles
+    ) -> Iterator[ArkIdentityBulkAddUserToRoleResultsPage]:
+        """
+        Adds many users to roles, grouping the users of each role into batched requests which run with bounded concurrency
+        Every role id is resolved once, and the results of every membership are yielded in pages as their batches complete
+        Failures are reported per membership in the results instead of failing the whole operation
+
+        Args:
+            bulk_add_users_to_roles (ArkIdentityBulkAddUsersToRoles): _description_
+
+        Yields:
+            Iterator[ArkIdentityBulkAddUserToRoleResultsPage]: _description_
+        """
+        start_time = time.perf_counter()
+        usernames_by_role: Dict[str, Dict[str, None]] = {}
+        for membership in bulk_add_users_to_roles.memberships:
+            usernames_by_role.setdefault(membership.role_name, {})[membership.username] = None
+        total_count = sum(len(usernames) for usernames in usernames_by_role.values())
+        self._logger.info(f'Adding [{total_count}] users to [{len(usernames_by_role)}] roles')
+        succeeded_count = 0
+        batches: List[Tuple[str, str, List[str]]] = []
+        batch_size = bulk_add_users_to_roles.batch_size
+        for role_name, usernames in usernames_by_role.items():
+            try:
+                role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=role_name))
+            except Exception as ex:
+                yield ArkIdentityBulkAddUserToRoleResultsPage(
+                    [
+                        ArkIdentityBulkAddUserToRoleResult(username=username, role_name=role_name, success=False, error=str(ex))
+                        for username in usernames
+                    ]
+                )
+                continue
+            role_usernames = list(usernames)
+            batches.extend(
+                (role_name, role_id, role_usernames[offset : offset + batch_size]) for offset in range(0, len(role_usernames), batch_size)
+            )
+        for page in ArkConcurrentPager.fetch_pages(
+            lambda index: self.__add_users_batch_to_role(*batches[index]),
+            range(len(batches)),
+            bulk_add_users_to_roles.max_concurrency,
+            ordered=False,
+        ):
+            succeeded_count += sum(1 for result in page if result.success)
+            yield page
+        elapsed = time.perf_counter() - start_time
+        self._logger.info(
+            f'Added [{succeeded_count}/{total_count}] users to roles in [{elapsed:.2f}] seconds [{total_count / max(elapsed, 1e-9):.1f}] per second'
+        )
+
     def add_group_to_role(self, add_group_to_role: ArkIdentityAddGroupToRole) -> None:
         """
         Adds a given group to the role
@@ -388,6 +480,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         if delete_role.role_name and not delete_role.role_id:
             delete_role.role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=delete_role.role_name))
         response: Response = self._client.post(f'{self._url_prefix}{DELETE_ROLE_URL}', json={'Name': delete_role.role_id})
+        self._lookup_cache.invalidate(ArkIdentityLookupCache.ROLE_ID, delete_role.role_name)
         try:
             result = response.json()
             if response.status_code != HTTPStatus.OK or not result['success']:
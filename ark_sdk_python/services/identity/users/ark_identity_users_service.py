@@ -1,16 +1,21 @@
+import time
 from datetime import datetime, timezone
 from http import HTTPStatus
-from typing import Final
+from typing import Dict, Final, Iterator, List, Optional, Tuple, Union
 
 from overrides import overrides
 from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
+from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage
 from ark_sdk_python.models.ark_exceptions import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
-from ark_sdk_python.models.services.identity.roles import ArkIdentityAddUserToRole
+from ark_sdk_python.models.services.identity.roles import ArkIdentityAddUserToRole, ArkIdentityBulkAddUsersToRoles
 from ark_sdk_python.models.services.identity.users import (
+    ArkIdentityBulkCreateUserResult,
+    ArkIdentityBulkCreateUsers,
     ArkIdentityCreateUser,
     ArkIdentityDeleteUser,
     ArkIdentityDeleteUsers,
@@ -22,7 +27,7 @@ from ark_sdk_python.models.services.identity.users import (
     ArkIdentityUserIdByName,
     ArkIdentityUserInfo,
 )
-from ark_sdk_python.services.identity.common import ArkIdentityBaseService
+from ark_sdk_python.services.identity.common import ArkIdentityBaseService, ArkIdentityLookupCache
 from ark_sdk_python.services.identity.directories import ArkIdentityDirectoriesService
 from ark_sdk_python.services.identity.roles import ArkIdentityRolesService
 
@@ -39,8 +44,27 @@ RESET_USER_PASSWORD_URL: Final[str] = 'UserMgmt/ResetUserPassword'
 REDROCK_QUERY: Final[str] = 'Redrock/query'
 USER_INFO_URL: Final[str] = 'OAuth2/UserInfo/__idaptive_cybr_user_oidc'
 
+ArkIdentityBulkCreateUserResultsPage = ArkPage[ArkIdentityBulkCreateUserResult]
+
 
 class ArkIdentityUsersService(ArkIdentityBaseService):
+    def __init__(self, isp_auth: ArkISPAuth) -> None:
+        super().__init__(isp_auth)
+        self.__directories_service: Optional[ArkIdentityDirectoriesService] = None
+        self.__roles_service: Optional[ArkIdentityRolesService] = None
+
+    @property
+    def _directories_service(self) -> ArkIdentityDirectoriesService:
+        if not self.__directories_service:
+            self.__directories_service = ArkIdentityDirectoriesService(self._isp_auth)
+        return self.__directories_service
+
+    @property
+    def _roles_service(self) -> ArkIdentityRolesService:
+        if not self.__roles_service:
+            self.__roles_service = ArkIdentityRolesService(self._isp_auth)
+        return self.__roles_service
+
     def create_user(self, create_user: ArkIdentityCreateUser) -> ArkIdentityUser:
         """
         Creates a user with the given details, and returns its finalized details and id
@@ -55,8 +79,15 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
             ArkIdentityUser: _description_
         """
         self._logger.info(f'Creating identity user [{create_user.username}]')
-        directories_service = ArkIdentityDirectoriesService(self._isp_auth)
-        tenant_suffix = create_user.suffix or directories_service.tenant_default_suffix()
+        tenant_suffix = create_user.suffix or self._directories_service.tenant_default_suffix()
+        user = self.__create_user(create_user, tenant_suffix)
+        if create_user.roles:
+            for role in create_user.roles:
+                self._roles_service.add_user_to_role(ArkIdentityAddUserToRole(username=user.username, role_name=role))
+        self._logger.info(f'User created successfully with id [{user.user_id}]')
+        return user
+
+    def __create_user(self, create_user: ArkIdentityCreateUser, tenant_suffix: str) -> ArkIdentityUser:
         response: Response = self._client.post(
             f'{self._url_prefix}{CREATE_USER_URL}',
             json={
@@ -76,13 +107,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
             result = response.json()
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to create user [{response.text}]')
-            if create_user.roles:
-                roles_service = ArkIdentityRolesService(self._isp_auth)
-                for role in create_user.roles:
-                    roles_service.add_user_to_role(
-                        ArkIdentityAddUserToRole(username=f'{create_user.username}@{tenant_suffix}', role_name=role)
-                    )
-            self._logger.info(f'User created successfully with id [{result["Result"]}]')
+            self._lookup_cache.set(ArkIdentityLookupCache.USER_ID, f'{create_user.username}@{tenant_suffix}', result['Result'])
             return ArkIdentityUser(
                 user_id=result['Result'],
                 username=f'{create_user.username}@{tenant_suffix}',
@@ -95,6 +120,78 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
             self._logger.exception(f'Failed to parse create user response [{str(ex)}] - [{response.text}]')
             raise ArkServiceException(f'Failed to parse create user response [{str(ex)}]') from ex
 
+    def __bulk_create_user(self, create_user: ArkIdentityCreateUser, tenant_suffix: str) -> Union[ArkIdentityUser, Exception]:
+        try:
+            return self.__create_user(create_user, tenant_suffix)
+        except Exception as ex:
+            return ex
+
+    def bulk_create_users(self, bulk_create_users: ArkIdentityBulkCreateUsers) -> Iterator[ArkIdentityBulkCreateUserResultsPage]:
+        """
+        Creates many users with bounded concurrency, and adds them to their roles with batched role requests
+        The tenant suffix and the role ids are resolved once for all the users
+        Users are processed in batches, and the results of every batch are yielded as a page once it completes
+        Failures are reported per user in the results instead of failing the whole operation
+
+        Args:
+            bulk_create_users (ArkIdentityBulkCreateUsers): _description_
+
+        Yields:
+            Iterator[ArkIdentityBulkCreateUserResultsPage]: _description_
+        """
+        start_time = time.perf_counter()
+        users = bulk_create_users.users
+        self._logger.info(f'Creating [{len(users)}] identity users')
+        default_suffix: Optional[str] = None
+        if any(not user.suffix for user in users):
+            default_suffix = self._directories_service.tenant_default_suffix()
+        succeeded_count = 0
+        for offset in range(0, len(users), bulk_create_users.batch_size):
+            batch = users[offset : offset + bulk_create_users.batch_size]
+            outcomes: List[Union[ArkIdentityUser, Exception]] = list(
+                ArkConcurrentPager.fetch_pages(
+                    lambda index: self.__bulk_create_user(batch[index], batch[index].suffix or default_suffix),
+                    range(len(batch)),
+                    bulk_create_users.max_concurrency,
+                )
+            )
+            memberships = [
+                ArkIdentityAddUserToRole(username=outcome.username, role_name=role)
+                for create_user, outcome in zip(batch, outcomes)
+                if isinstance(outcome, ArkIdentityUser)
+                for role in create_user.roles
+            ]
+            role_errors: Dict[Tuple[str, str], str] = {}
+            if memberships:
+                for page in self._roles_service.bulk_add_users_to_roles(
+                    ArkIdentityBulkAddUsersToRoles(
+                        memberships=memberships,
+                        max_concurrency=bulk_create_users.max_concurrency,
+                        batch_size=bulk_create_users.batch_size,
+                    )
+                ):
+                    role_errors.update({(result.username, result.role_name): result.error for result in page if not result.success})
+            results: List[ArkIdentityBulkCreateUserResult] = []
+            for create_user, outcome in zip(batch, outcomes):
+                if not isinstance(outcome, ArkIdentityUser):
+                    results.append(ArkIdentityBulkCreateUserResult(username=create_user.username, success=False, error=str(outcome)))
+                    continue
+                failed_roles = [role for role in create_user.roles if (outcome.username, role) in role_errors]
+                if failed_roles:
+                    outcome.roles = [role for role in create_user.roles if role not in failed_roles]
+                    error = ', '.join(
+                        f'Failed to add user to role [{role}] [{role_errors[(outcome.username, role)]}]' for role in failed_roles
+                    )
+                    results.append(ArkIdentityBulkCreateUserResult(username=create_user.username, success=False, user=outcome, error=error))
+                    continue
+                succeeded_count += 1
+                results.append(ArkIdentityBulkCreateUserResult(username=create_user.username, success=True, user=outcome))
+            yield ArkIdentityBulkCreateUserResultsPage(results)
+        elapsed = time.perf_counter() - start_time
+        self._logger.info(
+            f'Created [{succeeded_count}/{len(users)}] users in [{elapsed:.2f}] seconds [{len(users) / max(elapsed, 1e-9):.1f}] per second'
+        )
+
     def update_user(self, update_user: ArkIdentityUpdateUser) -> None:
         """
         Updates the user information
@@ -122,6 +219,8 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
             update_dict['MobileNumber'] = update_user.mobile_number
         update_dict['ID'] = update_user.user_id
         response: Response = self._client.post(f'{self._url_prefix}{UPDATE_USER_URL}', json=update_dict)
+        if update_user.new_username:
+            self._lookup_cache.invalidate(ArkIdentityLookupCache.USER_ID)
         try:
             result = response.json()
             if response.status_code != HTTPStatus.OK or not result['success']:
@@ -145,6 +244,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
         response: Response = self._client.post(
             f'{self._url_prefix}{DELETE_USER_URL}', json={'ID': delete_user.user_id or delete_user.username}
         )
+        self._lookup_cache.invalidate(ArkIdentityLookupCache.USER_ID, delete_user.username)
         try:
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to delete user [{response.text}]')
@@ -164,6 +264,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
         """
         self._logger.info(f'Removing users [{",".join(delete_users.user_ids)}]')
         response: Response = self._client.post(f'{self._url_prefix}{REMOVE_USERS_URL}', json={'Users': [delete_users.user_ids]})
+        self._lookup_cache.invalidate(ArkIdentityLookupCache.USER_ID)
         try:
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to remove users [{response.text}]')
@@ -174,6 +275,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
     def user_id_by_name(self, user_id_by_name: ArkIdentityUserIdByName) -> str:
         """
         Finds the identifier of the given username
+        Resolved identifiers are cached in the shared identity lookup cache
 
         Args:
             user_id_by_name (ArkIdentityUserIdByName): _description_
@@ -181,9 +283,14 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
         Returns:
             str: _description_
         """
+        return self._lookup_cache.get_or_load(
+            ArkIdentityLookupCache.USER_ID, user_id_by_name.username, lambda: self.__user_id_by_name(user_id_by_name.username)
+        )
+
+    def __user_id_by_name(self, username: str) -> str:
         response: Response = self._client.post(
             f'{self._url_prefix}{REDROCK_QUERY}',
-            json={"Script": f"Select ID, Username from User WHERE Username='{user_id_by_name.username}'"},
+            json={"Script": f"Select ID, Username from User WHERE Username='{username}'"},
         )
         if response.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to retrieve user id by name [{response.text}] - [{response.status_code}]')
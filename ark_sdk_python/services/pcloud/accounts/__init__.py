@@ -1,3 +1,4 @@
+from ark_sdk_python.services.pcloud.accounts.ark_async_pcloud_accounts_service import ArkAsyncPCloudAccountsService
 from ark_sdk_python.services.pcloud.accounts.ark_pcloud_accounts_service import ArkPCloudAccountsService
 
-__all__ = ['ArkPCloudAccountsService']
+__all__ = ['ArkPCloudAccountsService', 'ArkAsyncPCloudAccountsService']
@@ -0,0 +1,216 @@
+from http import HTTPStatus
+from json import JSONDecodeError
+from typing import Any, AsyncIterator, Dict, Final, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from httpx import Response
+from overrides import overrides
+from pydantic import ValidationError
+
+from ark_sdk_python.common import ArkConcurrentPager, ArkStatsAggregator
+from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.models.services import ArkServiceConfig
+from ark_sdk_python.models.services.pcloud.accounts import (
+    ArkPCloudAccount,
+    ArkPCloudAccountCredentials,
+    ArkPCloudAccountsFilter,
+    ArkPCloudAccountsStats,
+    ArkPCloudGetAccount,
+    ArkPCloudGetAccountCredentials,
+)
+from ark_sdk_python.services.pcloud.accounts.ark_pcloud_accounts_service import (
+    ACCOUNT_URL,
+    ACCOUNTS_URL,
+    RETRIEVE_ACCOUNT_CREDENTIALS,
+    ArkPCloudAccountsPage,
+)
+from ark_sdk_python.services.pcloud.common import ArkAsyncPCloudBaseService
+
+SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
+    service_name='pcloud-accounts-async',
+    rate_limit_name='pcloud-accounts',
+    required_authenticator_names=[],
+    optional_authenticator_names=['isp'],
+)
+
+
+class ArkAsyncPCloudAccountsService(ArkAsyncPCloudBaseService):
+    async def __fetch_accounts_page(self, query: Dict[str, Any], lazy: bool = False) -> Tuple[ArkPCloudAccountsPage, Dict[str, Any]]:
+        resp: Response = await self._client.get(ACCOUNTS_URL, params=query)
+        if resp.status_code == HTTPStatus.OK:
+            try:
+                return ArkPCloudAccountsPage.from_json_field(ArkPCloudAccount, resp.content, 'value', lazy)
+            except (ValidationError, JSONDecodeError, ValueError, KeyError) as ex:
+                self._logger.exception(f'Failed to parse list accounts response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse list accounts response [{str(ex)}]') from ex
+        raise ArkServiceException(f'Failed to list accounts [{resp.text}] - [{resp.status_code}]')
+
+    async def __list_accounts_concurrently(
+        self, query: Dict[str, Any], max_concurrent_pages: int, lazy: bool = False
+    ) -> AsyncIterator[ArkPCloudAccountsPage]:
+        page, result = await self.__fetch_accounts_page(query, lazy)
+        yield page
+        if 'nextLink' not in result or 'count' not in result:
+            return
+        start_offset = query.get('offset', 0)
+        page_size = query.get('limit', len(page.items))
+        if page_size <= 0:
+            return
+
+        async def fetch_page(offset: int) -> ArkPCloudAccountsPage:
+            return (await self.__fetch_accounts_page({**query, 'offset': offset, 'limit': page_size}, lazy))[0]
+
+        async for page in ArkConcurrentPager.fetch_pages_async(
+            fetch_page=fetch_page,
+            offsets=range(start_offset + page_size, result['count'], page_size),
+            max_concurrency=max_concurrent_pages,
+        ):
+            yield page
+
+    async def __list_accounts_with_filters(
+        self,
+        search: Optional[str] = None,
+        search_type: Optional[str] = None,
+        sort: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        safe_name: Optional[str] = None,
+        max_concurrent_pages: Optional[int] = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[ArkPCloudAccountsPage]:
+        query = {}
+        if search:
+            query['search'] = search
+        if search_type:
+            query['searchType'] = search_type
+        if sort:
+            query['sort'] = sort
+        if offset:
+            query['offset'] = offset
+        if limit:
+            query['limit'] = limit
+        if safe_name:
+            query['filter'] = f'safeName eq {safe_name}'
+        if max_concurrent_pages and max_concurrent_pages > 1:
+            async for page in self.__list_accounts_concurrently(query, max_concurrent_pages, lazy):
+                yield page
+            return
+        while True:
+            page, result = await self.__fetch_accounts_page(query, lazy)
+            yield page
+            if 'nextLink' in result:
+                query = parse_qs(urlparse(result['nextLink']).query)
+            else:
+                break
+
+    async def list_accounts(self) -> AsyncIterator[ArkPCloudAccountsPage]:
+        """
+        Yields all visible accounts to the logged in user as pages of accounts
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/GetAccounts.htm
+
+        Yields:
+            AsyncIterator[ArkPCloudAccountsPage]: _description_
+        """
+        self._logger.info('Listing all accounts')
+        async for page in self.__list_accounts_with_filters():
+            yield page
+
+    async def list_accounts_by(self, accounts_filter: ArkPCloudAccountsFilter) -> AsyncIterator[ArkPCloudAccountsPage]:
+        """
+        Yields visible accounts to the logged in user by filters as pages of accounts
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/GetAccounts.htm
+
+        Args:
+            accounts_filter (ArkPCloudAccountsFilter): _description_
+
+        Yields:
+            AsyncIterator[ArkPCloudAccountsPage]: _description_
+        """
+        self._logger.info(f'Listing accounts by filters [{accounts_filter}]')
+        async for page in self.__list_accounts_with_filters(
+            accounts_filter.search,
+            accounts_filter.search_type,
+            accounts_filter.sort,
+            accounts_filter.offset,
+            accounts_filter.limit,
+            accounts_filter.safe_name,
+            accounts_filter.max_concurrent_pages,
+            accounts_filter.lazy,
+        ):
+            yield page
+
+    async def account(self, get_account: ArkPCloudGetAccount) -> ArkPCloudAccount:
+        """
+        Retrieves the account by id
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/WebServices/Get%20Account%20Details.htm?
+
+        Args:
+            get_account (ArkPCloudGetAccount): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            ArkPCloudAccount: _description_
+        """
+        self._logger.info(f'Retrieving account by id [{get_account.account_id}]')
+        resp: Response = await self._client.get(ACCOUNT_URL.format(account_id=get_account.account_id))
+        if resp.status_code == HTTPStatus.OK:
+            try:
+                return ArkPCloudAccount.model_validate(resp.json())
+            except (ValidationError, JSONDecodeError, KeyError) as ex:
+                self._logger.exception(f'Failed to parse account response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse account response [{str(ex)}]') from ex
+        raise ArkServiceException(f'Failed to retrieve account [{resp.text}] - [{resp.status_code}]')
+
+    async def account_credentials(self, get_account_credentials: ArkPCloudGetAccountCredentials) -> ArkPCloudAccountCredentials:
+        """
+        Retrieves the account credentials
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/WebServices/GetPasswordValueV10.htm?
+
+        Args:
+            get_account_credentials (ArkPCloudGetAccountCredentials): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            ArkPCloudAccountCredentials: _description_
+        """
+        self._logger.info(f'Retrieving account password for details [{get_account_credentials}]')
+        body = {
+            k.replace('_', '').title(): v
+            for k, v in get_account_credentials.model_dump(exclude={'account_id', 'reason'}, exclude_none=True).items()
+        }
+        if get_account_credentials.reason:
+            body['reason'] = get_account_credentials.reason
+        resp: Response = await self._client.post(
+            RETRIEVE_ACCOUNT_CREDENTIALS.format(account_id=get_account_credentials.account_id), json=body
+        )
+        if resp.status_code == HTTPStatus.OK:
+            return ArkPCloudAccountCredentials(
+                account_id=get_account_credentials.account_id, password=resp.text[1:-1]  # Remove leading and trailing quotes
+            )
+        raise ArkServiceException(f'Failed to retrieve account credentials [{resp.text}] - [{resp.status_code}]')
+
+    async def accounts_stats(self) -> ArkPCloudAccountsStats:
+        """
+        Calculates account stats
+
+        Returns:
+            ArkPCloudAccountsStats: _description_
+        """
+        self._logger.info('Calculating accounts stats')
+        aggregator = ArkStatsAggregator().count_by('platform_id', lambda a: a.platform_id).count_by('safe_name', lambda a: a.safe_name)
+        async for page in self.list_accounts():
+            aggregator.consume(page)
+        accounts_stats = ArkPCloudAccountsStats.model_construct()
+        accounts_stats.accounts_count = aggregator.count
+        accounts_stats.accounts_count_by_platform_id = aggregator.counts('platform_id')
+        accounts_stats.accounts_count_by_safe_name = aggregator.counts('safe_name')
+        return accounts_stats
+
+    @staticmethod
+    @overrides
+    def service_config() -> ArkServiceConfig:
+        return SERVICE_CONFIG
@@ -1,15 +1,14 @@
-import itertools
 from http import HTTPStatus
-from typing import Final, Iterator, List, Optional, Set
+from typing import Any, Dict, Final, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
-from ark_sdk_python.common import ArkPage
-from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage, ArkStatsAggregator
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.pcloud.accounts import (
     ArkPCloudAccount,
@@ -54,6 +53,37 @@ ArkPCloudAccountsPage = ArkPage[ArkPCloudAccount]
 
 
 class ArkPCloudAccountsService(ArkPCloudBaseService):
+    def __fetch_accounts_page(self, query: Dict[str, Any], lazy: bool = False) -> Tuple[ArkPCloudAccountsPage, Dict[str, Any]]:
+        resp: Response = self._client.get(ACCOUNTS_URL, params=query)
+        if resp.status_code == HTTPStatus.OK:
+            try:
+                return ArkPCloudAccountsPage.from_json_field(ArkPCloudAccount, resp.content, 'value', lazy)
+            except (ValidationError, JSONDecodeError, ValueError, KeyError) as ex:
+                self._logger.exception(f'Failed to parse list accounts response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse list accounts response [{str(ex)}]') from ex
+        raise ArkServiceException(f'Failed to list accounts [{resp.text}] - [{resp.status_code}]')
+
+    def __list_accounts_concurrently(
+        self, query: Dict[str, Any], max_concurrent_pages: int, lazy: bool = False
+    ) -> Iterator[ArkPCloudAccountsPage]:
+        page, result = self.__fetch_accounts_page(query, lazy)
+        yield page
+        if 'nextLink' not in result or 'count' not in result:
+            return
+        start_offset = query.get('offset', 0)
+        page_size = query.get('limit', len(page))
+        if page_size <= 0:
+            return
+
+        def fetch_page(offset: int) -> ArkPCloudAccountsPage:
+            return self.__fetch_accounts_page({**query, 'offset': offset, 'limit': page_size}, lazy)[0]
+
+        yield from ArkConcurrentPager.fetch_pages(
+            fetch_page=fetch_page,
+            offsets=range(start_offset + page_size, result['count'], page_size),
+            max_workers=max_concurrent_pages,
+        )
+
     def __list_accounts_with_filters(
         self,
         search: Optional[str] = None,
@@ -62,6 +92,8 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         offset: Optional[int] = None,
         limit: Optional[int] = None,
         safe_name: Optional[str] = None,
+        max_concurrent_pages: Optional[int] = None,
+        lazy: bool = False,
     ) -> Iterator[ArkPCloudAccountsPage]:
         query = {}
         if search:
@@ -76,22 +108,16 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
             query['limit'] = limit
         if safe_name:
             query['filter'] = f'safeName eq {safe_name}'
+        if max_concurrent_pages and max_concurrent_pages > 1:
+            yield from self.__list_accounts_concurrently(query, max_concurrent_pages, lazy)
+            return
         while True:
-            resp: Response = self._client.get(ACCOUNTS_URL, params=query)
-            if resp.status_code == HTTPStatus.OK:
-                try:
-                    result = resp.json()
-                    accounts = TypeAdapter(List[ArkPCloudAccount]).validate_python(result['value'])
-                    yield ArkPCloudAccountsPage(items=accounts)
-                    if 'nextLink' in result:
-                        query = parse_qs(urlparse(result['nextLink']).query)
-                    else:
-                        break
-                except (ValidationError, JSONDecodeError, KeyError) as ex:
-                    self._logger.exception(f'Failed to parse list accounts response [{str(ex)}] - [{resp.text}]')
-                    raise ArkServiceException(f'Failed to parse list accounts response [{str(ex)}]') from ex
+            page, result = self.__fetch_accounts_page(query, lazy)
+            yield page
+            if 'nextLink' in result:
+                query = parse_qs(urlparse(result['nextLink']).query)
             else:
-                raise ArkServiceException(f'Failed to list accounts [{resp.text}] - [{resp.status_code}]')
+                break
 
     def list_accounts(self) -> Iterator[ArkPCloudAccountsPage]:
         """
@@ -123,6 +149,8 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
             accounts_filter.offset,
             accounts_filter.limit,
             accounts_filter.safe_name,
+            accounts_filter.max_concurrent_pages,
+            accounts_filter.lazy,
         )
 
     def list_account_secret_versions(
@@ -145,7 +173,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         resp: Response = self._client.get(ACCOUNT_SECRET_VERSIONS.format(account_id=list_account_secret_versions.account_id))
         if resp.status_code == HTTPStatus.OK:
             try:
-                return TypeAdapter(List[ArkPCloudAccountSecretVersion]).validate_python(resp.json()['versions'])
+                return ArkTypeAdapters.validate_json_field(List[ArkPCloudAccountSecretVersion], resp.content, 'versions')[0]
             except (ValidationError, JSONDecodeError, KeyError) as ex:
                 self._logger.exception(f'Failed to parse list account secret versions response [{str(ex)}] - [{resp.text}]')
                 raise ArkServiceException(f'Failed to parse list account secret versions response [{str(ex)}]') from ex
@@ -446,18 +474,17 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
             ArkPCloudAccountsStats: _description_
         """
         self._logger.info('Calculating accounts statistics')
-        accounts = list(itertools.chain.from_iterable([p.items for p in list(self.list_accounts())]))
+        # Only the counted fields are read from the raw pages, the accounts themselves are never materialized
+        aggregator: ArkStatsAggregator[Dict[str, Any]] = (
+            ArkStatsAggregator()
+            .count_by('platform_id', lambda a: a['platform_id'])
+            .count_by('safe_name', lambda a: a['safe_name'])
+            .consume_pages(page.project('platform_id', 'safe_name') for page in self.__list_accounts_with_filters(lazy=True))
+        )
         accounts_stats = ArkPCloudAccountsStats.model_construct()
-        accounts_stats.accounts_count = len(accounts)
-
-        # Get accounts per platform id
-        platform_ids: Set[str] = {a.platform_id for a in accounts}
-        accounts_stats.accounts_count_by_platform_id = {pi: len([a for a in accounts if a.platform_id == pi]) for pi in platform_ids}
-
-        # Get accounts per safe name
-        safe_names: Set[str] = {a.safe_name for a in accounts}
-        accounts_stats.accounts_count_by_safe_name = {sn: len([a for a in accounts if a.safe_name == sn]) for sn in safe_names}
-
+        accounts_stats.accounts_count = aggregator.count
+        accounts_stats.accounts_count_by_platform_id = aggregator.counts('platform_id')
+        accounts_stats.accounts_count_by_safe_name = aggregator.counts('safe_name')
         return accounts_stats
 
     @staticmethod
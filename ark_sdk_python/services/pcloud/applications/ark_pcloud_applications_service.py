@@ -4,11 +4,11 @@ from typing import Final, List, Optional
 
 from dateutil.parser import parse
 from overrides import overrides
-from pydantic import TypeAdapter
 from requests import Response
 
 from ark_sdk_python.auth import ArkISPAuth
-from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.common import ArkStatsAggregator
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.pcloud.applications import (
     ArkPCloudAddApplication,
@@ -93,7 +93,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         self._logger.info('Listing all applications')
         resp: Response = self._client.get(BASE_APPLICATIONS_URL)
         if resp.status_code == HTTPStatus.OK:
-            return TypeAdapter(List[ArkPCloudApplication]).validate_python(resp.json()['application'])
+            return ArkTypeAdapters.validate_json_field(List[ArkPCloudApplication], resp.content, 'application')[0]
         raise ArkServiceException(f'Failed to list applications [{resp.text}] - [{resp.status_code}]')
 
     def list_applications_by(self, applications_filter: ArkPCloudApplicationsFilter) -> List[ArkPCloudApplication]:
@@ -149,21 +149,26 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
             ArkPCloudAppicationsStats: _description_
         """
         self._logger.info('Calculating applications stats')
-        applications = self.list_applications()
+        aggregator: ArkStatsAggregator[ArkPCloudApplication] = (
+            ArkStatsAggregator()
+            .collect_by('disabled', lambda a: a.disabled, lambda a: a.app_id)
+            .map_by(
+                'auth_method_types',
+                lambda a: a.app_id,
+                lambda a: [am.auth_type for am in self.list_application_auth_methods(ArkPCloudListApplicationAuthMethods(app_id=a.app_id))],
+            )
+            .consume(self.list_applications())
+        )
         applications_stats = ArkPCloudAppicationsStats.model_construct()
-        applications_stats.count = len(applications)
-        applications_stats.disabled_apps = [a.app_id for a in applications if a.disabled]
-        apps_auth_types = {}
-        for a in applications:
-            auth_methods = self.list_application_auth_methods(ArkPCloudListApplicationAuthMethods(app_id=a.app_id))
-            apps_auth_types[a.app_id] = [am.auth_type for am in auth_methods]
-        applications_stats.applications_auth_method_types = apps_auth_types
-        applications_stats.auth_types_count = {}
-        for auth_method_types in apps_auth_types.values():
-            for auth_method in auth_method_types:
-                if auth_method not in applications_stats.auth_types_count:
-                    applications_stats.auth_types_count[auth_method] = 0
-                applications_stats.auth_types_count[auth_method] += 1
+        applications_stats.count = aggregator.count
+        applications_stats.disabled_apps = aggregator.collected('disabled').get(True, [])
+        applications_stats.applications_auth_method_types = aggregator.values('auth_method_types')
+        applications_stats.auth_types_count = (
+            ArkStatsAggregator()
+            .count_by_each('auth_type', lambda auth_types: auth_types)
+            .consume(applications_stats.applications_auth_method_types.values())
+            .counts('auth_type')
+        )
         return applications_stats
 
     def add_application_auth_method(self, add_application_auth_method: ArkPCloudAddApplicationAuthMethod) -> ArkPCloudApplicationAuthMethod:
@@ -268,7 +273,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         self._logger.info(f'Listing all application [{list_application_auth_methods.app_id}]] auth methods')
         resp: Response = self._client.get(BASE_AUTH_METHODS_URL.format(app_id=list_application_auth_methods.app_id))
         if resp.status_code == HTTPStatus.OK:
-            return TypeAdapter(List[ArkPCloudApplicationAuthMethod]).validate_python(resp.json()['authentication'])
+            return ArkTypeAdapters.validate_json_field(List[ArkPCloudApplicationAuthMethod], resp.content, 'authentication')[0]
         raise ArkServiceException(f'Failed to list application auth methods [{resp.text}] - [{resp.status_code}]]')
 
     def list_application_auth_methods_by(
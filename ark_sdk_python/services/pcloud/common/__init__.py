@@ -1,3 +1,4 @@
+from ark_sdk_python.services.pcloud.common.ark_async_pcloud_base_service import ArkAsyncPCloudBaseService
 from ark_sdk_python.services.pcloud.common.ark_pcloud_base_service import ArkPCloudBaseService
 
-__all__ = ['ArkPCloudBaseService']
+__all__ = ['ArkPCloudBaseService', 'ArkAsyncPCloudBaseService']
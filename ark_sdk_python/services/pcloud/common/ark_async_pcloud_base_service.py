@@ -0,0 +1,41 @@
+import os
+from typing import Literal
+
+from ark_sdk_python.auth import ArkISPAuth
+from ark_sdk_python.common.env import AwsEnv
+from ark_sdk_python.common.isp.ark_async_isp_service_client import ArkAsyncISPServiceClient
+from ark_sdk_python.services.ark_service import ArkService
+
+
+class ArkAsyncPCloudBaseService(ArkService):
+    def __init__(
+        self,
+        isp_auth: ArkISPAuth,
+        base_api_path: Literal['api', 'webservices'] = 'api',
+    ) -> None:
+        super().__init__(isp_auth)
+        self._isp_auth: ArkISPAuth = isp_auth
+        env = None
+        if 'env' in isp_auth.token.metadata.keys():
+            env = isp_auth.token.metadata['env']
+        else:
+            env = os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value)
+        self._client = ArkAsyncISPServiceClient(
+            service_name='privilegecloud',
+            token=isp_auth.token.token.get_secret_value(),
+            tenant_env=AwsEnv(env),
+            base_path=f'passwordvault/{base_api_path}/',
+            refresh_connection_callback=self.__refresh_pcloud_auth,
+            connection_pool_settings=isp_auth.connection_pool.settings,
+            retry_policy=isp_auth.retry_policy,
+            rate_limiter=self._rate_limiter,
+        )
+
+    async def __refresh_pcloud_auth(self, client: ArkAsyncISPServiceClient) -> None:
+        await ArkAsyncISPServiceClient.refresh_client(client, self._isp_auth)
+
+    async def aclose(self) -> None:
+        """
+        Closes the connections of the service client.
+        """
+        await self._client.aclose()
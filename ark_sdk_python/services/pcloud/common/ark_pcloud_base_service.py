@@ -1,10 +1,8 @@
-import codecs
 import os
-import pickle
 from typing import Literal
 
 from ark_sdk_python.auth import ArkISPAuth
-from ark_sdk_python.common import ArkClient
+from ark_sdk_python.common import ArkClient, ArkSessionSerializer
 from ark_sdk_python.common.env import AwsEnv
 from ark_sdk_python.common.isp.ark_isp_service_client import ArkISPServiceClient
 from ark_sdk_python.services.ark_service import ArkService
@@ -29,6 +27,9 @@ class ArkPCloudBaseService(ArkService):
             tenant_env=AwsEnv(env),
             base_path=f'passwordvault/{base_api_path}/',
             refresh_connection_callback=self.__refresh_pcloud_auth,
+            connection_pool=isp_auth.connection_pool,
+            retry_policy=isp_auth.retry_policy,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_pcloud_auth(self, client: ArkClient) -> None:
@@ -36,7 +37,5 @@ class ArkPCloudBaseService(ArkService):
         if token:
             client.update_token(token.token.get_secret_value())
             client.update_cookies(
-                cookie_jar=(
-                    pickle.loads(codecs.decode(token.metadata['cookies'].encode(), "base64")) if 'cookies' in token.metadata else None
-                )
+                cookie_jar=(ArkSessionSerializer.deserialize_cookies(token.metadata['cookies']) if 'cookies' in token.metadata else None)
             )
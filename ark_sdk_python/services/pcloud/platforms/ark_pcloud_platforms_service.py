@@ -2,14 +2,15 @@ from base64 import b64encode
 from fnmatch import fnmatch
 from http import HTTPStatus
 from pathlib import Path
-from typing import Final, List, Optional, Set, Union
+from typing import Final, List, Optional, Union
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
-from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.common import ArkStatsAggregator
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.pcloud.platforms import (
     ArkPCloudActivateTargetPlatform,
@@ -67,7 +68,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
                 # Platform type may come in uppercase, lowercase it just in case
                 for p in data['Platforms']:
                     p['general']['platformType'] = p['general']['platformType'].lower()
-                return TypeAdapter(List[ArkPCloudPlatform]).validate_python(data['Platforms'])
+                return ArkTypeAdapters.validate_python(List[ArkPCloudPlatform], data['Platforms'])
             except (ValidationError, JSONDecodeError, KeyError) as ex:
                 self._logger.exception(f'Failed to parse list platforms response [{str(ex)}] - [{resp.text}]')
                 raise ArkServiceException(f'Failed to parse list platforms response [{str(ex)}]') from ex
@@ -240,16 +241,12 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
             ArkPCloudPlatformsStats: _description_
         """
         self._logger.info('Calculating platform statistics')
-        platforms = self.list_platforms()
+        aggregator: ArkStatsAggregator[ArkPCloudPlatform] = (
+            ArkStatsAggregator().count_by('platform_type', lambda p: p.general.platform_type).consume(self.list_platforms())
+        )
         platforms_stats = ArkPCloudPlatformsStats.model_construct()
-        platforms_stats.platforms_count = len(platforms)
-
-        # Get platforms per platform type
-        platform_types: Set[ArkPCloudPlatformType] = {p.general.platform_type for p in platforms}
-        platforms_stats.platforms_count_by_type = {
-            pt: len([p for p in platforms if p.general.platform_type == pt]) for pt in platform_types
-        }
-
+        platforms_stats.platforms_count = aggregator.count
+        platforms_stats.platforms_count_by_type = aggregator.counts('platform_type')
         return platforms_stats
 
     def __list_target_platforms_by_filters(
@@ -284,7 +281,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         resp: Response = self._client.get(TARGET_PLATFORMS_URL, params=params)
         if resp.status_code == HTTPStatus.OK:
             try:
-                return TypeAdapter(List[ArkPCloudTargetPlatform]).validate_python(resp.json()['Platforms'])
+                return ArkTypeAdapters.validate_json_field(List[ArkPCloudTargetPlatform], resp.content, 'Platforms')[0]
             except (ValidationError, JSONDecodeError, KeyError) as ex:
                 self._logger.exception(f'Failed to parse list target platforms response [{str(ex)}] - [{resp.text}]')
                 raise ArkServiceException(f'Failed to parse list target platforms response [{str(ex)}]') from ex
@@ -449,16 +446,12 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
             ArkPCloudTargetPlatformsStats: _description_
         """
         self._logger.info('Calculating target platform statistics')
-        target_platforms = self.list_target_platforms()
+        aggregator: ArkStatsAggregator[ArkPCloudTargetPlatform] = (
+            ArkStatsAggregator().count_by('system_type', lambda p: p.system_type).consume(self.list_target_platforms())
+        )
         target_platforms_stats = ArkPCloudTargetPlatformsStats.model_construct()
-        target_platforms_stats.target_platforms_count = len(target_platforms)
-
-        # Get target platforms per system type
-        target_platform_system_types: Set[str] = {p.system_type for p in target_platforms}
-        target_platforms_stats.target_platforms_count_by_system_type = {
-            pt: len([p for p in target_platforms if p.system_type == pt]) for pt in target_platform_system_types
-        }
-
+        target_platforms_stats.target_platforms_count = aggregator.count
+        target_platforms_stats.target_platforms_count_by_system_type = aggregator.counts('system_type')
         return target_platforms_stats
 
     @staticmethod
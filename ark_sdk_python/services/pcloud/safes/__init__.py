@@ -1,3 +1,4 @@
+from ark_sdk_python.services.pcloud.safes.ark_async_pcloud_safes_service import ArkAsyncPCloudSafesService
 from ark_sdk_python.services.pcloud.safes.ark_pcloud_safes_service import ArkPCloudSafesService
 
-__all__ = ['ArkPCloudSafesService']
+__all__ = ['ArkPCloudSafesService', 'ArkAsyncPCloudSafesService']
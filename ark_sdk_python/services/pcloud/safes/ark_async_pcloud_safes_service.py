@@ -0,0 +1,238 @@
+from http import HTTPStatus
+from json import JSONDecodeError
+from typing import AsyncIterator, Final, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from httpx import Response
+from overrides import overrides
+from pydantic import ValidationError
+
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
+from ark_sdk_python.models.services import ArkServiceConfig
+from ark_sdk_python.models.services.pcloud.safes import (
+    ArkPCloudGetSafe,
+    ArkPCloudGetSafeMember,
+    ArkPCloudListSafeMembers,
+    ArkPCloudSafe,
+    ArkPCloudSafeMember,
+    ArkPCloudSafeMemberPermissionSet,
+    ArkPCloudSafeMembersFilters,
+    ArkPCloudSafeMemberType,
+    ArkPCloudSafesFilters,
+)
+from ark_sdk_python.services.pcloud.common import ArkAsyncPCloudBaseService
+from ark_sdk_python.services.pcloud.safes.ark_pcloud_safes_service import (
+    SAFE_MEMBER_PERMISSIONS_SETS,
+    SAFE_MEMBER_URL,
+    SAFE_MEMBERS_URL,
+    SAFE_URL,
+    SAFES_URL,
+    ArkPCloudSafeMembersPage,
+    ArkPCloudSafesPage,
+)
+
+SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
+    service_name='pcloud-safes-async',
+    rate_limit_name='pcloud-safes',
+    required_authenticator_names=[],
+    optional_authenticator_names=['isp'],
+)
+
+
+class ArkAsyncPCloudSafesService(ArkAsyncPCloudBaseService):
+    async def __list_safes_with_filters(
+        self, search: Optional[str] = None, sort: Optional[str] = None, offset: Optional[int] = None, limit: Optional[int] = None
+    ) -> AsyncIterator[ArkPCloudSafesPage]:
+        query = {}
+        if search:
+            query['search'] = search
+        if sort:
+            query['sort'] = sort
+        if offset:
+            query['offset'] = offset
+        if limit:
+            query['limit'] = limit
+        while True:
+            resp: Response = await self._client.get(SAFES_URL, params=query)
+            if resp.status_code != HTTPStatus.OK:
+                raise ArkServiceException(f'Failed to list safes [{resp.text}] - [{resp.status_code}]')
+            try:
+                result = resp.json()
+                safes = None
+                if 'value' in result:
+                    safes = result['value']
+                elif 'Safes' in result:
+                    safes = result['Safes']
+                if not safes:
+                    raise ArkServiceException('Failed to list safes, unexpected result')
+                safes = [{f'{k[0].lower()}{k[1:]}': v for k, v in safe.items()} for safe in safes]
+                page = ArkPCloudSafesPage(items=ArkTypeAdapters.validate_python(List[ArkPCloudSafe], safes))
+            except (ValidationError, JSONDecodeError, KeyError) as ex:
+                self._logger.exception(f'Failed to parse list safes response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse list safes response [{str(ex)}]') from ex
+            yield page
+            if 'nextLink' in result:
+                query = parse_qs(urlparse(result['nextLink']).query)
+            else:
+                break
+
+    async def __list_safe_members_with_filters(
+        self,
+        safe_id: str,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        member_type: Optional[ArkPCloudSafeMemberType] = None,
+    ) -> AsyncIterator[ArkPCloudSafeMembersPage]:
+        query = {}
+        if search:
+            query['search'] = search
+        if sort:
+            query['sort'] = sort
+        if offset:
+            query['offset'] = offset
+        if limit:
+            query['limit'] = limit
+        if member_type:
+            query['filter'] = f'memberType eq {member_type.value}'
+        while True:
+            resp: Response = await self._client.get(SAFE_MEMBERS_URL.format(safe_id=safe_id), params=query)
+            if resp.status_code != HTTPStatus.OK:
+                raise ArkServiceException(f'Failed to list safe members [{resp.text}] - [{resp.status_code}]')
+            try:
+                safe_members, result = ArkTypeAdapters.validate_json_field(List[ArkPCloudSafeMember], resp.content, 'value')
+                for sm in safe_members:
+                    sm.permission_set = (
+                        [p for p in SAFE_MEMBER_PERMISSIONS_SETS.keys() if SAFE_MEMBER_PERMISSIONS_SETS[p] == sm.permissions]
+                        + [ArkPCloudSafeMemberPermissionSet.Custom]
+                    )[0]
+            except (ValidationError, JSONDecodeError, KeyError) as ex:
+                self._logger.exception(f'Failed to parse list safe members response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse list safe members response [{str(ex)}]') from ex
+            yield ArkPCloudSafeMembersPage(items=safe_members)
+            if 'nextLink' in result:
+                query = parse_qs(urlparse(result['nextLink']).query)
+            else:
+                break
+
+    async def list_safes(self) -> AsyncIterator[ArkPCloudSafesPage]:
+        """
+        Lists all the visible safes of the logged in user as pages of safes
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/Safes%20Web%20Services%20-%20List%20Safes.htm?
+
+        Yields:
+            AsyncIterator[ArkPCloudSafesPage]: _description_
+        """
+        self._logger.info('Listing all safes')
+        async for page in self.__list_safes_with_filters():
+            yield page
+
+    async def list_safes_by(self, safes_filter: ArkPCloudSafesFilters) -> AsyncIterator[ArkPCloudSafesPage]:
+        """
+        Lists the visible safes of the logged in user by filters as pages of safes
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/Safes%20Web%20Services%20-%20List%20Safes.htm?
+
+        Yields:
+            AsyncIterator[ArkPCloudSafesPage]: _description_
+        """
+        self._logger.info(f'Listing safes by filter [{safes_filter}]')
+        async for page in self.__list_safes_with_filters(safes_filter.search, safes_filter.sort, safes_filter.offset, safes_filter.limit):
+            yield page
+
+    async def list_safe_members(self, list_safe_members: ArkPCloudListSafeMembers) -> AsyncIterator[ArkPCloudSafeMembersPage]:
+        """
+        Lists all safe members of a given safe that are visible to the logged in user as pages of safe members
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/Safe%20Members%20WS%20-%20List%20Safe%20Members.htm
+
+        Args:
+            list_safe_members (ArkPCloudListSafeMembers): _description_
+
+        Yields:
+            AsyncIterator[ArkPCloudSafeMembersPage]: _description_
+        """
+        self._logger.info('Listing all safe members')
+        async for page in self.__list_safe_members_with_filters(list_safe_members.safe_id):
+            yield page
+
+    async def list_safe_members_by(self, safe_members_filter: ArkPCloudSafeMembersFilters) -> AsyncIterator[ArkPCloudSafeMembersPage]:
+        """
+        Lists safe members of a given safe that are visible to the logged in user by filters as pages of safe members
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/Safe%20Members%20WS%20-%20List%20Safe%20Members.htm
+
+        Args:
+            safe_members_filter (ArkPCloudSafeMembersFilters): _description_
+
+        Yields:
+            AsyncIterator[ArkPCloudSafeMembersPage]: _description_
+        """
+        self._logger.info(f'Listing safe members by filter [{safe_members_filter}]')
+        async for page in self.__list_safe_members_with_filters(
+            safe_members_filter.safe_id,
+            safe_members_filter.search,
+            safe_members_filter.sort,
+            safe_members_filter.offset,
+            safe_members_filter.limit,
+            safe_members_filter.member_type,
+        ):
+            yield page
+
+    async def safe(self, get_safe: ArkPCloudGetSafe) -> ArkPCloudSafe:
+        """
+        Retrieves a safe by id
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/Safes%20Web%20Services%20-%20Get%20Safes%20Details.htm
+
+        Args:
+            get_safe (ArkPCloudGetSafe): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            ArkPCloudSafe: _description_
+        """
+        self._logger.info(f'Retrieving safe by id [{get_safe.safe_id}]')
+        resp: Response = await self._client.get(SAFE_URL.format(safe_id=get_safe.safe_id))
+        if resp.status_code == HTTPStatus.OK:
+            try:
+                return ArkPCloudSafe.model_validate(resp.json())
+            except (ValidationError, JSONDecodeError, KeyError) as ex:
+                self._logger.exception(f'Failed to parse safe response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse safe response [{str(ex)}]') from ex
+        raise ArkServiceException(f'Failed to retrieve safe [{resp.text}] - [{resp.status_code}]')
+
+    async def safe_member(self, get_safe_member: ArkPCloudGetSafeMember) -> ArkPCloudSafeMember:
+        """
+        Retrieves a safe member by safe id and member name
+        https://docs.cyberark.com/Product-Doc/OnlineHelp/PAS/Latest/en/Content/SDK/Safe%20Members%20WS%20-%20List%20Safe%20Member.htm
+
+        Args:
+            get_safe_member (ArkPCloudGetSafeMember): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            ArkPCloudSafeMember: _description_
+        """
+        self._logger.info(f'Retrieving safe member by safe [{get_safe_member.safe_id}] and member name [{get_safe_member.member_name}]')
+        resp: Response = await self._client.get(
+            SAFE_MEMBER_URL.format(safe_id=get_safe_member.safe_id, member_name=get_safe_member.member_name)
+        )
+        if resp.status_code == HTTPStatus.OK:
+            try:
+                safe_member = ArkPCloudSafeMember.model_validate(resp.json())
+                safe_member.permission_set = (
+                    [p for p in SAFE_MEMBER_PERMISSIONS_SETS.keys() if SAFE_MEMBER_PERMISSIONS_SETS[p] == safe_member.permissions]
+                    + [ArkPCloudSafeMemberPermissionSet.Custom]
+                )[0]
+                return safe_member
+            except (ValidationError, JSONDecodeError, KeyError) as ex:
+                self._logger.exception(f'Failed to parse safe member response [{str(ex)}] - [{resp.text}]')
+                raise ArkServiceException(f'Failed to parse safe member response [{str(ex)}]') from ex
+        raise ArkServiceException(f'Failed to retrieve safe member [{resp.text}] - [{resp.status_code}]')
+
+    @staticmethod
+    @overrides
+    def service_config() -> ArkServiceConfig:
+        return SERVICE_CONFIG
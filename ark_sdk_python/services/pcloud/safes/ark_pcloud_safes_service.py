@@ -1,16 +1,16 @@
 import itertools
 from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from typing import Dict, Final, Iterator, List, Optional, Set
+from typing import Dict, Final, Iterator, List, Optional
 from urllib.parse import parse_qs, urlparse
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
-from ark_sdk_python.common import ArkPage
-from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.common import ArkPage, ArkStatsAggregator
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.common import ArkCountedValues
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.pcloud.safes import (
@@ -124,7 +124,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
                     if not safes:
                         raise ArkServiceException('Failed to list safes, unexpected result')
                     safes = [{f'{k[0].lower()}{k[1:]}': v for k, v in safe.items()} for safe in safes]
-                    accounts = TypeAdapter(List[ArkPCloudSafe]).validate_python(safes)
+                    accounts = ArkTypeAdapters.validate_python(List[ArkPCloudSafe], safes)
                     yield ArkPCloudSafesPage(items=accounts)
                     if 'nextLink' in result:
                         query = parse_qs(urlparse(result['nextLink']).query)
@@ -160,8 +160,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             resp: Response = self._client.get(SAFE_MEMBERS_URL.format(safe_id=safe_id), params=query)
             if resp.status_code == HTTPStatus.OK:
                 try:
-                    result = resp.json()
-                    safe_members = TypeAdapter(List[ArkPCloudSafeMember]).validate_python(result['value'])
+                    safe_members, result = ArkTypeAdapters.validate_json_field(List[ArkPCloudSafeMember], resp.content, 'value')
                     for sm in safe_members:
                         sm.permission_set = (
                             [p for p in SAFE_MEMBER_PERMISSIONS_SETS.keys() if SAFE_MEMBER_PERMISSIONS_SETS[p] == sm.permissions]
@@ -450,18 +449,16 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             ArkPCloudSafesStats: _description_
         """
         self._logger.info('Calculating safes statistics')
-        safes = list(itertools.chain.from_iterable([p.items for p in list(self.list_safes())]))
+        aggregator: ArkStatsAggregator[ArkPCloudSafe] = (
+            ArkStatsAggregator()
+            .count_by('location', lambda s: s.location)
+            .count_by('creator', lambda s: s.creator.name)
+            .consume_pages(self.list_safes())
+        )
         safes_stats = ArkPCloudSafesStats.model_construct()
-        safes_stats.safes_count = len(safes)
-
-        # Get safes per location
-        locations: Set[str] = {s.location for s in safes}
-        safes_stats.safes_count_by_location = {l: len([s for s in safes if s.location == l]) for l in locations}
-
-        # Get safes per creator
-        creators: Set[str] = {s.creator.name for s in safes}
-        safes_stats.safes_count_by_creator = {c: len([s for s in safes if s.creator.name == c]) for c in creators}
-
+        safes_stats.safes_count = aggregator.count
+        safes_stats.safes_count_by_location = aggregator.counts('location')
+        safes_stats.safes_count_by_creator = aggregator.counts('creator')
         return safes_stats
 
     def safe_members_stats(self, get_safe_members_stats: ArkPCloudGetSafeMembersStats) -> ArkPCloudSafeMembersStats:
@@ -475,28 +472,19 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             ArkPCloudSafeMembersStats: _description_
         """
         self._logger.info(f'Calculating safe members statistics for safe [{get_safe_members_stats.safe_id}]')
-        safe_members = list(
-            itertools.chain.from_iterable(
-                [p.items for p in list(self.list_safe_members(ArkPCloudListSafeMembers(safe_id=get_safe_members_stats.safe_id)))]
-            )
+        aggregator: ArkStatsAggregator[ArkPCloudSafeMember] = (
+            ArkStatsAggregator()
+            .collect_by('permission_set', lambda sm: sm.permission_set, lambda sm: sm.member_name)
+            .count_by('member_type', lambda sm: sm.member_type)
+            .consume_pages(self.list_safe_members(ArkPCloudListSafeMembers(safe_id=get_safe_members_stats.safe_id)))
         )
         safe_members_stats = ArkPCloudSafeMembersStats.model_construct()
-        safe_members_stats.safe_members_count = len(safe_members)
-
-        # Get safe members count and names per permission set
-        permission_sets: Set[ArkPCloudSafeMemberPermissionSet] = {sm.permission_set for sm in safe_members}
+        safe_members_stats.safe_members_count = aggregator.count
         safe_members_stats.safe_members_permission_sets = {
-            ps: ArkCountedValues(
-                count=len([sm for sm in safe_members if sm.permission_set == ps]),
-                values=[sm.member_name for sm in safe_members if sm.permission_set == ps],
-            )
-            for ps in permission_sets
+            ps: ArkCountedValues(count=len(member_names), values=member_names)
+            for ps, member_names in aggregator.collected('permission_set').items()
         }
-
-        # Get safe members count per type
-        member_types: Set[ArkPCloudSafeMemberType] = {sm.member_type for sm in safe_members}
-        safe_members_stats.safe_members_types_count = {mt: len([sm for sm in safe_members if sm.member_type == mt]) for mt in member_types}
-
+        safe_members_stats.safe_members_types_count = aggregator.counts('member_type')
         return safe_members_stats
 
     def safes_members_stats(self) -> ArkPCloudSafesMembersStats:
@@ -507,11 +495,11 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             ArkPCloudSafesMembersStats: _description_
         """
         self._logger.info('Calculating safes members statistics')
-        safes = list(itertools.chain.from_iterable([p.items for p in list(self.list_safes())]))
         safes_members_stats = ArkPCloudSafesMembersStats.model_construct()
         with ThreadPoolExecutor() as executor:
             safe_members_stats_tuples = executor.map(
-                lambda s: (s.safe_name, self.safe_members_stats(ArkPCloudGetSafeMembersStats(safe_id=s.safe_id))), safes
+                lambda s: (s.safe_name, self.safe_members_stats(ArkPCloudGetSafeMembersStats(safe_id=s.safe_id))),
+                itertools.chain.from_iterable(self.list_safes()),
             )
             safes_members_stats.safe_members_stats = dict((a, b) for a, b in safe_members_stats_tuples)
         return safes_members_stats
@@ -1,7 +1,7 @@
 import json
 import time
 from http import HTTPStatus
-from typing import Dict, Final, Optional, Tuple
+from typing import Callable, Dict, Final, Iterator, List, Optional, Tuple
 
 from overrides import overrides
 from pydantic import ValidationError
@@ -9,6 +9,7 @@ from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage
 from ark_sdk_python.common.connections import ArkConnection
 from ark_sdk_python.common.connections.ssh import SSH_PORT, ArkSSHConnection
 from ark_sdk_python.common.connections.winrm import WINRM_HTTPS_PORT, ArkWinRMConnection
@@ -19,6 +20,9 @@ from ark_sdk_python.models.common.connections import ArkConnectionCommand, ArkCo
 from ark_sdk_python.models.common.connections.connection_data import ArkSSHConnectionData, ArkWinRMConnectionData
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.sia.access import (
+    ArkSIABulkInstallConnectors,
+    ArkSIABulkUninstallConnectors,
+    ArkSIAConnectorOperationResult,
     ArkSIAConnectorSetupScript,
     ArkSIAGetConnectorSetupScript,
     ArkSIAInstallConnector,
@@ -76,8 +80,11 @@ CONNECTOR_CMDSET: Final[Dict[ArkOsType, Dict[str, str]]] = {
     },
 }
 CONNECTOR_CMDSET[ArkOsType.DARWIN] = CONNECTOR_CMDSET[ArkOsType.LINUX]
-CONNECTOR_READY_RETRY_COUNT: Final[int] = 5
-CONNECTOR_RETRY_TICK_SECONDS: Final[int] = 3.0
+CONNECTOR_READY_TIMEOUT_SECONDS: Final[float] = 30.0
+CONNECTOR_READY_MIN_TICK_SECONDS: Final[float] = 0.5
+CONNECTOR_RETRY_TICK_SECONDS: Final[float] = 3.0
+
+ArkSIAConnectorOperationResultsPage = ArkPage[ArkSIAConnectorOperationResult]
 
 
 class ArkSIAAccessService(ArkService):
@@ -88,6 +95,7 @@ class ArkSIAAccessService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
@@ -134,34 +142,44 @@ class ArkSIAAccessService(ArkService):
         password: Optional[str] = None,
         private_key_path: Optional[str] = None,
         private_key_contents: Optional[str] = None,
+        ready_timeout_seconds: float = CONNECTOR_READY_TIMEOUT_SECONDS,
     ) -> str:
         connection, cmdset = self.__create_connection(os_type, target_machine, username, password, private_key_path, private_key_contents)
-        connection.run_command(ArkConnectionCommand(command=cmdset['stop-connector-service'], raise_on_error=False))
-        connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-service'], raise_on_error=False))
-        connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-files'], raise_on_error=False))
-        if os_type == ArkOsType.WINDOWS:
-            connection.run_command(ArkConnectionCommand(command=install_script, extra_command_data={'force_command_split': True}))
-        else:
-            connection.run_command(ArkConnectionCommand(command=install_script))
-        retry_count = CONNECTOR_READY_RETRY_COUNT
+        try:
+            connection.run_command(ArkConnectionCommand(command=cmdset['stop-connector-service'], raise_on_error=False))
+            connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-service'], raise_on_error=False))
+            connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-files'], raise_on_error=False))
+            if os_type == ArkOsType.WINDOWS:
+                connection.run_command(ArkConnectionCommand(command=install_script, extra_command_data={'force_command_split': True}))
+            else:
+                connection.run_command(ArkConnectionCommand(command=install_script))
+            self.__wait_for_connector_active(connection, cmdset, target_machine, ready_timeout_seconds)
+            result = connection.run_command(ArkConnectionCommand(command=cmdset['read-connector-config']))
+            connector_config = json.loads(str(result.stdout).strip())
+            return connector_config['Id']
+        finally:
+            connection.disconnect()
+
+    def __wait_for_connector_active(
+        self, connection: ArkConnection, cmdset: Dict[str, str], target_machine: str, ready_timeout_seconds: float
+    ) -> None:
+        # Polls with an exponentially growing tick, so connectors which start quickly are detected quickly,
+        # while slow ones are not polled more than once per max tick until the timeout
+        deadline = time.monotonic() + ready_timeout_seconds
+        tick = CONNECTOR_READY_MIN_TICK_SECONDS
         while True:
             try:
                 connection.run_command(ArkConnectionCommand(command=cmdset['connector-active']))
-                break
+                return
             except ArkException as ex:
-                self._logger.exception(f'Failed to check whether a connector is active [{str(ex)}]')
-                if retry_count > 0:
-                    retry_count = retry_count - 1
-                    self._logger.info(
-                        f'Retrying to check if connector is active, sleeping for '
-                        f'[{CONNECTOR_RETRY_TICK_SECONDS}] and retrying, retries left [{retry_count}]'
-                    )
-                    time.sleep(CONNECTOR_RETRY_TICK_SECONDS)
-                    continue
-                raise
-        result = connection.run_command(ArkConnectionCommand(command=cmdset['read-connector-config']))
-        connector_config = json.loads(str(result.stdout).strip())
-        return connector_config['Id']
+                time_left = deadline - time.monotonic()
+                if time_left <= 0:
+                    self._logger.exception(f'Connector on machine [{target_machine}] did not become active [{str(ex)}]')
+                    raise
+                tick = min(tick, time_left)
+                self._logger.info(f'Connector on machine [{target_machine}] is not active yet, checking again in [{tick:.1f}] seconds')
+                time.sleep(tick)
+                tick = min(tick * 2, CONNECTOR_RETRY_TICK_SECONDS)
 
     def __uninstall_connector_on_machine(
         self,
@@ -173,9 +191,70 @@ class ArkSIAAccessService(ArkService):
         private_key_contents: Optional[str] = None,
     ) -> None:
         connection, cmdset = self.__create_connection(os_type, target_machine, username, password, private_key_path, private_key_contents)
-        connection.run_command(ArkConnectionCommand(command=cmdset['stop-connector-service']))
-        connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-service']))
-        connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-files']))
+        try:
+            connection.run_command(ArkConnectionCommand(command=cmdset['stop-connector-service']))
+            connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-service']))
+            connection.run_command(ArkConnectionCommand(command=cmdset['remove-connector-files']))
+        finally:
+            connection.disconnect()
+
+    def __run_connector_operation(
+        self, target_machine: Optional[str], connector_id: Optional[str], operation: Callable[[], Optional[str]]
+    ) -> ArkSIAConnectorOperationResultsPage:
+        start_time = time.monotonic()
+        try:
+            connector_id = operation() or connector_id
+        except Exception as ex:
+            self._logger.warning(f'Connector operation on machine [{target_machine}] failed [{str(ex)}]')
+            return ArkSIAConnectorOperationResultsPage(
+                [
+                    ArkSIAConnectorOperationResult(
+                        target_machine=target_machine,
+                        connector_id=connector_id,
+                        success=False,
+                        error=str(ex),
+                        duration_seconds=time.monotonic() - start_time,
+                    )
+                ]
+            )
+        return ArkSIAConnectorOperationResultsPage(
+            [
+                ArkSIAConnectorOperationResult(
+                    target_machine=target_machine,
+                    connector_id=connector_id,
+                    success=True,
+                    duration_seconds=time.monotonic() - start_time,
+                )
+            ]
+        )
+
+    def __run_connector_operations(
+        self,
+        operation_name: str,
+        operations: List[Tuple[Optional[str], Optional[str], Callable[[], Optional[str]]]],
+        max_concurrency: int,
+    ) -> Iterator[ArkSIAConnectorOperationResultsPage]:
+        start_time = time.monotonic()
+        succeeded_count = 0
+        for done_count, page in enumerate(
+            ArkConcurrentPager.fetch_pages(
+                fetch_page=lambda index: self.__run_connector_operation(*operations[index]),
+                offsets=range(len(operations)),
+                max_workers=max_concurrency,
+                ordered=False,
+            ),
+            start=1,
+        ):
+            result = page[0]
+            succeeded_count += int(result.success)
+            self._logger.info(
+                f'[{done_count}/{len(operations)}] {operation_name} on machine [{result.target_machine}] '
+                f'{"succeeded" if result.success else "failed"} after [{result.duration_seconds:.1f}] seconds'
+            )
+            yield page
+        self._logger.info(
+            f'{operation_name} succeeded on [{succeeded_count}/{len(operations)}] machines in [{time.monotonic() - start_time:.1f}] seconds'
+        )
 
     def connector_setup_script(self, get_connector_setup_script: ArkSIAGetConnectorSetupScript) -> ArkSIAConnectorSetupScript:
         """
@@ -215,6 +294,9 @@ class ArkSIAAccessService(ArkService):
         Returns:
             str: _description_
         """
+        return self.__install_connector(install_connector, CONNECTOR_READY_TIMEOUT_SECONDS)
+
+    def __install_connector(self, install_connector: ArkSIAInstallConnector, ready_timeout_seconds: float) -> str:
         self._logger.info(
             f'Installing connector on machine [{install_connector.target_machine}] of type [{install_connector.connector_os}]'
         )
@@ -235,6 +317,7 @@ class ArkSIAAccessService(ArkService):
             private_key_contents=(
                 install_connector.private_key_contents.get_secret_value() if install_connector.private_key_contents else None
             ),
+            ready_timeout_seconds=ready_timeout_seconds,
         )
 
     def uninstall_connector(self, uninstall_connector: ArkSIAUninstallConnector) -> None:
@@ -253,7 +336,64 @@ class ArkSIAAccessService(ArkService):
             uninstall_connector.username,
             uninstall_connector.password.get_secret_value() if uninstall_connector.password else None,
             uninstall_connector.private_key_path,
-            uninstall_connector.private_key_contents,
+            uninstall_connector.private_key_contents.get_secret_value() if uninstall_connector.private_key_contents else None,
+        )
+
+    def bulk_install_connectors(
+        self, bulk_install_connectors: ArkSIABulkInstallConnectors
+    ) -> Iterator[ArkSIAConnectorOperationResultsPage]:
+        """
+        Installs connectors on many remote machines concurrently, with a bounded amount of machines handled at once
+        Every machine is handled over a single SSH / WinRM session, which is used for all of its installation steps and readiness checks
+        The result of every machine is yielded as soon as it is done, and failures are reported per machine instead of raised
+
+        Args:
+            bulk_install_connectors (ArkSIABulkInstallConnectors): _description_
+
+        Yields:
+            Iterator[ArkSIAConnectorOperationResultsPage]: _description_
+        """
+        self._logger.info(f'Installing connectors on [{len(bulk_install_connectors.connectors)}] machines')
+        yield from self.__run_connector_operations(
+            'Connector installation',
+            [
+                (
+                    install_connector.target_machine,
+                    None,
+                    lambda install_connector=install_connector: self.__install_connector(
+                        install_connector, bulk_install_connectors.ready_timeout_seconds
+                    ),
+                )
+                for install_connector in bulk_install_connectors.connectors
+            ],
+            bulk_install_connectors.max_concurrency,
+        )
+
+    def bulk_uninstall_connectors(
+        self, bulk_uninstall_connectors: ArkSIABulkUninstallConnectors
+    ) -> Iterator[ArkSIAConnectorOperationResultsPage]:
+        """
+        Uninstalls connectors from many remote machines concurrently, with a bounded amount of machines handled at once
+        The result of every machine is yielded as soon as it is done, and failures are reported per machine instead of raised
+
+        Args:
+            bulk_uninstall_connectors (ArkSIABulkUninstallConnectors): _description_
+
+        Yields:
+            Iterator[ArkSIAConnectorOperationResultsPage]: _description_
+        """
+        self._logger.info(f'Uninstalling connectors from [{len(bulk_uninstall_connectors.connectors)}] machines')
+        yield from self.__run_connector_operations(
+            'Connector uninstallation',
+            [
+                (
+                    uninstall_connector.target_machine,
+                    uninstall_connector.connector_id,
+                    lambda uninstall_connector=uninstall_connector: self.uninstall_connector(uninstall_connector),
+                )
+                for uninstall_connector in bulk_uninstall_connectors.connectors
+            ],
+            bulk_uninstall_connectors.max_concurrency,
         )
 
     @staticmethod
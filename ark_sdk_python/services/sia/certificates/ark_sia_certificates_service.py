@@ -38,6 +38,7 @@ class ArkSIACertificatesService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
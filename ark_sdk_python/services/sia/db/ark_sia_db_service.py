@@ -48,22 +48,27 @@ class ArkSIADBService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
         ArkISPServiceClient.refresh_client(client, self.__isp_auth)
 
     def __proxy_address(self, db_type: str):
-        claims = ArkJWTUtils.get_unverified_claims(self.__isp_auth.token.token.get_secret_value())
-        return f'{claims["subdomain"]}.{db_type}.{claims["platform_domain"]}'
+        claims = ArkJWTUtils.get_claims(self.__isp_auth.token.token.get_secret_value())
+        if not claims.subdomain or not claims.platform_domain:
+            raise ArkServiceException('Failed to retrieve the tenant subdomain and platform domain from the token')
+        return f'{claims.subdomain}.{db_type}.{claims.platform_domain}'
 
     def __connection_string(self, target_address: str, target_username: Optional[str] = None) -> None:
-        claims = ArkJWTUtils.get_unverified_claims(self.__isp_auth.token.token.get_secret_value())
+        unique_name = ArkJWTUtils.get_claims(self.__isp_auth.token.token.get_secret_value()).unique_name
+        if not unique_name:
+            raise ArkServiceException('Failed to retrieve the user name from the token')
         if target_username:
             # Standing
-            return f'{claims["unique_name"]}@{target_username}@{target_address}'
+            return f'{unique_name}@{target_username}@{target_address}'
         # Dynamic
-        return f'{claims["unique_name"]}@{target_address}'
+        return f'{unique_name}@{target_address}'
 
     def __create_mylogin_cnf(self, username: str, address: str, password: str) -> str:
         temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8')
@@ -1,23 +1,19 @@
 import json
 from fnmatch import fnmatch
 from http import HTTPStatus
-from typing import Final, List, Set
+from typing import Final, List
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
-from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.services import ArkServiceConfig
-from ark_sdk_python.models.services.sia.policies.common import (
-    ArkSIADeletePolicy,
-    ArkSIAGetPolicy,
-    ArkSIARuleStatus,
-    ArkSIAUpdatePolicyStatus,
-)
+from ark_sdk_python.models.services.sia.policies.common import ArkSIADeletePolicy, ArkSIAGetPolicy, ArkSIAUpdatePolicyStatus
 from ark_sdk_python.models.services.sia.policies.db import (
     ArkSIADBAddPolicy,
     ArkSIADBPoliciesFilter,
@@ -44,6 +40,7 @@ class ArkSIADBPoliciesService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
@@ -171,7 +168,7 @@ class ArkSIADBPoliciesService(ArkService):
         resp: Response = self.__client.get(DB_POLICIES_API)
         if resp.status_code == HTTPStatus.OK:
             try:
-                return TypeAdapter(List[ArkSIADBPolicyListItem]).validate_python(resp.json()['items'])
+                return ArkTypeAdapters.validate_json_field(List[ArkSIADBPolicyListItem], resp.content, 'items')[0]
             except (ValidationError, JSONDecodeError, KeyError) as ex:
                 self._logger.exception(f'Failed to parse list db policies response [{str(ex)}] - [{resp.text}]')
                 raise ArkServiceException(f'Failed to parse list db policies response [{str(ex)}]') from ex
@@ -237,22 +234,16 @@ class ArkSIADBPoliciesService(ArkService):
             ArkSIADBPoliciesStats: _description_
         """
         self._logger.info('Calculating db policies stats')
-        policies = self.list_policies()
+        aggregator: ArkStatsAggregator[ArkSIADBPolicyListItem] = (
+            ArkStatsAggregator()
+            .count_by('status', lambda p: p.status, skip_empty=True)
+            .count_by_each('provider', lambda p: p.providers or [])
+            .consume(self.list_policies())
+        )
         policies_stats = ArkSIADBPoliciesStats.model_construct()
-        policies_stats.policies_count = len(policies)
-
-        # Count policies per status
-        status_types: Set[ArkSIARuleStatus] = {p.status for p in policies if p.status}
-        policies_stats.policies_count_per_status = {st: len([p for p in policies if p.status and p.status == st]) for st in status_types}
-
-        # Count policies per platforms
-        policies_stats.policies_count_per_provider = {}
-        for policy in policies:
-            for platform in policy.providers:
-                if platform not in policies_stats.policies_count_per_provider:
-                    policies_stats.policies_count_per_provider[platform] = 0
-                policies_stats.policies_count_per_provider[platform] += 1
-
+        policies_stats.policies_count = aggregator.count
+        policies_stats.policies_count_per_status = aggregator.counts('status')
+        policies_stats.policies_count_per_provider = aggregator.counts('provider')
         return policies_stats
 
     @staticmethod
@@ -1,24 +1,19 @@
 import itertools
 import json
 from http import HTTPStatus
-from typing import Dict, Final, Iterator, List, Set, Tuple, Union
+from typing import Dict, Final, Iterator, List, Tuple, Union
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
-from ark_sdk_python.common import ArkPage
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage, ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
-from ark_sdk_python.models import ArkException, ArkServiceException
+from ark_sdk_python.models import ArkException, ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.services import ArkServiceConfig
-from ark_sdk_python.models.services.sia.policies.common import (
-    ArkSIADeletePolicy,
-    ArkSIAGetPolicy,
-    ArkSIARuleStatus,
-    ArkSIAUpdatePolicyStatus,
-)
+from ark_sdk_python.models.services.sia.policies.common import ArkSIADeletePolicy, ArkSIAGetPolicy, ArkSIAUpdatePolicyStatus
 from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy_list_item import ArkSIABasePolicyListItemBase
 from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy_list_item_extanded import ArkSIABasePolicyListItemExtended
 from ark_sdk_python.models.services.sia.policies.vm import (
@@ -39,6 +34,7 @@ from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_filter_b
 from ark_sdk_python.services.ark_service import ArkService
 
 MAX_ITERATIONS: Final[int] = 100
+STATS_MAX_CONCURRENT_PAGES: Final[int] = 4
 
 SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
     service_name='sia-policies-vm', required_authenticator_names=['isp'], optional_authenticator_names=[]
@@ -58,6 +54,7 @@ class ArkSIAVMPoliciesService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
@@ -204,14 +201,29 @@ class ArkSIAVMPoliciesService(ArkService):
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to list vm policies [{resp.text}] - [{resp.status_code}]')
         try:
-            return self.__parse_policies(resp, params.get('extended', False)), json.loads(resp.text)['totalCount']
+            return self.__parse_policies(resp, params.get('extended', False))
         except (ValidationError, JSONDecodeError, KeyError) as ex:
             self._logger.exception(f'Failed to parse list vm policies response [{str(ex)}] - [{resp.text}]')
             raise ArkServiceException(f'Failed to parse list vm policies response [{str(ex)}]') from ex
 
+    def __query_policies_concurrently(self, params: Dict, max_concurrent_pages: int, ordered: bool) -> Iterator[ArkPolicyListItemPage]:
+        def fetch_page(offset: int) -> Tuple[ArkPolicyListItemPage, int]:
+            parsed_policies, total_policies = self.__get_policies(params={**params, 'offset': offset})
+            return ArkPolicyListItemPage(items=parsed_policies), total_policies
+
+        yield from ArkConcurrentPager.fetch_pages_by_total(
+            fetch_page=fetch_page,
+            start_offset=params.get('offset', 0),
+            max_workers=max_concurrent_pages,
+            ordered=ordered,
+            max_pages=MAX_ITERATIONS,
+        )
+
     def query_policies(self, policies_filter: ArkSIAVMQueryPolicies = None) -> Iterator[ArkPolicyListItemPage]:
         """
         Lists VM policies that match the specified query.
+        When `max_concurrent_pages` is given, the first page reveals the total amount of policies,
+        and the rest of the pages are fetched concurrently.
 
         Raises:
             ArkServiceException: _description_
@@ -224,6 +236,14 @@ class ArkSIAVMPoliciesService(ArkService):
 
         self._logger.info(f'Retrieving all vm policies that comply to the filter: {policies_filter=}')
         params = self.__build_url_params(policies_filter=policies_filter)
+        if (
+            policies_filter
+            and not policies_filter.limit
+            and policies_filter.max_concurrent_pages
+            and policies_filter.max_concurrent_pages > 1
+        ):
+            yield from self.__query_policies_concurrently(params, policies_filter.max_concurrent_pages, policies_filter.ordered_pages)
+            return
         offset = params.get('offset', 0)
 
         iteration_count = 0
@@ -261,17 +281,17 @@ class ArkSIAVMPoliciesService(ArkService):
 
     def __parse_policies(
         self, response: Response, is_extended: bool
-    ) -> List[Union[ArkSIABasePolicyListItemExtended, ArkSIAVMPolicyListItem]]:
-        response_items = response.json()['items']
-        if is_extended:
-            for item in response_items:
-                # Inserting the provider name into the provider data for parsing reasons
-                if 'providersData' in item:
-                    for provider, provider_data in item['providersData'].items():
-                        provider_data['provider_name'] = provider
-        return TypeAdapter(List[ArkSIABasePolicyListItemExtended if is_extended else ArkSIAVMPolicyListItem]).validate_python(
-            response_items
-        )
+    ) -> Tuple[List[Union[ArkSIABasePolicyListItemExtended, ArkSIAVMPolicyListItem]], int]:
+        if not is_extended:
+            policies, result = ArkTypeAdapters.validate_json_field(List[ArkSIAVMPolicyListItem], response.content, 'items')
+            return policies, result['totalCount']
+        result = response.json()
+        for item in result['items']:
+            # Inserting the provider name into the provider data for parsing reasons
+            if 'providersData' in item:
+                for provider, provider_data in item['providersData'].items():
+                    provider_data['provider_name'] = provider
+        return ArkTypeAdapters.validate_python(List[ArkSIABasePolicyListItemExtended], result['items']), result['totalCount']
 
     def list_policies(self) -> Iterator[ArkPolicyListItemPage]:
         """
@@ -359,22 +379,16 @@ class ArkSIAVMPoliciesService(ArkService):
             ArkSIAVMPoliciesStats: _description_
         """
         self._logger.info('Calculating vm policies stats')
-        policies = list(itertools.chain.from_iterable([p.items for p in list(self.list_policies())]))
+        aggregator: ArkStatsAggregator[ArkSIAVMPolicyListItem] = (
+            ArkStatsAggregator()
+            .count_by('status', lambda p: p.status, skip_empty=True)
+            .count_by_each('platform', lambda p: p.platforms or [])
+            .consume_pages(self.query_policies(ArkSIAVMQueryPolicies(max_concurrent_pages=STATS_MAX_CONCURRENT_PAGES, ordered_pages=False)))
+        )
         policies_stats = ArkSIAVMPoliciesStats.model_construct()
-        policies_stats.policies_count = len(policies)
-
-        # Count policies per status
-        status_types: Set[ArkSIARuleStatus] = {p.status for p in policies if p.status}
-        policies_stats.policies_count_per_status = {st: len([p for p in policies if p.status and p.status == st]) for st in status_types}
-
-        # Count policies per platforms
-        policies_stats.policies_count_per_provider = {}
-        for policy in policies:
-            for platform in policy.platforms:
-                if platform not in policies_stats.policies_count_per_provider:
-                    policies_stats.policies_count_per_provider[platform] = 0
-                policies_stats.policies_count_per_provider[platform] += 1
-
+        policies_stats.policies_count = aggregator.count
+        policies_stats.policies_count_per_status = aggregator.counts('status')
+        policies_stats.policies_count_per_provider = aggregator.counts('platform')
         return policies_stats
 
     @staticmethod
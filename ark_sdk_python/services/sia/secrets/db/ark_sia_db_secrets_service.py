@@ -1,6 +1,6 @@
 from fnmatch import fnmatch
 from http import HTTPStatus
-from typing import Final, List, Optional, Set
+from typing import Final, List, Optional
 
 from overrides import overrides
 from pydantic import ValidationError
@@ -8,6 +8,7 @@ from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
 from ark_sdk_python.models import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
@@ -23,7 +24,6 @@ from ark_sdk_python.models.services.sia.secrets.db import (
     ArkSIADBSecretsFilter,
     ArkSIADBSecretsStats,
     ArkSIADBSecretType,
-    ArkSIADBStoreType,
     ArkSIADBUpdateSecret,
 )
 from ark_sdk_python.models.services.sia.workspaces.db import ArkSIADBTag
@@ -46,6 +46,7 @@ class ArkSIADBSecretsService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
@@ -407,24 +408,19 @@ class ArkSIADBSecretsService(ArkService):
             ArkSIADBSecretsStats: _description_
         """
         self._logger.info('Calculating secrets statistics')
-        secrets = self.list_secrets()
+        aggregator: ArkStatsAggregator[ArkSIADBSecretMetadata] = (
+            ArkStatsAggregator()
+            .count_if('active', lambda s: s.is_active)
+            .count_by('secret_type', lambda s: s.secret_type, skip_empty=True)
+            .count_by('store_type', lambda s: s.secret_store.store_type, skip_empty=True)
+            .consume(self.list_secrets().secrets)
+        )
         secrets_stats = ArkSIADBSecretsStats.model_construct()
-        secrets_stats.secrets_count = len(secrets.secrets)
-        secrets_stats.active_secrets_count = len([s for s in secrets.secrets if s.is_active])
-        secrets_stats.inactive_secrets_count = len([s for s in secrets.secrets if not s.is_active])
-
-        # Count secrets per secret type
-        secret_types: Set[ArkSIADBSecretType] = {s.secret_type for s in secrets.secrets if s.secret_type}
-        secrets_stats.secrets_count_by_secret_type = {
-            st: len([s for s in secrets.secrets if s.secret_type and s.secret_type == st]) for st in secret_types
-        }
-
-        # Count secrets per store type
-        store_types: Set[ArkSIADBStoreType] = {s.secret_store.store_type for s in secrets.secrets if s.secret_store.store_type}
-        secrets_stats.secrets_count_by_store_type = {
-            st: len([s for s in secrets.secrets if s.secret_store.store_type and s.secret_store.store_type == st]) for st in store_types
-        }
-
+        secrets_stats.secrets_count = aggregator.count
+        secrets_stats.active_secrets_count = aggregator.total('active')
+        secrets_stats.inactive_secrets_count = aggregator.count - aggregator.total('active')
+        secrets_stats.secrets_count_by_secret_type = aggregator.counts('secret_type')
+        secrets_stats.secrets_count_by_store_type = aggregator.counts('store_type')
         return secrets_stats
 
     @staticmethod
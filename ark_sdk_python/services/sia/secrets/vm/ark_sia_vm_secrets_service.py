@@ -1,16 +1,17 @@
 import json
 from fnmatch import fnmatch
 from http import HTTPStatus
-from typing import Any, Dict, Final, List, Optional, Set, Union
+from typing import Any, Dict, Final, List, Optional, Union
 
 from overrides import overrides
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
-from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.sia.secrets.vm import (
     ArkSIAVMAddSecret,
@@ -41,6 +42,7 @@ class ArkSIAVMSecretsService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
@@ -73,7 +75,7 @@ class ArkSIAVMSecretsService(ArkService):
         resp: Response = self.__client.get(SECRETS_ROUTE, params=params)
         if resp.status_code == HTTPStatus.OK:
             try:
-                return TypeAdapter(List[ArkSIAVMSecretInfo]).validate_python(resp.json())
+                return ArkTypeAdapters.validate_json(List[ArkSIAVMSecretInfo], resp.content)
             except (ValidationError, JSONDecodeError) as ex:
                 self._logger.exception(f'Failed to parse list secrets response [{str(ex)}] - [{resp.text}]')
                 raise ArkServiceException(f'Failed to parse list secrets response [{str(ex)}]') from ex
@@ -232,18 +234,17 @@ class ArkSIAVMSecretsService(ArkService):
             ArkSIAVMSecretsStats: _description_
         """
         self._logger.info('Calculating vm secrets statistics')
-        secrets = self.list_secrets()
+        aggregator: ArkStatsAggregator[ArkSIAVMSecretInfo] = (
+            ArkStatsAggregator()
+            .count_if('active', lambda s: s.is_active)
+            .count_by('secret_type', lambda s: s.secret_type, skip_empty=True)
+            .consume(self.list_secrets())
+        )
         secrets_stats = ArkSIAVMSecretsStats.model_construct()
-        secrets_stats.secrets_count = len(secrets)
-        secrets_stats.active_secrets_count = len([s for s in secrets if s.is_active])
-        secrets_stats.inactive_secrets_count = len([s for s in secrets if not s.is_active])
-
-        # Count secrets per type
-        secret_types: Set[ArkSIAVMSecretType] = {s.secret_type for s in secrets if s.secret_type}
-        secrets_stats.secrets_count_by_type = {
-            st: len([s for s in secrets if s.secret_type and s.secret_type == st]) for st in secret_types
-        }
-
+        secrets_stats.secrets_count = aggregator.count
+        secrets_stats.active_secrets_count = aggregator.total('active')
+        secrets_stats.inactive_secrets_count = aggregator.count - aggregator.total('active')
+        secrets_stats.secrets_count_by_type = aggregator.counts('secret_type')
         return secrets_stats
 
     @staticmethod
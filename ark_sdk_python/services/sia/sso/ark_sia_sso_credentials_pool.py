@@ -0,0 +1,150 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Final, Hashable, Optional, Tuple
+
+from ark_sdk_python.common import get_logger
+from ark_sdk_python.models.services.sia.sso import ArkSIASSOAcquireTokenResponse, ArkSIASSOCredentialsPoolStats
+
+DEFAULT_RENEW_BEFORE_EXPIRY_SECONDS: Final[float] = 30.0
+DEFAULT_MIN_VALIDITY_SECONDS: Final[float] = 5.0
+
+# Mints a credential, returning it with the amount of seconds it is still valid for
+ArkSIASSOCredentialMinter = Callable[[], Tuple[ArkSIASSOAcquireTokenResponse, float]]
+
+
+class _ArkSIASSOPooledCredential:
+    def __init__(self, credential: ArkSIASSOAcquireTokenResponse, valid_for: float, mint: ArkSIASSOCredentialMinter) -> None:
+        self.credential = credential
+        self.expires_at = time.monotonic() + valid_for
+        self.mint = mint
+        self.used = False
+        self.timer: Optional[threading.Timer] = None
+
+
+class ArkSIASSOCredentialsPool:
+    """
+    In memory pool of short lived SIA credentials, holding one valid credential per token type and service.
+    Credentials are served from memory while they are valid, concurrent requests for a missing credential share a single mint,
+    and credentials which were used since they were minted are renewed in the background ahead of their expiry.
+    Credentials which were not used since their last mint are dropped instead of renewed, so idle credentials are not minted forever.
+    """
+
+    def __init__(
+        self,
+        renew_before_seconds: float = DEFAULT_RENEW_BEFORE_EXPIRY_SECONDS,
+        min_validity_seconds: float = DEFAULT_MIN_VALIDITY_SECONDS,
+    ) -> None:
+        self._logger = get_logger(app=self.__class__.__name__)
+        self.__renew_before_seconds = renew_before_seconds
+        self.__min_validity_seconds = min_validity_seconds
+        self.__lock = threading.Lock()
+        self.__credentials: Dict[Hashable, _ArkSIASSOPooledCredential] = {}
+        self.__in_flight: Dict[Hashable, Future] = {}
+        self.__stats = ArkSIASSOCredentialsPoolStats()
+
+    @property
+    def min_validity_seconds(self) -> float:
+        return self.__min_validity_seconds
+
+    def __schedule_renewal(self, key: Hashable, pooled: _ArkSIASSOPooledCredential) -> None:
+        delay = pooled.expires_at - time.monotonic() - self.__renew_before_seconds
+        if delay <= 0:
+            return
+        pooled.timer = threading.Timer(delay, self.__renew, args=(key, pooled))
+        pooled.timer.daemon = True
+        pooled.timer.start()
+
+    def __store(self, key: Hashable, pooled: _ArkSIASSOPooledCredential) -> None:
+        with self.__lock:
+            previous = self.__credentials.get(key)
+            if previous and previous.timer and previous is not pooled:
+                previous.timer.cancel()
+            self.__credentials[key] = pooled
+        self.__schedule_renewal(key, pooled)
+
+    def __renew(self, key: Hashable, pooled: _ArkSIASSOPooledCredential) -> None:
+        with self.__lock:
+            if self.__credentials.get(key) is not pooled:
+                return
+            if not pooled.used:
+                self.__credentials.pop(key)
+                self.__stats.evictions += 1
+                return
+        try:
+            credential, valid_for = pooled.mint()
+        except Exception as ex:
+            self._logger.warning(f'Failed to renew short lived credential [{key}] in the background [{str(ex)}]')
+            with self.__lock:
+                self.__stats.renewal_failures += 1
+            return
+        with self.__lock:
+            self.__stats.renewals += 1
+        self.__store(key, _ArkSIASSOPooledCredential(credential, valid_for, pooled.mint))
+
+    def get(self, key: Hashable, mint: ArkSIASSOCredentialMinter) -> ArkSIASSOAcquireTokenResponse:
+        """
+        Returns the pooled credential of the given key, or mints it when it is missing or about to expire.
+        Concurrent requests of a missing credential wait for a single mint and share its result.
+
+        Args:
+            key (Hashable): _description_
+            mint (ArkSIASSOCredentialMinter): _description_
+
+        Returns:
+            ArkSIASSOAcquireTokenResponse: _description_
+        """
+        with self.__lock:
+            pooled = self.__credentials.get(key)
+            if pooled and pooled.expires_at - time.monotonic() > self.__min_validity_seconds:
+                pooled.used = True
+                self.__stats.hits += 1
+                return pooled.credential
+            future = self.__in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.__in_flight[key] = future
+                self.__stats.misses += 1
+            else:
+                self.__stats.deduplicated += 1
+        if not owner:
+            return future.result()
+        try:
+            credential, valid_for = mint()
+        except BaseException as ex:
+            with self.__lock:
+                self.__in_flight.pop(key, None)
+            future.set_exception(ex)
+            raise
+        pooled = _ArkSIASSOPooledCredential(credential, valid_for, mint)
+        pooled.used = True
+        self.__store(key, pooled)
+        with self.__lock:
+            self.__in_flight.pop(key, None)
+        future.set_result(credential)
+        return credential
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drops the pooled credential of the given key, or all the pooled credentials when no key is given.
+
+        Args:
+            key (Optional[Hashable]): _description_. Defaults to None.
+        """
+        with self.__lock:
+            keys = [key] if key is not None else list(self.__credentials.keys())
+            for k in keys:
+                pooled = self.__credentials.pop(k, None)
+                if pooled and pooled.timer:
+                    pooled.timer.cancel()
+
+    def stats(self) -> ArkSIASSOCredentialsPoolStats:
+        """
+        Returns a snapshot of the pool usage metrics.
+
+        Returns:
+            ArkSIASSOCredentialsPoolStats: _description_
+        """
+        with self.__lock:
+            return self.__stats.model_copy(update={'size': len(self.__credentials)})
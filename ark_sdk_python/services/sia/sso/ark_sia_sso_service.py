@@ -1,12 +1,13 @@
 # pylint: disable=too-many-function-args
 import base64
 import os
+import threading
 import zipfile
 from datetime import datetime
 from http import HTTPStatus
 from io import BytesIO
 from json import JSONDecodeError
-from typing import Any, Dict, Final, Optional
+from typing import Any, Dict, Final, List, Optional, Set, Tuple
 
 from dateutil.parser import parse
 from overrides import overrides
@@ -23,6 +24,7 @@ from ark_sdk_python.models.auth import ArkToken, ArkTokenType
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.sia.sso import (
     ArkSIASSOAcquireTokenResponse,
+    ArkSIASSOCredentialsPoolStats,
     ArkSIASSOGetShortLivedClientCertificate,
     ArkSIASSOGetShortLivedOracleWallet,
     ArkSIASSOGetShortLivedPassword,
@@ -34,6 +36,7 @@ from ark_sdk_python.models.services.sia.sso import (
 )
 from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_client_certificate import ArkSIASSOShortLiveClientCertificateFormat
 from ark_sdk_python.services.ark_service import ArkService
+from ark_sdk_python.services.sia.sso.ark_sia_sso_credentials_pool import ArkSIASSOCredentialsPool
 
 SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
     service_name='sia-sso', required_authenticator_names=['isp'], optional_authenticator_names=[]
@@ -45,32 +48,52 @@ DEFAULT_SSH_FOLDER_PATH: Final[str] = '~/.ssh'
 
 
 class ArkSIASSOService(ArkService):
+    __LEGACY_CACHE_LOCK: Final[threading.Lock] = threading.Lock()
+    __LEGACY_CACHE_CLEARED: Final[Set[str]] = set()
 
     def __init__(self, isp_auth: ArkISPAuth) -> None:
         super().__init__(isp_auth)
         self.__isp_auth = isp_auth
         self.__cache_keyring = ArkKeyring(self.service_config().service_name)
+        self.__credentials_pool = ArkSIASSOCredentialsPool()
         self.__client: ArkISPServiceClient = ArkISPServiceClient.from_isp_auth(
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
         ArkISPServiceClient.refresh_client(client, self.__isp_auth)
 
-    def __load_from_cache(self, token_type: str) -> Optional[ArkSIASSOAcquireTokenResponse]:
-        claims = ArkJWTUtils.get_unverified_claims(self.__client.session_token)
-        token = self.__cache_keyring.load_token(
-            ArkProfileLoader.load_default_profile(),
-            postfix=f'{claims["tenant_id"]}_{claims["unique_name"]}_sia_sso_short_lived_{token_type}',
-        )
+    def __unique_name(self) -> str:
+        unique_name = ArkJWTUtils.get_claims(self.__client.session_token).unique_name
+        if not unique_name:
+            raise ArkServiceException('Failed to retrieve the user name from the session token')
+        return unique_name
+
+    def __cache_postfix(self, cache_name: str) -> str:
+        tenant_id = ArkJWTUtils.get_claims(self.__client.session_token).tenant_id
+        if not tenant_id:
+            raise ArkServiceException('Failed to retrieve the tenant id from the session token')
+        return f'{tenant_id}_{self.__unique_name()}_sia_sso_short_lived_{cache_name}'
+
+    def __clear_legacy_cache(self, token_type: str) -> None:
+        # Entries cached before the cache was keyed by service may belong to any service, so they are deleted once instead of reused
+        postfix = self.__cache_postfix(token_type)
+        with ArkSIASSOService.__LEGACY_CACHE_LOCK:
+            if postfix in ArkSIASSOService.__LEGACY_CACHE_CLEARED:
+                return
+            ArkSIASSOService.__LEGACY_CACHE_CLEARED.add(postfix)
+        self.__cache_keyring.delete_token(ArkProfileLoader.load_default_profile(), postfix)
+
+    def __load_from_cache(self, cache_name: str) -> Optional[Tuple[ArkSIASSOAcquireTokenResponse, datetime]]:
+        token = self.__cache_keyring.load_token(ArkProfileLoader.load_default_profile(), postfix=self.__cache_postfix(cache_name))
         if token:
-            return ArkSIASSOAcquireTokenResponse.model_validate_json(token.token.get_secret_value())
+            return ArkSIASSOAcquireTokenResponse.model_validate_json(token.token.get_secret_value()), token.expires_in.replace(tzinfo=None)
         return None
 
-    def __save_to_cache(self, result: ArkSIASSOAcquireTokenResponse, token_type: str) -> None:
-        claims = ArkJWTUtils.get_unverified_claims(self.__client.session_token)
+    def __save_to_cache(self, result: ArkSIASSOAcquireTokenResponse, cache_name: str) -> datetime:
         expires_in = datetime.now() + (parse(result.metadata['expires_at']) - parse(result.metadata['created_at']))
         self.__cache_keyring.save_token(
             ArkProfileLoader.load_default_profile(),
@@ -79,7 +102,42 @@ class ArkSIASSOService(ArkService):
                 token_type=ArkTokenType.Token,
                 expires_in=expires_in,
             ),
-            postfix=f'{claims["tenant_id"]}_{claims["unique_name"]}_sia_sso_short_lived_{token_type}',
+            postfix=self.__cache_postfix(cache_name),
+        )
+        return expires_in
+
+    def __acquire_token(self, body: Dict[str, Any], description: str, required_keys: List[str]) -> ArkSIASSOAcquireTokenResponse:
+        response: Response = self.__client.post(ACQUIRE_SSO_TOKEN_URL, json=body)
+        if response.status_code != HTTPStatus.CREATED:
+            raise ArkServiceException(f'Failed to generate short lived {description} - [{response.status_code}] - [{response.text}]')
+        result: ArkSIASSOAcquireTokenResponse = ArkSIASSOAcquireTokenResponse.model_validate(response.json())
+        if any(key not in result.token for key in required_keys):
+            raise ArkServiceException(f'Failed to generate short lived {description} - [{response.status_code}] - [{response.text}]')
+        return result
+
+    def __mint_cached_token(
+        self, token_type: str, variant: str, body: Dict[str, Any], description: str, required_keys: List[str]
+    ) -> Tuple[ArkSIASSOAcquireTokenResponse, float]:
+        self.__clear_legacy_cache(token_type)
+        cache_name = f'{token_type}_{variant}'
+        cached = self.__load_from_cache(cache_name)
+        if cached and all(key in cached[0].token for key in required_keys):
+            valid_for = (cached[1] - datetime.now()).total_seconds()
+            # Cached credentials which are about to expire are minted again, instead of being pooled for the rest of their short validity
+            if valid_for > self.__credentials_pool.min_validity_seconds:
+                return cached[0], valid_for
+        result = self.__acquire_token(body, description, required_keys)
+        expires_in = self.__save_to_cache(result, cache_name)
+        return result, (expires_in - datetime.now()).total_seconds()
+
+    def __short_lived_token(
+        self, allow_caching: bool, token_type: str, variant: str, body: Dict[str, Any], description: str, required_keys: List[str]
+    ) -> ArkSIASSOAcquireTokenResponse:
+        if not allow_caching:
+            return self.__acquire_token(body, description, required_keys)
+        # Cached credentials are served from the in memory pool, which falls back to the keyring and then to minting a new one
+        return self.__credentials_pool.get(
+            (token_type, variant), lambda: self.__mint_cached_token(token_type, variant, body, description, required_keys)
         )
 
     def __expand_folder(self, folder: str) -> str:
@@ -92,8 +150,7 @@ class ArkSIASSOService(ArkService):
         self, folder: str, output_format: ArkSIASSOShortLiveClientCertificateFormat, result: ArkSIASSOAcquireTokenResponse
     ) -> None:
         folder_path = self.__expand_folder(folder)
-        claims = ArkJWTUtils.get_unverified_claims(self.__client.session_token)
-        base_name = claims["unique_name"].split('@')[0]
+        base_name = self.__unique_name().split('@')[0]
         client_certificate = result.token['client_certificate']
         private_key = result.token['private_key']
 
@@ -132,23 +189,22 @@ class ArkSIASSOService(ArkService):
 
     def __save_oracle_sso_wallet(self, folder: str, unzip_wallet: bool, result: ArkSIASSOAcquireTokenResponse) -> None:
         folder_path = self.__expand_folder(folder)
-        result.token['wallet'] = base64.b64decode(result.token['wallet'])
+        # The wallet is decoded aside, pooled credentials are shared and must not be modified
+        wallet = base64.b64decode(result.token['wallet'])
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
         if not unzip_wallet:
-            claims = ArkJWTUtils.get_unverified_claims(self.__client.session_token)
-            base_name = claims["unique_name"].split('@')[0]
+            base_name = self.__unique_name().split('@')[0]
             with open(f'{folder_path}{os.path.sep}{base_name}_wallet.zip', 'wb') as file_handle:
-                file_handle.write(result.token['wallet'])
+                file_handle.write(wallet)
         else:
-            wallet_bytes = BytesIO(result.token['wallet'])
+            wallet_bytes = BytesIO(wallet)
             with zipfile.ZipFile(wallet_bytes, 'r') as zipf:
                 zipf.extractall(folder_path)
 
     def __save_oracle_pem_wallet(self, folder: str, result: ArkSIASSOAcquireTokenResponse) -> None:
         folder_path = self.__expand_folder(folder)
-        claims = ArkJWTUtils.get_unverified_claims(self.__client.session_token)
-        base_name = claims["unique_name"].split('@')[0]
+        base_name = self.__unique_name().split('@')[0]
         pem_wallet = base64.b64decode(result.token['pem_wallet']).decode('utf-8')
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
@@ -179,25 +235,18 @@ class ArkSIASSOService(ArkService):
             str: __description__
         """
         self._logger.info('Generating short lived password token')
-        if get_short_lived_password.allow_caching:
-            result = self.__load_from_cache('password')
-            if result:
-                return result.token['key']
-        response: Response = self.__client.post(
-            ACQUIRE_SSO_TOKEN_URL,
-            json={
+        result = self.__short_lived_token(
+            get_short_lived_password.allow_caching,
+            'password',
+            get_short_lived_password.service,
+            {
                 'token_type': 'password',
                 'service': get_short_lived_password.service,
             },
+            'password',
+            ['key'],
         )
-        if response.status_code != HTTPStatus.CREATED:
-            raise ArkServiceException(f'Failed to generate short lived password - [{response.status_code}] - [{response.text}]')
-        result: ArkSIASSOAcquireTokenResponse = ArkSIASSOAcquireTokenResponse.model_validate(response.json())
-        if 'key' in result.token:
-            if get_short_lived_password.allow_caching:
-                self.__save_to_cache(result, 'password')
-            return result.token['key']
-        raise ArkServiceException(f'Failed to generate short lived password - [{response.status_code}] - [{response.text}]')
+        return result.token['key']
 
     def short_lived_client_certificate(self, get_short_lived_client_certificate: ArkSIASSOGetShortLivedClientCertificate) -> None:
         """
@@ -213,31 +262,20 @@ class ArkSIASSOService(ArkService):
             str: __description__
         """
         self._logger.info('Generating short lived client certificate')
-        if get_short_lived_client_certificate.allow_caching:
-            result = self.__load_from_cache('client_certificate')
-            if result:
-                self.__output_client_certificate(
-                    get_short_lived_client_certificate.folder, get_short_lived_client_certificate.output_format, result
-                )
-                return
-        response: Response = self.__client.post(
-            ACQUIRE_SSO_TOKEN_URL,
-            json={
+        result = self.__short_lived_token(
+            get_short_lived_client_certificate.allow_caching,
+            'client_certificate',
+            get_short_lived_client_certificate.service,
+            {
                 'token_type': 'client_certificate',
                 'service': get_short_lived_client_certificate.service,
             },
+            'client certificate',
+            ['client_certificate', 'private_key'],
+        )
+        self.__output_client_certificate(
+            get_short_lived_client_certificate.folder, get_short_lived_client_certificate.output_format, result
         )
-        if response.status_code != HTTPStatus.CREATED:
-            raise ArkServiceException(f'Failed to generate short lived client certificate - [{response.status_code}] - [{response.text}]')
-        result: ArkSIASSOAcquireTokenResponse = ArkSIASSOAcquireTokenResponse.model_validate(response.json())
-        if 'client_certificate' in result.token and 'private_key' in result.token:
-            if get_short_lived_client_certificate.allow_caching:
-                self.__save_to_cache(result, 'client_certificate')
-            self.__output_client_certificate(
-                get_short_lived_client_certificate.folder, get_short_lived_client_certificate.output_format, result
-            )
-            return
-        raise ArkServiceException(f'Failed to generate short lived password - [{response.status_code}] - [{response.text}]')
 
     def short_lived_oracle_wallet(self, get_short_lived_oracle_wallet: ArkSIASSOGetShortLivedOracleWallet) -> None:
         """
@@ -253,38 +291,25 @@ class ArkSIASSOService(ArkService):
             str: __description__
         """
         self._logger.info('Generating short lived oracle wallet')
-        if get_short_lived_oracle_wallet.allow_caching:
-            result = self.__load_from_cache('oracle_wallet')
-            if result:
-                if get_short_lived_oracle_wallet.wallet_type == ArkSIASSOShortLivedOracleWalletType.SSO:
-                    self.__save_oracle_sso_wallet(get_short_lived_oracle_wallet.folder, get_short_lived_oracle_wallet.unzip_wallet, result)
-                if get_short_lived_oracle_wallet.wallet_type == ArkSIASSOShortLivedOracleWalletType.PEM:
-                    self.__save_oracle_pem_wallet(get_short_lived_oracle_wallet.folder, get_short_lived_oracle_wallet.unzip_wallet, result)
-                return
-        response: Response = self.__client.post(
-            ACQUIRE_SSO_TOKEN_URL,
-            json={
+        is_sso_wallet = get_short_lived_oracle_wallet.wallet_type == ArkSIASSOShortLivedOracleWalletType.SSO
+        result = self.__short_lived_token(
+            get_short_lived_oracle_wallet.allow_caching,
+            'oracle_wallet',
+            get_short_lived_oracle_wallet.wallet_type.value,
+            {
                 'token_type': 'oracle_wallet',
                 'service': 'DPA-DB',
                 'token_parameters': {
                     'walletType': get_short_lived_oracle_wallet.wallet_type.value,
                 },
             },
+            'oracle wallet',
+            ['wallet'] if is_sso_wallet else ['pem_wallet'],
         )
-        if response.status_code != HTTPStatus.CREATED:
-            raise ArkServiceException(f'Failed to generate short lived oracle wallet - [{response.status_code}] - [{response.text}]')
-        result: ArkSIASSOAcquireTokenResponse = ArkSIASSOAcquireTokenResponse.model_validate(response.json())
-        if 'wallet' in result.token and get_short_lived_oracle_wallet.wallet_type == ArkSIASSOShortLivedOracleWalletType.SSO:
-            if get_short_lived_oracle_wallet.allow_caching:
-                self.__save_to_cache(result, 'oracle_wallet')
+        if is_sso_wallet:
             self.__save_oracle_sso_wallet(get_short_lived_oracle_wallet.folder, get_short_lived_oracle_wallet.unzip_wallet, result)
-            return
-        elif 'pem_wallet' in result.token and get_short_lived_oracle_wallet.wallet_type == ArkSIASSOShortLivedOracleWalletType.PEM:
-            if get_short_lived_oracle_wallet.allow_caching:
-                self.__save_to_cache(result, 'oracle_wallet')
+        else:
             self.__save_oracle_pem_wallet(get_short_lived_oracle_wallet.folder, result)
-            return
-        raise ArkServiceException(f'Failed to generate short lived password - [{response.status_code}] - [{response.text}]')
 
     def short_lived_rdp_file(self, get_short_lived_rdp_file: ArkSIASSOGetShortLivedRDPFile) -> None:
         """
@@ -297,34 +322,26 @@ class ArkSIASSOService(ArkService):
             ArkServiceException: _description_
         """
         self._logger.info('Generating short lived rdp file')
-        if get_short_lived_rdp_file.allow_caching:
-            result = self.__load_from_cache('rdp_file')
-            if result:
-                self.__save_rdp_file(get_short_lived_rdp_file, result)
         token_parameters: Dict[str, Any] = {
             'targetAddress': get_short_lived_rdp_file.target_address,
             'targetDomain': get_short_lived_rdp_file.target_domain,
             'targetUser': get_short_lived_rdp_file.target_user,
             'elevatedPrivileges': get_short_lived_rdp_file.elevated_privileges,
         }
-        response: Response = self.__client.post(
-            ACQUIRE_SSO_TOKEN_URL,
-            json={
+        result = self.__short_lived_token(
+            get_short_lived_rdp_file.allow_caching,
+            'rdp_file',
+            '_'.join(str(v) for v in token_parameters.values()),
+            {
                 'token_type': 'rdp_file',
                 'service': 'DPA-RDP',
                 'token_parameters': {k: v for k, v in token_parameters.items() if v is not None},
                 'token_response_format': 'extended',
             },
+            'rdp file',
+            ['text'],
         )
-        if response.status_code != HTTPStatus.CREATED:
-            raise ArkServiceException(f'Failed to generate short lived rdp file - [{response.status_code}] - [{response.text}]')
-        result: ArkSIASSOAcquireTokenResponse = ArkSIASSOAcquireTokenResponse.model_validate(response.json())
-        if 'text' in result.token:
-            if get_short_lived_rdp_file.allow_caching:
-                self.__save_to_cache(result, 'rdp_file')
-            self.__save_rdp_file(get_short_lived_rdp_file, result)
-            return
-        raise ArkServiceException(f'Failed to generate short rdp file - [{response.status_code}] - [{response.text}]')
+        self.__save_rdp_file(get_short_lived_rdp_file, result)
 
     def short_lived_token_info(self, get_token_info: ArkSIASSOGetTokenInfo) -> ArkSIASSOTokenInfo:
         """
@@ -376,8 +393,7 @@ class ArkSIASSOService(ArkService):
                 raise ArkServiceException('Folder parameter is required')
             if not os.path.exists(folder_path):
                 os.makedirs(folder_path)
-            claims = ArkJWTUtils.get_unverified_claims(self.__client.session_token)
-            base_name = f'sia_ssh_key_{claims["unique_name"].split("@")[0]}.pem'
+            base_name = f'sia_ssh_key_{self.__unique_name().split("@")[0]}.pem'
             full_path = os.path.normpath(f'{folder_path}{os.path.sep}{base_name}')
             with open(full_path, 'w', encoding='utf-8') as file_handle:
                 file_handle.write(response.text)
@@ -386,6 +402,21 @@ class ArkSIASSOService(ArkService):
             self._logger.exception(f'Failed to parse get short lived token info response [{str(ex)}] - [{response.text}]')
             raise ArkServiceException(f'Failed to parse get short lived token info response [{str(ex)}]') from ex
 
+    def credentials_pool_stats(self) -> ArkSIASSOCredentialsPoolStats:
+        """
+        Returns the usage metrics of the in memory pool of short lived credentials, which serves the requests that allow caching.
+
+        Returns:
+            ArkSIASSOCredentialsPoolStats: _description_
+        """
+        return self.__credentials_pool.stats()
+
+    def clear_credentials_pool(self) -> None:
+        """
+        Drops all the pooled short lived credentials, the next requests mint new ones.
+        """
+        self.__credentials_pool.invalidate()
+
     @staticmethod
     @overrides
     def service_config() -> ArkServiceConfig:
@@ -1,6 +1,6 @@
 from fnmatch import fnmatch
 from http import HTTPStatus
-from typing import Final, List, Optional, Set
+from typing import Final, List, Optional
 
 from overrides import overrides
 from pydantic import ValidationError
@@ -8,6 +8,7 @@ from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
 from ark_sdk_python.models import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
@@ -15,14 +16,12 @@ from ark_sdk_python.models.services.sia.workspaces.db import (
     DATABASE_FAMILIES_DEFAULT_PORTS,
     DATABASES_ENGINES_TO_FAMILY,
     ArkSIADBAddDatabase,
-    ArkSIADBAuthMethodType,
     ArkSIADBDatabase,
-    ArkSIADBDatabaseEngineType,
     ArkSIADBDatabaseFamilyType,
+    ArkSIADBDatabaseInfo,
     ArkSIADBDatabaseInfoList,
     ArkSIADBDatabasesFilter,
     ArkSIADBDatabasesStats,
-    ArkSIADBDatabaseWorkspaceType,
     ArkSIADBDeleteDatabase,
     ArkSIADBGetDatabase,
     ArkSIADBTag,
@@ -47,6 +46,7 @@ class ArkSIADBWorkspaceService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
@@ -238,40 +238,26 @@ class ArkSIADBWorkspaceService(ArkService):
             ArkSIADBDatabasesStats: _description_
         """
         self._logger.info('Calculating databases stats')
-        databases = self.list_databases()
+        aggregator: ArkStatsAggregator[ArkSIADBDatabaseInfo] = (
+            ArkStatsAggregator()
+            .count_by('engine', lambda d: d.provider_info.engine)
+            .count_by('workspace', lambda d: d.provider_info.workspace)
+            .count_by('family', lambda d: d.provider_info.family)
+            .count_by('auth_method', lambda d: d.configured_auth_method_type)
+            .count_if(ArkSIADBWarning.NoCertificates, lambda d: not d.certificate)
+            .count_if(ArkSIADBWarning.NoSecrets, lambda d: not d.secret_id)
+            .consume(self.list_databases().items)
+        )
         databases_stats = ArkSIADBDatabasesStats.model_construct()
-        databases_stats.databases_count = len(databases.items)
-
-        # Get databases per engine
-        engines_types: Set[ArkSIADBDatabaseEngineType] = {d.provider_info.engine for d in databases.items}
-        databases_stats.databases_count_by_engine = {
-            et: len([d for d in databases.items if d.provider_info.engine == et]) for et in engines_types
-        }
-
-        # Get databases per workspace
-        workspaces_types: Set[ArkSIADBDatabaseWorkspaceType] = {d.provider_info.workspace for d in databases.items}
-        databases_stats.databases_count_by_workspace = {
-            wt: len([d for d in databases.items if d.provider_info.workspace == wt]) for wt in workspaces_types
-        }
-
-        # Get databases per family
-        family_types: Set[ArkSIADBDatabaseFamilyType] = {d.provider_info.family for d in databases.items}
-        databases_stats.databases_count_by_family = {
-            ft: len([d for d in databases.items if d.provider_info.family == ft]) for ft in family_types
-        }
-
-        # Get databases per auth method
-        auth_method_types: Set[ArkSIADBAuthMethodType] = {d.configured_auth_method_type for d in databases.items}
-        databases_stats.databases_count_by_auth_method = {
-            am: len([d for d in databases.items if d.configured_auth_method_type == am]) for am in auth_method_types
-        }
-
-        # Get databases per db warning
+        databases_stats.databases_count = aggregator.count
+        databases_stats.databases_count_by_engine = aggregator.counts('engine')
+        databases_stats.databases_count_by_workspace = aggregator.counts('workspace')
+        databases_stats.databases_count_by_family = aggregator.counts('family')
+        databases_stats.databases_count_by_auth_method = aggregator.counts('auth_method')
         databases_stats.databases_count_by_warning = {
-            ArkSIADBWarning.NoCertificates: len([d for d in databases.items if not d.certificate]),
-            ArkSIADBWarning.NoSecrets: len([d for d in databases.items if not d.secret_id]),
+            ArkSIADBWarning.NoCertificates: aggregator.total(ArkSIADBWarning.NoCertificates),
+            ArkSIADBWarning.NoSecrets: aggregator.total(ArkSIADBWarning.NoSecrets),
         }
-
         return databases_stats
 
     @staticmethod
@@ -1,6 +1,6 @@
 from fnmatch import fnmatch
 from http import HTTPStatus
-from typing import Final, List, Set
+from typing import Final, List
 
 from overrides import overrides
 from pydantic import ValidationError
@@ -8,10 +8,10 @@ from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
 from ark_sdk_python.models import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
-from ark_sdk_python.models.services.sia.secrets.vm import ArkSIAVMSecretType
 from ark_sdk_python.models.services.sia.workspaces.targetsets import (
     ArkSIAAddTargetSet,
     ArkSIADeleteTargetSet,
@@ -42,6 +42,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='dpa',
             refresh_connection_callback=self.__refresh_sia_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sia_auth(self, client: ArkISPServiceClient) -> None:
@@ -229,16 +230,12 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
             ArkSIATargetSetsStats: _description_
         """
         self._logger.info('Calculating target sets stats')
-        target_sets = self.list_target_sets()
+        aggregator: ArkStatsAggregator[ArkSIATargetSet] = (
+            ArkStatsAggregator().count_by('secret_type', lambda t: t.secret_type, skip_empty=True).consume(self.list_target_sets())
+        )
         target_sets_stats = ArkSIATargetSetsStats.model_construct()
-        target_sets_stats.target_sets_count = len(target_sets)
-
-        # Get target_sets per secret type
-        secret_types: Set[ArkSIAVMSecretType] = {d.secret_type for d in target_sets if d.secret_type}
-        target_sets_stats.target_sets_count_per_secret_type = {
-            st: len([d for d in target_sets if d.secret_type and d.secret_type == st]) for st in secret_types
-        }
-
+        target_sets_stats.target_sets_count = aggregator.count
+        target_sets_stats.target_sets_count_per_secret_type = aggregator.counts('secret_type')
         return target_sets_stats
 
     @staticmethod
@@ -1,3 +1,4 @@
+from ark_sdk_python.services.sm.ark_async_sm_service import ArkAsyncSMService
 from ark_sdk_python.services.sm.ark_sm_service import ArkSMService
 
-__all__ = ['ArkSMService']
+__all__ = ['ArkSMService', 'ArkAsyncSMService']
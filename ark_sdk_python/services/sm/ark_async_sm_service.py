@@ -0,0 +1,288 @@
+from http import HTTPStatus
+from typing import AsyncIterator, Dict, Final, List, Optional, Tuple
+
+from overrides import overrides
+
+from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkConcurrentPager
+from ark_sdk_python.common.isp import ArkAsyncISPServiceClient
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
+from ark_sdk_python.models.services import ArkServiceConfig
+from ark_sdk_python.models.services.sm import (
+    ArkSMGetSession,
+    ArkSMGetSessionActivities,
+    ArkSMSearchSessionsActivities,
+    ArkSMSession,
+    ArkSMSessionActivities,
+    ArkSMSessionActivitiesFilter,
+    ArkSMSessionActivity,
+    ArkSMSessions,
+    ArkSMSessionsFilter,
+)
+from ark_sdk_python.services.ark_service import ArkService
+from ark_sdk_python.services.sm.ark_sm_service import (
+    SESSION_ACTIVITIES_API_URL,
+    SESSION_API_URL,
+    SESSIONS_API_URL,
+    ArkSMActivitiesPage,
+    ArkSMPage,
+)
+
+SERVICE_CONFIG: Final[ArkServiceConfig] = ArkServiceConfig(
+    service_name='sm-async',
+    rate_limit_name='sm',
+    required_authenticator_names=['isp'],
+    optional_authenticator_names=[],
+)
+
+
+class ArkAsyncSMService(ArkService):
+    def __init__(self, isp_auth: ArkISPAuth) -> None:
+        super().__init__(isp_auth)
+        self.__isp_auth = isp_auth
+        self.__client: ArkAsyncISPServiceClient = ArkAsyncISPServiceClient.from_isp_auth(
+            isp_auth=self.__isp_auth,
+            service_name='sessionmonitoring',
+            refresh_connection_callback=self.__refresh_sm_auth,
+            rate_limiter=self._rate_limiter,
+        )
+
+    async def __refresh_sm_auth(self, client: ArkAsyncISPServiceClient) -> None:
+        await ArkAsyncISPServiceClient.refresh_client(client, self.__isp_auth)
+
+    def __search_params_from_filter(self, sessions_filter: ArkSMSessionsFilter):
+        return {'search': sessions_filter.search}
+
+    @staticmethod
+    def __activities_search_params(search: Optional[str]) -> Dict:
+        return {'search': search} if search else {}
+
+    @staticmethod
+    def __matching_activities(activities: List[ArkSMSessionActivity], command_contains: Optional[str]) -> List[ArkSMSessionActivity]:
+        if not command_contains:
+            return activities
+        return [activity for activity in activities if activity.command and command_contains in activity.command]
+
+    async def __call_sessions_api(self, params: Optional[dict] = None) -> ArkSMSessions:
+        params_dict = {}
+        if params:
+            params_dict['params'] = params
+        resp = await self.__client.get(SESSIONS_API_URL, **params_dict)
+        if resp.status_code != HTTPStatus.OK:
+            raise ArkServiceException(f'Failed to list sessions [{resp.text}] {params=}')
+        return ArkTypeAdapters.validate_json(ArkSMSessions, resp.content)
+
+    async def __call_activities_api(self, session_id: str, params: Optional[dict] = None) -> ArkSMSessionActivities:
+        endpoint = SESSION_ACTIVITIES_API_URL.format(session_id=session_id)
+        resp = await self.__client.get(endpoint, params=params)
+        if resp.status_code != HTTPStatus.OK:
+            raise ArkServiceException(f'Failed to list activities [{resp.text}]')
+        return ArkTypeAdapters.validate_json(ArkSMSessionActivities, resp.content)
+
+    async def __fetch_sessions_page(self, params: Dict, lazy: bool) -> Tuple[ArkSMPage, int]:
+        resp = await self.__client.get(SESSIONS_API_URL, params=params)
+        if resp.status_code != HTTPStatus.OK:
+            raise ArkServiceException(f'Failed to list sessions [{resp.text}] {params=}')
+        page, result = ArkSMPage.from_json_field(ArkSMSession, resp.content, 'sessions', lazy)
+        return page, result['returnedCount']
+
+    async def __list_sessions(self, params: Optional[Dict] = None, lazy: bool = False) -> AsyncIterator[ArkSMPage]:
+        params = params or {}
+        page, returned_count = await self.__fetch_sessions_page(params, lazy)
+        offset = 0
+        while returned_count > 0:
+            yield page
+            offset += returned_count
+            params['offset'] = offset
+            page, returned_count = await self.__fetch_sessions_page(params, lazy)
+
+    async def __list_activities(self, session_id: str, params: Optional[Dict] = None) -> AsyncIterator[ArkSMActivitiesPage]:
+        params = params or {}
+        activities: ArkSMSessionActivities = await self.__call_activities_api(session_id=session_id, params=params)
+        offset = 0
+        while activities.returned_count > 0:
+            yield ArkSMActivitiesPage(items=activities.activities)
+            offset += activities.returned_count
+            params['offset'] = offset
+            activities = await self.__call_activities_api(session_id=session_id, params=params)
+
+    async def list_sessions(self) -> AsyncIterator[ArkSMPage]:
+        """
+        Lists all sessions done on the last 24 hours
+
+        Raises:
+            ArkServiceException: _description_
+
+        Yields:
+            AsyncIterator[ArkSMPage]: _description_
+        """
+        self._logger.info('Listing all session')
+        async for page in self.__list_sessions():
+            yield page
+
+    async def count_sessions(self) -> int:
+        """
+        Counts all sessions done on the last 24 hours
+
+        Returns:
+            int: _description_
+        """
+        return (await self.__call_sessions_api()).filtered_count
+
+    async def list_sessions_by(self, sessions_filter: ArkSMSessionsFilter) -> AsyncIterator[ArkSMPage]:
+        """
+        Lists all sessions with given filter
+
+        Args:
+            sessions_filter (ArkSMSessionsFilter): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Yields:
+            AsyncIterator[ArkSMPage]: _description_
+        """
+        self._logger.info(f'Listing sessions by filter: {sessions_filter.search}')
+        async for page in self.__list_sessions(self.__search_params_from_filter(sessions_filter), sessions_filter.lazy):
+            yield page
+
+    async def count_sessions_by(self, sessions_filter: ArkSMSessionsFilter) -> int:
+        """
+        Counts all sessions with given filter
+
+        Args:
+            sessions_filter (ArkSMSessionsFilter): _description_
+
+        Returns:
+            int: _description_
+        """
+        return (await self.__call_sessions_api(self.__search_params_from_filter(sessions_filter))).filtered_count
+
+    async def session(self, get_session: ArkSMGetSession) -> ArkSMSession:
+        """
+        Retrieves a session by id
+
+        Args:
+            get_session (ArkSMGetSession): _description_
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            ArkSMSession: _description_
+        """
+        self._logger.info(f'Retrieving session by id [{get_session.session_id}]')
+        resp = await self.__client.get(SESSION_API_URL.format(session_id=get_session.session_id))
+        if resp.status_code != HTTPStatus.OK:
+            raise ArkServiceException(f'Failed to list sessions [{resp.text}]')
+        session = resp.json()
+        if len(session) == 0:
+            raise ArkServiceException(f'No session found for requested session id [{get_session.session_id}]')
+        return ArkSMSession.model_validate(session)
+
+    async def list_session_activities(self, get_session_activities: ArkSMGetSessionActivities) -> AsyncIterator[ArkSMActivitiesPage]:
+        """
+        Lists all session activities by session id
+
+        Args:
+            get_session_activities (ArkSMGetSessionActivities): _description_
+
+        Yields:
+            AsyncIterator[ArkSMActivitiesPage]: _description_
+        """
+        self._logger.info(f'Retrieving session activities by id [{get_session_activities.session_id}]')
+        async for page in self.__list_activities(session_id=get_session_activities.session_id):
+            yield page
+
+    async def count_session_activities(self, get_session_activities: ArkSMGetSessionActivities) -> int:
+        """
+        Count all session activities by session id
+
+        Args:
+            get_session_activities (ArkSMGetSessionActivities): _description_
+
+        Returns:
+            int: _description_
+        """
+        self._logger.info(f'Counting session activities by id [{get_session_activities.session_id}]')
+        return (await self.__call_activities_api(session_id=get_session_activities.session_id)).filtered_count
+
+    async def list_session_activities_by(
+        self, session_activities_filter: ArkSMSessionActivitiesFilter
+    ) -> AsyncIterator[ArkSMActivitiesPage]:
+        """
+        Lists all session activities for session id by filter
+
+        Args:
+            session_activities_filter (ArkSMSessionActivitiesFilter): _description_
+
+        Yields:
+            AsyncIterator[ArkSMActivitiesPage]: _description_
+        """
+        self._logger.info(f'Retrieving session activities by id [{session_activities_filter.session_id}]')
+        async for page in self.__list_activities(
+            session_id=session_activities_filter.session_id, params=self.__activities_search_params(session_activities_filter.search)
+        ):
+            yield ArkSMActivitiesPage(items=self.__matching_activities(page.items, session_activities_filter.command_contains))
+
+    async def __search_session_activities(
+        self, session_id: str, search: ArkSMSearchSessionsActivities
+    ) -> AsyncIterator[ArkSMActivitiesPage]:
+        async for page in self.__list_activities(session_id=session_id, params=self.__activities_search_params(search.search)):
+            matches = self.__matching_activities(page.items, search.command_contains)
+            if matches:
+                yield ArkSMActivitiesPage(items=matches)
+
+    async def __searched_session_ids(self, search: ArkSMSearchSessionsActivities) -> AsyncIterator[str]:
+        seen_session_ids = set()
+        for session_id in search.session_ids or []:
+            if session_id not in seen_session_ids:
+                seen_session_ids.add(session_id)
+                yield session_id
+        if search.sessions_search:
+            async for page in self.__list_sessions(self.__search_params_from_filter(ArkSMSessionsFilter(search=search.sessions_search))):
+                for session in page.items:
+                    if session.session_id not in seen_session_ids:
+                        seen_session_ids.add(session.session_id)
+                        yield session.session_id
+
+    async def search_sessions_activities(
+        self, search_sessions_activities: ArkSMSearchSessionsActivities
+    ) -> AsyncIterator[ArkSMActivitiesPage]:
+        """
+        Searches the activities of many sessions at once, given by ids and / or by a sessions search
+        The activities search is done by the server, and the command filter is applied on the returned activities
+        The activities of the sessions are fetched concurrently as the sessions are listed,
+        and every page of matches is yielded as soon as it is fetched, in completion order
+
+        Args:
+            search_sessions_activities (ArkSMSearchSessionsActivities): _description_
+
+        Examples:
+            ArkSMSearchSessionsActivities(sessions_search='protocol IN SSH', command_contains='sudo')
+            ArkSMSearchSessionsActivities(session_ids=['session-id'], search='command STARTSWITH rm')
+
+        Raises:
+            ArkServiceException: _description_
+
+        Yields:
+            AsyncIterator[ArkSMActivitiesPage]: _description_
+        """
+        self._logger.info('Searching sessions activities')
+        async for page in ArkConcurrentPager.stream_pages_async(
+            fetch_pages=lambda session_id: self.__search_session_activities(session_id, search_sessions_activities),
+            sources=self.__searched_session_ids(search_sessions_activities),
+            max_concurrency=search_sessions_activities.max_concurrency,
+        ):
+            yield page
+
+    async def aclose(self) -> None:
+        """
+        Closes the connections of the service client.
+        """
+        await self.__client.aclose()
+
+    @staticmethod
+    @overrides
+    def service_config() -> ArkServiceConfig:
+        return SERVICE_CONFIG
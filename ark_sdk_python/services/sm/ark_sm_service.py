@@ -1,20 +1,19 @@
-import itertools
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from typing import Dict, Final, Iterator, Optional, Set
+from typing import Dict, Final, Iterator, List, Optional, Tuple
 
 from dateutil.tz import tzutc
 from overrides import overrides
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
-from ark_sdk_python.common import ArkPage
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage, ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
-from ark_sdk_python.models import ArkServiceException
-from ark_sdk_python.models.common import ArkApplicationCode, ArkProtocolType, ArkWorkspaceType
+from ark_sdk_python.models import ArkServiceException, ArkTypeAdapters
 from ark_sdk_python.models.services import ArkServiceConfig
 from ark_sdk_python.models.services.sm import (
     ArkSMGetSession,
     ArkSMGetSessionActivities,
+    ArkSMSearchSessionsActivities,
     ArkSMSession,
     ArkSMSessionActivities,
     ArkSMSessionActivitiesFilter,
@@ -47,6 +46,7 @@ class ArkSMService(ArkService):
             isp_auth=self.__isp_auth,
             service_name='sessionmonitoring',
             refresh_connection_callback=self.__refresh_sm_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_sm_auth(self, client: ArkISPServiceClient) -> None:
@@ -55,6 +55,16 @@ class ArkSMService(ArkService):
     def __search_params_from_filter(self, sessions_filter: ArkSMSessionsFilter):
         return {'search': sessions_filter.search}
 
+    @staticmethod
+    def __activities_search_params(search: Optional[str]) -> Dict:
+        return {'search': search} if search else {}
+
+    @staticmethod
+    def __matching_activities(activities: List[ArkSMSessionActivity], command_contains: Optional[str]) -> List[ArkSMSessionActivity]:
+        if not command_contains:
+            return activities
+        return [activity for activity in activities if activity.command and command_contains in activity.command]
+
     def __call_sessions_api(self, params: Optional[dict] = None) -> ArkSMSessions:
         params_dict = {}
         if params:
@@ -62,24 +72,31 @@ class ArkSMService(ArkService):
         resp = self.__client.get(SESSIONS_API_URL, **params_dict)
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to list sessions [{resp.text}] {params=}')
-        return ArkSMSessions.model_validate(resp.json())
+        return ArkTypeAdapters.validate_json(ArkSMSessions, resp.content)
 
     def __call_activities_api(self, session_id: str, params: Optional[dict] = None) -> ArkSMSessionActivities:
         endpoint = SESSION_ACTIVITIES_API_URL.format(session_id=session_id)
         resp = self.__client.get(endpoint, params=params)
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to list activities [{resp.text}]')
-        return ArkSMSessionActivities.model_validate(resp.json())
+        return ArkTypeAdapters.validate_json(ArkSMSessionActivities, resp.content)
+
+    def __fetch_sessions_page(self, params: Dict, lazy: bool) -> Tuple[ArkSMPage, int]:
+        resp = self.__client.get(SESSIONS_API_URL, params=params)
+        if resp.status_code != HTTPStatus.OK:
+            raise ArkServiceException(f'Failed to list sessions [{resp.text}] {params=}')
+        page, result = ArkSMPage.from_json_field(ArkSMSession, resp.content, 'sessions', lazy)
+        return page, result['returnedCount']
 
-    def __list_sessions(self, params: Optional[Dict] = None) -> Iterator[ArkSMPage]:
+    def __list_sessions(self, params: Optional[Dict] = None, lazy: bool = False) -> Iterator[ArkSMPage]:
         params = params or {}
-        sessions: ArkSMSessions = self.__call_sessions_api(params)
+        page, returned_count = self.__fetch_sessions_page(params, lazy)
         offset = 0
-        while sessions.returned_count > 0:
-            yield ArkSMPage(items=sessions.sessions)
-            offset += sessions.returned_count
+        while returned_count > 0:
+            yield page
+            offset += returned_count
             params['offset'] = offset
-            sessions = self.__call_sessions_api(params)
+            page, returned_count = self.__fetch_sessions_page(params, lazy)
 
     def __list_activities(self, session_id: str, params: Optional[Dict] = None) -> Iterator[ArkSMActivitiesPage]:
         params = params or {}
@@ -132,7 +149,7 @@ class ArkSMService(ArkService):
             Iterator[ArkSMPage]: _description_
         """
         self._logger.info(f'Listing sessions by filter: {sessions_filter.search}')
-        yield from self.__list_sessions(self.__search_params_from_filter(sessions_filter))
+        yield from self.__list_sessions(self.__search_params_from_filter(sessions_filter), sessions_filter.lazy)
 
     def count_sessions_by(self, sessions_filter: ArkSMSessionsFilter) -> int:
         """
@@ -211,14 +228,15 @@ class ArkSMService(ArkService):
             Iterator[ArkSMActivitiesPage]: _description_
         """
         self._logger.info(f'Retrieving session activities by id [{session_activities_filter.session_id}]')
-        for page in self.__list_activities(session_id=session_activities_filter.session_id):
-            yield ArkSMActivitiesPage(
-                items=[activity for activity in page.items if session_activities_filter.command_contains in activity.command]
-            )
+        for page in self.__list_activities(
+            session_id=session_activities_filter.session_id, params=self.__activities_search_params(session_activities_filter.search)
+        ):
+            yield ArkSMActivitiesPage(items=self.__matching_activities(page.items, session_activities_filter.command_contains))
 
     def count_session_activities_by(self, session_activities_filter: ArkSMSessionActivitiesFilter) -> int:
         """
         Count all session activities for session id by filter
+        When only the server side search is given, the count is taken from the filtered count of the first response
 
         Args:
             session_activities_filter (ArkSMSessionActivitiesFilter): _description_
@@ -226,12 +244,65 @@ class ArkSMService(ArkService):
         Returns:
             int: _description_
         """
-        count = 0
         self._logger.info(f'Counting session activities by id [{session_activities_filter.session_id}] and filter')
+        if not session_activities_filter.command_contains:
+            return self.__call_activities_api(
+                session_id=session_activities_filter.session_id, params=self.__activities_search_params(session_activities_filter.search)
+            ).filtered_count
+        count = 0
         for page in self.list_session_activities_by(session_activities_filter):
             count += len(page.items)
         return count
 
+    def __search_session_activities(self, session_id: str, search: ArkSMSearchSessionsActivities) -> ArkSMActivitiesPage:
+        matches: List[ArkSMSessionActivity] = []
+        for page in self.__list_activities(session_id=session_id, params=self.__activities_search_params(search.search)):
+            matches.extend(self.__matching_activities(page.items, search.command_contains))
+        return ArkSMActivitiesPage(items=matches)
+
+    def __searched_session_ids(self, search: ArkSMSearchSessionsActivities) -> Iterator[str]:
+        seen_session_ids = set()
+        for session_id in search.session_ids or []:
+            if session_id not in seen_session_ids:
+                seen_session_ids.add(session_id)
+                yield session_id
+        if search.sessions_search:
+            for page in self.__list_sessions(self.__search_params_from_filter(ArkSMSessionsFilter(search=search.sessions_search))):
+                for session in page.items:
+                    if session.session_id not in seen_session_ids:
+                        seen_session_ids.add(session.session_id)
+                        yield session.session_id
+
+    def search_sessions_activities(self, search_sessions_activities: ArkSMSearchSessionsActivities) -> Iterator[ArkSMActivitiesPage]:
+        """
+        Searches the activities of many sessions at once, given by ids and / or by a sessions search
+        The activities search is done by the server, and the command filter is applied on the returned activities
+        The activities of the sessions are fetched concurrently as the sessions are listed,
+        and the matches of every session are yielded as a page as soon as the session is searched
+
+        Args:
+            search_sessions_activities (ArkSMSearchSessionsActivities): _description_
+
+        Examples:
+            ArkSMSearchSessionsActivities(sessions_search='protocol IN SSH', command_contains='sudo')
+            ArkSMSearchSessionsActivities(session_ids=['session-id'], search='command STARTSWITH rm')
+
+        Raises:
+            ArkServiceException: _description_
+
+        Yields:
+            Iterator[ArkSMActivitiesPage]: _description_
+        """
+        self._logger.info('Searching sessions activities')
+        for page in ArkConcurrentPager.fetch_pages(
+            fetch_page=lambda session_id: self.__search_session_activities(session_id, search_sessions_activities),
+            offsets=self.__searched_session_ids(search_sessions_activities),
+            max_workers=search_sessions_activities.max_concurrency,
+            ordered=False,
+        ):
+            if len(page):
+                yield page
+
     def sessions_stats(self) -> ArkSMSessionsStats:
         """
         Returns statistics about the sessions in the last 30 days
@@ -241,33 +312,22 @@ class ArkSMService(ArkService):
         """
         self._logger.info('Calculating sessions stats for the last 30 days')
         start_time_from = (datetime.now() - timedelta(days=30)).isoformat(timespec='seconds') + 'Z'
-        sessions = list(
-            itertools.chain.from_iterable(
-                [p.items for p in self.list_sessions_by(ArkSMSessionsFilter(search=f'startTime ge {start_time_from}'))]
-            )
+        aggregator: ArkStatsAggregator[ArkSMSession] = (
+            ArkStatsAggregator()
+            .count_if('failed', lambda s: s.session_status == ArkSMSessionStatus.FAILED)
+            .count_by('application_code', lambda s: s.application_code)
+            .count_by('platform', lambda s: s.platform)
+            .count_by('protocol', lambda s: s.protocol)
+            .count_by('status', lambda s: s.session_status)
+            .consume_pages(self.list_sessions_by(ArkSMSessionsFilter(search=f'startTime ge {start_time_from}')))
         )
         sessions_stats = ArkSMSessionsStats.model_construct()
-        sessions_stats.sessions_count = len(sessions)
-        sessions_stats.sessions_failure_count = len([s for s in sessions if s.session_status == ArkSMSessionStatus.FAILED])
-
-        # Get sessions per application code
-        app_codes: Set[ArkApplicationCode] = {s.application_code for s in sessions}
-        sessions_stats.sessions_count_per_application_code = {
-            ac: len([s for s in sessions if s.application_code == ac]) for ac in app_codes
-        }
-
-        # Get sessions per platform
-        platforms: Set[ArkWorkspaceType] = {s.platform for s in sessions}
-        sessions_stats.sessions_count_per_platform = {p: len([s for s in sessions if s.platform == p]) for p in platforms}
-
-        # Get sessions per protocol
-        protocols: Set[ArkProtocolType] = {s.protocol for s in sessions}
-        sessions_stats.sessions_count_per_protocol = {p: len([s for s in sessions if s.protocol == p]) for p in protocols}
-
-        # Get sessions per status
-        statuses: Set[ArkSMSessionStatus] = {s.session_status for s in sessions}
-        sessions_stats.sessions_count_per_status = {st: len([s for s in sessions if s.session_status == st]) for st in statuses}
-
+        sessions_stats.sessions_count = aggregator.count
+        sessions_stats.sessions_failure_count = aggregator.total('failed')
+        sessions_stats.sessions_count_per_application_code = aggregator.counts('application_code')
+        sessions_stats.sessions_count_per_platform = aggregator.counts('platform')
+        sessions_stats.sessions_count_per_protocol = aggregator.counts('protocol')
+        sessions_stats.sessions_count_per_status = aggregator.counts('status')
         return sessions_stats
 
     @staticmethod
@@ -1,6 +1,5 @@
 # pylint: disable=unused-private-member
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from http import HTTPStatus
 from typing import Any, Dict, Final, List, Optional
 
@@ -9,6 +8,7 @@ from requests import Response
 from requests.exceptions import JSONDecodeError
 
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+from ark_sdk_python.common import ArkStatsAggregator
 from ark_sdk_python.common.isp import ArkISPServiceClient
 from ark_sdk_python.models import ArkServiceException
 from ark_sdk_python.models.services import ArkServiceConfig
@@ -34,6 +34,7 @@ class ArkUAPBaseService(ArkService, ABC):
             isp_auth=self.__isp_auth,
             service_name='uap',
             refresh_connection_callback=self.__refresh_uap_auth,
+            rate_limiter=self._rate_limiter,
         )
 
     def __refresh_uap_auth(self, client: ArkISPServiceClient) -> None:
@@ -192,21 +193,16 @@ class ArkUAPBaseService(ArkService, ABC):
             ArkUAPPoliciesStats: Summary of policies by status and provider.
         """
         self._logger.info('Calculating policies stats')
-        policies = self._base_list_policies(ark_uap_filter=ark_uap_filter).results
-
+        aggregator: ArkStatsAggregator[ArkUAPCommonAccessPolicy] = (
+            ArkStatsAggregator()
+            .count_by('status', lambda p: p.metadata.status.status)
+            .count_by('provider', lambda p: p.metadata.policy_entitlement.location_type)
+            .consume(self._base_list_policies(ark_uap_filter=ark_uap_filter).results)
+        )
         policies_stats = ArkUAPPoliciesStats.model_construct()
-        policies_stats.policies_count = len(policies)
-
-        status_counts = defaultdict(int)
-        provider_counts = defaultdict(int)
-
-        for policy in policies:
-            status_counts[policy.metadata.status.status] += 1
-            provider_counts[policy.metadata.policy_entitlement.location_type] += 1
-
-        policies_stats.policies_count_per_status = dict(status_counts)
-        policies_stats.policies_count_per_provider = dict(provider_counts)
-
+        policies_stats.policies_count = aggregator.count
+        policies_stats.policies_count_per_status = aggregator.counts('status')
+        policies_stats.policies_count_per_provider = aggregator.counts('provider')
         return policies_stats
 
     def _base_policy_by_name(self, policy_request: ArkUAPGetPolicyByNameRequest) -> ArkUAPCommonAccessPolicy:
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the startup time of the `ark` CLI for a few common invocations.
+Every invocation runs in a fresh interpreter, once with a cold CLI schema cache and then repeatedly with a warm cache.
+
+Usage:
+    python tests/benchmarks/cli_startup_benchmark.py [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+INVOCATIONS: List[List[str]] = [
+    ['--help'],
+    ['exec', '--help'],
+    ['exec', 'pcloud', 'accounts', '--help'],
+    ['exec', 'sia', 'policies', 'vm', '--help'],
+]
+
+
+def run_invocation(invocation: List[str], env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'ark_sdk_python.ark'] + invocation, env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5, help='Warm runs per invocation')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as cache_folder:
+        env = dict(os.environ, ARK_CLI_CACHE_FOLDER=cache_folder)
+        print(f'{"invocation":<40} {"cold (s)":>10} {"warm median (s)":>16}')
+        for invocation in INVOCATIONS:
+            for cache_file in os.listdir(cache_folder):
+                os.unlink(os.path.join(cache_folder, cache_file))
+            cold = run_invocation(invocation, env)
+            warm = statistics.median(run_invocation(invocation, env) for _ in range(max(args.runs, 1)))
+            print(f'{" ".join(invocation):<40} {cold:>10.3f} {warm:>16.3f}')
+
+
+if __name__ == '__main__':
+    main()
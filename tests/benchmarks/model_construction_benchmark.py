@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the construction of listed models from recorded response fixtures, in records per second.
+Every fixture page is replicated to the requested amount of records and parsed by each of the modes:
+    two pass    - decode the body to python objects, then validate them (`model_validate(resp.json())`)
+    single pass - validate straight from the raw body (`ArkTypeAdapters.validate_json`), as the services do
+    trusted     - decode the body and construct the models without validation (`model_construct`),
+                  with the aliases and nested models of every model resolved once up front
+    lazy        - decode the body into a lazy page (`ArkPage.from_json_field(..., lazy=True)`) without touching the items
+    lazy all    - decode the body into a lazy page and access every item, validating all of them
+
+Usage:
+    python tests/benchmarks/model_construction_benchmark.py [--records 20000] [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from ark_sdk_python.common import ArkPage
+from ark_sdk_python.models import ArkTypeAdapters
+from ark_sdk_python.models.services.cmgr import ArkCmgrPoolIdentifier
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudAccount
+from ark_sdk_python.models.services.sm import ArkSMSession
+
+FIXTURES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Fixture file, listed model and the items field of the page
+FIXTURES: List[Tuple[str, Type[BaseModel], str]] = [
+    ('pcloud_accounts_page.json', ArkPCloudAccount, 'value'),
+    ('sm_sessions_page.json', ArkSMSession, 'sessions'),
+    ('cmgr_pool_identifiers_page.json', ArkCmgrPoolIdentifier, 'identifiers'),
+]
+
+
+def load_fixture(file_name: str, items_field: str, records: int) -> bytes:
+    with open(os.path.join(FIXTURES_FOLDER, file_name), 'r', encoding='utf-8') as fh:
+        page = json.load(fh)
+    items = page[items_field]
+    page[items_field] = [items[i % len(items)] for i in range(records)]
+    return json.dumps(page).encode('utf-8')
+
+
+# Construction plans per model, the (alias, field name, nested model) of every field
+CONSTRUCTION_PLANS: Dict[Type[BaseModel], Tuple[Tuple[str, str, Optional[Tuple[bool, Type[BaseModel]]]], ...]] = {}
+
+
+def nested_model(annotation: Any) -> Optional[Tuple[bool, Type[BaseModel]]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return False, annotation
+    origin = get_origin(annotation)
+    if origin is Union:
+        return next((nested for nested in map(nested_model, get_args(annotation)) if nested), None)
+    if origin is list:
+        nested = nested_model(get_args(annotation)[0])
+        return (True, nested[1]) if nested else None
+    return None
+
+
+def construct(model: Type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    plan = CONSTRUCTION_PLANS.get(model)
+    if plan is None:
+        plan = tuple((field.alias or name, name, nested_model(field.annotation)) for name, field in model.model_fields.items())
+        CONSTRUCTION_PLANS[model] = plan
+    values = {}
+    for key, name, nested in plan:
+        if key not in data:
+            continue
+        value = data[key]
+        if nested and value is not None:
+            is_list, nested_type = nested
+            value = [construct(nested_type, v) for v in value] if is_list else construct(nested_type, value)
+        values[name] = value
+    return model.model_construct(**values)
+
+
+def modes(model: Type[BaseModel], items_field: str) -> Dict[str, Callable[[bytes], int]]:
+    return {
+        'two pass': lambda data: len(ArkTypeAdapters.validate_python(List[model], json.loads(data)[items_field])),
+        'single pass': lambda data: len(ArkTypeAdapters.validate_json_field(List[model], data, items_field)[0]),
+        'trusted': lambda data: len([construct(model, item) for item in from_json(data)[items_field]]),
+        'lazy': lambda data: len(ArkPage[model].from_json_field(model, data, items_field, lazy=True)[0]),
+        'lazy all': lambda data: len(list(ArkPage[model].from_json_field(model, data, items_field, lazy=True)[0])),
+    }
+
+
+def records_per_second(parse: Callable[[bytes], int], data: bytes, runs: int) -> float:
+    durations = []
+    count = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        count = parse(data)
+        durations.append(time.perf_counter() - start)
+    return count / statistics.median(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=20000, help='Records per fixture page')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per mode')
+    args = parser.parse_args()
+    names = list(modes(ArkSMSession, 'sessions').keys())
+    print(f'{"fixture (rec/s)":<36} ' + ' '.join(f'{name:>12}' for name in names))
+    for file_name, model, items_field in FIXTURES:
+        data = load_fixture(file_name, items_field, max(args.records, 1))
+        rates = [records_per_second(parse, data, max(args.runs, 1)) for parse in modes(model, items_field).values()]
+        print(f'{file_name:<36} ' + ' '.join(f'{rate:>12,.0f}' for rate in rates))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the transfer of large powershell scripts over winrm, against the script size.
+The winrm protocol is simulated with a fixed latency per round trip, so the results reflect the amount of round trips and the payload sizes
+of each transfer mode rather than the target:
+    legacy  - the script is sent as UTF-16 in 4000 byte chunks, a powershell round trip per chunk
+    bulk    - the script is compressed and sent in chunks as large as a cmd.exe command line allows (`ArkWinRMConnection.upload_file`)
+
+Usage:
+    python tests/benchmarks/winrm_transfer_benchmark.py [--sizes-kb 16 64 200 1024] [--latency-ms 25]
+"""
+
+import argparse
+import base64
+import random
+import time
+from typing import List, Tuple
+
+from ark_sdk_python.common.connections.winrm import ArkWinRMConnection
+from ark_sdk_python.models.common.connections import ArkConnectionCommand
+
+LEGACY_CHUNK_SIZE = 4000
+
+
+class SimulatedProtocol:
+    def __init__(self, latency_seconds: float) -> None:
+        self.latency_seconds = latency_seconds
+        self.round_trips = 0
+        self.sent_bytes = 0
+
+    def __round_trip(self, payload: int) -> None:
+        self.round_trips += 1
+        self.sent_bytes += payload
+        time.sleep(self.latency_seconds)
+
+    def run_command(self, _shell_id: str, command: str, arguments: Tuple[str, ...] = ()) -> str:
+        self.__round_trip(len(command) + sum(len(a) for a in arguments))
+        return 'command'
+
+    def get_command_output(self, _shell_id: str, _command_id: str) -> Tuple[bytes, bytes, int]:
+        self.__round_trip(0)
+        return b'', b'', 0
+
+    def cleanup_command(self, _shell_id: str, _command_id: str) -> None:
+        self.__round_trip(0)
+
+
+def generate_script(size: int) -> str:
+    rng = random.Random(size)
+    lines: List[str] = []
+    while sum(len(line) + 1 for line in lines) < size:
+        lines.append(f'$value{rng.randint(0, 1 << 30)} = Get-Item -Path "C:\\Program Files\\Vendor\\{rng.getrandbits(64):x}\\agent.conf"')
+    return '\n'.join(lines)
+
+
+def legacy_transfer(protocol: SimulatedProtocol, script: str) -> None:
+    encoded_command = script.encode('utf_16_le')
+    protocol.run_command('shell', 'if not exist "C:\\temp" mkdir C:\\temp')
+    for i in range(0, len(encoded_command), LEGACY_CHUNK_SIZE):
+        encoded_chunk_base64 = base64.b64encode(encoded_command[i : i + LEGACY_CHUNK_SIZE]).decode('ascii')
+        command_id = protocol.run_command(
+            'shell',
+            f'powershell -Command "[System.Text.Encoding]::Unicode.GetString([System.Convert]::FromBase64String(\'{encoded_chunk_base64}\')) '
+            '| Add-Content -Path "C:\\temp\\script.ps1" -Encoding Unicode -NoNewline"',
+        )
+        protocol.get_command_output('shell', command_id)
+    command_id = protocol.run_command('shell', 'powershell -File "C:\\temp\\script.ps1"')
+    protocol.get_command_output('shell', command_id)
+    protocol.run_command('shell', 'del /f "C:\\temp\\script.ps1"')
+    protocol.cleanup_command('shell', command_id)
+
+
+def bulk_transfer(protocol: SimulatedProtocol, script: str) -> None:
+    connection = ArkWinRMConnection()
+    connection._ArkWinRMConnection__winrm_protocol = protocol
+    connection._ArkWinRMConnection__winrm_shell_id = 'shell'
+    connection._ArkWinRMConnection__is_connected = True
+    connection.run_command(ArkConnectionCommand(command=script))
+
+
+def measure(transfer, script: str, latency_seconds: float) -> Tuple[float, int, int]:
+    protocol = SimulatedProtocol(latency_seconds)
+    start = time.perf_counter()
+    transfer(protocol, script)
+    return time.perf_counter() - start, protocol.round_trips, protocol.sent_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes-kb', type=int, nargs='+', default=[16, 64, 200, 1024], help='Script sizes in KB')
+    parser.add_argument('--latency-ms', type=float, default=25.0, help='Simulated latency of a winrm round trip')
+    args = parser.parse_args()
+    latency_seconds = max(args.latency_ms, 0) / 1000
+    print(
+        f'{"script (KB)":>11} {"legacy (s)":>11} {"legacy trips":>13} {"legacy sent (KB)":>17} '
+        f'{"bulk (s)":>9} {"bulk trips":>11} {"bulk sent (KB)":>15}'
+    )
+    for size_kb in args.sizes_kb:
+        script = generate_script(size_kb * 1024)
+        legacy_seconds, legacy_trips, legacy_sent = measure(legacy_transfer, script, latency_seconds)
+        bulk_seconds, bulk_trips, bulk_sent = measure(bulk_transfer, script, latency_seconds)
+        print(
+            f'{size_kb:>11} {legacy_seconds:>11.2f} {legacy_trips:>13} {legacy_sent / 1024:>17,.0f} '
+            f'{bulk_seconds:>9.2f} {bulk_trips:>11} {bulk_sent / 1024:>15,.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import argparse
+import sys
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.actions import ArkServiceExecAction
+from ark_sdk_python.args import ArkCLISchemaCache
+from ark_sdk_python.models.common import ArkRetryPolicy
+
+
+class TestArkCLISchemaCache:
+    def test_schemas_persisted_per_version(self, tmp_path, mocker: MockerFixture):
+        cache = ArkCLISchemaCache(str(tmp_path), version='1.0.0')
+        schema = cache.model_json_schema(ArkRetryPolicy)
+        assert schema == ArkRetryPolicy.model_json_schema()
+        cache.flush()
+        schema_mock = mocker.patch.object(ArkRetryPolicy, 'model_json_schema')
+        assert ArkCLISchemaCache(str(tmp_path), version='1.0.0').model_json_schema(ArkRetryPolicy) == schema
+        schema_mock.assert_not_called()
+        ArkCLISchemaCache(str(tmp_path), version='2.0.0').model_json_schema(ArkRetryPolicy)
+        schema_mock.assert_called_once()
+
+    def test_only_selected_service_fully_defined(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('ARK_CLI_CACHE_FOLDER', str(tmp_path))
+        monkeypatch.setattr(sys, 'argv', ['ark', 'exec', 'pcloud', 'accounts', '--help'])
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest='action')
+        ArkServiceExecAction().define_action(subparsers)
+        exec_subparsers = subparsers.choices['exec']._subparsers._group_actions[0]  # pylint: disable=protected-access
+        assert exec_subparsers.choices['pcloud']._subparsers is not None  # pylint: disable=protected-access
+        assert exec_subparsers.choices['sia']._subparsers is None  # pylint: disable=protected-access
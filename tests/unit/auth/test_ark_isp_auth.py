@@ -98,8 +98,8 @@ class TestArkISPAuth:
         )
 
     def test_identity_auth_method_caching(self, mocker: MockerFixture):
-        pickle_dumps_mock = mocker.patch('dill.dumps')
-        pickle_dumps_mock.return_value = 'abcd'.encode('utf-8')
+        serialize_session_mock = mocker.patch('ark_sdk_python.common.ark_session_serializer.ArkSessionSerializer.serialize_session')
+        serialize_session_mock.return_value = '{}'
         tenant_fqdn_mock = mocker.patch(
             'ark_sdk_python.auth.identity.ark_identity_fqdn_resolver.ArkIdentityFQDNResolver.resolve_tenant_fqdn_from_tenant_suffix'
         )
@@ -126,7 +126,7 @@ class TestArkISPAuth:
         tenant_fqdn_mock.assert_called_once()
         keyring_load_mock.assert_called()
         keyring_save_mock.assert_called()
-        pickle_dumps_mock.assert_called()
+        serialize_session_mock.assert_called()
         session_mock.return_value.post.assert_any_call(
             url='https://url.com/Security/StartAuthentication',
             json={'User': 'user@user.com', 'Version': '1.0', 'PlatformTokenResponse': True, 'MfaRequestor': 'DeviceAgent'},
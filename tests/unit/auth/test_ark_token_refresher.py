@@ -0,0 +1,78 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.auth import ArkISPAuth
+from ark_sdk_python.models import ArkAuthException
+from ark_sdk_python.models.auth import ArkAuthMethod, ArkToken
+
+
+def _token(value: str, lifetime: timedelta) -> ArkToken:
+    return ArkToken(token=value, auth_method=ArkAuthMethod.Identity, expires_in=datetime.now() + lifetime)
+
+
+class TestArkTokenRefresher:
+    def test_concurrent_refreshes_are_collapsed(self, mocker: MockerFixture):
+        auth = ArkISPAuth(cache_authentication=False, token=_token('old', timedelta(seconds=10)))
+        assert not auth.token_refresher.is_proactive
+        refreshed = _token('new', timedelta(hours=1))
+
+        def load_authentication(*_args, **_kwargs):
+            time.sleep(0.2)
+            return refreshed
+
+        load_mock = mocker.patch.object(auth, 'load_authentication', side_effect=load_authentication)
+        clients = [MagicMock() for _ in range(3)]
+        for client in clients:
+            auth.token_refresher.register_client(client)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(auth.token_refresher.refresh())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert load_mock.call_count == 1
+        assert results == [refreshed] * 10
+        for client in clients:
+            client.update_token.assert_called_once_with('new')
+        # Refreshes right after a completed refresh reuse its token
+        assert auth.token_refresher.refresh() is refreshed
+        assert load_mock.call_count == 1
+
+    def test_proactive_refresh(self, mocker: MockerFixture):
+        auth = ArkISPAuth(cache_authentication=False, token=_token('old', timedelta(seconds=61)))
+        refreshed = _token('new', timedelta(hours=1))
+        done = threading.Event()
+
+        load_mock = mocker.patch.object(auth, 'load_authentication', return_value=refreshed)
+        client = MagicMock()
+        client.update_token.side_effect = lambda _token: done.set()
+        auth.token_refresher.enable_proactive_refresh()
+        auth.token_refresher.register_client(client)
+        assert done.wait(5)
+        auth.token_refresher.disable_proactive_refresh()
+        # Background refreshes never authenticate interactively
+        load_mock.assert_called_once()
+        assert load_mock.call_args.args[3] is False
+        client.update_token.assert_called_once_with('new')
+
+    def test_failed_proactive_refresh_is_skipped(self, mocker: MockerFixture):
+        auth = ArkISPAuth(cache_authentication=False, token=_token('old', timedelta(seconds=61)))
+        failed = threading.Event()
+
+        def load_authentication(*_args, **_kwargs):
+            failed.set()
+            raise ArkAuthException('No refresh token is available for a non interactive refresh')
+
+        load_mock = mocker.patch.object(auth, 'load_authentication', side_effect=load_authentication)
+        client = MagicMock()
+        auth.token_refresher.enable_proactive_refresh()
+        auth.token_refresher.register_client(client)
+        assert failed.wait(5)
+        time.sleep(0.1)
+        auth.token_refresher.disable_proactive_refresh()
+        load_mock.assert_called_once()
+        client.update_token.assert_not_called()
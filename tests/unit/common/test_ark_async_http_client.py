@@ -0,0 +1,63 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ark_sdk_python.common import ArkAsyncHttpClient
+
+
+class _AuthorizedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        status = 200 if self.headers.get('Authorization') == 'Bearer valid' else 401
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _AuthorizedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestArkAsyncHttpClient:
+    def test_concurrent_requests(self, server_url: str):
+        async def run():
+            async with ArkAsyncHttpClient(token='valid') as client:
+                return await asyncio.gather(*[client.get(f'{server_url}/items/{i}') for i in range(50)])
+
+        responses = asyncio.run(run())
+        assert [r.status_code for r in responses] == [200] * 50
+        assert responses[0].json() == {}
+
+    def test_refresh_on_unauthorized(self, server_url: str):
+        refreshes = []
+
+        async def refresh(client: ArkAsyncHttpClient) -> None:
+            refreshes.append(client)
+            client.update_token('valid')
+
+        async def run():
+            async with ArkAsyncHttpClient(token='expired', refresh_connection_callback=refresh) as client:
+                return await client.get(server_url)
+
+        assert asyncio.run(run()).status_code == 200
+        assert len(refreshes) == 1
+
+    def test_unauthorized_without_refresh(self, server_url: str):
+        async def run():
+            async with ArkAsyncHttpClient(token='expired') as client:
+                return await client.get(server_url)
+
+        assert asyncio.run(run()).status_code == 401
@@ -0,0 +1,118 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from ark_sdk_python.common import ArkConcurrentPager, ArkPage
+from ark_sdk_python.models import ArkException
+
+
+class TestArkConcurrentPager:
+    @pytest.mark.parametrize('max_workers', [1, 4, 16])
+    def test_ordered_pages(self, max_workers: int):
+        in_flight = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        def fetch_page(offset: int) -> int:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(random.uniform(0, 0.005))
+            with lock:
+                in_flight -= 1
+            return offset
+
+        offsets = list(range(0, 1000, 10))
+        assert list(ArkConcurrentPager.fetch_pages(fetch_page, offsets, max_workers)) == offsets
+        assert max_in_flight <= max_workers
+
+    def test_unordered_pages(self):
+        offsets = list(range(0, 500, 5))
+        pages = list(ArkConcurrentPager.fetch_pages(lambda o: o, offsets, 8, ordered=False))
+        assert sorted(pages) == offsets
+
+    def test_failure_is_raised(self):
+        def fetch_page(offset: int) -> int:
+            if offset == 30:
+                raise ValueError('failed page')
+            return offset
+
+        with pytest.raises(ValueError):
+            list(ArkConcurrentPager.fetch_pages(fetch_page, range(0, 100, 10), 4))
+
+    def test_async_ordered_pages(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch_page(offset: int) -> int:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(random.uniform(0, 0.005))
+            in_flight -= 1
+            return offset
+
+        async def collect():
+            return [page async for page in ArkConcurrentPager.fetch_pages_async(fetch_page, offsets, 8)]
+
+        offsets = list(range(0, 1000, 10))
+        assert asyncio.run(collect()) == offsets
+        assert max_in_flight <= 8
+
+    def test_async_streamed_pages(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def sources():
+            for source in range(20):
+                await asyncio.sleep(0.001)
+                yield source
+
+        async def fetch_pages(source: int):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            for page in range(3):
+                await asyncio.sleep(random.uniform(0, 0.005) if source != 0 else 0.05)
+                yield (source, page)
+            in_flight -= 1
+
+        async def collect():
+            return [page async for page in ArkConcurrentPager.stream_pages_async(fetch_pages, sources(), 4)]
+
+        pages = asyncio.run(collect())
+        assert sorted(pages) == [(source, page) for source in range(20) for page in range(3)]
+        # Pages are yielded in completion order, the slow first source does not hold back the others
+        assert pages[0][0] != 0 and pages[-1] == (0, 2)
+        assert max_in_flight <= 4
+
+    def test_async_streamed_pages_failure(self):
+        async def fetch_pages(source: int):
+            yield source
+            if source == 3:
+                raise ValueError('failed page')
+
+        async def collect():
+            return [page async for page in ArkConcurrentPager.stream_pages_async(fetch_pages, range(10), 2)]
+
+        with pytest.raises(ValueError):
+            asyncio.run(collect())
+
+    def test_pages_by_total(self):
+        items = list(range(95))
+        fetched_offsets = []
+
+        def fetch_page(offset: int):
+            fetched_offsets.append(offset)
+            # The server caps the page size below the requested one
+            return ArkPage(items=items[offset : offset + 10]), len(items)
+
+        pages = list(ArkConcurrentPager.fetch_pages_by_total(fetch_page, 0, 4))
+        assert [i for p in pages for i in p.items] == items
+        assert sorted(fetched_offsets) == list(range(0, 95, 10))
+        with pytest.raises(ArkException):
+            list(ArkConcurrentPager.fetch_pages_by_total(fetch_page, 0, 4, max_pages=5))
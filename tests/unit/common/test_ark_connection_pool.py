@@ -0,0 +1,53 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ark_sdk_python.common import ArkClient, ArkConnectionPool
+from ark_sdk_python.models.common import ArkConnectionPoolSettings
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestArkConnectionPool:
+    def test_connections_reused_across_clients(self, server_url: str):
+        pool = ArkConnectionPool()
+        first_client = ArkClient(connection_pool=pool)
+        second_client = ArkClient(connection_pool=pool)
+        for _ in range(3):
+            assert first_client.get(server_url).status_code == 200
+            assert second_client.get(server_url).status_code == 200
+        stats = pool.stats
+        assert stats.new_connections == 1
+        assert stats.reused_connections == 5
+
+    def test_connections_not_reused_without_keep_alive(self, server_url: str):
+        pool = ArkConnectionPool(ArkConnectionPoolSettings(keep_alive=False))
+        client = ArkClient(connection_pool=pool)
+        for _ in range(3):
+            assert client.get(server_url).status_code == 200
+        assert pool.stats.new_connections == 3
+        assert pool.stats.reused_connections == 0
+        pool.reset_stats()
+        assert pool.stats.new_connections == 0
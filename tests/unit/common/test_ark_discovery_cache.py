@@ -0,0 +1,66 @@
+import json
+import os
+import threading
+import time
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkDiscoveryCache
+
+
+class TestArkDiscoveryCache:
+    def test_resolved_once_across_instances(self, tmp_path):
+        resolver_calls = []
+
+        def resolver() -> str:
+            resolver_calls.append(1)
+            return 'https://tenant.id.cyberark.cloud'
+
+        assert ArkDiscoveryCache(str(tmp_path)).get_or_resolve('tenant', resolver) == 'https://tenant.id.cyberark.cloud'
+        assert ArkDiscoveryCache(str(tmp_path)).get_or_resolve('tenant', resolver) == 'https://tenant.id.cyberark.cloud'
+        assert ArkDiscoveryCache(str(tmp_path)).get('tenant') == 'https://tenant.id.cyberark.cloud'
+        assert len(resolver_calls) == 1
+
+    def test_stale_entry_revalidated_in_background(self, tmp_path):
+        cache = ArkDiscoveryCache(str(tmp_path), ttl_seconds=60, stale_ttl_seconds=600)
+        with open(cache.entry_file_path('tenant'), 'w', encoding='utf-8') as fh:
+            json.dump({'key': 'tenant', 'value': 'old', 'updated_at': time.time() - 120}, fh)
+        assert cache.get_or_resolve('tenant', lambda: 'new') == 'old'
+        for _ in range(100):
+            if cache.get('tenant') == 'new':
+                break
+            time.sleep(0.01)
+        assert cache.get_or_resolve('tenant', lambda: 'newer') == 'new'
+
+    def test_expired_entry_resolved(self, tmp_path):
+        cache = ArkDiscoveryCache(str(tmp_path), ttl_seconds=60, stale_ttl_seconds=60)
+        with open(cache.entry_file_path('tenant'), 'w', encoding='utf-8') as fh:
+            json.dump({'key': 'tenant', 'value': 'old', 'updated_at': time.time() - 120}, fh)
+        assert cache.get_or_resolve('tenant', lambda: 'new') == 'new'
+        cache.invalidate('tenant')
+        assert cache.get('tenant') is None
+
+    def test_disabled(self, tmp_path, mocker: MockerFixture):
+        mocker.patch.dict(os.environ, {'ARK_DISABLE_DISCOVERY_CACHE': 'true'})
+        cache = ArkDiscoveryCache(str(tmp_path))
+        assert cache.get_or_resolve('tenant', lambda: 'value') == 'value'
+        assert not os.path.exists(cache.entry_file_path('tenant'))
+
+    def test_processes_do_not_overwrite_other_keys(self, tmp_path):
+        # Separate instances share no lock, like separate processes revalidating different tenants
+        barrier = threading.Barrier(16)
+
+        def resolve(index: int) -> None:
+            cache = ArkDiscoveryCache(str(tmp_path))
+            barrier.wait()
+            cache.get_or_resolve(f'tenant-{index}', lambda: f'value-{index}')
+
+        threads = [threading.Thread(target=resolve, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache = ArkDiscoveryCache(str(tmp_path))
+        assert [cache.get(f'tenant-{i}') for i in range(16)] == [f'value-{i}' for i in range(16)]
+        cache.invalidate()
+        assert all(cache.get(f'tenant-{i}') is None for i in range(16))
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import jwt
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkJWTUtils
+from ark_sdk_python.common.isp import ArkISPServiceClient
+from ark_sdk_python.models import ArkException
+
+
+def _token(**claims) -> str:
+    return jwt.encode(claims, 'a-test-signing-key-of-at-least-32-bytes', algorithm='HS256')
+
+
+class TestArkJWTUtils:
+    def test_claims_are_decoded_once(self, mocker: MockerFixture):
+        token = _token(
+            tenant_id='tenant',
+            subdomain='acme',
+            platform_domain='cyberark.cloud',
+            unique_name='user@acme.com',
+            exp=4102444800,
+            iat=4102441200,
+        )
+        decode_spy = mocker.spy(jwt, 'decode')
+        claims = ArkJWTUtils.get_claims(token)
+        assert ArkISPServiceClient.service_url('dpa', token=token) == 'https://acme.dpa.cyberark.cloud'
+        assert ArkJWTUtils.get_unverified_claims(token)['tenant_id'] == 'tenant'
+        assert ArkJWTUtils.get_subdomain_from_token(token) == 'acme'
+        decode_spy.assert_called_once()
+        assert ArkJWTUtils.get_claims(token) is claims
+        assert (claims.tenant_id, claims.subdomain, claims.platform_domain, claims.unique_name) == (
+            'tenant',
+            'acme',
+            'cyberark.cloud',
+            'user@acme.com',
+        )
+        assert claims.exp == datetime.fromtimestamp(4102444800)
+        assert (claims.exp - claims.iat).seconds == 3600
+        assert ArkJWTUtils.get_claims(_token(tenant_id='other')).subdomain is None
+
+    def test_missing_tenant_id_claim(self):
+        assert ArkISPServiceClient(base_tenant_url='https://acme.cyberark.cloud', token=_token(tenant_id='tenant')).tenant_id == 'tenant'
+        client = ArkISPServiceClient(base_tenant_url='https://acme.cyberark.cloud', token=_token(subdomain='acme'))
+        with pytest.raises(ArkException, match='tenant id'):
+            _ = client.tenant_id
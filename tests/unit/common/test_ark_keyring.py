@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common.ark_keyring import (
+    ARK_BASIC_KEYRING_FOLDER_ENV_VAR,
+    ARK_BASIC_KEYRING_OVERRIDE_ENV_VAR,
+    ArkKeyring,
+    BasicKeyring,
+    IndexedKeyring,
+)
+from ark_sdk_python.models import ArkProfile
+from ark_sdk_python.models.auth import ArkToken, ArkTokenType
+
+
+class TestIndexedKeyring:
+    @pytest.fixture(autouse=True)
+    def keyring_folder(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(ARK_BASIC_KEYRING_FOLDER_ENV_VAR, str(tmp_path))
+        return tmp_path
+
+    def test_set_get_delete(self):
+        kr = IndexedKeyring()
+        assert kr.get_password('service', 'user') is None
+        kr.set_password('service', 'user', 'secret')
+        kr.set_password('service', 'other', 'other-secret')
+        assert IndexedKeyring().get_password('service', 'user') == 'secret'
+        kr.delete_password('service', 'user')
+        assert kr.get_password('service', 'user') is None
+        assert kr.get_password('service', 'other') == 'other-secret'
+
+    @pytest.mark.skipif(os.name == 'nt', reason='File modes are not enforced on windows')
+    def test_db_file_is_created_owner_only(self, keyring_folder, mocker: MockerFixture):
+        connect = sqlite3.connect
+        modes = []
+
+        def checked_connect(path, *args, **kwargs):
+            modes.append(stat.S_IMODE(os.stat(path).st_mode))
+            return connect(path, *args, **kwargs)
+
+        mocker.patch('sqlite3.connect', side_effect=checked_connect)
+        previous_umask = os.umask(0o022)
+        try:
+            kr = IndexedKeyring()
+        finally:
+            os.umask(previous_umask)
+        assert modes == [0o600]
+        os.chmod(kr.db_file_path, 0o644)
+        IndexedKeyring()
+        assert stat.S_IMODE(os.stat(kr.db_file_path).st_mode) == 0o600
+
+    def test_migrates_legacy_keyring(self, keyring_folder):
+        legacy = BasicKeyring()
+        legacy.set_password('service', 'user', 'secret')
+        legacy.set_password('other-service', 'user', 'other-secret')
+        kr = IndexedKeyring()
+        assert kr.get_password('service', 'user') == 'secret'
+        assert kr.get_password('other-service', 'user') == 'other-secret'
+        assert not os.path.exists(os.path.join(keyring_folder, 'keyring'))
+        assert not os.path.exists(os.path.join(keyring_folder, 'mac'))
+
+    def test_tampered_entry_is_isolated(self):
+        kr = IndexedKeyring()
+        kr.set_password('service', 'user', 'secret')
+        kr.set_password('service', 'other', 'other-secret')
+        with sqlite3.connect(kr.db_file_path) as conn:
+            conn.execute("UPDATE entries SET username = 'swapped' WHERE username = 'user'")
+        with pytest.raises(Exception):
+            kr.get_password('service', 'swapped')
+        assert kr.get_password('service', 'other') == 'other-secret'
+
+    def test_concurrent_writers(self):
+        def write(index: int) -> None:
+            IndexedKeyring().set_password('service', f'user-{index}', f'secret-{index}')
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write, range(50)))
+        kr = IndexedKeyring()
+        assert all(kr.get_password('service', f'user-{i}') == f'secret-{i}' for i in range(50))
+
+
+class TestArkKeyring:
+    @pytest.fixture(autouse=True)
+    def keyring_folder(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(ARK_BASIC_KEYRING_FOLDER_ENV_VAR, str(tmp_path))
+        monkeypatch.setenv(ARK_BASIC_KEYRING_OVERRIDE_ENV_VAR, 'true')
+        ArkKeyring.clear_cache()
+        yield tmp_path
+        ArkKeyring.clear_cache()
+
+    def test_token_cached_in_memory(self, mocker: MockerFixture):
+        profile = ArkProfile(profile_name='cached')
+        token = ArkToken(token='token', token_type=ArkTokenType.Token, expires_in=datetime.now() + timedelta(hours=1))
+        ArkKeyring('service').save_token(profile, token, 'postfix')
+        get_password_mock = mocker.spy(IndexedKeyring, 'get_password')
+        assert ArkKeyring('service').load_token(profile, 'postfix').token.get_secret_value() == 'token'
+        assert ArkKeyring('service').load_token(profile, 'postfix').token.get_secret_value() == 'token'
+        assert get_password_mock.call_count == 0
+        assert ArkKeyring.get_keyring() is ArkKeyring.get_keyring()
+
+    def test_expired_cached_token_evicted(self):
+        profile = ArkProfile(profile_name='expired')
+        token = ArkToken(token='token', token_type=ArkTokenType.Token, expires_in=datetime.now() - timedelta(hours=1))
+        ArkKeyring('service').save_token(profile, token, 'postfix')
+        assert ArkKeyring('service').load_token(profile, 'postfix') is None
+        assert ArkKeyring.get_keyring().get_password('service-postfix', 'expired') is None
+
+    def test_delete_token(self):
+        profile = ArkProfile(profile_name='deleted')
+        token = ArkToken(token='token', token_type=ArkTokenType.Token, expires_in=datetime.now() + timedelta(hours=1))
+        ArkKeyring('service').save_token(profile, token, 'postfix')
+        ArkKeyring('service').delete_token(profile, 'postfix')
+        assert ArkKeyring('service').load_token(profile, 'postfix') is None
+        assert ArkKeyring.get_keyring().get_password('service-postfix', 'deleted') is None
+        # Deleting a missing token is a no-op
+        ArkKeyring('service').delete_token(profile, 'postfix')
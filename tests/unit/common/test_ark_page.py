@@ -0,0 +1,78 @@
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from ark_sdk_python.common import ArkPage
+from ark_sdk_python.models import ArkCamelizedModel, ArkModel
+
+
+class _Status(str, Enum):
+    ACTIVE = 'active'
+    ENDED = 'ended'
+
+
+class _Item(ArkCamelizedModel):
+    item_id: str
+    safe_name: Optional[str] = None
+
+
+class _Session(ArkModel):
+    session_id: str
+    start_time: datetime
+    status: _Status = _Status.ACTIVE
+
+
+class TestArkPage:
+    def test_eager_page(self):
+        items = [_Item(item_id=str(i)) for i in range(3)]
+        page = ArkPage(items=items)
+        assert not page.is_lazy
+        assert page.items is items
+        assert page.rows is None
+        assert len(page) == 3
+        assert [i.item_id for i in page[1:]] == ['1', '2']
+        assert list(page.project('item_id')) == [{'item_id': '0'}, {'item_id': '1'}, {'item_id': '2'}]
+
+    def test_lazy_page_materializes_on_access(self):
+        rows = [{'itemId': str(i), 'safeName': f'safe-{i % 2}'} for i in range(5)]
+        page = ArkPage[_Item].from_rows(_Item, rows)
+        assert page.is_lazy
+        assert page.rows is rows
+        view = page[1:4]
+        assert len(view) == 3
+        assert view.rows == rows[1:4]
+        assert list(view.project('safe_name')) == [{'safe_name': 'safe-1'}, {'safe_name': 'safe-0'}, {'safe_name': 'safe-1'}]
+        item = view[0]
+        assert isinstance(item, _Item) and item.item_id == '1'
+        # Views share the materialized items of the page
+        assert page[1] is item
+        assert [i.item_id for i in page] == [str(i) for i in range(5)]
+        assert json.loads(page[::2].to_json()) == rows[::2]
+
+    def test_page_from_json_field(self):
+        data = json.dumps({'value': [{'itemId': str(i)} for i in range(3)], 'count': 3}).encode('utf-8')
+        page, result = ArkPage[_Item].from_json_field(_Item, data, 'value')
+        assert not page.is_lazy and result == {'count': 3}
+        assert all(isinstance(i, _Item) for i in page.items)
+        lazy_page, result = ArkPage[_Item].from_json_field(_Item, data, 'value', lazy=True)
+        assert lazy_page.is_lazy and result == {'count': 3}
+        assert lazy_page.rows == [{'itemId': str(i)} for i in range(3)]
+        assert [i.item_id for i in lazy_page] == ['0', '1', '2']
+
+    def test_lazy_page_projection_is_validated(self):
+        rows = [
+            {'session_id': '0', 'start_time': '2024-01-01T10:00:00', 'status': 'ended'},
+            {'session_id': '1', 'start_time': '2024-01-01T11:00:00'},
+        ]
+        page = ArkPage[_Session].from_rows(_Session, rows)
+        projection = page.project('start_time', 'status')
+        before = list(projection)
+        assert before == [
+            {'start_time': datetime(2024, 1, 1, 10), 'status': _Status.ENDED},
+            {'start_time': datetime(2024, 1, 1, 11), 'status': _Status.ACTIVE},
+        ]
+        assert all(isinstance(p['status'], _Status) for p in before)
+        # Materializing an item does not change the values of its projection
+        assert page[0].start_time == datetime(2024, 1, 1, 10)
+        assert list(projection) == before
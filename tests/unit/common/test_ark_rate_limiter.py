@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import time
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.auth import ArkISPAuth
+from ark_sdk_python.common import ArkRateLimiters, ArkTokenBucketRateLimiter
+from ark_sdk_python.models.common import ArkRateLimitSettings
+from ark_sdk_python.services.sm import ArkAsyncSMService, ArkSMService
+
+
+class TestArkRateLimiter:
+    def test_burst_then_sustained_rate(self):
+        limiter = ArkTokenBucketRateLimiter(ArkRateLimitSettings(requests_per_second=50, burst=5))
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.05
+        for _ in range(10):
+            limiter.acquire()
+        assert time.monotonic() - start >= 10 / 50 - 0.02
+
+    def test_shared_across_threads(self):
+        limiter = ArkTokenBucketRateLimiter(ArkRateLimitSettings(requests_per_second=100))
+        start = time.monotonic()
+        threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - start >= 19 / 100 - 0.02
+
+    def test_async_acquire(self):
+        limiter = ArkTokenBucketRateLimiter(ArkRateLimitSettings(requests_per_second=100))
+
+        async def run():
+            await asyncio.gather(*[limiter.async_acquire() for _ in range(10)])
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 9 / 100 - 0.02
+
+    def test_registry(self):
+        try:
+            assert ArkRateLimiters.limiter_for('sm') is None
+            ArkRateLimiters.configure('sm', ArkRateLimitSettings(requests_per_second=10))
+            ArkRateLimiters.configure_default(ArkRateLimitSettings(requests_per_second=20))
+            assert ArkRateLimiters.limiter_for('sm').settings.requests_per_second == 10
+            assert ArkRateLimiters.limiter_for('sm') is ArkRateLimiters.limiter_for('sm')
+            assert ArkRateLimiters.limiter_for('cmgr').settings.requests_per_second == 20
+        finally:
+            ArkRateLimiters.reset()
+
+    def test_sync_and_async_services_share_the_api_limiter(self, mocker: MockerFixture):
+        mocker.patch('ark_sdk_python.common.isp.ArkISPServiceClient.from_isp_auth')
+        mocker.patch('ark_sdk_python.common.isp.ArkAsyncISPServiceClient.from_isp_auth')
+        try:
+            ArkRateLimiters.configure('sm', ArkRateLimitSettings(requests_per_second=10))
+            isp_auth = ArkISPAuth(cache_authentication=False)
+            sync_service = ArkSMService(isp_auth)
+            async_service = ArkAsyncSMService(isp_auth)
+            assert sync_service._rate_limiter is ArkRateLimiters.limiter_for('sm')
+            assert async_service._rate_limiter is sync_service._rate_limiter
+        finally:
+            ArkRateLimiters.reset()
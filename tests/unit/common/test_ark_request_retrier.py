@@ -0,0 +1,83 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ark_sdk_python.common import ArkClient, ArkRequestRetrier
+from ark_sdk_python.models.common import ArkRetryPolicy
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    throttled_requests = 0
+    requests_count = 0
+
+    def __respond(self):
+        _ThrottlingHandler.requests_count += 1
+        if _ThrottlingHandler.requests_count <= _ThrottlingHandler.throttled_requests:
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.__respond()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.__respond()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def server_url():
+    _ThrottlingHandler.requests_count = 0
+    _ThrottlingHandler.throttled_requests = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ThrottlingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestArkRequestRetrier:
+    def test_throttled_request_retried(self, server_url: str):
+        _ThrottlingHandler.throttled_requests = 2
+        client = ArkClient(retry_policy=ArkRetryPolicy(base_delay=0.01))
+        assert client.get(server_url).status_code == 200
+        assert _ThrottlingHandler.requests_count == 3
+
+    def test_non_idempotent_method_not_retried(self, server_url: str):
+        _ThrottlingHandler.throttled_requests = 1
+        assert ArkClient().post(server_url, json={}).status_code == 429
+        assert _ThrottlingHandler.requests_count == 1
+        client = ArkClient(retry_policy=ArkRetryPolicy(retry_methods=['POST']))
+        assert client.post(server_url, json={}).status_code == 200
+
+    def test_retry_budget_exhausted(self, server_url: str):
+        _ThrottlingHandler.throttled_requests = 10
+        client = ArkClient(retry_policy=ArkRetryPolicy(retry_budget=2, max_retries=5))
+        assert client.get(server_url).status_code == 429
+        assert _ThrottlingHandler.requests_count == 3
+
+    def test_backoff_delays(self):
+        retrier = ArkRequestRetrier(ArkRetryPolicy(base_delay=1, max_delay=10))
+        delay = 0.0
+        for _ in range(20):
+            delay = retrier.next_delay(delay)
+            assert 1 <= delay <= 10
+        assert retrier.next_delay(delay, '7') == 7
+
+    def test_parse_retry_after(self):
+        assert ArkRequestRetrier.parse_retry_after('120') == 120
+        assert ArkRequestRetrier.parse_retry_after('invalid') is None
+        retry_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        assert 25 <= ArkRequestRetrier.parse_retry_after(retry_date) <= 30
@@ -0,0 +1,46 @@
+import codecs
+import json
+import pickle
+
+import dill
+from requests import Session
+from requests.cookies import RequestsCookieJar, create_cookie
+
+from ark_sdk_python.common import ArkSessionSerializer
+
+
+def _cookie_jar() -> RequestsCookieJar:
+    cookie_jar = RequestsCookieJar()
+    cookie_jar.set_cookie(create_cookie('idToken-tenant', 'token', domain='.example.cyberark.cloud', secure=True, rest={'HttpOnly': None}))
+    cookie_jar.set_cookie(create_cookie('refreshToken-tenant', 'refresh', domain='example.cyberark.cloud', path='/api', expires=4102444800))
+    return cookie_jar
+
+
+def _as_tuples(cookie_jar: RequestsCookieJar):
+    return sorted((c.name, c.value, c.domain, c.path, c.secure, c.expires, c.has_nonstandard_attr('HttpOnly')) for c in cookie_jar)
+
+
+class TestArkSessionSerializer:
+    def test_cookies_round_trip(self):
+        data = ArkSessionSerializer.serialize_cookies(_cookie_jar())
+        assert json.loads(data)['version'] == 1
+        assert _as_tuples(ArkSessionSerializer.deserialize_cookies(data)) == _as_tuples(_cookie_jar())
+
+    def test_session_round_trip(self):
+        session = Session()
+        session.headers.update({'X-IDAP-NATIVE-CLIENT': 'true'})
+        session.cookies = _cookie_jar()
+        loaded = ArkSessionSerializer.deserialize_session(ArkSessionSerializer.serialize_session(session))
+        assert dict(loaded.headers) == dict(session.headers)
+        assert _as_tuples(loaded.cookies) == _as_tuples(session.cookies)
+
+    def test_legacy_entries(self):
+        legacy_cookies = codecs.encode(pickle.dumps(_cookie_jar()), 'base64').decode()
+        assert _as_tuples(ArkSessionSerializer.deserialize_cookies(legacy_cookies)) == _as_tuples(_cookie_jar())
+        session = Session()
+        session.headers.update({'X-IDAP-NATIVE-CLIENT': 'true'})
+        session.cookies = _cookie_jar()
+        legacy_session = codecs.encode(dill.dumps(session), 'base64').decode()
+        loaded = ArkSessionSerializer.deserialize_session(legacy_session)
+        assert loaded.headers['X-IDAP-NATIVE-CLIENT'] == 'true'
+        assert _as_tuples(loaded.cookies) == _as_tuples(session.cookies)
@@ -0,0 +1,118 @@
+import os
+import tempfile
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common.connections.ssh import ArkSSHConnection
+from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.common.connections import ArkConnectionCommand, ArkConnectionOutputStream
+
+
+class _FakeChannel:
+    def __init__(self, stdout: List[bytes], stderr: List[bytes], rc: int):
+        self.stdout = list(stdout)
+        self.stderr = list(stderr)
+        self.rc = rc
+        self.closed = False
+
+    def recv_ready(self):
+        return bool(self.stdout)
+
+    def recv(self, _size):
+        return self.stdout.pop(0)
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv_stderr(self, _size):
+        return self.stderr.pop(0)
+
+    def exit_status_ready(self):
+        # The exit status only arrives after the output was drained, like a command blocked on a full channel window
+        return not self.stdout and not self.stderr
+
+    def recv_exit_status(self):
+        assert self.exit_status_ready()
+        return self.rc
+
+    def close(self):
+        self.closed = True
+
+
+def _connection(channel: _FakeChannel) -> ArkSSHConnection:
+    connection = ArkSSHConnection()
+    stdout_stream = MagicMock()
+    stdout_stream.channel = channel
+    ssh_client = MagicMock()
+    ssh_client.exec_command.return_value = (None, stdout_stream, MagicMock())
+    connection._ArkSSHConnection__ssh_client = ssh_client
+    connection._ArkSSHConnection__is_connected = True
+    return connection
+
+
+class TestArkSSHConnection:
+    def test_run_command_streaming(self):
+        # A multi byte character split across chunks is decoded once it is complete
+        channel = _FakeChannel([b'line-1\n', b'line-2 \xe2\x82', b'\xac\n', b'line-3\n'], [b'warning\n'], 0)
+        chunks = []
+        result = _connection(channel).run_command_streaming(
+            ArkConnectionCommand(command='collect-logs'),
+            output_callback=lambda stream, text: chunks.append((stream, text)),
+            max_retained_output_size=10,
+            spill_to_file=True,
+        )
+        try:
+            assert result.rc == 0
+            assert ''.join(text for stream, text in chunks if stream == ArkConnectionOutputStream.STDOUT) == 'line-1\nline-2 €\nline-3\n'
+            assert result.stdout == ' €\nline-3\n'
+            assert result.stdout_truncated and result.stdout_size == 23
+            assert result.stderr == 'warning\n' and not result.stderr_truncated
+            with open(result.stdout_path, encoding='utf-8') as file_handle:
+                assert file_handle.read() == 'line-1\nline-2 €\nline-3\n'
+        finally:
+            os.remove(result.stdout_path)
+            os.remove(result.stderr_path)
+
+    def test_run_command(self):
+        assert _connection(_FakeChannel([b'out'], [], 0)).run_command(ArkConnectionCommand(command='ls')).stdout == 'out'
+        with pytest.raises(ArkException, match='denied'):
+            _connection(_FakeChannel([], [b'denied'], 1)).run_command(ArkConnectionCommand(command='ls'))
+
+    def test_run_command_streaming_removes_spill_files_on_failure(self, mocker: MockerFixture):
+        spill_files = mocker.spy(tempfile, 'NamedTemporaryFile')
+        with pytest.raises(ArkException, match='denied'):
+            _connection(_FakeChannel([b'partial'], [b'denied'], 1)).run_command_streaming(
+                ArkConnectionCommand(command='collect-logs'), spill_to_file=True
+            )
+
+        def failing_callback(_stream, _text):
+            raise ValueError('callback failed')
+
+        channel = _FakeChannel([b'line-1\n', b'line-2\n'], [], 0)
+        with pytest.raises(ValueError, match='callback failed'):
+            _connection(channel).run_command_streaming(
+                ArkConnectionCommand(command='collect-logs'), output_callback=failing_callback, spill_to_file=True
+            )
+        assert channel.closed
+        assert spill_files.call_count == 4
+        assert not any(os.path.exists(spill_file.name) for spill_file in spill_files.spy_return_list)
+
+    def test_stream_command_output(self):
+        channel = _FakeChannel([b'line-1\n', b'line-2\n'], [b'warning\n'], 0)
+        chunks = list(_connection(channel).stream_command_output(ArkConnectionCommand(command='collect-logs')))
+        assert chunks == [
+            (ArkConnectionOutputStream.STDOUT, 'line-1\n'),
+            (ArkConnectionOutputStream.STDERR, 'warning\n'),
+            (ArkConnectionOutputStream.STDOUT, 'line-2\n'),
+        ]
+        with pytest.raises(ArkException, match='denied'):
+            list(_connection(_FakeChannel([b'out'], [b'denied'], 1)).stream_command_output(ArkConnectionCommand(command='ls')))
+        # Stopping early closes the channel of the command
+        channel = _FakeChannel([b'line-1\n', b'line-2\n'], [], 0)
+        output = _connection(channel).stream_command_output(ArkConnectionCommand(command='collect-logs'))
+        assert next(output) == (ArkConnectionOutputStream.STDOUT, 'line-1\n')
+        output.close()
+        assert channel.closed
@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+from ark_sdk_python.common import ArkPage, ArkStatsAggregator
+from ark_sdk_python.models import ArkModel
+
+
+class _Item(ArkModel):
+    name: str
+    kind: Optional[str] = None
+    tags: List[str] = []
+    active: bool = True
+
+
+class TestArkStatsAggregator:
+    def test_streaming_stats(self):
+        pages = (
+            ArkPage(items=[_Item(name=f'item-{page}-{i}', kind=['a', 'b', None][i % 3], tags=['x', 'y'][: i % 3], active=i % 2 == 0)])
+            for page in range(4)
+            for i in range(3)
+        )
+        aggregator: ArkStatsAggregator[_Item] = (
+            ArkStatsAggregator()
+            .count_by('kind', lambda i: i.kind)
+            .count_by('kind_set', lambda i: i.kind, skip_empty=True)
+            .count_by_each('tag', lambda i: i.tags)
+            .count_if('active', lambda i: i.active)
+            .map_by('tags_count', lambda i: i.name, lambda i: len(i.tags))
+            .collect_by('names', lambda i: i.kind, lambda i: i.name)
+            .consume_pages(pages)
+        )
+        assert aggregator.count == 12
+        assert aggregator.counts('kind') == {'a': 4, 'b': 4, None: 4}
+        assert aggregator.counts('kind_set') == {'a': 4, 'b': 4}
+        assert aggregator.counts('tag') == {'x': 8, 'y': 4}
+        assert aggregator.total('active') == 8
+        assert aggregator.values('tags_count')['item-0-2'] == 2
+        assert aggregator.collected('names')['a'] == [f'item-{p}-0' for p in range(4)]
+
+    def test_empty(self):
+        aggregator = ArkStatsAggregator().count_by('kind', lambda i: i.kind).count_if('active', lambda i: i.active).consume([])
+        assert aggregator.count == 0
+        assert aggregator.counts('kind') == {}
+        assert aggregator.total('active') == 0
@@ -0,0 +1,64 @@
+import base64
+import codecs
+import gzip
+import os
+import random
+import re
+from unittest.mock import MagicMock
+
+from ark_sdk_python.common.connections.winrm import ArkWinRMConnection
+from ark_sdk_python.models.common.connections import ArkConnectionCommand
+
+
+def _script(size: int) -> str:
+    rng = random.Random(size)
+    lines = []
+    while sum(len(line) + 1 for line in lines) < size:
+        lines.append(f'$value{rng.randint(0, 1 << 30)} = Get-Item -Path "C:\\Program Files\\{rng.getrandbits(64):x}" # ünïcode')
+    return '\n'.join(lines)
+
+
+def _connection() -> ArkWinRMConnection:
+    protocol = MagicMock()
+    protocol.run_command.side_effect = lambda *args: f'command-{protocol.run_command.call_count}'
+    protocol.get_command_output.return_value = (b'done', b'', 0)
+    connection = ArkWinRMConnection()
+    connection._ArkWinRMConnection__winrm_protocol = protocol
+    connection._ArkWinRMConnection__winrm_shell_id = 'shell'
+    connection._ArkWinRMConnection__is_connected = True
+    return connection
+
+
+class TestArkWinRMConnection:
+    def test_large_script_transfer(self):
+        script = _script(200 * 1024)
+        connection = _connection()
+        result = connection.run_command(ArkConnectionCommand(command=script))
+        assert result.stdout == 'done' and result.rc == 0
+        protocol = connection._ArkWinRMConnection__winrm_protocol
+        commands = [call.args[1] for call in protocol.run_command.call_args_list]
+        transfers, run, cleanup = commands[:-2], commands[-2], commands[-1]
+        # A 200KB script used to take a hundred 4KB chunks
+        assert len(transfers) < 20
+        # Every command has to fit in a cmd.exe command line
+        assert all(len(command) <= 8191 for command in commands)
+        assert protocol.cleanup_command.call_count == len(commands) - 1
+        payload = ''.join(re.search(r"-Value '([^']*)'", command).group(1) for command in transfers)
+        assert gzip.decompress(base64.b64decode(payload)) == codecs.BOM_UTF8 + script.encode('utf-8')
+        script_path = re.search(r'-File "([^"]+)"', run).group(1)
+        assert f"::Create('{script_path}')" in transfers[-1]
+        assert cleanup == f'del /f "{script_path}"'
+
+    def test_small_upload_is_single_round_trip(self):
+        connection = _connection()
+        connection.upload_file(b'data', 'C:\\temp\\file.bin')
+        protocol = connection._ArkWinRMConnection__winrm_protocol
+        assert protocol.run_command.call_count == 1 and protocol.get_command_output.call_count == 1
+        protocol.cleanup_command.assert_called_once_with('shell', 'command-1')
+
+    def test_long_remote_path_upload(self):
+        connection = _connection()
+        remote_path = f'C:\\temp\\{"nested" * 40}\\file.bin'
+        connection.upload_file(os.urandom(64 * 1024), remote_path)
+        commands = [call.args[1] for call in connection._ArkWinRMConnection__winrm_protocol.run_command.call_args_list]
+        assert len(commands) > 1 and all(len(command) <= 8191 for command in commands)
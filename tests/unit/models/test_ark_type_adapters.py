@@ -0,0 +1,21 @@
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from ark_sdk_python.models import ArkTypeAdapters
+from ark_sdk_python.models.common import ArkRetryPolicy
+
+
+class TestArkTypeAdapters:
+    def test_adapter_compiled_once(self):
+        assert ArkTypeAdapters.adapter(List[ArkRetryPolicy]) is ArkTypeAdapters.adapter(List[ArkRetryPolicy])
+
+    def test_validate_json_field(self):
+        policies, rest = ArkTypeAdapters.validate_json_field(
+            List[ArkRetryPolicy], b'{"value": [{"max_retries": 2}, {"max_retries": 3}], "count": 2, "nextLink": "next"}', 'value'
+        )
+        assert [p.max_retries for p in policies] == [2, 3]
+        assert rest == {'count': 2, 'nextLink': 'next'}
+        with pytest.raises(ValidationError):
+            ArkTypeAdapters.validate_json_field(List[ArkRetryPolicy], b'{"count": 0}', 'value')
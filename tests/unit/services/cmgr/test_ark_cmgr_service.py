@@ -0,0 +1,147 @@
+import json
+import threading
+import uuid
+from typing import Any, Callable, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from requests.exceptions import ConnectTimeout, ReadTimeout
+
+from ark_sdk_python.common.ark_request_retrier import ArkRequestRetrier
+from ark_sdk_python.models import ArkServiceException
+from ark_sdk_python.models.common import ArkRetryPolicy
+from ark_sdk_python.models.services.cmgr import (
+    ArkCmgrAddPoolBulkIdentifier,
+    ArkCmgrAddPoolIdentifier,
+    ArkCmgrPoolIdentifierType,
+    ArkCmgrSyncPoolIdentifiers,
+)
+from ark_sdk_python.services.cmgr import ArkCmgrService
+
+
+class _FakeCmgrClient:
+    def __init__(self, existing, flaky_values=(), rejected_values=(), bulk_failures=()):
+        self.lock = threading.Lock()
+        self.retry_policy = ArkRetryPolicy(base_delay=0.001, max_delay=0.001)
+        self.identifiers = {i['id']: i for i in existing}
+        self.flaky_values = set(flaky_values)
+        self.rejected_values = set(rejected_values)
+        self.bulk_sizes = []
+        # Failures of whole bulk requests, raised or returned by order of the requests
+        self.bulk_failures = list(bulk_failures)
+
+    def get(self, route, params=None):
+        body = {'resources': list(self.identifiers.values())}
+        return MagicMock(status_code=200, content=json.dumps(body).encode())
+
+    def post(self, route, json=None):
+        responses = {}
+        with self.lock:
+            self.bulk_sizes.append(len(json['requests']))
+            if self.bulk_failures:
+                failure = self.bulk_failures.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            for key, request in json['requests'].items():
+                if request['value'] in self.flaky_values:
+                    self.flaky_values.discard(request['value'])
+                    responses[key] = {'statusCode': 503, 'body': {'error': 'unavailable'}}
+                elif request['value'] in self.rejected_values:
+                    responses[key] = {'statusCode': 400, 'body': {'error': 'invalid'}}
+                else:
+                    identifier = {
+                        'id': str(uuid.uuid4()),
+                        'poolId': 'pool',
+                        'type': request['type'],
+                        'value': request['value'],
+                        'createdAt': '2023-10-11T10:15:00Z',
+                        'updatedAt': '2023-10-11T10:15:00Z',
+                    }
+                    self.identifiers[identifier['id']] = identifier
+                    responses[key] = {'statusCode': 201, 'body': identifier}
+        return MagicMock(status_code=207, json=MagicMock(return_value={'responses': responses}))
+
+    def delete(self, route, json=None):
+        with self.lock:
+            self.bulk_sizes.append(len(json['requests']))
+            for request in json['requests'].values():
+                self.identifiers.pop(request['id'])
+        return MagicMock(
+            status_code=207,
+            json=MagicMock(return_value={'responses': {key: {'statusCode': 204, 'body': None} for key in json['requests']}}),
+        )
+
+
+def _fqdn(index: int) -> ArkCmgrAddPoolIdentifier:
+    return ArkCmgrAddPoolIdentifier(type=ArkCmgrPoolIdentifierType.GENERAL_FQDN, value=f'srv{index}.corp.local')
+
+
+class TestArkCmgrService:
+    def test_add_pool_identifiers_chunks_and_retries_failed_sub_requests(self, service_factory: Callable[..., Any]):
+        client = _FakeCmgrClient(existing=[], flaky_values={'srv3.corp.local', 'srv17.corp.local'})
+        service = service_factory(ArkCmgrService, client)
+        added = service.add_pool_identifiers(
+            ArkCmgrAddPoolBulkIdentifier(pool_id='pool', identifiers=[_fqdn(i) for i in range(25)], chunk_size=10, max_concurrency=3)
+        )
+        assert [i.value for i in added.identifiers] == [f'srv{i}.corp.local' for i in range(25)]
+        assert sorted(client.bulk_sizes) == [1, 1, 5, 10, 10]
+
+    def test_add_pool_identifiers_reports_failed_items(self, service_factory: Callable[..., Any]):
+        client = _FakeCmgrClient(existing=[], rejected_values={'srv2.corp.local'})
+        service = service_factory(ArkCmgrService, client)
+        with pytest.raises(ArkServiceException, match=r'\[1/5\].*srv2\.corp\.local'):
+            service.add_pool_identifiers(ArkCmgrAddPoolBulkIdentifier(pool_id='pool', identifiers=[_fqdn(i) for i in range(5)]))
+        assert len(client.identifiers) == 4
+
+    def test_sync_pool_identifiers(self, service_factory: Callable[..., Any]):
+        existing = [
+            {
+                'id': f'id-{i}',
+                'poolId': 'pool',
+                'type': 'GENERAL_FQDN',
+                'value': f'srv{i}.corp.local',
+                'createdAt': '2023-10-11T10:15:00Z',
+                'updatedAt': '2023-10-11T10:15:00Z',
+            }
+            for i in range(10)
+        ]
+        client = _FakeCmgrClient(existing=existing, rejected_values={'srv14.corp.local'})
+        service = service_factory(ArkCmgrService, client)
+        result = service.sync_pool_identifiers(
+            ArkCmgrSyncPoolIdentifiers(pool_id='pool', identifiers=[_fqdn(i) for i in range(5, 15)], chunk_size=4)
+        )
+        assert result.unchanged_count == 5
+        assert sorted(i.value for i in result.added) == sorted(f'srv{i}.corp.local' for i in range(10, 14))
+        assert sorted(result.deleted) == sorted(f'id-{i}' for i in range(5))
+        assert [(f.value, f.status_code) for f in result.failed] == [('srv14.corp.local', 400)]
+        assert sorted(i['value'] for i in client.identifiers.values()) == sorted(f'srv{i}.corp.local' for i in range(5, 14))
+
+    def test_add_pool_identifiers_honors_retry_after_of_unprocessed_bulks(self, mocker: MockerFixture, service_factory: Callable[..., Any]):
+        throttled = MagicMock(status_code=429, text='throttled', headers={'Retry-After': '0'})
+        client = _FakeCmgrClient(existing=[], bulk_failures=[throttled, ConnectTimeout('connect timeout')])
+        service = service_factory(ArkCmgrService, client)
+        next_delay = mocker.spy(ArkRequestRetrier, 'next_delay')
+        added = service.add_pool_identifiers(ArkCmgrAddPoolBulkIdentifier(pool_id='pool', identifiers=[_fqdn(i) for i in range(3)]))
+        assert len(added.identifiers) == 3
+        assert client.bulk_sizes == [3, 3, 3]
+        assert [c.args[2:] for c in next_delay.call_args_list] == [('0',), (None,)]
+
+    @pytest.mark.parametrize(
+        'failure, status_code',
+        [
+            (ReadTimeout('read timeout'), None),
+            (MagicMock(status_code=504, text='gateway timeout', headers={}), 504),
+            (MagicMock(status_code=400, text='bad request', headers={}), 400),
+        ],
+    )
+    def test_add_pool_identifiers_does_not_resend_ambiguous_bulks(
+        self, service_factory: Callable[..., Any], failure: Any, status_code: Optional[int]
+    ):
+        client = _FakeCmgrClient(existing=[], bulk_failures=[failure])
+        service = service_factory(ArkCmgrService, client)
+        with pytest.raises(ArkServiceException, match=rf'\[3/3\].*srv0\.corp\.local - \[{status_code}\]'):
+            service.add_pool_identifiers(ArkCmgrAddPoolBulkIdentifier(pool_id='pool', identifiers=[_fqdn(i) for i in range(3)]))
+        assert client.bulk_sizes == [3]
+        assert not client.identifiers
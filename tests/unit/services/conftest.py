@@ -0,0 +1,30 @@
+from typing import Any, Callable, Optional, Type, TypeVar
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import get_logger
+from ark_sdk_python.services.ark_service import ArkService
+
+ServiceType = TypeVar('ServiceType', bound=ArkService)
+
+
+def _init_service(service: ArkService, *_) -> None:
+    service._logger = get_logger(app=service.__class__.__name__)
+    service._rate_limiter = None
+
+
+@pytest.fixture
+def service_factory(mocker: MockerFixture) -> Callable[..., Any]:
+    """
+    Creates ISP services without authenticating, whose ISP client is the given client.
+    """
+
+    def create(service_type: Type[ServiceType], client: Optional[Any] = None) -> ServiceType:
+        mocker.patch.object(ArkService, '__init__', _init_service)
+        client = client or mocker.MagicMock()
+        mocker.patch('ark_sdk_python.common.isp.ArkISPServiceClient.from_isp_auth', return_value=client)
+        mocker.patch('ark_sdk_python.common.isp.ArkAsyncISPServiceClient.from_isp_auth', return_value=client)
+        return service_type(mocker.MagicMock())
+
+    return create
@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common.env import AwsEnv
+from ark_sdk_python.models.services.identity.roles import ArkIdentityAddUserToRole, ArkIdentityBulkAddUsersToRoles
+from ark_sdk_python.models.services.identity.users import ArkIdentityBulkCreateUsers, ArkIdentityCreateUser
+from ark_sdk_python.services.identity.common import ArkIdentityLookupCache
+from ark_sdk_python.services.identity.directories import ArkIdentityDirectoriesService
+from ark_sdk_python.services.identity.users import ArkIdentityUsersService
+
+
+class _FakeIdentityClient:
+    def __init__(self, mocker: MockerFixture, failing_users=(), failing_roles=()):
+        self.mocker = mocker
+        self.tenant_env = AwsEnv.PROD
+        self.lock = threading.Lock()
+        self.created = []
+        self.role_requests = []
+        self.failing_users = set(failing_users)
+        self.failing_roles = set(failing_roles)
+
+    def post(self, url, json):
+        response = self.mocker.MagicMock(status_code=200, text='')
+        with self.lock:
+            if url.endswith('CDirectoryService/CreateUser'):
+                self.created.append(json['Name'])
+                success = json['Name'].split('@')[0] not in self.failing_users
+                response.json.return_value = {'success': success, 'Result': f'id-{json["Name"]}'}
+            elif url.endswith('SaasManage/AddUsersAndGroupsToRole'):
+                self.role_requests.append((json['Name'], list(json['Users'])))
+                response.json.return_value = {'success': json['Name'] not in self.failing_roles}
+            else:
+                raise AssertionError(f'Unexpected request [{url}]')
+        return response
+
+
+def _services(mocker: MockerFixture, service_factory: Callable[..., Any], client: _FakeIdentityClient):
+    users_service = service_factory(ArkIdentityUsersService, client)
+    lookup_cache = ArkIdentityLookupCache.for_auth(users_service._isp_auth)
+    lookup_cache.set(ArkIdentityLookupCache.ROLE_ID, 'admins', 'role-admins')
+    lookup_cache.set(ArkIdentityLookupCache.ROLE_ID, 'auditors', 'role-auditors')
+    tenant_default_suffix = mocker.patch.object(
+        ArkIdentityDirectoriesService, 'tenant_default_suffix', return_value='tenant.cyberark.cloud'
+    )
+    return users_service, users_service._roles_service, tenant_default_suffix
+
+
+class TestArkIdentityBulkUsers:
+    def test_bulk_create_users(self, mocker: MockerFixture, service_factory: Callable[..., Any]):
+        client = _FakeIdentityClient(mocker, failing_users={'user-3'})
+        users_service, _, tenant_default_suffix = _services(mocker, service_factory, client)
+        pages = list(
+            users_service.bulk_create_users(
+                ArkIdentityBulkCreateUsers(
+                    users=[ArkIdentityCreateUser(username=f'user-{i}', roles=['admins', 'auditors']) for i in range(10)],
+                    max_concurrency=4,
+                    batch_size=4,
+                )
+            )
+        )
+        results = [result for page in pages for result in page]
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert [result.username for result in results] == [f'user-{i}' for i in range(10)]
+        assert [result.success for result in results] == [i != 3 for i in range(10)]
+        assert results[3].user is None and results[3].error
+        assert results[0].user.user_id == 'id-user-0@tenant.cyberark.cloud'
+        tenant_default_suffix.assert_called_once()
+        # Role memberships are added with a request per role per batch instead of a request per user per role
+        assert len(client.role_requests) == 6
+        assert sorted(u for _, users in client.role_requests for u in users) == sorted(
+            f'user-{i}@tenant.cyberark.cloud' for i in range(10) if i != 3 for _ in range(2)
+        )
+
+    def test_bulk_add_users_to_roles_reports_failures(self, mocker: MockerFixture, service_factory: Callable[..., Any]):
+        client = _FakeIdentityClient(mocker, failing_roles={'role-auditors'})
+        _, roles_service, _ = _services(mocker, service_factory, client)
+        memberships = [ArkIdentityAddUserToRole(username=f'user-{i}', role_name=role) for i in range(5) for role in ('admins', 'auditors')]
+        results = [
+            result
+            for page in roles_service.bulk_add_users_to_roles(
+                ArkIdentityBulkAddUsersToRoles(memberships=memberships, max_concurrency=2, batch_size=2)
+            )
+            for result in page
+        ]
+        assert len(results) == 10
+        assert all(result.success == (result.role_name == 'admins') for result in results)
+        assert len(client.role_requests) == 6
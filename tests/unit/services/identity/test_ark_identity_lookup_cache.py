@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from ark_sdk_python.auth import ArkISPAuth
+from ark_sdk_python.services.identity.common import ArkIdentityLookupCache
+
+
+class TestArkIdentityLookupCache:
+    def test_get_or_load_and_invalidate(self):
+        cache = ArkIdentityLookupCache()
+        loads = []
+
+        def loader(name: str) -> str:
+            loads.append(name)
+            return f'id-{name}'
+
+        assert cache.get_or_load(ArkIdentityLookupCache.ROLE_ID, 'admins', lambda: loader('admins')) == 'id-admins'
+        assert cache.get_or_load(ArkIdentityLookupCache.ROLE_ID, 'admins', lambda: loader('admins')) == 'id-admins'
+        cache.set(ArkIdentityLookupCache.ROLE_ID, 'users', 'id-users')
+        cache.set(ArkIdentityLookupCache.USER_ID, 'user@tenant', 'user-id')
+        assert loads == ['admins']
+        cache.invalidate(ArkIdentityLookupCache.ROLE_ID, 'admins')
+        assert cache.get(ArkIdentityLookupCache.ROLE_ID, 'admins') is None
+        assert cache.get(ArkIdentityLookupCache.ROLE_ID, 'users') == 'id-users'
+        cache.invalidate(ArkIdentityLookupCache.ROLE_ID)
+        assert cache.get(ArkIdentityLookupCache.ROLE_ID, 'users') is None
+        assert cache.get(ArkIdentityLookupCache.USER_ID, 'user@tenant') == 'user-id'
+
+    def test_failures_are_not_cached(self):
+        cache = ArkIdentityLookupCache()
+
+        def failing_loader() -> str:
+            raise ValueError('not found')
+
+        with pytest.raises(ValueError):
+            cache.get_or_load(ArkIdentityLookupCache.TENANT_SUFFIX, None, failing_loader)
+        assert cache.get_or_load(ArkIdentityLookupCache.TENANT_SUFFIX, None, lambda: 'tenant.cyberark.cloud') == 'tenant.cyberark.cloud'
+
+    def test_ttl_expiry(self):
+        cache = ArkIdentityLookupCache(ttl_seconds=0.05)
+        cache.set(ArkIdentityLookupCache.TENANT_SUFFIX, None, 'tenant.cyberark.cloud')
+        assert cache.get(ArkIdentityLookupCache.TENANT_SUFFIX) == 'tenant.cyberark.cloud'
+        time.sleep(0.1)
+        assert cache.get(ArkIdentityLookupCache.TENANT_SUFFIX) is None
+
+    def test_shared_per_authenticator(self):
+        first_auth = ArkISPAuth(cache_authentication=False)
+        second_auth = ArkISPAuth(cache_authentication=False)
+        assert ArkIdentityLookupCache.for_auth(first_auth) is ArkIdentityLookupCache.for_auth(first_auth)
+        assert ArkIdentityLookupCache.for_auth(first_auth) is not ArkIdentityLookupCache.for_auth(second_auth)
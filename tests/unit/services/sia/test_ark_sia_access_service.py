@@ -0,0 +1,76 @@
+from typing import Any, Callable
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.common import ArkOsType, ArkWorkspaceType
+from ark_sdk_python.models.common.connections import ArkConnectionResult
+from ark_sdk_python.models.services.sia.access import ArkSIABulkInstallConnectors, ArkSIAConnectorSetupScript, ArkSIAInstallConnector
+from ark_sdk_python.services.sia.access import ArkSIAAccessService
+from ark_sdk_python.services.sia.access.ark_sia_access_service import CONNECTOR_CMDSET
+
+
+class _FakeConnection:
+    def __init__(self, machine: str, inactive_checks: int):
+        self.machine = machine
+        self.inactive_checks = inactive_checks
+        self.commands = []
+        self.disconnected = False
+
+    def run_command(self, command):
+        self.commands.append(command.command)
+        if command.command == CONNECTOR_CMDSET[ArkOsType.LINUX]['connector-active'] and self.inactive_checks > 0:
+            self.inactive_checks -= 1
+            raise ArkException('connector is not active')
+        if command.command == CONNECTOR_CMDSET[ArkOsType.LINUX]['read-connector-config']:
+            return ArkConnectionResult(stdout=f'{{"Id": "connector-{self.machine}"}}')
+        return ArkConnectionResult()
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+class TestArkSIAAccessService:
+    def test_bulk_install_connectors(self, mocker: MockerFixture, service_factory: Callable[..., Any]):
+        connections = {}
+
+        def create_connection(os_type, target_machine, *_):
+            if target_machine == 'unreachable':
+                raise ArkException('connection refused')
+            connections[target_machine] = _FakeConnection(target_machine, inactive_checks=2 if target_machine == 'slow' else 0)
+            return connections[target_machine], CONNECTOR_CMDSET[os_type]
+
+        service = service_factory(ArkSIAAccessService)
+        machines = ['fast', 'slow', 'unreachable']
+        mocker.patch.object(service, '_ArkSIAAccessService__create_connection', side_effect=create_connection)
+        mocker.patch.object(
+            service, 'connector_setup_script', return_value=ArkSIAConnectorSetupScript(script_url='url', bash_cmd='install')
+        )
+        sleep_mock = mocker.patch('ark_sdk_python.services.sia.access.ark_sia_access_service.time.sleep')
+        results = [
+            result
+            for page in service.bulk_install_connectors(
+                ArkSIABulkInstallConnectors(
+                    connectors=[
+                        ArkSIAInstallConnector(
+                            connector_type=ArkWorkspaceType.ONPREM,
+                            connector_os=ArkOsType.LINUX,
+                            target_machine=machine,
+                            username='user',
+                            password='password',
+                        )
+                        for machine in machines
+                    ],
+                    max_concurrency=2,
+                )
+            )
+            for result in page
+        ]
+        by_machine = {result.target_machine: result for result in results}
+        assert sorted(by_machine) == sorted(machines)
+        assert by_machine['fast'].success and by_machine['fast'].connector_id == 'connector-fast'
+        assert by_machine['slow'].success and by_machine['slow'].connector_id == 'connector-slow'
+        assert not by_machine['unreachable'].success and 'connection refused' in by_machine['unreachable'].error
+        assert all(connection.disconnected for connection in connections.values())
+        # Readiness is polled with a growing tick instead of a fixed one
+        assert [c.args[0] for c in sleep_mock.call_args_list] == [0.5, 1.0]
@@ -0,0 +1,128 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import jwt
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common.ark_keyring import ARK_BASIC_KEYRING_FOLDER_ENV_VAR, ARK_BASIC_KEYRING_OVERRIDE_ENV_VAR, ArkKeyring
+from ark_sdk_python.models import ArkProfileLoader
+from ark_sdk_python.models.auth import ArkToken, ArkTokenType
+from ark_sdk_python.models.services.sia.sso import ArkSIASSOGetShortLivedPassword, ArkSIASSOGetShortLivedRDPFile
+from ark_sdk_python.services.sia.sso import ArkSIASSOService
+
+
+@pytest.fixture(autouse=True)
+def keyring_folder(tmp_path, monkeypatch):
+    monkeypatch.setenv(ARK_BASIC_KEYRING_FOLDER_ENV_VAR, str(tmp_path))
+    monkeypatch.setenv(ARK_BASIC_KEYRING_OVERRIDE_ENV_VAR, 'true')
+    ArkKeyring.clear_cache()
+    yield tmp_path
+    ArkKeyring.clear_cache()
+
+
+def _session_token(unique_name: str) -> str:
+    return jwt.encode({'tenant_id': 'tenant', 'unique_name': unique_name}, 'sso-session-token-signing-key', algorithm='HS256')
+
+
+def _sso_service(service_factory: Callable[..., Any], lifetime: timedelta, unique_name: str, token_key: str = 'key'):
+    client = MagicMock(session_token=_session_token(unique_name))
+    minted = []
+
+    def post(*_args, **_kwargs):
+        time.sleep(0.1)
+        minted.append(len(minted))
+        now = datetime.now()
+        response = MagicMock(status_code=HTTPStatus.CREATED)
+        response.json.return_value = {
+            'token': {token_key: f'password-{len(minted)}'},
+            'metadata': {'created_at': now.isoformat(), 'expires_at': (now + lifetime).isoformat()},
+        }
+        return response
+
+    client.post.side_effect = post
+    return service_factory(ArkSIASSOService, client), minted
+
+
+def _cached_token(value: str, lifetime: timedelta) -> ArkToken:
+    now = datetime.now()
+    return ArkToken(
+        token=f'{{"token": {{"key": "{value}"}}, "metadata": '
+        f'{{"created_at": "{now.isoformat()}", "expires_at": "{(now + lifetime).isoformat()}"}}}}',
+        token_type=ArkTokenType.Token,
+        expires_in=now + lifetime,
+    )
+
+
+class TestArkSIASSOService:
+    def test_short_lived_password_pool(self, service_factory: Callable[..., Any]):
+        service, minted = _sso_service(service_factory, timedelta(minutes=5), 'pool@corp.local')
+        passwords = []
+        threads = [
+            threading.Thread(
+                target=lambda: passwords.append(service.short_lived_password(ArkSIASSOGetShortLivedPassword(allow_caching=True)))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert passwords == ['password-1'] * 8
+        assert service.short_lived_password(ArkSIASSOGetShortLivedPassword(allow_caching=True)) == 'password-1'
+        # Requests which do not allow caching always mint
+        assert service.short_lived_password(ArkSIASSOGetShortLivedPassword()) == 'password-2'
+        assert len(minted) == 2
+        stats = service.credentials_pool_stats()
+        assert stats.size == 1 and stats.misses == 1 and stats.hits + stats.deduplicated == 8
+        service.clear_credentials_pool()
+        # The pooled credential was cached in the keyring as well, so an empty pool does not mint it again
+        assert service.short_lived_password(ArkSIASSOGetShortLivedPassword(allow_caching=True)) == 'password-1'
+        assert len(minted) == 2
+        service.clear_credentials_pool()
+
+    def test_short_lived_password_renewal(self, service_factory: Callable[..., Any]):
+        service, _ = _sso_service(service_factory, timedelta(seconds=31), 'renewal@corp.local')
+        assert service.short_lived_password(ArkSIASSOGetShortLivedPassword(allow_caching=True)) == 'password-1'
+        deadline = time.monotonic() + 5
+        while service.credentials_pool_stats().renewals == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert service.credentials_pool_stats().renewals == 1
+        assert service.short_lived_password(ArkSIASSOGetShortLivedPassword(allow_caching=True)) == 'password-2'
+        service.clear_credentials_pool()
+
+    def test_legacy_cache_entries_are_deleted(self, service_factory: Callable[..., Any]):
+        profile = ArkProfileLoader.load_default_profile()
+        keyring = ArkKeyring(ArkSIASSOService.service_config().service_name)
+        legacy_postfix = 'tenant_legacy@corp.local_sia_sso_short_lived_password'
+        keyring.save_token(profile, _cached_token('legacy-password', timedelta(minutes=5)), legacy_postfix)
+        service, minted = _sso_service(service_factory, timedelta(minutes=5), 'legacy@corp.local')
+        # Legacy entries were not keyed by service, so they are deleted instead of served
+        assert service.short_lived_password(ArkSIASSOGetShortLivedPassword(allow_caching=True)) == 'password-1'
+        assert len(minted) == 1
+        ArkKeyring.clear_cache()
+        assert keyring.load_token(profile, legacy_postfix) is None
+        service.clear_credentials_pool()
+
+    def test_cached_credentials_about_to_expire_are_minted(self, mocker: MockerFixture, service_factory: Callable[..., Any]):
+        service, minted = _sso_service(service_factory, timedelta(minutes=5), 'expiring@corp.local')
+        mocker.patch.object(ArkKeyring, 'load_token', return_value=_cached_token('cached', timedelta(seconds=2)))
+        assert service.short_lived_password(ArkSIASSOGetShortLivedPassword(allow_caching=True)) == 'password-1'
+        assert len(minted) == 1
+        service.clear_credentials_pool()
+
+    def test_short_lived_rdp_file_pool(self, service_factory: Callable[..., Any], tmp_path):
+        service, minted = _sso_service(service_factory, timedelta(minutes=5), 'rdp@corp.local', token_key='text')
+        for target_address in ('10.0.0.1', '10.0.0.1', '10.0.0.2'):
+            service.short_lived_rdp_file(
+                ArkSIASSOGetShortLivedRDPFile(allow_caching=True, folder=f'{tmp_path}/rdp/', target_address=target_address)
+            )
+        # Rdp files are pooled per target
+        assert len(minted) == 2
+        assert (tmp_path / 'rdp' / 'sia _a 10.0.0.1.rdp').read_text() == 'password-1'
+        assert (tmp_path / 'rdp' / 'sia _a 10.0.0.2.rdp').read_text() == 'password-2'
+        service.clear_credentials_pool()
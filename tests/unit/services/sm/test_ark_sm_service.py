@@ -0,0 +1,109 @@
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+from ark_sdk_python.models.services.sm import ArkSMSearchSessionsActivities, ArkSMSessionActivitiesFilter
+from ark_sdk_python.services.sm import ArkAsyncSMService, ArkSMService
+
+SESSIONS_PAGE = json.loads((Path(__file__).parents[3] / 'benchmarks' / 'fixtures' / 'sm_sessions_page.json').read_text())
+ACTIVITIES_PAGE_SIZE = 3
+
+
+def _activity(session_id: str, index: int) -> dict:
+    return {
+        'uuid': f'{session_id}-{index}',
+        'tenantId': 'tenant',
+        'timestamp': '2023-10-11T10:15:00Z',
+        'username': 'john.doe@corp.local',
+        'applicationCode': 'SIA',
+        'action': 'Command',
+        'userId': 'user-id',
+        'source': '203.0.113.10',
+        'actionType': 'Command',
+        'command': f'sudo ls {index}' if index % 2 else f'ls {index}',
+        'sessionId': session_id,
+    }
+
+
+class _FakeSMClient:
+    def __init__(self, activities_per_session: int):
+        self.lock = threading.Lock()
+        self.activities_requests = []
+        self.activities_per_session = activities_per_session
+
+    def get(self, endpoint, params=None):
+        params = dict(params or {})
+        offset = params.get('offset', 0)
+        if endpoint == 'api/sessions':
+            sessions = SESSIONS_PAGE['sessions'] if offset == 0 else []
+            body = {'sessions': sessions, 'filteredCount': len(SESSIONS_PAGE['sessions']), 'returnedCount': len(sessions)}
+        else:
+            session_id = endpoint.split('/')[2]
+            with self.lock:
+                self.activities_requests.append((session_id, params))
+            count = self.activities_per_session
+            activities = [_activity(session_id, i) for i in range(offset, min(offset + ACTIVITIES_PAGE_SIZE, count))]
+            body = {'activities': activities, 'filteredCount': count, 'returnedCount': len(activities)}
+        return MagicMock(status_code=200, content=json.dumps(body).encode())
+
+
+class _FakeAsyncSMClient(_FakeSMClient):
+    async def get(self, endpoint, params=None):
+        await asyncio.sleep(0)
+        return super().get(endpoint, params)
+
+
+class TestArkSMService:
+    def test_search_sessions_activities(self, service_factory: Callable[..., Any]):
+        client = _FakeSMClient(activities_per_session=7)
+        service = service_factory(ArkSMService, client)
+        session_ids = [session['sessionId'] for session in SESSIONS_PAGE['sessions']]
+        pages = list(
+            service.search_sessions_activities(
+                ArkSMSearchSessionsActivities(
+                    session_ids=session_ids[:1],
+                    sessions_search='protocol IN SSH',
+                    search='command STARTSWITH sudo',
+                    command_contains='sudo',
+                    max_concurrency=4,
+                )
+            )
+        )
+        assert sorted(page.items[0].session_id for page in pages) == sorted(session_ids)
+        assert all(activity.command.startswith('sudo') for page in pages for activity in page)
+        assert sum(len(page) for page in pages) == 3 * len(session_ids)
+        assert all(params.get('search') == 'command STARTSWITH sudo' for _, params in client.activities_requests)
+
+    def test_count_session_activities_by_uses_filtered_count(self, service_factory: Callable[..., Any]):
+        client = _FakeSMClient(activities_per_session=7)
+        service = service_factory(ArkSMService, client)
+        assert (
+            service.count_session_activities_by(ArkSMSessionActivitiesFilter(session_id='session', search='command STARTSWITH sudo')) == 7
+        )
+        assert len(client.activities_requests) == 1
+        assert service.count_session_activities_by(ArkSMSessionActivitiesFilter(session_id='session', command_contains='sudo')) == 3
+
+    def test_async_search_sessions_activities_streams_pages(self, service_factory: Callable[..., Any]):
+        client = _FakeAsyncSMClient(activities_per_session=7)
+        service = service_factory(ArkAsyncSMService, client)
+        session_ids = [session['sessionId'] for session in SESSIONS_PAGE['sessions']]
+
+        async def collect():
+            return [
+                page
+                async for page in service.search_sessions_activities(
+                    ArkSMSearchSessionsActivities(
+                        session_ids=session_ids[:1], sessions_search='protocol IN SSH', command_contains='sudo', max_concurrency=4
+                    )
+                )
+            ]
+
+        pages = asyncio.run(collect())
+        # Every fetched page of matches is yielded on its own, instead of a page per session
+        assert sorted(len(page) for page in pages) == sorted([1, 2] * len(session_ids))
+        assert sorted(activity.uuid for page in pages for activity in page) == sorted(
+            f'{session_id}-{i}' for session_id in session_ids for i in (1, 3, 5)
+        )